@@ -1,122 +1,406 @@
-import os
+import argparse
+import random
+import threading
+import time
 import requests
 import urllib.parse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from requests.adapters import HTTPAdapter
 
-from suburbs import suburbs
+from scrape_manifest import Manifest, content_hash
+from suburb_archive import import_directory, open_archive
+from suburb_registry import load_registry
 
-# Directory to save the data
+# Where to save the data: a directory of per-suburb files, or a packed
+# *.sqlite archive (see suburb_archive.py)
 output_dir = "suburb_data"
-os.makedirs(output_dir, exist_ok=True)
+
+# Manifest of what was fetched when (kept outside output_dir, which only holds suburb files)
+manifest_path = "suburb_manifest.json"
 
 # Base URL pattern
 base_url = "https://www.abc.net.au/dat/news/interactives" \
     "/dsi-data/2025-insurance-risk/sal-lookups-v2/{}.json"
 
-# Loop through each suburb
-"""
-for suburb in suburbs:
-    encoded_suburb = urllib.parse.quote(suburb)
-    url = base_url.format(encoded_suburb)
+# Status codes worth retrying; anything else is a permanent failure
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` requests per second, with bursts up to `burst`."""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    # One token bucket per host, created on first use
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.limiters = {}
+        self.lock = threading.Lock()
+
+    def acquire(self, url):
+        host = urllib.parse.urlsplit(url).netloc
+        with self.lock:
+            limiter = self.limiters.get(host)
+            if limiter is None:
+                limiter = self.limiters[host] = RateLimiter(self.rate, self.burst)
+        limiter.acquire()
+
+
+def make_session(pool_size):
+    # One keep-alive connection pool shared by every worker thread
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def suburb_url(suburb, url_pattern=base_url):
+    return url_pattern.format(urllib.parse.quote(suburb))
+
+
+def fetch_with_retry(session, url, limiter=None, retries=4, backoff=0.5, timeout=30, headers=None):
+    # GET with jittered exponential backoff on connection errors and retryable statuses
+    for attempt in range(retries + 1):
+        if limiter is not None:
+            limiter.acquire(url)
+        try:
+            response = session.get(url, timeout=timeout, headers=headers)
+            if response.status_code not in RETRY_STATUSES or attempt == retries:
+                response.raise_for_status()
+                return response
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == retries:
+                raise
+        time.sleep(backoff * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+
+def fetch_suburbs(names, url_pattern=base_url, archive=None, concurrency=16,
+                  rate=20, retries=4, backoff=0.5, timeout=30, manifest=None, max_age=None):
+    """
+    Download every suburb lookup concurrently and save it to `archive`
+    (default: the output_dir directory).
+
+    At most `concurrency` requests are in flight, sharing one connection pool,
+    and each host gets at most `rate` requests per second. With a manifest,
+    suburbs fetched less than `max_age` seconds ago are skipped, the rest are
+    requested conditionally and only rewritten when their content changed.
+    Returns a (saved, failed) pair of suburb name lists, where saved only
+    holds suburbs whose data was (re)written.
+    """
+    if archive is None:
+        archive = open_archive(output_dir)
+    session = make_session(concurrency)
+    limiter = HostRateLimiter(rate, burst=concurrency)
+
+    def fetch(suburb):
+        url = suburb_url(suburb, url_pattern)
+        headers = manifest.conditional_headers(suburb, archive) if manifest else None
+
+        response = fetch_with_retry(session, url, limiter, retries, backoff, timeout, headers)
+        if response.status_code == 304 and manifest:
+            manifest.record_not_modified(suburb)
+            return False
+
+        # Store the body before the manifest records its hash and ETag, so a
+        # crash in between leaves the suburb looking stale rather than fresh
+        digest = content_hash(response.text)
+        written = not manifest or manifest.has_changed(suburb, digest) or suburb not in archive
+        if written:
+            archive.put(suburb, response.text)
+        if manifest:
+            manifest.record_fetch(suburb, url, response.headers, digest)
+        return written
+
+    if manifest is not None:
+        # Manifest checkpoints commit the archive first
+        manifest.archive = archive
+        names = [name for name in names if manifest.needs_fetch(name, archive, max_age)]
+        print(f"{len(names)} suburbs missing or stale in manifest")
+
+    saved, failed = [], []
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        filename = os.path.join(output_dir, f"{suburb.replace('/', '-')}.json")
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(response.text)
-        print(f"Saved: {filename}")
-    except requests.HTTPError as e:
-        print(f"Failed to fetch data for {suburb}: {e}")
-"""
-
-# Count the number of files in the output directory
-file_count = len([name for name in os.listdir(output_dir) if os.path.isfile(os.path.join(output_dir, name))])
-print(f"Number of files in '{output_dir}': {file_count}")
-# Count the number of entries in the suburbs list
-suburb_count = len(suburbs)
-print(f"Number of entries in 'suburbs': {suburb_count}")
-
-
-import os
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {executor.submit(fetch, suburb): suburb for suburb in names}
+            for future in as_completed(futures):
+                suburb = futures[future]
+                try:
+                    if future.result():
+                        print(f"Saved: {suburb}")
+                        saved.append(suburb)
+                except requests.RequestException as e:
+                    print(f"Failed to fetch data for {suburb}: {e}")
+                    failed.append(suburb)
+    finally:
+        session.close()
+        archive.commit()
+        if manifest is not None:
+            manifest.save()
+
+    return saved, failed
+
+
+def report_counts(archive):
+    # Count the number of suburbs saved so far
+    print(f"Number of suburbs saved: {len(archive)}")
+    # Count the number of entries in the suburbs list
+    suburb_count = len(load_registry())
+    print(f"Number of entries in 'suburbs': {suburb_count}")
+
+
 import boto3
 from botocore.exceptions import ClientError
 import json
 import logging
+from decimal import Decimal
 from botocore.config import Config
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 
-# Initialize DynamoDB resource
-dynamodb = boto3.resource('dynamodb', region_name='ap-southeast-2',
-                          config=Config(retries={'max_attempts': 10, 'mode': 'standard'}))
-
-# Initialize the table
+# DynamoDB table and batch limits
 table_name = 'suburb_data'
-table = dynamodb.Table(table_name)
+BATCH_SIZE = 25  # BatchWriteItem maximum
+THROTTLE_ERRORS = {'ProvisionedThroughputExceededException', 'ThrottlingException', 'RequestLimitExceeded'}
+
+
+def make_dynamodb():
+    # boto3 resources are not thread-safe, so each worker builds its own
+    return boto3.session.Session().resource('dynamodb', region_name='ap-southeast-2',
+                                            config=Config(retries={'max_attempts': 10, 'mode': 'standard'}))
+
+
+def build_item(suburb, data):
+    # Prepare the item for DynamoDB
+    item = {
+        'suburb': suburb,  # Filename without extension is the key
+        'bbox': data.get('bbox', []),  # Bounding box coordinates
+        'population': data.get('c', None),  # Population (key 'c')
+        'risk_data': {  # Group risk-related fields
+            '2025': {
+                'Coastal Inundation': data.get('26_2025_Coastal Inundation', 0),
+                'Extreme Wind': data.get('26_2025_Extreme Wind', 0),
+                'Forest Fire': data.get('26_2025_Forest Fire', 0),
+                'Riverine Flooding': data.get('26_2025_Riverine Flooding', 0),
+                'Surface Water Flooding': data.get('26_2025_Surface Water Flooding', 0),
+                'Tropical Cyclone Wind': data.get('26_2025_Tropical Cyclone Wind', 0),
+                'Total MVAR': data.get('26_2025_Total MVAR', 0),
+            },
+            '2050': {
+                'Coastal Inundation': data.get('26_2050_Coastal Inundation', 0),
+                'Extreme Wind': data.get('26_2050_Extreme Wind', 0),
+                'Forest Fire': data.get('26_2050_Forest Fire', 0),
+                'Riverine Flooding': data.get('26_2050_Riverine Flooding', 0),
+                'Surface Water Flooding': data.get('26_2050_Surface Water Flooding', 0),
+                'Tropical Cyclone Wind': data.get('26_2050_Tropical Cyclone Wind', 0),
+                'Total MVAR': data.get('26_2050_Total MVAR', 0),
+            },
+            '2100': {
+                'Coastal Inundation': data.get('26_2100_Coastal Inundation', 0),
+                'Extreme Wind': data.get('26_2100_Extreme Wind', 0),
+                'Forest Fire': data.get('26_2100_Forest Fire', 0),
+                'Riverine Flooding': data.get('26_2100_Riverine Flooding', 0),
+                'Surface Water Flooding': data.get('26_2100_Surface Water Flooding', 0),
+                'Tropical Cyclone Wind': data.get('26_2100_Tropical Cyclone Wind', 0),
+                'Total MVAR': data.get('26_2100_Total MVAR', 0),
+            },
+        },
+        'climate_scenarios': {  # Group climate scenario data
+            'RCP4.5': {
+                '2025': data.get('45_2025_Total MVAR', 0),
+                '2050': data.get('45_2050_Total MVAR', 0),
+                '2100': data.get('45_2100_Total MVAR', 0),
+            },
+            'RCP8.5': {
+                '2025': data.get('85_2025_Total MVAR', 0),
+                '2050': data.get('85_2050_Total MVAR', 0),
+                '2100': data.get('85_2100_Total MVAR', 0),
+            },
+        }
+    }
+    return item
+
+
+def iter_items(archive, keys=None):
+    # keys optionally limits loading to these suburb keys (names with "/" as "-")
+    for name, text in archive.iter_records():
+        key = name.replace('/', '-')
+        if keys is not None and key not in keys:
+            continue
+        try:
+            # DynamoDB rejects Python floats, so read numbers as Decimal
+            data = json.loads(text, parse_float=Decimal)
+            yield build_item(key, data)
+        except Exception as e:
+            logging.error(f"An error occurred while processing {name}: {str(e)}")
+
+
+def iter_batches(items, size=BATCH_SIZE):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class LoadStats:
+    # Counters shared by the loader threads
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.items = 0
+        self.batches = 0
+        self.retries = 0
+        self.throttled = 0
+        self.failed = 0
+        self.written = []
+        self.started = time.monotonic()
+
+    def add(self, **counts):
+        with self.lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def report(self):
+        elapsed = time.monotonic() - self.started
+        rate = self.items / elapsed if elapsed else 0.0
+        logging.info(f"Wrote {self.items} items in {self.batches} batches in {elapsed:.1f}s "
+                     f"({rate:.1f} items/s); {self.retries} unprocessed retries, "
+                     f"{self.throttled} throttled requests, {self.failed} failed items")
+
+
+def write_batch(dynamodb, batch, stats, table=table_name, max_attempts=8, backoff=0.05):
+    # BatchWriteItem with retry of UnprocessedItems using jittered backoff
+    request = {table: [{'PutRequest': {'Item': item}} for item in batch]}
+    for attempt in range(max_attempts):
+        try:
+            response = dynamodb.batch_write_item(RequestItems=request)
+            request = response.get('UnprocessedItems') or {}
+        except ClientError as e:
+            if e.response['Error']['Code'] not in THROTTLE_ERRORS:
+                raise
+            stats.add(throttled=1)
+
+        written = len(batch) - sum(len(puts) for puts in request.values())
+        if not request:
+            stats.add(items=written, batches=1, written=[item['suburb'] for item in batch])
+            return
+        stats.add(retries=1)
+        time.sleep(backoff * (2 ** attempt) * random.uniform(0.5, 1.5))
+
+    unprocessed = {put['PutRequest']['Item']['suburb'] for puts in request.values() for put in puts}
+    stats.add(items=written, batches=1, failed=len(batch) - written,
+              written=[item['suburb'] for item in batch if item['suburb'] not in unprocessed])
+    logging.error(f"Gave up on {len(batch) - written} unprocessed items after {max_attempts} attempts")
+
 
 # Function to write data to DynamoDB
-def write_to_dynamodb(directory):
-    for filename in os.listdir(directory):
-        if filename.endswith(".json"):
-            file_path = os.path.join(directory, filename)
+def write_to_dynamodb(archive, parallelism=8, dynamodb_factory=make_dynamodb, table=table_name, keys=None):
+    """
+    Bulk load every suburb in `archive` using 25-item batch writes
+    spread over `parallelism` threads. `dynamodb_factory` returns an object
+    with batch_write_item (a boto3 resource, or a fake in tests); it is
+    called once per worker thread. `keys` limits the load to those suburb
+    keys. Returns the LoadStats counters.
+    """
+    stats = LoadStats()
+    local = threading.local()
+
+    def load(batch):
+        try:
+            if not hasattr(local, 'dynamodb'):
+                local.dynamodb = dynamodb_factory()
+            write_batch(local.dynamodb, batch, stats, table)
+        except ClientError as e:
+            stats.add(failed=len(batch))
+            logging.error(f"Failed to write batch starting at {batch[0]['suburb']}: {e.response['Error']['Message']}")
+        except Exception as e:
+            # Connection errors, bad parameters, bugs: count the batch as failed rather than lose it
+            stats.add(failed=len(batch))
+            logging.error(f"Failed to write batch starting at {batch[0]['suburb']}: {e!r}")
+
+    def check(done):
+        # load handles its own errors; anything escaping it still gets reported
+        for future in done:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Prepare the item for DynamoDB
-                    item = {
-                        'suburb': filename.replace('.json', ''),  # Use filename (without extension) as the key
-                        'bbox': data.get('bbox', []),  # Bounding box coordinates
-                        'population': data.get('c', None),  # Population (key 'c')
-                        'risk_data': {  # Group risk-related fields
-                            '2025': {
-                                'Coastal Inundation': data.get('26_2025_Coastal Inundation', 0),
-                                'Extreme Wind': data.get('26_2025_Extreme Wind', 0),
-                                'Forest Fire': data.get('26_2025_Forest Fire', 0),
-                                'Riverine Flooding': data.get('26_2025_Riverine Flooding', 0),
-                                'Surface Water Flooding': data.get('26_2025_Surface Water Flooding', 0),
-                                'Tropical Cyclone Wind': data.get('26_2025_Tropical Cyclone Wind', 0),
-                                'Total MVAR': data.get('26_2025_Total MVAR', 0),
-                            },
-                            '2050': {
-                                'Coastal Inundation': data.get('26_2050_Coastal Inundation', 0),
-                                'Extreme Wind': data.get('26_2050_Extreme Wind', 0),
-                                'Forest Fire': data.get('26_2050_Forest Fire', 0),
-                                'Riverine Flooding': data.get('26_2050_Riverine Flooding', 0),
-                                'Surface Water Flooding': data.get('26_2050_Surface Water Flooding', 0),
-                                'Tropical Cyclone Wind': data.get('26_2050_Tropical Cyclone Wind', 0),
-                                'Total MVAR': data.get('26_2050_Total MVAR', 0),
-                            },
-                            '2100': {
-                                'Coastal Inundation': data.get('26_2100_Coastal Inundation', 0),
-                                'Extreme Wind': data.get('26_2100_Extreme Wind', 0),
-                                'Forest Fire': data.get('26_2100_Forest Fire', 0),
-                                'Riverine Flooding': data.get('26_2100_Riverine Flooding', 0),
-                                'Surface Water Flooding': data.get('26_2100_Surface Water Flooding', 0),
-                                'Tropical Cyclone Wind': data.get('26_2100_Tropical Cyclone Wind', 0),
-                                'Total MVAR': data.get('26_2100_Total MVAR', 0),
-                            },
-                        },
-                        'climate_scenarios': {  # Group climate scenario data
-                            'RCP4.5': {
-                                '2025': data.get('45_2025_Total MVAR', 0),
-                                '2050': data.get('45_2050_Total MVAR', 0),
-                                '2100': data.get('45_2100_Total MVAR', 0),
-                            },
-                            'RCP8.5': {
-                                '2025': data.get('85_2025_Total MVAR', 0),
-                                '2050': data.get('85_2050_Total MVAR', 0),
-                                '2100': data.get('85_2100_Total MVAR', 0),
-                            },
-                        }
-                    }
-                    table.put_item(Item=item)
-                    logging.info(f"Successfully wrote data for {item['suburb']} to DynamoDB.")
-            except ClientError as e:
-                logging.error(f"Failed to write data for {filename}: {e.response['Error']['Message']}")
+                future.result()
             except Exception as e:
-                logging.error(f"An error occurred while processing {filename}: {str(e)}")
+                logging.error(f"Loader thread failed: {e!r}")
+
+    with ThreadPoolExecutor(max_workers=parallelism) as executor:
+        # Bound the number of queued batches so files are read as we go
+        pending = set()
+        for batch in iter_batches(iter_items(archive, keys)):
+            pending.add(executor.submit(load, batch))
+            if len(pending) >= parallelism * 2:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                check(done)
+        check(wait(pending).done)
+
+    stats.report()
+    return stats
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Scrape ABC suburb risk lookups and load them into DynamoDB")
+    parser.add_argument("--fetch", action="store_true", help="Download suburb lookups before loading")
+    parser.add_argument("--base-url", default=base_url, help="URL pattern with {} for the quoted suburb name")
+    parser.add_argument("--archive", default=output_dir,
+                        help="Directory of suburb files, or a packed *.sqlite archive")
+    parser.add_argument("--import-dir", help="Pack an existing directory of suburb files into --archive first")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rate", type=float, default=20, help="Requests per second per host")
+    parser.add_argument("--retries", type=int, default=4)
+    parser.add_argument("--parallelism", type=int, default=8, help="DynamoDB loader threads")
+    parser.add_argument("--manifest", default=manifest_path, help="Fetch manifest used for incremental runs")
+    parser.add_argument("--max-age", type=float, help="Refetch suburbs older than this many hours")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only load suburbs whose content changed since the last DynamoDB load")
+    args = parser.parse_args()
+
+    archive = open_archive(args.archive)
+    if args.import_dir:
+        print(f"Imported {import_directory(args.import_dir, archive)} suburbs from '{args.import_dir}'")
+
+    manifest = Manifest(args.manifest, archive=archive)
+    if args.fetch:
+        max_age = args.max_age * 3600 if args.max_age is not None else None
+        fetch_suburbs(load_registry().names, args.base_url, archive, args.concurrency, args.rate, args.retries,
+                      manifest=manifest, max_age=max_age)
+    report_counts(archive)
+
+    # Suburb keys to load: everything, or only what changed since the last load
+    keys = None
+    if args.incremental:
+        pending = manifest.pending("dynamodb")
+        keys = {suburb.replace('/', '-'): suburb for suburb in pending}
+        print(f"{len(keys)} suburbs changed since the last DynamoDB load")
 
-# Directory containing JSON files
-json_directory = "suburb_data"
-# Write all JSON files in the directory to DynamoDB
-write_to_dynamodb(json_directory)
\ No newline at end of file
+    # Write every saved suburb to DynamoDB
+    stats = write_to_dynamodb(archive, args.parallelism, keys=keys)
+    if keys is not None:
+        manifest.mark_processed("dynamodb", [keys[key] for key in stats.written if key in keys])
+        manifest.save()
+    archive.close()
\ No newline at end of file
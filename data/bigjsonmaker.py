@@ -1,25 +1,76 @@
-import os
+import argparse
 import json
+import os
+from multiprocessing import Pool
+
+from scrape_manifest import Manifest
+from suburb_archive import open_archive
+
+# Archive opened once per worker process by _init_worker
+_archive = None
+
+
+def _init_worker(archive_path):
+    global _archive
+    _archive = open_archive(archive_path)
+
+
+def _encode(name):
+    # Parse one suburb and re-serialise it compactly; None if it can't be read
+    text = _archive.get(name)
+    try:
+        return json.dumps(json.loads(text), separators=(",", ":"))
+    except (TypeError, ValueError) as e:
+        print(f"Skipping {name}: {e}")
+        return None
+
 
-# Path to the folder containing the JSON files
-suburb_data_folder = '/Users/matthewodea/development/frontend/data/suburb_data'
+def combine(archive_path, output_file, output_format="json", workers=None, chunksize=64):
+    """
+    Stream every suburb in the archive to `output_file`, sorted by suburb
+    name. Files are parsed across a process pool and written as soon as they
+    come back in order, so memory stays flat however many suburbs there are.
+    output_format is "json" (one compact array) or "ndjson" (one per line).
+    """
+    names = open_archive(archive_path).names()
 
-# List to hold combined data
-combined_data = []
+    count = 0
+    with open(output_file, "w", encoding="utf-8") as outfile, \
+            Pool(workers or os.cpu_count(), initializer=_init_worker, initargs=(archive_path,)) as pool:
+        if output_format == "json":
+            outfile.write("[")
+        for encoded in pool.imap(_encode, names, chunksize):
+            if encoded is None:
+                continue
+            if output_format == "json":
+                outfile.write("," if count else "")
+                outfile.write(encoded)
+            else:
+                outfile.write(encoded)
+                outfile.write("\n")
+            count += 1
+        if output_format == "json":
+            outfile.write("]")
 
-# Iterate through each file in the folder
-for filename in os.listdir(suburb_data_folder):
-    if filename.endswith('.json'):
-        file_path = os.path.join(suburb_data_folder, filename)
-        with open(file_path, 'r') as file:
-            data = json.load(file)
-            combined_data.append(data)
+    return count
 
-# Path to save the combined JSON file
-output_file = '/Users/matthewodea/development/frontend/data/combined_suburb_data.json'
 
-# Write the combined data to a new JSON file
-with open(output_file, 'w') as outfile:
-    json.dump(combined_data, outfile, indent=4)
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Combine scraped suburb files into one JSON or NDJSON file")
+    parser.add_argument("--archive", default="suburb_data",
+                        help="Directory of suburb files, or a packed *.sqlite archive")
+    parser.add_argument("--output", default="combined_suburb_data.json")
+    parser.add_argument("--format", choices=["json", "ndjson"], default="json")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--manifest", help="Scrape manifest; skip the rebuild when no suburb changed since the last one")
+    args = parser.parse_args()
 
-print(f"Combined JSON saved to {output_file}")
\ No newline at end of file
+    manifest = Manifest(args.manifest) if args.manifest else None
+    if manifest is not None and os.path.exists(args.output) and not manifest.pending("combine"):
+        print(f"No suburbs changed since the last combine; keeping {args.output}")
+    else:
+        count = combine(args.archive, args.output, args.format, args.workers)
+        print(f"Combined {count} suburbs into {args.output}")
+        if manifest is not None:
+            manifest.mark_processed("combine", list(manifest.entries))
+            manifest.save()
@@ -0,0 +1,82 @@
+import argparse
+import json
+from bisect import bisect_right
+
+import numpy as np
+
+
+def change_points(classes, start_year):
+    """
+    Encode each row of a (suburb x year) class matrix, whose first column is
+    `start_year`, as a flat [year, class, year, class, ...] list holding only
+    the years where the class changes. The first entry is always start_year.
+    """
+    changed = np.ones(classes.shape, dtype=bool)
+    changed[:, 1:] = classes[:, 1:] != classes[:, :-1]
+    encoded = []
+    for row, row_changed in zip(classes, changed):
+        columns = np.flatnonzero(row_changed)
+        encoded.append(np.column_stack([columns + start_year, row[columns]]).ravel().tolist())
+    return encoded
+
+
+def decode(points, years):
+    # Dense class list for `years` from one suburb's flat change points
+    starts, classes = points[0::2], points[1::2]
+    return [classes[max(bisect_right(starts, year) - 1, 0)] for year in years]
+
+
+class ColourTimeline:
+    """
+    Reads the change-point timeline written by mvar_to_colour.py --timeline.
+    Each suburb keeps only its change years, so a lookup is a binary search
+    over a handful of entries; years before the range take the first class
+    and years after it the last.
+    """
+
+    def __init__(self, table):
+        self.years = table["years"]
+        self.palette = table["palette"]
+        self.breakpoints = table["breakpoints"]
+        self.suburbs = table["suburbs"]
+        self.suburb_index = {name: i for i, name in enumerate(self.suburbs)}
+        # Split into (starts, classes) per suburb once, so bisect sees plain lists
+        self.scenarios = {
+            scenario: [(points[0::2], points[1::2]) for points in rows]
+            for scenario, rows in table["scenarios"].items()
+        }
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def class_at(self, suburb, year, scenario="medium"):
+        starts, classes = self.scenarios[scenario][self.suburb_index[suburb]]
+        return classes[max(bisect_right(starts, year) - 1, 0)]
+
+    def colour_at(self, suburb, year, scenario="medium"):
+        return self.palette[self.class_at(suburb, year, scenario)]
+
+    def year_classes(self, year, scenario="medium"):
+        # Class of every suburb in one year, in suburb order
+        return np.array([classes[max(bisect_right(starts, year) - 1, 0)]
+                         for starts, classes in self.scenarios[scenario]], dtype=np.uint8)
+
+    def year_colours(self, year, scenario="medium"):
+        # The map_colours.json shape for one year: suburb -> colour
+        palette = np.array(self.palette, dtype=object)
+        return dict(zip(self.suburbs, palette[self.year_classes(year, scenario)].tolist()))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Look up a suburb's colour class from the timeline file")
+    parser.add_argument("suburb")
+    parser.add_argument("year", type=int)
+    parser.add_argument("--timeline", default="map_timeline.json")
+    parser.add_argument("--scenario", default="medium")
+    args = parser.parse_args()
+
+    timeline = ColourTimeline.load(args.timeline)
+    print(timeline.class_at(args.suburb, args.year, args.scenario),
+          timeline.colour_at(args.suburb, args.year, args.scenario))
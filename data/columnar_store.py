@@ -0,0 +1,143 @@
+import json
+import os
+
+import numpy as np
+
+from jsonsplitter import HAZARDS, SCENARIOS, YEARS
+
+
+# Files making up a store directory. Arrays are plain .npy so they can be
+# memory-mapped; names and axis labels live in a small JSON sidecar
+META_FILE = "meta.json"
+BBOX_FILE = "bbox.npy"
+POPULATION_FILE = "population.npy"
+HAZARDS_FILE = "hazards.npy"
+
+# Population is stored as int64 with this marker where "c" is missing
+MISSING_POPULATION = -1
+
+
+def write_store(directory, records):
+    """
+    Write combined suburb records (the scraper's JSON objects) as a columnar
+    store: a suburb table, a (n, 4) float64 bbox array, an int64 population
+    vector and a float64 hazard tensor of shape (suburbs, scenarios, years,
+    hazards). Missing values are NaN (or MISSING_POPULATION).
+    """
+    os.makedirs(directory, exist_ok=True)
+
+    # Records are consumed one at a time, so only the arrays are held in memory
+    suburbs = []
+    bbox_rows = []
+    population = []
+    hazard_rows = []
+    for item in records:
+        suburbs.append(item.get("a"))
+
+        bbox = np.full(4, np.nan, dtype=np.float64)
+        if item.get("bbox") is not None:
+            bbox[:] = item["bbox"]
+        bbox_rows.append(bbox)
+
+        population.append(int(item["c"]) if "c" in item else MISSING_POPULATION)
+
+        values = np.full((len(SCENARIOS), len(YEARS), len(HAZARDS)), np.nan, dtype=np.float64)
+        for s, scen_key in enumerate(SCENARIOS):
+            for y, year in enumerate(YEARS):
+                prefix = f"{scen_key}_{year}_"
+                for h, hazard in enumerate(HAZARDS):
+                    value = item.get(f"{prefix}{hazard}")
+                    if value is not None:
+                        values[s, y, h] = value
+        hazard_rows.append(values)
+
+    n = len(suburbs)
+    bbox = np.array(bbox_rows, dtype=np.float64).reshape(n, 4)
+    population = np.array(population, dtype=np.int64)
+    hazards = np.array(hazard_rows, dtype=np.float64).reshape(n, len(SCENARIOS), len(YEARS), len(HAZARDS))
+
+    np.save(os.path.join(directory, BBOX_FILE), bbox)
+    np.save(os.path.join(directory, POPULATION_FILE), population)
+    np.save(os.path.join(directory, HAZARDS_FILE), hazards)
+
+    meta = {
+        "suburbs": suburbs,
+        "scenarios": list(SCENARIOS.values()),
+        "years": [int(year) for year in YEARS],
+        "hazards": HAZARDS,
+    }
+    with open(os.path.join(directory, META_FILE), "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+
+    return n
+
+
+class ColumnarStore:
+    """
+    Read side of a store written by write_store. Arrays are memory-mapped by
+    default, so slicing a scenario/year/hazard column only touches those pages.
+    """
+
+    def __init__(self, directory, mmap=True):
+        mmap_mode = "r" if mmap else None
+        with open(os.path.join(directory, META_FILE), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+
+        self.suburbs = meta["suburbs"]
+        self.scenarios = meta["scenarios"]
+        self.years = meta["years"]
+        self.hazard_names = meta["hazards"]
+
+        self.suburb_index = {name: i for i, name in enumerate(self.suburbs)}
+        self.scenario_index = {name: i for i, name in enumerate(self.scenarios)}
+        self.year_index = {int(year): i for i, year in enumerate(self.years)}
+        self.hazard_index = {name: i for i, name in enumerate(self.hazard_names)}
+
+        self.bbox = np.load(os.path.join(directory, BBOX_FILE), mmap_mode=mmap_mode)
+        self.population = np.load(os.path.join(directory, POPULATION_FILE), mmap_mode=mmap_mode)
+        self.hazards = np.load(os.path.join(directory, HAZARDS_FILE), mmap_mode=mmap_mode)
+
+    def __len__(self):
+        return len(self.suburbs)
+
+    def column(self, scenario, year, hazard="Total MVAR"):
+        # One value per suburb, as a view into the hazard tensor
+        return self.hazards[
+            :,
+            self.scenario_index[scenario],
+            self.year_index[int(year)],
+            self.hazard_index[hazard]
+        ]
+
+    def event(self, row, scenario, year):
+        # Rebuild the event dict convert_to_event_structure produces
+        bbox = self.bbox[row]
+        attributes = {
+            "a": self.suburbs[row],
+            "bbox": None if np.isnan(bbox).all() else bbox.tolist(),
+        }
+        if self.population[row] != MISSING_POPULATION:
+            # The scraped data holds population as a string
+            attributes["c"] = str(int(self.population[row]))
+
+        values = self.hazards[row, self.scenario_index[scenario], self.year_index[int(year)]]
+        for hazard, value in zip(self.hazard_names, values.tolist()):
+            if not np.isnan(value):
+                attributes[hazard] = int(value) if value.is_integer() else value
+
+        return {
+            "time_object": {
+                "timestamp": f"{year}-01-01T12:00:00Z",
+                "duration": "00:00:00",
+                "time-zone": "UTC"
+            },
+            "event_type": scenario,
+            "attributes": attributes
+        }
+
+    def iter_events(self):
+        # Same order as convert_to_event_structure: suburb, scenario, year
+        for row in range(len(self.suburbs)):
+            for scenario in self.scenarios:
+                for year in self.years:
+                    yield self.event(row, scenario, year)
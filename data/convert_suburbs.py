@@ -1,11 +1,38 @@
+import argparse
 import json
-from suburbs import suburbs
+import os
+
+from suburb_autocomplete import write_index
+from suburb_registry import load_registry
+
+# Command line options
+parser = argparse.ArgumentParser(description="Write the suburb list and search index for the frontend")
+parser.add_argument("--output", default="../public/suburbs.json")
+parser.add_argument("--index-dir", default="../public/suburb_index", help="Prefix-sharded autocomplete index")
+parser.add_argument("--store", default="structured_store", help="Columnar store used to rank matches by population")
+parser.add_argument("--no-index", action="store_true")
+args = parser.parse_args()
+
+suburbs = load_registry().names
 
 # Format suburbs as a list of objects
 suburb_data = [{"name": suburb} for suburb in suburbs]
 
 # Write to JSON file
-with open('../public/suburbs.json', 'w') as f:
+with open(args.output, 'w') as f:
     json.dump(suburb_data, f)
 
-print(f"Successfully converted {len(suburbs)} suburbs to JSON") 
\ No newline at end of file
+print(f"Successfully converted {len(suburbs)} suburbs to JSON")
+
+if not args.no_index:
+    # Rank by population where the store has it; everything else sorts by name after
+    ranks = {}
+    if os.path.isdir(args.store):
+        from columnar_store import MISSING_POPULATION, ColumnarStore
+
+        store = ColumnarStore(args.store)
+        ranks = {name: int(population) for name, population in zip(store.suburbs, store.population.tolist())
+                 if name is not None and population != MISSING_POPULATION}
+
+    count = write_index(args.index_dir, suburbs, ranks)
+    print(f"Wrote {count} autocomplete shards to '{args.index_dir}'")
@@ -0,0 +1,136 @@
+import json
+import re
+
+from timestamps import event_year, timestamp_year
+
+# Strings (possibly unterminated at the end of the buffer) and braces; matching
+# strings whole means braces inside suburb names never affect the depth count
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"?|[{}]')
+
+# Fast path: a complete object nested up to four levels deep, matched in one
+# regex call. Possessive quantifiers keep failed matches (objects cut off at
+# the end of the buffer) linear
+_STRING = r'"[^"\\]*+(?:\\.[^"\\]*+)*+"'
+_OBJECT_PATTERN = r'\{(?:[^{}"]++|' + _STRING + r')*+\}'
+for _ in range(3):
+    _OBJECT_PATTERN = r'\{(?:[^{}"]++|' + _STRING + '|' + _OBJECT_PATTERN + r')*+\}'
+_OBJECT = re.compile(_OBJECT_PATTERN)
+
+# Cheap lookups on the raw event text, used to skip events before decoding
+_EVENT_TYPE = re.compile(r'"event_type"\s*:\s*"([^"\\]*)"')
+_TIMESTAMP = re.compile(r'"timestamp"\s*:\s*"([^"\\]*)"')
+
+
+def _scan_object_end(buffer, start):
+    # Slow path for deeper nesting: count braces outside strings. Returns None
+    # if the object is not complete within the buffer
+    depth = 0
+    for match in _TOKEN.finditer(buffer, start):
+        token = match.group()
+        if token == "{":
+            depth += 1
+        elif token == "}":
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return None
+
+
+def _iter_raw_objects(f, chunk_size):
+    # Yield the source text of each top-level object in a JSON array
+    buffer = f.read(chunk_size)
+    pos = 0
+    while True:
+        start = buffer.find("{", pos)
+        if start == -1:
+            more = f.read(chunk_size)
+            if not more:
+                return
+            buffer, pos = more, 0
+            continue
+
+        while True:
+            match = _OBJECT.match(buffer, start)
+            end = match.end() if match else _scan_object_end(buffer, start)
+            if end is not None:
+                break
+
+            # Object runs past the buffer; keep it and read more
+            more = f.read(chunk_size)
+            if not more:
+                raise ValueError("Unexpected end of file inside a JSON object")
+            buffer = buffer[start:] + more
+            start = 0
+
+        yield buffer[start:end]
+        pos = end
+
+
+def _iter_raw_lines(f):
+    # NDJSON sidecar: one event per line
+    for line in f:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def _raw_year(raw):
+    # Year from the raw event text, or None if it can't be read without decoding
+    match = _TIMESTAMP.search(raw)
+    if match:
+        try:
+            return timestamp_year(match.group(1))
+        except ValueError:
+            pass
+    return None
+
+
+def _decoded_year(event):
+    try:
+        return event_year(event)
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _iter_raw(path, chunk_size):
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith(".ndjson"):
+            yield from _iter_raw_lines(f)
+        else:
+            yield from _iter_raw_objects(f, chunk_size)
+
+
+def iter_json_objects(path, chunk_size=1 << 20):
+    # Decode the objects of any JSON array (or NDJSON) file one at a time
+    for raw in _iter_raw(path, chunk_size):
+        yield json.loads(raw)
+
+
+def iter_events(path, event_types=None, years=None, chunk_size=1 << 20, with_year=False):
+    """
+    Yield events from structured_data.json (a JSON array) or an NDJSON sidecar
+    one at a time, holding at most one chunk plus one event in memory.
+
+    event_types and years are optional sets used to skip events from their raw
+    text before they are decoded; callers should still check decoded values.
+    With with_year=True, yields (year, event) pairs where year is decoded once
+    here (None if the event has no valid timestamp).
+    """
+    for raw in _iter_raw(path, chunk_size):
+        # Only reject when the raw text says so; anything unusual gets decoded
+        if event_types is not None:
+            match = _EVENT_TYPE.search(raw)
+            if match and match.group(1) not in event_types:
+                continue
+
+        year = _raw_year(raw) if years is not None or with_year else None
+        if years is not None and year is not None and year not in years:
+            continue
+
+        event = json.loads(raw)
+        if with_year:
+            if year is None:
+                year = _decoded_year(event)
+            yield year, event
+        else:
+            yield event
@@ -0,0 +1,75 @@
+import json
+import re
+
+from suburb_names import normalize_name, parse_suburb_name
+
+# Default colour for suburbs with no MVAR data, as in RiskMap.jsx
+DEFAULT_COLOUR = "rgba(255, 255, 255, 0.5)"
+
+_LOCA_FIELDS = ["name", "NAME", "suburb"]
+_SSC_FIELDS = ["SSC_NAME", "SSCNAME", "LOCALITY", "AREA_NAME", "SUBURB_NAME", "LOC_NAME", "LOCALITY_NAME"]
+
+# State key -> (GeoJSON file in public/, state abbreviation, name fields), mirroring stateData in RiskMap.jsx
+STATE_FILES = {
+    "nsw": ("nsw_suburbs.json", "NSW", ["nsw_loca_2"] + _LOCA_FIELDS),
+    "vic": ("victoria_suburbs.json", "Vic.", ["vic_loca_2"] + _LOCA_FIELDS),
+    "qld": ("queensland_suburbs.json", "Qld", ["qld_loca_2"] + _LOCA_FIELDS),
+    "wa": ("wa_suburbs.json", "WA", _SSC_FIELDS),
+    "sa": ("sa_suburbs.json", "SA", _SSC_FIELDS),
+    "tas": ("tasmania_suburbs.json", "Tas.", ["tas_loca_2"] + _LOCA_FIELDS),
+    "nt": ("nt_suburbs.json", "NT", _SSC_FIELDS),
+}
+
+# Values that look like IDs ("WA1234") rather than locality names
+_ID_VALUE = re.compile(r"^[A-Z]{1,3}\d+$")
+_NON_LETTERS = re.compile(r"[^a-zA-Z\s].*[^a-zA-Z\s].*[^a-zA-Z\s]")
+
+
+def load_geojson(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def feature_name(feature, fields):
+    """
+    Suburb name of a GeoJSON feature: the first of `fields` holding a string,
+    then (like getSuburbName) any property value that looks like a name.
+    """
+    props = feature.get("properties") or {}
+    for field in fields:
+        value = props.get(field)
+        if value and isinstance(value, str):
+            return value
+    for value in props.values():
+        if not value or not isinstance(value, str) or _ID_VALUE.match(value):
+            continue
+        if 3 <= len(value) <= 40 and not _NON_LETTERS.search(value):
+            return value
+    return None
+
+
+class ColourIndex:
+    """
+    Matches GeoJSON locality names to suburb names from the MVAR data, which
+    carry a state qualifier ("Abbotsford (NSW)", "Alison (Central Coast - NSW)").
+    Tries the exact name, then (base name, state), then an unqualified name.
+    """
+
+    def __init__(self, names):
+        self.exact = {}
+        self.by_state = {}
+        for name in names:
+            if name is None:
+                continue
+            base, _, state = parse_suburb_name(name)
+            self.exact.setdefault(normalize_name(name), name)
+            self.by_state.setdefault((normalize_name(base), state), name)
+
+    def match(self, name, state=None):
+        if not name:
+            return None
+        key = normalize_name(name)
+        if key in self.exact:
+            return self.exact[key]
+        base = normalize_name(parse_suburb_name(name)[0])
+        return self.by_state.get((base, state)) or self.by_state.get((base, None))
@@ -0,0 +1,146 @@
+import math
+
+import numpy as np
+
+
+def polygons(geometry):
+    # Polygon or MultiPolygon -> list of polygons, each a list of rings
+    if not geometry:
+        return []
+    if geometry["type"] == "Polygon":
+        return [geometry["coordinates"]]
+    if geometry["type"] == "MultiPolygon":
+        return geometry["coordinates"]
+    return []
+
+
+def to_mercator(ring):
+    """
+    Project lon/lat points to web mercator world coordinates in [0, 1], y
+    pointing south like tile rows.
+    """
+    points = np.asarray(ring, dtype=np.float64)[:, :2]
+    x = (points[:, 0] + 180.0) / 360.0
+    lat = np.radians(np.clip(points[:, 1], -85.05112878, 85.05112878))
+    y = (1.0 - np.log(np.tan(lat) + 1.0 / np.cos(lat)) / math.pi) / 2.0
+    return np.column_stack([x, y])
+
+
+def _segment_distances(points, start, end):
+    # Distance of every point to the segment points[start]-points[end]
+    a, b = points[start], points[end]
+    ab = b - a
+    length2 = ab @ ab
+    if length2 == 0:
+        return np.hypot(*(points - a).T)
+    t = np.clip((points - a) @ ab / length2, 0.0, 1.0)
+    return np.hypot(*(points - (a + t[:, None] * ab)).T)
+
+
+def simplify_line(points, tolerance):
+    """
+    Douglas-Peucker: keep mask over `points` (an (n, 2) array). Endpoints are
+    always kept; iterative so long rings don't hit the recursion limit.
+    """
+    n = len(points)
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        distances = _segment_distances(points[start:end + 1], 0, end - start)[1:-1]
+        i = int(np.argmax(distances))
+        if distances[i] > tolerance:
+            split = start + 1 + i
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return keep
+
+
+def drop_collinear(points):
+    # Keep mask dropping interior points that lie exactly on the line through their neighbours
+    keep = np.ones(len(points), dtype=bool)
+    if len(points) < 3:
+        return keep
+    before = points[1:-1] - points[:-2]
+    after = points[2:] - points[1:-1]
+    keep[1:-1] = before[:, 0] * after[:, 1] - before[:, 1] * after[:, 0] != 0
+    return keep
+
+
+def simplify_ring(ring, tolerance):
+    """
+    Simplify a closed ring (first point == last point). The ring is split at
+    the point furthest from its start so both halves have a real baseline.
+    Returns the closed simplified ring, or None if it collapses.
+    """
+    if len(ring) < 4:
+        return None
+    if tolerance <= 0:
+        return ring
+    far = int(np.argmax(np.hypot(*(ring - ring[0]).T)))
+    if far == 0:
+        return None
+    keep = np.zeros(len(ring), dtype=bool)
+    keep[:far + 1] |= simplify_line(ring[:far + 1], tolerance)
+    keep[far:] |= simplify_line(ring[far:], tolerance)
+    simplified = ring[keep]
+    return simplified if len(simplified) >= 4 else None
+
+
+def ring_area(ring):
+    # Signed shoelace area; positive is clockwise when y points down
+    x, y = ring[:, 0], ring[:, 1]
+    return 0.5 * float(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]))
+
+
+def dedupe(ring):
+    # Drop consecutive repeated points (e.g. after rounding)
+    if len(ring) < 2:
+        return ring
+    changed = np.any(ring[1:] != ring[:-1], axis=1)
+    return ring[np.concatenate([[True], changed])]
+
+
+def clip_ring(ring, xmin, ymin, xmax, ymax):
+    """
+    Sutherland-Hodgman clip of a closed ring to a rectangle. Returns the
+    closed clipped ring, or None if nothing is left. Clipped pieces of one
+    ring stay joined along the rectangle edge, which is fine for fills.
+    """
+    lo, hi = ring.min(axis=0), ring.max(axis=0)
+    if lo[0] >= xmin and lo[1] >= ymin and hi[0] <= xmax and hi[1] <= ymax:
+        return ring
+    if hi[0] < xmin or hi[1] < ymin or lo[0] > xmax or lo[1] > ymax:
+        return None
+
+    points = ring[:-1].tolist()
+    for axis, bound, inside_low in ((0, xmin, True), (0, xmax, False), (1, ymin, True), (1, ymax, False)):
+        if not points:
+            return None
+        clipped = []
+        previous = points[-1]
+        previous_in = previous[axis] >= bound if inside_low else previous[axis] <= bound
+        for point in points:
+            point_in = point[axis] >= bound if inside_low else point[axis] <= bound
+            if point_in != previous_in:
+                t = (bound - previous[axis]) / (point[axis] - previous[axis])
+                crossing = [previous[0] + t * (point[0] - previous[0]), previous[1] + t * (point[1] - previous[1])]
+                crossing[axis] = bound
+                clipped.append(crossing)
+            if point_in:
+                clipped.append(point)
+            previous, previous_in = point, point_in
+        points = clipped
+
+    if len(points) < 3:
+        return None
+    return np.array(points + [points[0]], dtype=np.float64)
+
+
+def quantize(ring, scale=1.0, offset=(0.0, 0.0)):
+    # Snap to an integer grid and drop the repeats that snapping creates
+    return dedupe(np.round((ring - np.asarray(offset)) * scale).astype(np.int64))
@@ -1,57 +1,111 @@
+import argparse
+import heapq
 import json
 from collections import defaultdict
-from datetime import datetime
 
-# Load data
-with open("structured_data.json", "r") as f:
-    events = json.load(f)
+import numpy as np
+
+from columnar_store import MISSING_POPULATION, ColumnarStore
+from event_stream import iter_events
+
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return value
+
+
+# Command line options; defaults reproduce the original top 100 output
+parser = argparse.ArgumentParser(description="Select the top N events by impact score (Total MVAR * c)")
+parser.add_argument("--input", default="structured_data.json")
+parser.add_argument("--store", help="Read a columnar store directory instead of the event JSON")
+parser.add_argument("--output", default="top_100_suburbs.json")
+parser.add_argument("-n", "--top-n", type=positive_int, default=100)
+parser.add_argument("--scenarios", nargs="+", default=["low", "medium", "high"])
+parser.add_argument("--years", nargs="+", type=int, default=[2025, 2050, 2100])
+args = parser.parse_args()
 
 # Define the event types and years of interest
-event_types = ["low_emissions_impact", "medium_emissions_impact", "high_emissions_impact"]
-target_years = [2025, 2050, 2100]
-
-# Group events by (event_type, year)
-grouped = defaultdict(list)
-for event in events:
-    try:
-        event_type = event["event_type"]
-        timestamp = event["time_object"]["timestamp"]
-        year = datetime.fromisoformat(timestamp.replace("Z", "+00:00")).year
-        if event_type in event_types and year in target_years:
-            grouped[(event_type, year)].append(event)
-    except (KeyError, ValueError):
-        continue
-
-# Collect top 100 full events by "impact_score" (MVAR * c)
-results = {}
-
-for event_type in event_types:
-    for year in target_years:
-        key = (event_type, year)
-        group_name = f"{event_type}_{year}"
-
-        events_group = grouped.get(key, [])
-        # Filter valid events with required attributes
-        valid_events = [
-            e for e in events_group
-            if "attributes" in e and
-               "a" in e["attributes"] and
-               "Total MVAR" in e["attributes"] and
-               "c" in e["attributes"]
-        ]
-
-        # Sort by impact score: Total MVAR * population (c)
-        sorted_group = sorted(
-            valid_events,
-            key=lambda e: float(e["attributes"]["Total MVAR"]) * int(e["attributes"]["c"]),
-            reverse=True
-        )
-
-        top_events = sorted_group[:100]
-        results[group_name] = top_events
+event_types = [f"{scenario}_emissions_impact" for scenario in args.scenarios]
+target_years = args.years
+
+
+def top_from_events():
+    # Stream events instead of loading the whole file, skipping other types/years early
+    events = iter_events(args.input, set(event_types), set(target_years), with_year=True)
+
+    # Keep a bounded min-heap of (impact score, -arrival order, event) per
+    # (event_type, year). The arrival order breaks ties the same way a stable
+    # descending sort would: earlier events win
+    heaps = defaultdict(list)
+    for order, (year, event) in enumerate(events):
+        try:
+            event_type = event["event_type"]
+            if event_type not in event_types or year not in target_years:
+                continue
+
+            # Skip events without the required attributes
+            attributes = event["attributes"]
+            if "a" not in attributes:
+                continue
+
+            # Impact score: Total MVAR * population (c)
+            score = float(attributes["Total MVAR"]) * int(attributes["c"])
+        except (KeyError, ValueError):
+            continue
+
+        heap = heaps[(event_type, year)]
+        if len(heap) < args.top_n:
+            heapq.heappush(heap, (score, -order, event))
+        elif (score, -order) > heap[0][:2]:
+            heapq.heapreplace(heap, (score, -order, event))
+
+    # Collect top N full events per group, highest impact first
+    results = {}
+    for event_type in event_types:
+        for year in target_years:
+            group_name = f"{event_type}_{year}"
+            top_events = sorted(heaps.get((event_type, year), []), key=lambda entry: entry[:2], reverse=True)
+            results[group_name] = [event for _, _, event in top_events]
+    return results
+
+
+def top_from_store():
+    store = ColumnarStore(args.store)
+    population = np.asarray(store.population)
+    has_name = np.array([name is not None for name in store.suburbs], dtype=bool)
+
+    results = {}
+    for event_type in event_types:
+        for year in target_years:
+            group_name = f"{event_type}_{year}"
+            if event_type not in store.scenario_index or year not in store.year_index:
+                results[group_name] = []
+                continue
+
+            # Impact score over the whole column at once; suburbs missing
+            # data are dropped just like the event path drops them
+            mvar = np.asarray(store.column(event_type, year))
+            valid = has_name & ~np.isnan(mvar) & (population != MISSING_POPULATION)
+            rows = np.flatnonzero(valid)
+            scores = mvar[rows] * population[rows]
+
+            if len(rows) > args.top_n:
+                # Keep every row tied with the N-th score so the row-order
+                # tie-break below picks the same ones as the event path
+                threshold = np.partition(-scores, args.top_n - 1)[args.top_n - 1]
+                keep = -scores <= threshold
+                rows, scores = rows[keep], scores[keep]
+            order = np.lexsort((rows, -scores))[:args.top_n]
+            results[group_name] = [store.event(row, event_type, year) for row in rows[order]]
+    return results
+
+
+results = top_from_store() if args.store else top_from_events()
 
 # Save to file
-with open("top_100_suburbs.json", "w") as out_file:
+with open(args.output, "w") as out_file:
     json.dump(results, out_file, indent=2)
 
-print("Top 100 events by impact score saved to 'top_100_suburbs.json'")
\ No newline at end of file
+print(f"Top {args.top_n} events by impact score saved to '{args.output}'")
@@ -1,28 +1,34 @@
+import argparse
 import json
+import os
+from collections import OrderedDict
+
+from suburb_names import UNKNOWN_STATE, letter_key, state_key
+
+SCENARIOS = {
+    "26": "low_emissions_impact",
+    "45": "medium_emissions_impact",
+    "85": "high_emissions_impact"
+}
+
+YEARS = ["2025", "2050", "2100"]
+
+HAZARDS = [
+    "Coastal Inundation",
+    "Extreme Wind",
+    "Forest Fire",
+    "Riverine Flooding",
+    "Surface Water Flooding",
+    "Tropical Cyclone Wind",
+    "Total MVAR"
+]
 
-def convert_to_event_structure(data):
-    scenarios = {
-        "26": "low_emissions_impact",
-        "45": "medium_emissions_impact",
-        "85": "high_emissions_impact"
-    }
-
-    years = ["2025", "2050", "2100"]
-    hazards = [
-        "Coastal Inundation",
-        "Extreme Wind",
-        "Forest Fire",
-        "Riverine Flooding",
-        "Surface Water Flooding",
-        "Tropical Cyclone Wind",
-        "Total MVAR"
-    ]
-
-    events = []
 
+def iter_event_structure(data):
+    # Lazily yield the events for each input item; data can be any iterable
     for item in data:
-        for scen_key, event_type in scenarios.items():
-            for year in years:
+        for scen_key, event_type in SCENARIOS.items():
+            for year in YEARS:
                 timestamp = f"{year}-01-01T12:00:00Z"
                 prefix = f"{scen_key}_{year}_"
                 attributes = {
@@ -33,7 +39,7 @@ def convert_to_event_structure(data):
                     attributes["c"] = item["c"]
 
                 # Add hazards without prefixes in the output keys
-                for hazard in hazards:
+                for hazard in HAZARDS:
                     full_key = f"{prefix}{hazard}"
                     if full_key in item:
                         attributes[hazard] = item[full_key]  # <-- use unprefixed key
@@ -48,21 +54,128 @@ def convert_to_event_structure(data):
                     "attributes": attributes
                 }
 
-                events.append(event)
+                yield event
+
+
+def convert_to_event_structure(data):
+    return list(iter_event_structure(data))
+
+
+def write_events(events, out_f, output_format="pretty", indent=4):
+    """
+    Write events to out_f one at a time. "pretty" matches
+    json.dump(events, out_f, indent=indent) byte for byte, "compact" drops the
+    whitespace and "ndjson" writes one event per line. Returns the count.
+    """
+    count = 0
+    if output_format == "ndjson":
+        for event in events:
+            out_f.write(json.dumps(event, separators=(",", ":")))
+            out_f.write("\n")
+            count += 1
+        return count
 
-    return events
+    pad = " " * indent
+    out_f.write("[")
+    for event in events:
+        if output_format == "pretty":
+            encoded = json.dumps(event, indent=indent).replace("\n", "\n" + pad)
+            out_f.write(("," if count else "") + "\n" + pad + encoded)
+        else:
+            out_f.write(("," if count else "") + json.dumps(event, separators=(",", ":")))
+        count += 1
+    if output_format == "pretty" and count:
+        out_f.write("\n")
+    out_f.write("]")
+    return count
+
+
+def write_shards(events, directory, max_open=64):
+    """
+    Split events into small JSON array files at
+    {directory}/{event_type}/{state}/{letter}.json, where state comes from the
+    suburb name's qualifier (e.g. "Abbotsford (NSW)" -> NSW, unqualified
+    names -> unknown) and letter is the first letter of the name. Most names
+    are unqualified, so unknown shards use the first two letters instead
+    ("Aarons Pass" -> unknown/aa).
+
+    Events are appended to per-shard NDJSON files through a small pool of
+    open handles, then each shard is rewritten as a compact array, so memory
+    stays bounded. Writes {directory}/manifest.json mapping each shard key to
+    its file, byte size and event count, and returns that mapping.
+    """
+    handles = OrderedDict()
+    counts = {}
+
+    def handle_for(key):
+        if key in handles:
+            handles.move_to_end(key)
+            return handles[key]
+        if len(handles) >= max_open:
+            handles.popitem(last=False)[1].close()
+        path = os.path.join(directory, f"{key}.ndjson")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Truncate on first use in this run, append when reopened
+        handles[key] = open(path, "a" if key in counts else "w", encoding="utf-8")
+        return handles[key]
+
+    for event in events:
+        name = event["attributes"].get("a") or ""
+        state = state_key(name)
+        letter = letter_key(name, 2 if state == UNKNOWN_STATE else 1)
+        key = f"{event['event_type']}/{state}/{letter}"
+        handle_for(key).write(json.dumps(event, separators=(",", ":")) + "\n")
+        counts[key] = counts.get(key, 0) + 1
+
+    for handle in handles.values():
+        handle.close()
+
+    manifest = {}
+    for key in sorted(counts):
+        ndjson_path = os.path.join(directory, f"{key}.ndjson")
+        json_path = os.path.join(directory, f"{key}.json")
+        with open(ndjson_path, "r", encoding="utf-8") as lines, open(json_path, "w", encoding="utf-8") as out_f:
+            out_f.write("[" + ",".join(line.rstrip("\n") for line in lines) + "]")
+        os.remove(ndjson_path)
+        manifest[key] = {
+            "file": f"{key}.json",
+            "bytes": os.path.getsize(json_path),
+            "events": counts[key],
+        }
+
+    with open(os.path.join(directory, "manifest.json"), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
 
 
 # Example usage:
 if __name__ == "__main__":
-    # Replace this with loading from a file if necessary
-    with open("combined_suburb_data.json", "r") as f:
-        input_data = json.load(f)
+    from columnar_store import write_store
+    from event_stream import iter_json_objects
+
+    parser = argparse.ArgumentParser(description="Convert combined suburb data into the pipeline's columnar store")
+    parser.add_argument("--input", default="combined_suburb_data.json", help="Combined JSON array or NDJSON")
+    parser.add_argument("--store", default="structured_store", help="Columnar store directory (canonical output)")
+    parser.add_argument("--events", default="structured_data.json", help="Event JSON export path")
+    parser.add_argument("--no-events", action="store_true", help="Skip the event JSON export")
+    parser.add_argument("--format", choices=["pretty", "compact", "ndjson"], default="pretty",
+                        help="Event export layout; compact and ndjson skip the indentation")
+    parser.add_argument("--shards", default="structured_shards",
+                        help="Directory for per scenario/state/letter event shards")
+    parser.add_argument("--no-shards", action="store_true", help="Skip the sharded export")
+    args = parser.parse_args()
+
+    # Input is streamed twice rather than held in memory
+    count = write_store(args.store, iter_json_objects(args.input))
+    print(f"Wrote {count} suburbs to columnar store '{args.store}'.")
 
-    structured_events = convert_to_event_structure(input_data)
+    if not args.no_events:
+        # Output result to a file, one suburb's events at a time
+        with open(args.events, "w") as out_f:
+            event_count = write_events(iter_event_structure(iter_json_objects(args.input)), out_f, args.format)
 
-    # Output result to a file or print
-    with open("structured_data.json", "w") as out_f:
-        json.dump(structured_events, out_f, indent=4)
+        print(f"Converted {count} input entries into {event_count} events.")
 
-    print(f"Converted {len(input_data)} input entries into {len(structured_events)} events.")
\ No newline at end of file
+    if not args.no_shards:
+        manifest = write_shards(iter_event_structure(iter_json_objects(args.input)), args.shards)
+        print(f"Wrote {len(manifest)} shards to '{args.shards}'.")
\ No newline at end of file
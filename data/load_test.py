@@ -0,0 +1,90 @@
+import argparse
+import http.client
+import json
+import random
+import threading
+import time
+from urllib.parse import quote
+
+
+def build_paths(host, port):
+    # Suburb names come from the service itself, via the top-K endpoint
+    connection = http.client.HTTPConnection(host, port)
+    connection.request("GET", "/top?year=2050&k=100")
+    response = connection.getresponse()
+    top = json.loads(response.read()) if response.status == 200 else []
+    connection.close()
+
+    paths = [f"/suburb/{quote(entry['suburb'])}" for entry in top]
+    paths += [f"/suburb/{quote(entry['suburb'])}?scenario=high&year=2100" for entry in top[:20]]
+    for year in range(2025, 2101, 5):
+        for scenario in ("low", "medium", "high"):
+            paths.append(f"/top?year={year}&scenario={scenario}&k=10")
+    paths += [f"/colours?year={year}" for year in (2025, 2050, 2100)]
+    return paths
+
+
+def worker(host, port, paths, deadline, gzip, latencies, errors, lock):
+    # One keep-alive connection per thread, like a browser tab
+    connection = http.client.HTTPConnection(host, port)
+    headers = {"Accept-Encoding": "gzip"} if gzip else {}
+    local_latencies = []
+    local_errors = 0
+    while time.monotonic() < deadline:
+        path = random.choice(paths)
+        started = time.perf_counter()
+        try:
+            connection.request("GET", path, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            if response.status >= 500:
+                local_errors += 1
+        except (OSError, http.client.HTTPException):
+            local_errors += 1
+            connection.close()
+            connection = http.client.HTTPConnection(host, port)
+            continue
+        local_latencies.append(time.perf_counter() - started)
+    connection.close()
+
+    with lock:
+        latencies.extend(local_latencies)
+        errors.append(local_errors)
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load test the query service")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10, help="Seconds to run")
+    parser.add_argument("--no-gzip", action="store_true")
+    args = parser.parse_args()
+
+    paths = build_paths(args.host, args.port)
+    latencies, errors, lock = [], [], threading.Lock()
+    deadline = time.monotonic() + args.duration
+
+    threads = [
+        threading.Thread(target=worker,
+                         args=(args.host, args.port, paths, deadline, not args.no_gzip, latencies, errors, lock))
+        for _ in range(args.threads)
+    ]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+
+    latencies.sort()
+    print(f"{len(latencies)} requests in {elapsed:.1f}s ({len(latencies) / elapsed:.0f} req/s), {sum(errors)} errors")
+    print(f"latency p50 {percentile(latencies, 0.5) * 1000:.2f}ms, "
+          f"p95 {percentile(latencies, 0.95) * 1000:.2f}ms, "
+          f"p99 {percentile(latencies, 0.99) * 1000:.2f}ms")
@@ -2,28 +2,32 @@ import json
 from collections import defaultdict
 from datetime import datetime
 import numpy as np
-from sklearn.linear_model import LinearRegression
-from sklearn.preprocessing import PolynomialFeatures
-from sklearn.pipeline import make_pipeline
 
-# Load medium-emission event data
+from polyfit import fit_quadratic_batch, predict_quadratic
+from topk import StreamingTopK
+from prediction_table import PredictionTable
+
+# Load event data for every emissions scenario
 with open("top_100_suburbs.json", "r") as f:
     data = json.load(f)
 
+# Scenarios to predict, as they prefix the group keys ("medium_emissions_impact_2050")
+scenarios = ["low", "medium", "high"]
+
 # Prediction years
 prediction_years = list(range(2025, 2151))
 
-# Data structures
-suburb_data = defaultdict(list)
+# Data structures, keyed by scenario then suburb
+suburb_data = {scenario: defaultdict(list) for scenario in scenarios}
 population_lookup = {}
-risk_factors_lookup = defaultdict(lambda: defaultdict(float))
+risk_factors_lookup = {scenario: defaultdict(lambda: defaultdict(float)) for scenario in scenarios}
 
 # Parse historical data
 for group_key, events in data.items():
     try:
         parts = group_key.split("_")
         scenario = parts[0]
-        if scenario != "medium":
+        if scenario not in suburb_data:
             continue
 
         year = int(parts[-1])
@@ -34,63 +38,85 @@ for group_key, events in data.items():
             pop = int(attr.get("c", 0))
 
             if mvar is not None:
-                suburb_data[suburb].append((year, mvar))
+                suburb_data[scenario][suburb].append((year, mvar))
                 population_lookup[suburb] = pop
 
                 # Track max risk factor per suburb
+                risk_factors = risk_factors_lookup[scenario][suburb]
                 for k, v in attr.items():
                     if k not in {"Total MVAR", "a", "c"} and isinstance(v, (int, float)):
-                        if v > risk_factors_lookup[suburb][k]:
-                            risk_factors_lookup[suburb][k] = v
+                        if v > risk_factors[k]:
+                            risk_factors[k] = v
     except Exception:
         continue
 
-# Store results by year
-predictions_by_year = defaultdict(list)
-
-for suburb, history in suburb_data.items():
-    if len(history) < 2:
-        continue
-
-    years = np.array([y for y, _ in history]).reshape(-1, 1)
-    mvars = np.array([m for _, m in history])
+# Number of suburbs to keep per year, and suburbs predicted per chunk
+top_n = 100
+chunk_size = 4096
 
-    model = make_pipeline(PolynomialFeatures(degree=2), LinearRegression())
-    model.fit(years, mvars)
+# Fit every (scenario, suburb) with enough history in one batched solve, so
+# scenarios sampled at the same years share their pseudo-inverse
+fitted = [
+    (scenario, suburb)
+    for scenario in scenarios
+    for suburb, history in suburb_data[scenario].items()
+    if len(history) >= 2
+]
+intercepts, coefs = fit_quadratic_batch([suburb_data[scenario][suburb] for scenario, suburb in fitted])
 
-    future_years = np.array(prediction_years).reshape(-1, 1)
-    predicted_mvars = np.clip(model.predict(future_years), 0, 1)
 
-    population = population_lookup[suburb]
-    risk_factors = risk_factors_lookup[suburb]
+def biggest_risk(scenario, suburb):
+    risk_factors = risk_factors_lookup[scenario][suburb]
     if risk_factors:
-        biggest_risk_type, biggest_risk_value = max(risk_factors.items(), key=lambda x: x[1])
-        biggest_risk_value = round(biggest_risk_value, 4)
-    else:
-        biggest_risk_type = "Unknown"
-        biggest_risk_value = None
-
-    for year, mvar in zip(prediction_years, predicted_mvars):
-        impact = mvar * population
-        predictions_by_year[year].append({
-            "suburb": suburb,
-            "mvar": round(float(mvar), 4),
-            "population": population,
-            "impact": round(impact, 2),
-            "biggest_risk": {
-                "type": biggest_risk_type,
-                "value": biggest_risk_value
-            }
-        })
-
-# Keep top 100 suburbs by impact per year
-output = {}
-for year in prediction_years:
-    sorted_suburbs = sorted(predictions_by_year[year], key=lambda x: x["impact"], reverse=True)
-    output[str(year)] = sorted_suburbs[:100]
-
-# Save to file
-with open("mvar_predictions_100.json", "w") as f:
-    json.dump(output, f, indent=2)
-
-print("Saved top 100 suburbs by year with biggest risk to 'mvar_predictions_100.json'")
\ No newline at end of file
+        return max(risk_factors.items(), key=lambda x: x[1])
+    return "Unknown", None
+
+
+def predict_scenario(scenario):
+    # Rows of the batched fit belonging to this scenario
+    rows = np.array([i for i, (s, _) in enumerate(fitted) if s == scenario], dtype=np.int64)
+    fitted_suburbs = [fitted[i][1] for i in rows]
+    populations = np.array([population_lookup[suburb] for suburb in fitted_suburbs], dtype=np.float64)
+
+    # Stream predictions into a dense float32 MVAR matrix and a bounded top-N
+    # per year instead of building a dict per suburb per year
+    mvar_matrix = np.empty((len(fitted_suburbs), len(prediction_years)), dtype=np.float32)
+    top_k = StreamingTopK(len(prediction_years), top_n)
+    for start in range(0, len(fitted_suburbs), chunk_size):
+        stop = min(start + chunk_size, len(fitted_suburbs))
+        chunk = rows[start:stop]
+        mvars = np.clip(predict_quadratic(intercepts[chunk], coefs[chunk], prediction_years), 0, 1)
+        mvar_matrix[start:stop] = mvars
+        # Score the stored float32 values, so the ranking matches the table's top_k and records()
+        impacts = mvar_matrix[start:stop].astype(np.float64) * populations[start:stop, None]
+        top_k.push(np.round(impacts, 2), np.arange(start, stop))
+
+    table = PredictionTable(
+        fitted_suburbs,
+        prediction_years,
+        mvar_matrix,
+        populations,
+        [biggest_risk(scenario, suburb) for suburb in fitted_suburbs]
+    )
+
+    # Build the top 100 suburbs by impact per year
+    top_rows, top_impacts = top_k.result()
+    return {
+        str(year): table.records(year, top_rows[j], top_impacts[j])
+        for j, year in enumerate(prediction_years)
+    }
+
+
+# Save one file per scenario; medium also goes to the file the frontend reads
+for scenario in scenarios:
+    output = predict_scenario(scenario)
+
+    filenames = [f"mvar_predictions_100_{scenario}.json"]
+    if scenario == "medium":
+        filenames.append("mvar_predictions_100.json")
+
+    for filename in filenames:
+        with open(filename, "w") as f:
+            json.dump(output, f, indent=2)
+
+    print(f"Saved top 100 {scenario} emissions suburbs by year with biggest risk to '{filenames[0]}'")
@@ -1,50 +1,272 @@
+import argparse
+import base64
 import json
-from datetime import datetime
+import os
+from bisect import bisect_right
+
+import numpy as np
+
+from colour_timeline import change_points
+from columnar_store import ColumnarStore
+from event_stream import iter_events
+from geo_states import DEFAULT_COLOUR, STATE_FILES, ColourIndex, feature_name, load_geojson
+
+# Colour classes: class i covers BREAKPOINTS[i - 1] <= MVAR < BREAKPOINTS[i]
+BREAKPOINTS = [0.2, 0.4, 0.6, 0.8]
+PALETTE = [
+    "rgba(255, 255, 255, 0.5)",
+    "rgba(255, 220, 220, 0.5)",
+    "rgba(255, 170, 170, 0.5)",
+    "rgba(255, 100, 100, 0.5)",
+    "rgba(180, 0, 0, 0.7)",
+]
+
+# Class index for suburbs with no value in a year
+MISSING_CLASS = 255
+
 
 # Define MVAR to color mapping
-def mvar_to_color(mvar):
-    if mvar < 0.2:
-        return "rgba(255, 255, 255, 0.5)"
-    elif mvar < 0.4:
-        return "rgba(255, 220, 220, 0.5)"
-    elif mvar < 0.6:
-        return "rgba(255, 170, 170, 0.5)"
-    elif mvar < 0.8:
-        return "rgba(255, 100, 100, 0.5)"
-    else:
-        return "rgba(180, 0, 0, 0.7)"
+def mvar_to_color(mvar, breakpoints=BREAKPOINTS, palette=PALETTE):
+    return palette[bisect_right(breakpoints, mvar)]
+
+
+def mvar_classes(mvars, breakpoints=BREAKPOINTS):
+    # Vectorised mvar_to_color: one uint8 palette index per value, missing MVAR counts as 0
+    return np.digitize(np.nan_to_num(np.asarray(mvars, dtype=np.float64), nan=0.0), breakpoints).astype(np.uint8)
+
+
+def float_list(text):
+    return [float(value) for value in text.split(",")]
+
+
+def year_range(text):
+    # "2025-2100" -> (2025, 2100)
+    start, _, end = text.partition("-")
+    return int(start), int(end or start)
+
+
+# Command line options
+parser = argparse.ArgumentParser(description="Map medium emissions MVAR to suburb colours by year")
+parser.add_argument("--input", default="structured_data.json")
+parser.add_argument("--store", help="Read a columnar store directory instead of the event JSON")
+parser.add_argument("--output", help="Output file (default map_colours.json, or map_classes.json for --format classes)")
+parser.add_argument("--format", choices=["colours", "classes"], default="colours",
+                    help="'colours': suburb -> rgba string per year; "
+                         "'classes': palette table plus a uint8 class per suburb and year")
+parser.add_argument("--breakpoints", type=float_list, default=BREAKPOINTS,
+                    help="Comma-separated ascending MVAR class boundaries")
+parser.add_argument("--palette", type=lambda text: text.split(";"), default=PALETTE,
+                    help="Semicolon-separated colours, one more than there are breakpoints")
+parser.add_argument("--timeline", help="Also write change-point encoded classes for every year and scenario "
+                                         "to this file (needs --store)")
+parser.add_argument("--timeline-years", type=year_range, default=(2025, 2100), help="Year range, e.g. 2025-2100")
+parser.add_argument("--feature-colours", help="Also write colours aligned to GeoJSON feature order into this directory")
+parser.add_argument("--feature-format", choices=["table", "index"], default="index",
+                    help="'table': {state}_{year}.json property objects per feature; "
+                         "'index': {state}_colours.json palette + per-year index arrays")
+parser.add_argument("--geojson-dir", default="../public", help="Directory holding the *_suburbs.json files")
+parser.add_argument("--states", default=",".join(STATE_FILES), help="Comma-separated state keys")
+args = parser.parse_args()
+
+if sorted(args.breakpoints) != args.breakpoints:
+    parser.error("--breakpoints must be ascending")
+if len(args.palette) != len(args.breakpoints) + 1:
+    parser.error(f"--palette needs {len(args.breakpoints) + 1} colours for {len(args.breakpoints)} breakpoints")
+if args.timeline and not args.store:
+    parser.error("--timeline needs --store")
+if args.output is None:
+    args.output = "map_classes.json" if args.format == "classes" else "map_colours.json"
 
 # Years we care about
 target_years = {"2025", "2050", "2100"}
 
-# Load structured data
-with open("structured_data.json", "r") as f:
-    records = json.load(f)
 
-# Process events
-result = {year: {} for year in target_years}
+def mvars_from_events():
+    # Stream structured data, skipping other scenarios/years before decoding
+    records = iter_events(
+        args.input,
+        {"medium_emissions_impact"},
+        {int(year) for year in target_years},
+        with_year=True
+    )
+
+    # Process events
+    values = {year: {} for year in target_years}
+
+    for year, record in records:
+        try:
+            if record.get("event_type") != "medium_emissions_impact":
+                continue
+
+            if str(year) not in target_years:
+                continue
+
+            attr = record["attributes"]
+            suburb = attr["a"]
+            mvar = attr.get("Total MVAR", 0)
+
+            values[str(year)][suburb] = float(mvar)
+        except Exception:
+            continue
+
+    return {year: (list(suburbs), np.fromiter(suburbs.values(), np.float64, len(suburbs)))
+            for year, suburbs in values.items()}
+
+
+def mvars_from_store():
+    store = ColumnarStore(args.store)
 
-for record in records:
-    try:
-        if record.get("event_type") != "medium_emissions_impact":
+    result = {}
+    for year in target_years:
+        if int(year) not in store.year_index:
+            result[year] = ([], np.zeros(0))
             continue
+        result[year] = (store.suburbs, np.asarray(store.column("medium_emissions_impact", year)))
+
+    return result
+
+
+def colours_from_classes(classes):
+    palette = np.array(args.palette, dtype=object)
+    return {year: dict(zip(suburbs, palette[year_classes].tolist())) for year, (suburbs, year_classes) in classes.items()}
+
+
+def classes_table(classes):
+    """
+    Palette-indexed output: the palette and breakpoints, every suburb name
+    once, then per year one uint8 class per suburb (MISSING_CLASS where a
+    suburb has no value), base64 encoded.
+    """
+    suburbs = sorted({suburb for names, _ in classes.values() for suburb in names if suburb is not None})
+    position = {suburb: i for i, suburb in enumerate(suburbs)}
+
+    encoded = {}
+    for year, (names, year_classes) in sorted(classes.items()):
+        row = np.full(len(suburbs), MISSING_CLASS, dtype=np.uint8)
+        known = np.array([name is not None for name in names], dtype=bool)
+        rows = np.fromiter((position[name] for name in names if name is not None), np.int64, int(known.sum()))
+        row[rows] = year_classes[known]
+        encoded[year] = base64.b64encode(row.tobytes()).decode("ascii")
+
+    return {
+        "breakpoints": args.breakpoints,
+        "palette": args.palette,
+        "missing": MISSING_CLASS,
+        "suburbs": suburbs,
+        "classes": encoded,
+    }
+
+
+def interpolate_years(matrix, anchor_years, years):
+    """
+    Linear interpolation of every row of `matrix` (suburb x anchor year) at
+    `years` in one pass. Years outside the anchors take the nearest anchor's
+    value, as analytics.interpolateRisks does. Suburbs missing some anchor
+    years (NaN) are interpolated over the years they do have.
+    """
+    anchors = np.asarray(anchor_years, dtype=np.float64)
+    years = np.asarray(years, dtype=np.float64)
+    if len(anchors) == 1:
+        return np.repeat(matrix, len(years), axis=1)
+    lower = np.clip(np.searchsorted(anchors, years, side="right") - 1, 0, len(anchors) - 2)
+    weight = np.clip((years - anchors[lower]) / (anchors[lower + 1] - anchors[lower]), 0.0, 1.0)
+    result = matrix[:, lower] * (1.0 - weight) + matrix[:, lower + 1] * weight
 
-        timestamp = record["time_object"]["timestamp"]
-        year = datetime.fromisoformat(timestamp.replace("Z", "+00:00")).year
-        if str(year) not in target_years:
+    for row in np.flatnonzero(np.isnan(matrix).any(axis=1)):
+        valid = ~np.isnan(matrix[row])
+        if valid.any():
+            result[row] = np.interp(years, anchors[valid], matrix[row, valid])
+    return result
+
+
+def timeline_table(store, years):
+    """
+    Classes for every year and scenario, interpolated from the store's
+    anchor years. Most suburbs stay in one class for decades, so each
+    suburb's sequence is stored as (start year, class) change points;
+    colour_timeline.ColourTimeline reads it back.
+    """
+    order = np.argsort(store.years)
+    anchors = np.asarray(store.years)[order]
+    total = store.hazard_index["Total MVAR"]
+    scenarios = {}
+    for s, scenario in enumerate(store.scenarios):
+        # (suburb x anchor year) MVAR matrix straight from the store
+        matrix = np.asarray(store.hazards[:, s, :, total], dtype=np.float64)[:, order]
+        classes = mvar_classes(interpolate_years(matrix, anchors, years), args.breakpoints)
+        scenarios[scenario.split("_")[0]] = change_points(classes, int(years[0]))
+
+    return {
+        "years": [int(years[0]), int(years[-1])],
+        "breakpoints": args.breakpoints,
+        "palette": args.palette,
+        "suburbs": store.suburbs,
+        "scenarios": scenarios,
+    }
+
+
+def feature_colours(result, path, state):
+    # Per feature in file order: (suburb name, {year: colour}), matched once by name
+    _, abbreviation, fields = STATE_FILES[state]
+    index = ColourIndex({suburb for year_colours in result.values() for suburb in year_colours})
+    features = []
+    for feature in load_geojson(path)["features"]:
+        name = feature_name(feature, fields)
+        suburb = index.match(name, abbreviation)
+        features.append((name, {year: result[year].get(suburb, DEFAULT_COLOUR) for year in result}))
+    return features
+
+
+def write_feature_colours(result, directory, output_format):
+    """
+    Colours in GeoJSON feature order, so the map indexes by feature id
+    instead of matching names and copying features on every year change.
+    """
+    os.makedirs(directory, exist_ok=True)
+    for state in args.states.split(","):
+        path = os.path.join(args.geojson_dir, STATE_FILES[state][0])
+        if not os.path.exists(path):
+            print(f"Skipping {state}: {path} not found")
             continue
+        features = feature_colours(result, path, state)
+
+        if output_format == "table":
+            # One array of feature properties per year: table[i] belongs to feature i
+            for year in sorted(result):
+                with open(os.path.join(directory, f"{state}_{year}.json"), "w", encoding="utf-8") as f:
+                    json.dump([{"suburbName": name, "suburbColor": colours[year]} for name, colours in features],
+                              f, separators=(",", ":"))
+        else:
+            # Distinct colours once, then one small integer per feature and year
+            palette = sorted({colour for _, colours in features for colour in colours.values()} | {DEFAULT_COLOUR})
+            position = {colour: i for i, colour in enumerate(palette)}
+            with open(os.path.join(directory, f"{state}_colours.json"), "w", encoding="utf-8") as f:
+                json.dump({
+                    "palette": palette,
+                    "names": [name for name, _ in features],
+                    "years": {year: [position[colours[year]] for _, colours in features] for year in sorted(result)},
+                }, f, separators=(",", ":"))
+        print(f"Saved {state} feature colours for {len(features)} features to '{directory}'")
 
-        attr = record["attributes"]
-        suburb = attr["a"]
-        mvar = attr.get("Total MVAR", 0)
-        color = mvar_to_color(float(mvar))
 
-        result[str(year)][suburb] = color
-    except Exception:
-        continue
+mvars = mvars_from_store() if args.store else mvars_from_events()
+classes = {year: (suburbs, mvar_classes(values, args.breakpoints)) for year, (suburbs, values) in mvars.items()}
+result = colours_from_classes(classes)
 
 # Write to output
-with open("map_colours.json", "w") as f:
-    json.dump(result, f, indent=2)
+with open(args.output, "w") as f:
+    if args.format == "classes":
+        json.dump(classes_table(classes), f, separators=(",", ":"))
+    else:
+        json.dump(result, f, indent=2)
+
+print(f"Saved suburb MVAR {args.format} by year to '{args.output}'")
+
+if args.feature_colours:
+    write_feature_colours(result, args.feature_colours, args.feature_format)
 
-print("Saved suburb MVAR colors by year to 'map_colours.json'")
\ No newline at end of file
+if args.timeline:
+    start, end = args.timeline_years
+    with open(args.timeline, "w") as f:
+        json.dump(timeline_table(ColumnarStore(args.store), np.arange(start, end + 1)), f, separators=(",", ":"))
+    print(f"Saved suburb MVAR classes for {start}-{end} to '{args.timeline}'")
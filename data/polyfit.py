@@ -0,0 +1,55 @@
+import numpy as np
+from collections import defaultdict
+
+
+def _features(years):
+    # Same columns as PolynomialFeatures(degree=2) minus the bias term,
+    # which LinearRegression handles through its intercept
+    x = np.asarray(years, dtype=np.float64)
+    return np.column_stack([x, x * x])
+
+
+def fit_quadratic_batch(histories):
+    """
+    Fit y = b0 + b1*x + b2*x^2 for every (year, value) history at once.
+
+    Histories that share the same sample years share a single pseudo-inverse,
+    so the cost is one small SVD per distinct set of years rather than one
+    estimator per suburb. Mirrors sklearn's LinearRegression: features and
+    targets are centred before the least-squares solve, which gives the same
+    minimum-norm answer when a history only has two points.
+
+    Returns (intercepts, coefs) aligned with the input order, with shapes
+    (n,) and (n, 2).
+    """
+    n = len(histories)
+    intercepts = np.zeros(n, dtype=np.float64)
+    coefs = np.zeros((n, 2), dtype=np.float64)
+
+    # Group histories by their (sorted) sample years
+    groups = defaultdict(list)
+    for i, history in enumerate(histories):
+        history = sorted(history)
+        years = tuple(y for y, _ in history)
+        groups[years].append((i, [v for _, v in history]))
+
+    for years, members in groups.items():
+        rows = np.array([i for i, _ in members])
+        values = np.array([v for _, v in members], dtype=np.float64)
+
+        features = _features(years)
+        feature_mean = features.mean(axis=0)
+        pinv = np.linalg.pinv(features - feature_mean)
+
+        value_mean = values.mean(axis=1)
+        group_coefs = (values - value_mean[:, None]) @ pinv.T
+
+        coefs[rows] = group_coefs
+        intercepts[rows] = value_mean - group_coefs @ feature_mean
+
+    return intercepts, coefs
+
+
+def predict_quadratic(intercepts, coefs, years):
+    # Returns an (n_histories, n_years) matrix of predictions
+    return intercepts[:, None] + coefs @ _features(years).T
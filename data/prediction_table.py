@@ -0,0 +1,86 @@
+import numpy as np
+
+
+class PredictionTable:
+    """
+    Columnar store for predicted MVAR values.
+
+    Holds a float32 (n_suburbs, n_years) MVAR matrix, a population vector and
+    interned suburb / risk type indexes. JSON-ready dicts are only built by
+    records(), at the output edge.
+    """
+
+    def __init__(self, suburbs, years, mvar, population, biggest_risks):
+        self.suburbs = list(suburbs)
+        self.suburb_index = {name: i for i, name in enumerate(self.suburbs)}
+        self.years = np.asarray(years, dtype=np.int32)
+        self.year_index = {int(year): j for j, year in enumerate(self.years)}
+        self.mvar = np.asarray(mvar, dtype=np.float32)
+        self.population = np.asarray(population, dtype=np.int64)
+
+        # Intern risk type names; each suburb stores a small index plus value
+        self.risk_types = []
+        risk_type_index = {}
+        self.risk_type = np.zeros(len(self.suburbs), dtype=np.uint8)
+        self.risk_value = np.full(len(self.suburbs), np.nan, dtype=np.float32)
+        for i, (risk_type, risk_value) in enumerate(biggest_risks):
+            if risk_type not in risk_type_index:
+                risk_type_index[risk_type] = len(self.risk_types)
+                self.risk_types.append(risk_type)
+            self.risk_type[i] = risk_type_index[risk_type]
+            if risk_value is not None:
+                self.risk_value[i] = risk_value
+
+    def __len__(self):
+        return len(self.suburbs)
+
+    def year(self, year):
+        # MVAR for every suburb in the given year
+        return self.mvar[:, self.year_index[int(year)]]
+
+    def suburb(self, name):
+        # MVAR for every year for the given suburb
+        return self.mvar[self.suburb_index[name]]
+
+    def impact(self, year):
+        return self.year(year).astype(np.float64) * self.population
+
+    def top_k(self, year, k):
+        # Row indexes of the k highest-impact suburbs in a year, best first.
+        # Ranks by impact rounded as records() writes it, ties by row, like
+        # the prediction files
+        impacts = np.round(self.impact(year), 2)
+        if k < len(impacts):
+            # Every row tied with the k-th best stays a candidate for the row tie-break
+            threshold = np.partition(-impacts, k - 1)[k - 1]
+            rows = np.flatnonzero(-impacts <= threshold)
+        else:
+            rows = np.arange(len(impacts))
+        return rows[np.lexsort((rows, -impacts[rows]))][:k]
+
+    def biggest_risk(self, row):
+        risk_value = float(self.risk_value[row])
+        if np.isnan(risk_value):
+            risk_value = None
+        elif risk_value.is_integer():
+            # Hazard scores of exactly 0 or 1 come through as JSON integers
+            risk_value = int(risk_value)
+        else:
+            risk_value = round(risk_value, 4)
+        return {"type": self.risk_types[self.risk_type[row]], "value": risk_value}
+
+    def records(self, year, rows, impacts=None):
+        # Materialise JSON rows for the given suburbs in one year
+        mvars = self.year(year)[rows]
+        if impacts is None:
+            impacts = np.round(mvars.astype(np.float64) * self.population[rows], 2)
+        return [
+            {
+                "suburb": self.suburbs[row],
+                "mvar": round(float(mvar), 4),
+                "population": int(self.population[row]),
+                "impact": float(impact),
+                "biggest_risk": self.biggest_risk(row)
+            }
+            for row, mvar, impact in zip(rows, mvars, impacts)
+        ]
@@ -0,0 +1,218 @@
+import argparse
+import gzip
+import hashlib
+import json
+import os
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from columnar_store import ColumnarStore
+from suburb_lookup import suburb_record
+from suburb_names import normalize_name, parse_suburb_name
+
+SCENARIOS = ["low", "medium", "high"]
+
+
+class NotFound(Exception):
+    pass
+
+
+class BadRequest(Exception):
+    pass
+
+
+def scenario_name(value):
+    # Accept "medium" or "medium_emissions_impact"
+    scenario = (value or "medium").split("_")[0]
+    if scenario not in SCENARIOS:
+        raise BadRequest(f"Unknown scenario '{value}'")
+    return scenario
+
+
+def int_param(params, name, default=None):
+    value = params.get(name, default)
+    if value is None:
+        raise BadRequest(f"Missing '{name}'")
+    try:
+        return int(value)
+    except ValueError:
+        raise BadRequest(f"'{name}' must be an integer")
+
+
+class Dataset:
+    """
+    Processed pipeline outputs, loaded once: the columnar store (memory-mapped)
+    for per-suburb data, the per-scenario prediction files for top-K queries
+    and map_colours.json for colours.
+    """
+
+    def __init__(self, store_dir="structured_store", predictions="mvar_predictions_100_{}.json",
+                 colours="map_colours.json"):
+        self.store = ColumnarStore(store_dir) if os.path.isdir(store_dir) else None
+
+        # Normalised full name -> row, and base name -> rows for loose matches
+        self.names = {}
+        self.bases = {}
+        if self.store is not None:
+            for row, name in enumerate(self.store.suburbs):
+                if name is None:
+                    continue
+                self.names[normalize_name(name)] = row
+                base = parse_suburb_name(name)[0]
+                self.bases.setdefault(normalize_name(base), []).append(row)
+
+        self.predictions = {}
+        for scenario in SCENARIOS:
+            path = predictions.format(scenario)
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    self.predictions[scenario] = json.load(f)
+
+        self.colours = {}
+        if os.path.exists(colours):
+            with open(colours, "r", encoding="utf-8") as f:
+                self.colours = json.load(f)
+
+    def suburb(self, name, scenario=None, year=None):
+        if self.store is None:
+            raise NotFound("No suburb store loaded")
+        rows = [self.names[normalize_name(name)]] if normalize_name(name) in self.names \
+            else self.bases.get(normalize_name(name), [])
+        if not rows:
+            raise NotFound(f"Unknown suburb '{name}'")
+
+        records = []
+        for row in rows:
+            record = suburb_record(self.store, row)
+            if scenario is not None:
+                event_type = f"{scenario_name(scenario)}_emissions_impact"
+                record["scenarios"] = {event_type: record["scenarios"].get(event_type, {})}
+            if year is not None:
+                record["scenarios"] = {
+                    key: {str(year): years[str(year)]} if str(year) in years else {}
+                    for key, years in record["scenarios"].items()
+                }
+            records.append(record)
+        return records
+
+    def top(self, year, scenario=None, k=10):
+        if k < 1:
+            raise BadRequest("'k' must be at least 1")
+        predictions = self.predictions.get(scenario_name(scenario))
+        if predictions is None:
+            raise NotFound(f"No predictions loaded for '{scenario_name(scenario)}'")
+        if str(year) not in predictions:
+            raise NotFound(f"No predictions for {year}")
+        # Slicing caps k at the stored list size
+        return predictions[str(year)][:k]
+
+    def colours_for(self, year):
+        if str(year) not in self.colours:
+            raise NotFound(f"No colours for {year}")
+        return self.colours[str(year)]
+
+
+def make_app(dataset, cache_size=1024):
+    """
+    Returns respond(path, query) -> (status, body bytes, etag). Responses are
+    cached per (path, query) in an LRU, body and ETag included.
+    """
+
+    def route(path, params):
+        parts = [unquote(part) for part in path.strip("/").split("/")]
+        if len(parts) == 2 and parts[0] == "suburb":
+            year = int_param(params, "year") if "year" in params else None
+            return dataset.suburb(parts[1], params.get("scenario"), year)
+        if parts == ["top"]:
+            return dataset.top(int_param(params, "year"), params.get("scenario"), int_param(params, "k", 10))
+        if parts == ["colours"]:
+            return dataset.colours_for(int_param(params, "year"))
+        raise NotFound(f"No route for '{path}'")
+
+    @lru_cache(maxsize=cache_size)
+    def respond(path, query):
+        params = {key: values[-1] for key, values in parse_qs(query).items()}
+        try:
+            status, payload = 200, route(path, params)
+        except NotFound as e:
+            status, payload = 404, {"error": str(e)}
+        except BadRequest as e:
+            status, payload = 400, {"error": str(e)}
+        body = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        return status, body, etag
+
+    return respond
+
+
+@lru_cache(maxsize=1024)
+def gzipped(body):
+    return gzip.compress(body, compresslevel=6)
+
+
+def make_handler(respond):
+    class QueryHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Headers and body go out in separate writes; don't let Nagle hold the body
+        disable_nagle_algorithm = True
+
+        def do_GET(self):
+            url = urlsplit(self.path)
+            status, body, etag = respond(url.path, url.query)
+
+            encoding = None
+            if "gzip" in self.headers.get("Accept-Encoding", "") and len(body) > 512:
+                encoding = "gzip"
+                # The compressed body is a different representation, so it gets its own tag
+                etag = etag[:-1] + '-gz"'
+
+            if status == 200 and etag in self.headers.get("If-None-Match", ""):
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "public, max-age=3600")
+                self.send_header("Vary", "Accept-Encoding")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            if encoding:
+                body = gzipped(body)
+
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("ETag", etag)
+            # Only successful lookups are cacheable
+            if status == 200:
+                self.send_header("Cache-Control", "public, max-age=3600")
+            self.send_header("Vary", "Accept-Encoding")
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return QueryHandler
+
+
+def make_server(dataset, host="127.0.0.1", port=8000, cache_size=1024):
+    return ThreadingHTTPServer((host, port), make_handler(make_app(dataset, cache_size)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Read-only HTTP queries over the processed dataset")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--store", default="structured_store")
+    parser.add_argument("--predictions", default="mvar_predictions_100_{}.json",
+                        help="Prediction file pattern, {} is the scenario")
+    parser.add_argument("--colours", default="map_colours.json")
+    parser.add_argument("--cache-size", type=int, default=1024, help="LRU response cache entries")
+    args = parser.parse_args()
+
+    server = make_server(Dataset(args.store, args.predictions, args.colours), args.host, args.port, args.cache_size)
+    print(f"Serving on http://{args.host}:{server.server_port}")
+    server.serve_forever()
@@ -0,0 +1,121 @@
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class Manifest:
+    """
+    Persistent record of every scraped suburb: URL, ETag / Last-Modified,
+    content hash and fetch times. The scraper uses it to skip fresh entries
+    and send conditional requests; downstream stages use it to find suburbs
+    whose content changed since they last processed them.
+
+    Saved as JSON with an atomic replace every `checkpoint_every` updates, so
+    a crashed run resumes from the last checkpoint. If `archive` is set it is
+    committed before every save, so the manifest never records a body the
+    archive hasn't durably stored.
+    """
+
+    def __init__(self, path, checkpoint_every=50, archive=None):
+        self.path = path
+        self.checkpoint_every = checkpoint_every
+        self.archive = archive
+        self.lock = threading.Lock()
+        self.unsaved = 0
+
+        self.entries = {}
+        self.stages = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            self.entries = data.get("entries", {})
+            self.stages = data.get("stages", {})
+
+    def get(self, suburb):
+        return self.entries.get(suburb)
+
+    def needs_fetch(self, suburb, archive, max_age=None):
+        # Missing from the archive, never fetched, or older than max_age seconds
+        entry = self.entries.get(suburb)
+        if entry is None or suburb not in archive:
+            return True
+        if max_age is None:
+            return False
+        return time.time() - entry["fetched_at"] > max_age
+
+    def conditional_headers(self, suburb, archive):
+        # Only ask for a 304 when we still have the body it would refer to
+        entry = self.entries.get(suburb)
+        headers = {}
+        if entry is None or suburb not in archive:
+            return headers
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def has_changed(self, suburb, digest):
+        entry = self.entries.get(suburb)
+        return entry is None or entry.get("hash") != digest
+
+    def record_fetch(self, suburb, url, headers, digest):
+        # Returns True if the content changed since the previous fetch
+        now = time.time()
+        with self.lock:
+            previous = self.entries.get(suburb)
+            changed = previous is None or previous.get("hash") != digest
+            self.entries[suburb] = {
+                "url": url,
+                "etag": headers.get("ETag"),
+                "last_modified": headers.get("Last-Modified"),
+                "hash": digest,
+                "fetched_at": now,
+                "changed_at": now if changed else previous.get("changed_at", now),
+            }
+            self._touch()
+        return changed
+
+    def record_not_modified(self, suburb):
+        with self.lock:
+            self.entries[suburb]["fetched_at"] = time.time()
+            self._touch()
+
+    def pending(self, stage, suburbs=None):
+        # Suburbs whose current content hash differs from what `stage` last processed
+        processed = self.stages.get(stage, {})
+        names = self.entries if suburbs is None else [s for s in suburbs if s in self.entries]
+        return [name for name in names if processed.get(name) != self.entries[name]["hash"]]
+
+    def mark_processed(self, stage, suburbs):
+        with self.lock:
+            processed = self.stages.setdefault(stage, {})
+            for suburb in suburbs:
+                if suburb in self.entries:
+                    processed[suburb] = self.entries[suburb]["hash"]
+            self._touch()
+
+    def _touch(self):
+        # Caller holds the lock
+        self.unsaved += 1
+        if self.unsaved >= self.checkpoint_every:
+            self._save()
+
+    def save(self):
+        with self.lock:
+            self._save()
+
+    def _save(self):
+        if self.archive is not None:
+            self.archive.commit()
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"entries": self.entries, "stages": self.stages}, f)
+        os.replace(tmp_path, self.path)
+        self.unsaved = 0
@@ -0,0 +1,194 @@
+import argparse
+import json
+import os
+from multiprocessing import Pool
+
+import numpy as np
+
+from geo_states import STATE_FILES, load_geojson
+from geometry import drop_collinear, polygons, simplify_line, simplify_ring
+
+# Metres per degree of latitude, for turning a tolerance in metres into degrees
+METRES_PER_DEGREE = 111320.0
+
+
+def _snapped(ring, precision):
+    # Ring as a list of integer (x, y) grid points at `precision` decimals, closed, no repeats
+    points = np.round(np.asarray(ring, dtype=np.float64)[:, :2] * 10 ** precision).astype(np.int64)
+    points = list(map(tuple, points.tolist()))
+    ring = [point for i, point in enumerate(points) if i == 0 or point != points[i - 1]]
+    if ring[0] != ring[-1]:
+        ring.append(ring[0])
+    return ring
+
+
+def _snapped_polygon(polygon, precision):
+    """
+    Snapped rings of one polygon. Rings that round to fewer than three
+    distinct points (slivers) are dropped, and the whole polygon with them
+    if it's the outer ring.
+    """
+    rings = []
+    for r, ring in enumerate(polygon):
+        snapped = _snapped(ring, precision) if len(ring) >= 4 else []
+        if len(snapped) < 4 or len(set(snapped)) < 3:
+            if r == 0:
+                return []
+            continue
+        rings.append(snapped)
+    return rings
+
+
+def find_junctions(rings):
+    """
+    Points where shared borders start or end. A point is a junction if it
+    is seen with two different pairs of neighbours, i.e. the rings through
+    it stop running together there.
+    """
+    first_seen = {}
+    junctions = set()
+    for ring in rings:
+        points = ring[:-1]
+        n = len(points)
+        for i, point in enumerate(points):
+            before, after = points[i - 1], points[(i + 1) % n]
+            pair = (before, after) if before <= after else (after, before)
+            if first_seen.setdefault(point, pair) != pair:
+                junctions.add(point)
+    return junctions
+
+
+def split_ring(ring, junctions):
+    """
+    Cut a closed ring into arcs that run between junctions. A ring with no
+    junctions is one closed arc, rotated to start at its smallest point so
+    every ring sharing it cuts it the same way.
+    """
+    points = ring[:-1]
+    cuts = [i for i, point in enumerate(points) if point in junctions]
+    if not cuts:
+        start = points.index(min(points))
+        rotated = points[start:] + points[:start]
+        return [rotated + [rotated[0]]]
+    rotated = points[cuts[0]:] + points[:cuts[0]]
+    cuts = [i - cuts[0] for i in cuts] + [len(points)]
+    rotated.append(rotated[0])
+    return [rotated[a:b + 1] for a, b in zip(cuts, cuts[1:])]
+
+
+class ArcSimplifier:
+    """
+    Simplifies each distinct arc once, whichever ring asks first, so both
+    sides of a shared border get exactly the same points and no gaps or
+    overlaps open between neighbours.
+    """
+
+    def __init__(self, tolerance):
+        self.tolerance = tolerance
+        self.cache = {}
+
+    def simplify(self, arc):
+        backwards = arc[::-1]
+        forwards = arc <= backwards
+        key = tuple(arc if forwards else backwards)
+        if key not in self.cache:
+            points = np.array(key, dtype=np.int64)
+            points = points[drop_collinear(points)]
+            if key[0] == key[-1]:
+                simplified = simplify_ring(points, self.tolerance)
+            else:
+                simplified = points[simplify_line(points, self.tolerance)]
+            self.cache[key] = None if simplified is None else list(map(tuple, simplified.tolist()))
+        simplified = self.cache[key]
+        if simplified is None or forwards:
+            return simplified
+        return simplified[::-1]
+
+
+def simplify_collection(collection, tolerance, precision=5):
+    """
+    Topology-preserving simplification of a FeatureCollection of (Multi)
+    Polygons. Coordinates are rounded to `precision` decimals, collinear
+    points dropped and every shared border simplified once with
+    Douglas-Peucker at `tolerance` (in degrees). Rings that collapse are
+    dropped, along with polygons whose outer ring collapses. Returns the
+    new collection and (vertices before, vertices after).
+    """
+    features = collection["features"]
+    before = sum(len(ring) for feature in features for polygon in polygons(feature.get("geometry"))
+                 for ring in polygon)
+    snapped = [[_snapped_polygon(polygon, precision) for polygon in polygons(feature.get("geometry"))]
+               for feature in features]
+    junctions = find_junctions(ring for feature in snapped for polygon in feature for ring in polygon)
+
+    arcs = ArcSimplifier(tolerance * 10 ** precision)
+    scale = 10.0 ** -precision
+    after = 0
+    output = []
+    for feature, feature_polygons in zip(features, snapped):
+        new_polygons = []
+        for polygon in feature_polygons:
+            rings = []
+            for r, ring in enumerate(polygon):
+                points = []
+                for arc in split_ring(ring, junctions):
+                    simplified = arcs.simplify(arc)
+                    if simplified is None:
+                        points = []
+                        break
+                    points.extend(simplified if not points else simplified[1:])
+                if len(points) < 4:
+                    if r == 0:
+                        break
+                    continue
+                after += len(points)
+                rings.append([[round(x * scale, precision), round(y * scale, precision)] for x, y in points])
+            if rings:
+                new_polygons.append(rings)
+
+        geometry = None
+        if len(new_polygons) == 1:
+            geometry = {"type": "Polygon", "coordinates": new_polygons[0]}
+        elif new_polygons:
+            geometry = {"type": "MultiPolygon", "coordinates": new_polygons}
+        output.append({**feature, "geometry": geometry})
+
+    return {**collection, "features": output}, (before, after)
+
+
+def simplify_file(job):
+    input_path, output_path, tolerance, precision = job
+    collection, (before, after) = simplify_collection(load_geojson(input_path), tolerance, precision)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(collection, f, separators=(",", ":"))
+    return input_path, output_path, before, after
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Simplify the state suburb GeoJSON files, keeping shared borders")
+    parser.add_argument("--geojson-dir", default="../public", help="Directory holding the *_suburbs.json files")
+    parser.add_argument("--states", default=",".join(STATE_FILES), help="Comma-separated state keys")
+    parser.add_argument("--output", default="simplified_geojson")
+    parser.add_argument("--tolerance", type=float, default=10.0, help="Simplification tolerance in metres")
+    parser.add_argument("--precision", type=int, default=5, help="Decimal places kept (5 is about 1 m)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    os.makedirs(args.output, exist_ok=True)
+    jobs = []
+    for state in args.states.split(","):
+        filename = STATE_FILES[state][0]
+        path = os.path.join(args.geojson_dir, filename)
+        if not os.path.exists(path):
+            print(f"Skipping {state}: {path} not found")
+            continue
+        jobs.append((path, os.path.join(args.output, filename), args.tolerance / METRES_PER_DEGREE, args.precision))
+
+    # States are independent, so each gets its own process
+    with Pool(min(len(jobs), args.workers or os.cpu_count()) or 1) as pool:
+        for input_path, output_path, before, after in pool.imap_unordered(simplify_file, jobs):
+            size_before, size_after = os.path.getsize(input_path), os.path.getsize(output_path)
+            print(f"{os.path.basename(input_path)}: "
+                  f"{size_before / 1e6:.1f} MB -> {size_after / 1e6:.1f} MB "
+                  f"({100 * (1 - size_after / size_before):.0f}% smaller), "
+                  f"{before} -> {after} vertices ({100 * (1 - after / max(before, 1)):.0f}% fewer)")
@@ -0,0 +1,137 @@
+import os
+import sqlite3
+import threading
+
+
+class DirectoryArchive:
+    """The original layout: one small JSON file per suburb in a directory."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, name):
+        return os.path.join(self.directory, f"{name.replace('/', '-')}.json")
+
+    def put(self, name, text):
+        with open(self.path(name), "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def get(self, name):
+        try:
+            with open(self.path(name), "r", encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def __contains__(self, name):
+        return os.path.exists(self.path(name))
+
+    def names(self):
+        # Filenames can't hold "/", so these are the "-" substituted keys
+        return sorted(filename[:-len(".json")] for filename in os.listdir(self.directory)
+                      if filename.endswith(".json"))
+
+    def __len__(self):
+        return len(self.names())
+
+    def iter_records(self):
+        for name in self.names():
+            yield name, self.get(name)
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class SQLiteArchive:
+    """
+    All suburbs packed into a single SQLite file, one row per suburb. The table
+    is clustered on the name, so lookups are a B-tree probe and a full scan
+    reads the file sequentially in name order.
+    """
+
+    def __init__(self, path, commit_every=500):
+        self.path = path
+        self.commit_every = commit_every
+        self.uncommitted = 0
+        self.lock = threading.Lock()
+        # Shared between fetch threads; every access goes through self.lock
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS suburbs (name TEXT PRIMARY KEY, body TEXT NOT NULL) WITHOUT ROWID"
+        )
+        self.connection.commit()
+
+    def put(self, name, text):
+        with self.lock:
+            self.connection.execute("INSERT OR REPLACE INTO suburbs (name, body) VALUES (?, ?)", (name, text))
+            self.uncommitted += 1
+            if self.uncommitted >= self.commit_every:
+                self.connection.commit()
+                self.uncommitted = 0
+
+    def get(self, name):
+        with self.lock:
+            row = self.connection.execute("SELECT body FROM suburbs WHERE name = ?", (name,)).fetchone()
+        return row[0] if row else None
+
+    def __contains__(self, name):
+        with self.lock:
+            return self.connection.execute("SELECT 1 FROM suburbs WHERE name = ?", (name,)).fetchone() is not None
+
+    def names(self):
+        with self.lock:
+            return [row[0] for row in self.connection.execute("SELECT name FROM suburbs ORDER BY name")]
+
+    def __len__(self):
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM suburbs").fetchone()[0]
+
+    def iter_records(self, batch_size=1000):
+        # Keyset pagination so the lock isn't held while the caller works
+        last = None
+        while True:
+            with self.lock:
+                if last is None:
+                    rows = self.connection.execute(
+                        "SELECT name, body FROM suburbs ORDER BY name LIMIT ?", (batch_size,)
+                    ).fetchall()
+                else:
+                    rows = self.connection.execute(
+                        "SELECT name, body FROM suburbs WHERE name > ? ORDER BY name LIMIT ?", (last, batch_size)
+                    ).fetchall()
+            if not rows:
+                return
+            yield from rows
+            last = rows[-1][0]
+
+    def commit(self):
+        with self.lock:
+            self.connection.commit()
+            self.uncommitted = 0
+
+    def close(self):
+        self.commit()
+        self.connection.close()
+
+
+def open_archive(path):
+    # *.sqlite / *.db files are packed archives; anything else is a directory of files
+    if path.endswith((".sqlite", ".db")):
+        return SQLiteArchive(path)
+    return DirectoryArchive(path)
+
+
+def import_directory(directory, archive):
+    # Pack an existing suburb_data/ directory into another archive
+    source = DirectoryArchive(directory)
+    count = 0
+    for name, text in source.iter_records():
+        archive.put(name, text)
+        count += 1
+    archive.commit()
+    return count
@@ -0,0 +1,110 @@
+import json
+import os
+import re
+from functools import lru_cache
+
+from suburb_names import normalize_name, parse_suburb_name
+
+INDEX_FILE = "index.json"
+PREFIX_LENGTH = 2
+
+# Word boundaries inside a base name: "St Albans", "Hawks Nest-Tea Gardens"
+_WORDS = re.compile(r"[\s\-]+")
+
+
+def prefix_key(text, length=PREFIX_LENGTH):
+    # Shard key / file stem for a normalised query or word: first characters, file-safe
+    return "".join(ch if "a" <= ch <= "z" or "0" <= ch <= "9" else "_" for ch in text[:length])
+
+
+def search_terms(name):
+    """
+    Normalised strings a query can be a prefix of: the full name and each
+    word of its base name, so "alb" finds "St Albans (Vic.)".
+    """
+    base = normalize_name(parse_suburb_name(name)[0])
+    words = [word for word in _WORDS.split(base) if word]
+    return [normalize_name(name)] + [word for word in words if word != base]
+
+
+def matches(name, query):
+    query = normalize_name(query)
+    return any(term.startswith(query) for term in search_terms(name))
+
+
+def build_index(names, ranks=None, top_n=10):
+    """
+    Group names into shards by the first PREFIX_LENGTH characters of each
+    search term, every shard ordered by rank (higher first, e.g.
+    population), then name. Also returns the top `top_n` names per first
+    character, for one-character queries.
+    """
+    ranks = ranks or {}
+    ordered = sorted(names, key=lambda name: (-ranks.get(name, -1), name))
+    shards = {}
+    top = {}
+    for name in ordered:
+        keys = {prefix_key(term) for term in search_terms(name)}
+        for key in keys:
+            shards.setdefault(key, []).append(name)
+        for first in {key[:1] for key in keys}:
+            if len(top.setdefault(first, [])) < top_n:
+                top[first].append(name)
+    return shards, top
+
+
+def write_index(directory, names, ranks=None, top_n=10):
+    # One small JSON array per prefix, plus index.json listing shard sizes and the one-letter tops
+    shards, top = build_index(names, ranks, top_n)
+    os.makedirs(directory, exist_ok=True)
+    for key, shard in shards.items():
+        with open(os.path.join(directory, f"{key}.json"), "w", encoding="utf-8") as f:
+            json.dump(shard, f, separators=(",", ":"))
+
+    index = {
+        "prefix_length": PREFIX_LENGTH,
+        "shards": {key: len(shard) for key, shard in sorted(shards.items())},
+        "top": top,
+    }
+    with open(os.path.join(directory, INDEX_FILE), "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+    return len(shards)
+
+
+class AutocompleteIndex:
+    """
+    Queries a directory written by write_index the way the search box
+    does: fetch the shard for the query's prefix, then filter it locally.
+    Shards are loaded on demand and kept.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, INDEX_FILE), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        self.prefix_length = index["prefix_length"]
+        self.shard_sizes = index["shards"]
+        self.top = index["top"]
+        self.shard = lru_cache(maxsize=None)(self._load_shard)
+
+    def _load_shard(self, key):
+        if key not in self.shard_sizes:
+            return []
+        with open(os.path.join(self.directory, f"{key}.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def query(self, text, limit=10):
+        # Best-ranked names with a word (or the whole name) starting with `text`
+        query = normalize_name(text)
+        if not query:
+            return []
+        if len(query) < self.prefix_length:
+            return self.top.get(prefix_key(query), [])[:limit]
+
+        results = []
+        for name in self.shard(prefix_key(query, self.prefix_length)):
+            if matches(name, query):
+                results.append(name)
+                if len(results) == limit:
+                    break
+        return results
@@ -0,0 +1,113 @@
+import argparse
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from columnar_store import MISSING_POPULATION, ColumnarStore
+from suburb_names import normalize_name, parse_suburb_name
+
+INDEX_FILE = "index.json"
+
+
+def lookup_path(name, levels=2, width=1):
+    """
+    Relative path of a suburb's record. The directory comes from a hash of the
+    normalised name, so any client can compute it without listing anything
+    and no bucket grows large: levels=2, width=1 gives 256 buckets.
+    """
+    digest = hashlib.md5(normalize_name(name).encode("utf-8")).hexdigest()
+    buckets = [digest[i * width:(i + 1) * width] for i in range(levels)]
+    return "/".join(buckets + [f"{digest}.json"])
+
+
+def lookup_key(base, state=None):
+    # Index key for a (suburb, state) pair; state is the abbreviation or None
+    return f"{normalize_name(base)}|{normalize_name(state.rstrip('.')) if state else ''}"
+
+
+def suburb_record(store, row):
+    # Every scenario, year and hazard for one suburb, without the event wrapping
+    bbox = store.bbox[row]
+    record = {
+        "a": store.suburbs[row],
+        "bbox": None if np.isnan(bbox).all() else bbox.tolist(),
+    }
+    if store.population[row] != MISSING_POPULATION:
+        record["c"] = int(store.population[row])
+
+    scenarios = {}
+    values = store.hazards[row].tolist()
+    for s, scenario in enumerate(store.scenarios):
+        years = {}
+        for y, year in enumerate(store.years):
+            years[str(year)] = {
+                hazard: int(value) if value.is_integer() else value
+                for hazard, value in zip(store.hazard_names, values[s][y])
+                if not np.isnan(value)
+            }
+        scenarios[scenario] = years
+    record["scenarios"] = scenarios
+    return record
+
+
+def write_lookup(store, directory, levels=2, width=1):
+    """
+    Write one compact record per suburb under a hash-bucketed tree, plus an
+    index.json with:
+      "names":  normalised full name -> record path
+      "lookup": "normalised base|state" -> list of full names, for resolving a
+                suburb + state pair (several councils can share one)
+      "bases":  normalised base name -> list of full names in any state
+    """
+    names = {}
+    lookup = {}
+    bases = {}
+    for row, name in enumerate(store.suburbs):
+        if name is None:
+            continue
+        path = lookup_path(name, levels, width)
+        full_path = os.path.join(directory, path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "w", encoding="utf-8") as f:
+            json.dump(suburb_record(store, row), f, separators=(",", ":"))
+
+        base, _, state = parse_suburb_name(name)
+        names[normalize_name(name)] = path
+        lookup.setdefault(lookup_key(base, state), []).append(name)
+        bases.setdefault(normalize_name(base), []).append(name)
+
+    index = {"levels": levels, "width": width, "names": names, "lookup": lookup, "bases": bases}
+    with open(os.path.join(directory, INDEX_FILE), "w", encoding="utf-8") as f:
+        json.dump(index, f, separators=(",", ":"))
+    return len(names)
+
+
+def resolve(index, suburb, state=None):
+    """
+    Record paths for a suburb, optionally narrowed by state abbreviation.
+    Exact full names ("Abbotsford (NSW)") resolve directly; otherwise the
+    (base name, state) pair is looked up, or without a state every suburb
+    with that base name. Returns a list, empty if unknown.
+    """
+    path = index["names"].get(normalize_name(suburb))
+    if path is not None:
+        return [path]
+    if state is None:
+        names = index["bases"].get(normalize_name(suburb), [])
+    else:
+        names = index["lookup"].get(lookup_key(suburb, state), [])
+    return [index["names"][normalize_name(name)] for name in names]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write per-suburb lookup records from the columnar store")
+    parser.add_argument("--store", default="structured_store")
+    parser.add_argument("--output", default="suburb_lookup")
+    parser.add_argument("--levels", type=int, default=2, help="Directory levels in the hashed tree")
+    parser.add_argument("--width", type=int, default=1, help="Hex characters per directory level")
+    args = parser.parse_args()
+
+    count = write_lookup(ColumnarStore(args.store), args.output, args.levels, args.width)
+    print(f"Wrote {count} suburb records to '{args.output}'")
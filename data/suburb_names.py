@@ -0,0 +1,47 @@
+import re
+import unicodedata
+
+# Trailing "(...)" qualifier, e.g. "Abbotsford (NSW)" or "Alison (Central Coast - NSW)"
+_QUALIFIER = re.compile(r"^(.*?)\s*\(([^()]*)\)\s*$")
+
+# State abbreviations as they appear in suburb qualifiers
+STATES = ["NSW", "Vic.", "Qld", "SA", "WA", "Tas.", "NT", "ACT", "OT"]
+
+# Shard / file key used for suburbs whose name doesn't say which state they're in
+UNKNOWN_STATE = "unknown"
+
+
+def parse_suburb_name(name):
+    """
+    Split a suburb name into (base name, qualifier, state abbreviation).
+
+    "Abbotsford (NSW)" -> ("Abbotsford", "NSW", "NSW")
+    "Alison (Central Coast - NSW)" -> ("Alison", "Central Coast - NSW", "NSW")
+    "Aarons Pass" -> ("Aarons Pass", None, None)
+    """
+    match = _QUALIFIER.match(name)
+    if not match:
+        return name, None, None
+
+    base, qualifier = match.groups()
+    state = qualifier.rsplit(" - ", 1)[-1].strip()
+    return base, qualifier, state if state in STATES else None
+
+
+def state_key(name):
+    # File-safe state key: "Vic." -> "Vic", unqualified names -> "unknown"
+    state = parse_suburb_name(name)[2]
+    return state.rstrip(".") if state else UNKNOWN_STATE
+
+
+def letter_key(name, length=1):
+    # Lower-case first `length` letters of the base name, "_" for anything else
+    base = parse_suburb_name(name)[0].strip().lower()[:length].ljust(length, "_")
+    return "".join(ch if "a" <= ch <= "z" else "_" for ch in base)
+
+
+def normalize_name(name):
+    # Case, diacritic and whitespace insensitive form used for lookups
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.casefold().split())
@@ -0,0 +1,81 @@
+import os
+from functools import lru_cache
+
+from suburb_names import normalize_name, parse_suburb_name
+
+# One suburb name per line, in the original list order
+REGISTRY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "suburbs.txt")
+
+
+def _state_key(state):
+    # "Vic." and "vic" are the same state
+    return normalize_name(state).rstrip(".") if state else None
+
+
+class SuburbRegistry:
+    """
+    The known suburb names with hashed lookups. Exact lookups use a dict
+    built on load; the normalised and parsed views are only built the first
+    time they're asked for.
+    """
+
+    def __init__(self, names):
+        self.names = list(names)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self._parsed = None
+        self._normalized = None
+        self._bases = None
+
+    @classmethod
+    def load(cls, path=REGISTRY_FILE):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls(line.rstrip("\n") for line in f if line.strip())
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        return iter(self.names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def position(self, name):
+        # Index of an exact name in the registry order, or None
+        return self.index.get(name)
+
+    def parsed(self, name):
+        # (base name, qualifier, state) for a registered name, e.g. ("Alison", "Central Coast - NSW", "NSW")
+        if self._parsed is None:
+            self._parsed = [parse_suburb_name(name) for name in self.names]
+        return self._parsed[self.index[name]]
+
+    def _build_normalized(self):
+        self._normalized = {}
+        self._bases = {}
+        for name in self.names:
+            base, _, state = self.parsed(name)
+            self._normalized.setdefault(normalize_name(name), []).append(name)
+            self._bases.setdefault(normalize_name(base), []).append((_state_key(state), name))
+
+    def find(self, name, state=None):
+        """
+        Registered names matching `name` regardless of case, diacritics and
+        spacing. A full name ("abbotsford (nsw)") matches directly; otherwise
+        every suburb with that base name is returned, narrowed to `state`
+        (an abbreviation such as "NSW" or "Vic") when given.
+        """
+        if self._normalized is None:
+            self._build_normalized()
+        key = normalize_name(name)
+        if key in self._normalized:
+            return list(self._normalized[key])
+        state = _state_key(state)
+        return [full_name for full_state, full_name in self._bases.get(key, [])
+                if state is None or full_state == state]
+
+
+@lru_cache(maxsize=None)
+def load_registry(path=REGISTRY_FILE):
+    # Read once per process, on first use
+    return SuburbRegistry.load(path)
@@ -1,15355 +0,0 @@
-suburbs = [
-    "Aarons Pass",
-    "Abbotsbury",
-    "Abbotsford (NSW)",
-    "Abercrombie",
-    "Abercrombie River",
-    "Aberdare",
-    "Aberdeen (NSW)",
-    "Aberfoyle",
-    "Aberglasslyn",
-    "Abermain",
-    "Abernethy",
-    "Abington (NSW)",
-    "Acacia Creek",
-    "Acacia Gardens",
-    "Adaminaby",
-    "Adamstown",
-    "Adamstown Heights",
-    "Adelong",
-    "Adjungbilly",
-    "Afterlee",
-    "Agnes Banks",
-    "Airds",
-    "Akolele",
-    "Albert",
-    "Albion Park",
-    "Albion Park Rail",
-    "Albury",
-    "Aldavilla",
-    "Alectown",
-    "Alexandria",
-    "Alfords Point",
-    "Alfredtown",
-    "Alice",
-    "Alison (Central Coast - NSW)",
-    "Alison (Dungog - NSW)",
-    "Allambie Heights",
-    "Allandale (NSW)",
-    "Allawah",
-    "Alleena",
-    "Allgomera",
-    "Allworth",
-    "Allynbrook",
-    "Alma Park",
-    "Alpine",
-    "Alstonvale",
-    "Alstonville",
-    "Alumy Creek",
-    "Amaroo (NSW)",
-    "Ambarvale",
-    "Amosfield",
-    "Anabranch North",
-    "Anabranch South",
-    "Anambah",
-    "Ando",
-    "Anembo",
-    "Angledale",
-    "Angledool",
-    "Anglers Reach",
-    "Angourie",
-    "Angus",
-    "Anna Bay",
-    "Annandale (NSW)",
-    "Annangrove",
-    "Appin (NSW)",
-    "Apple Tree Flat",
-    "Appleby",
-    "Appletree Flat",
-    "Apsley (NSW)",
-    "Arable",
-    "Arakoon",
-    "Araluen (NSW)",
-    "Aratula (NSW)",
-    "Arcadia (NSW)",
-    "Arcadia Vale",
-    "Ardglen",
-    "Arding",
-    "Ardlethan",
-    "Argalong",
-    "Argenton",
-    "Argents Hill",
-    "Argoon",
-    "Ariah Park",
-    "Arkell",
-    "Arkstone",
-    "Armatree",
-    "Armidale",
-    "Arncliffe",
-    "Arndell Park",
-    "Arrawarra",
-    "Arrawarra Headland",
-    "Artarmon",
-    "Arthurville",
-    "Arumpo",
-    "Ashbury",
-    "Ashby (NSW)",
-    "Ashby Heights",
-    "Ashby Island",
-    "Ashcroft",
-    "Ashfield (NSW)",
-    "Ashford (NSW)",
-    "Ashley",
-    "Ashmont",
-    "Ashtonfield",
-    "Asquith",
-    "Atholwood",
-    "Attunga",
-    "Auburn (NSW)",
-    "Auburn Vale",
-    "Austinmer",
-    "Austral",
-    "Austral Eden",
-    "Avalon Beach",
-    "Avisford",
-    "Avoca (NSW)",
-    "Avoca Beach",
-    "Avon (NSW)",
-    "Avondale (NSW)",
-    "Avonside",
-    "Awaba",
-    "Aylmerton",
-    "Baan Baa",
-    "Babinda (NSW)",
-    "Babyl Creek",
-    "Back Creek (Bland - NSW)",
-    "Back Creek (Gwydir - NSW)",
-    "Back Creek (Mid-Coast - NSW)",
-    "Back Creek (Queanbeyan-Palerang Regional - NSW)",
-    "Back Creek (Tenterfield - NSW)",
-    "Back Creek (Tweed - NSW)",
-    "Back Forest",
-    "Backmede",
-    "Backwater",
-    "Badgerys Creek",
-    "Badja",
-    "Baerami",
-    "Baerami Creek",
-    "Bagnoo",
-    "Bago",
-    "Bagotville",
-    "Bakers Creek (Mid-Coast - NSW)",
-    "Bakers Creek (Nambucca Valley - NSW)",
-    "Bakers Creek (Uralla - NSW)",
-    "Bakers Swamp",
-    "Balaclava (NSW)",
-    "Balala",
-    "Balcolyn",
-    "Bald Blair",
-    "Bald Hills (NSW)",
-    "Bald Nob",
-    "Bald Ridge",
-    "Baldersleigh",
-    "Baldry",
-    "Balfours Peak",
-    "Balgowlah",
-    "Balgowlah Heights",
-    "Balgownie",
-    "Balickera",
-    "Balladoran",
-    "Ballalaba",
-    "Balldale",
-    "Ballengarra",
-    "Ballimore",
-    "Ballina",
-    "Ballyroe",
-    "Balmain",
-    "Balmain East",
-    "Balmoral (Lake Macquarie - NSW)",
-    "Balmoral (Wingecarribee - NSW)",
-    "Balranald",
-    "Bamarang",
-    "Banda Banda",
-    "Bandon Grove",
-    "Bangadang",
-    "Bangalee (NSW)",
-    "Bangalow",
-    "Bangheet",
-    "Bango",
-    "Bangor (NSW)",
-    "Banksia",
-    "Banksmeadow",
-    "Bankstown",
-    "Bankstown Aerodrome",
-    "Bannaby",
-    "Bannister (NSW)",
-    "Banoon",
-    "Banora Point",
-    "Banyabba",
-    "Bar Beach",
-    "Bar Point",
-    "Bara",
-    "Baradine",
-    "Barangaroo",
-    "Barcoongere",
-    "Barden Ridge",
-    "Bardia",
-    "Bardwell Park",
-    "Bardwell Valley",
-    "Barellan",
-    "Bargo",
-    "Barham",
-    "Barigan",
-    "Barkers Vale",
-    "Barmedman",
-    "Barneys Reef",
-    "Barnsley",
-    "Barooga",
-    "Barraba",
-    "Barrack Heights",
-    "Barrack Point",
-    "Barraganyatti",
-    "Barragga Bay",
-    "Barratta (NSW)",
-    "Barren Grounds",
-    "Barrengarry",
-    "Barretts Creek",
-    "Barringella",
-    "Barrington (NSW)",
-    "Barrington Tops",
-    "Barry (Blayney - NSW)",
-    "Barry (Tamworth Regional - NSW)",
-    "Barwang",
-    "Baryulgil",
-    "Basin View",
-    "Bass Hill",
-    "Bassendean (NSW)",
-    "Batar Creek",
-    "Bateau Bay",
-    "Batehaven",
-    "Batemans Bay",
-    "Bathampton",
-    "Bathurst",
-    "Batlow",
-    "Baulkham Hills",
-    "Baw Baw (NSW)",
-    "Bawley Point",
-    "Baxters Ridge",
-    "Bayview (NSW)",
-    "Beacon Hill",
-    "Beaconsfield (NSW)",
-    "Bean Creek",
-    "Bearbong",
-    "Beaumont (NSW)",
-    "Beaumont Hills",
-    "Beckom",
-    "Bective",
-    "Bectric",
-    "Bedgerabong",
-    "Beechwood",
-    "Beecroft",
-    "Beecroft Peninsula",
-    "Beelbangera",
-    "Beemunnel",
-    "Bega",
-    "Beggan Beggan",
-    "Belanglo",
-    "Belbora",
-    "Belfield",
-    "Belford",
-    "Belfrayden",
-    "Belgravia",
-    "Belimbla Park",
-    "Bell (NSW)",
-    "Bella Vista",
-    "Bellambi",
-    "Bellangry",
-    "Bellata",
-    "Bellawongarah",
-    "Bellbird",
-    "Bellbird Heights",
-    "Bellbrook",
-    "Bellevue Hill",
-    "Bellimbopinni",
-    "Bellingen",
-    "Bellmount Forest",
-    "Belltrees",
-    "Belmont (NSW)",
-    "Belmont North",
-    "Belmont South",
-    "Belmore",
-    "Belmore River",
-    "Beloka",
-    "Belowra",
-    "Belrose",
-    "Bemboka",
-    "Ben Bullen",
-    "Ben Lomond (NSW)",
-    "Benandarah",
-    "Bendalong",
-    "Bendemeer",
-    "Bendick Murrell",
-    "Bendolba",
-    "Bendoura",
-    "Benerembah",
-    "Bengalla",
-    "Bennetts Green",
-    "Benolong",
-    "Bensville",
-    "Bentley (NSW)",
-    "Berala",
-    "Berambing",
-    "Beresfield",
-    "Bergalia",
-    "Berkeley",
-    "Berkeley Vale",
-    "Berkshire Park",
-    "Berlang",
-    "Bermagui",
-    "Berowra",
-    "Berowra Heights",
-    "Berowra Waters",
-    "Berrambool",
-    "Berrara",
-    "Berremangra",
-    "Berrico",
-    "Berridale",
-    "Berrigal",
-    "Berrigan",
-    "Berrilee",
-    "Berrima",
-    "Berringer Lake",
-    "Berry",
-    "Berry Jerry",
-    "Berry Mountain",
-    "Berry Park",
-    "Berthong",
-    "Beryl",
-    "Bethungra",
-    "Bevendale",
-    "Beverley Park",
-    "Beverly Hills",
-    "Bewong",
-    "Bexhill",
-    "Bexley",
-    "Bexley North",
-    "Biala",
-    "Bibbenluke",
-    "Biddon",
-    "Bidgeemia",
-    "Bidwill (NSW)",
-    "Bielsdown Hills",
-    "Big Hill (NSW)",
-    "Big Jacks Creek",
-    "Big Ridge",
-    "Big Springs",
-    "Bigga",
-    "Bilambil",
-    "Bilambil Heights",
-    "Bilbul",
-    "Bilgola Beach",
-    "Bilgola Plateau",
-    "Billeroy",
-    "Billilingra",
-    "Billimari",
-    "Billinudgel",
-    "Billys Creek",
-    "Billywillinga",
-    "Bilpin",
-    "Bimberi",
-    "Bimbi",
-    "Bimbimbie",
-    "Binalong",
-    "Binda",
-    "Bindera",
-    "Bingara",
-    "Bingeebeebra Creek",
-    "Bingie",
-    "Bingleburra",
-    "Biniguy",
-    "Binjura",
-    "Binna Burra (NSW)",
-    "Binnaway",
-    "Binya",
-    "Birchgrove",
-    "Birdwood (NSW)",
-    "Birganbigil",
-    "Birmingham Gardens",
-    "Birriwa",
-    "Birrong",
-    "Bishops Bridge",
-    "Bithramere",
-    "Black Creek (Port Macquarie-Hastings - NSW)",
-    "Black Creek (Snowy Valleys - NSW)",
-    "Black Head",
-    "Black Hill (NSW)",
-    "Black Hollow",
-    "Black Mountain (NSW)",
-    "Black Range (NSW)",
-    "Black Springs (NSW)",
-    "Blackalls Park",
-    "Blackbutt (NSW)",
-    "Blackett",
-    "Blackheath",
-    "Blackmans Flat",
-    "Blackmans Point",
-    "Blacksmiths",
-    "Blacktown",
-    "Blackville",
-    "Blackwall (NSW)",
-    "Blair Athol (NSW)",
-    "Blairmount",
-    "Blakebrook",
-    "Blakehurst",
-    "Blakney Creek",
-    "Bland",
-    "Blandford",
-    "Blaxland (NSW)",
-    "Blaxlands Creek",
-    "Blaxlands Ridge",
-    "Blayney",
-    "Bligh Park",
-    "Blighty",
-    "Blowering",
-    "Blue Bay",
-    "Blue Haven",
-    "Blue Knob",
-    "Blue Mountains National Park",
-    "Blue Nobby",
-    "Blue Vale",
-    "Blueys Beach",
-    "Boambee",
-    "Boambee East",
-    "Boambolo",
-    "Boat Harbour (Lismore - NSW)",
-    "Boat Harbour (Port Stephens - NSW)",
-    "Bobadah",
-    "Bobin",
-    "Bobs Creek",
-    "Bobs Farm",
-    "Bobundara",
-    "Boco",
-    "Bocoble",
-    "Bocobra",
-    "Bodalla",
-    "Bodangora",
-    "Boeill Creek",
-    "Bogan",
-    "Bogan Gate",
-    "Bogangar",
-    "Bogee",
-    "Boggabilla",
-    "Boggabri",
-    "Bogong Peaks Wilderness",
-    "Bohena Creek",
-    "Bohnock",
-    "Bolaro",
-    "Bolivia",
-    "Bolong",
-    "Bolton Point",
-    "Bolwarra (NSW)",
-    "Bolwarra Heights",
-    "Bom Bom",
-    "Bomaderry",
-    "Bombah Point",
-    "Bombala",
-    "Bombay",
-    "Bombira",
-    "Bombo",
-    "Bombowlee",
-    "Bombowlee Creek",
-    "Bomen",
-    "Bonalbo",
-    "Bondi",
-    "Bondi Beach",
-    "Bondi Forest",
-    "Bondi Junction",
-    "Bonnells Bay",
-    "Bonnet Bay",
-    "Bonny Hills",
-    "Bonnyrigg",
-    "Bonnyrigg Heights",
-    "Bonshaw (NSW)",
-    "Bonville",
-    "Booerie Creek",
-    "Book Book",
-    "Booker Bay",
-    "Bookham",
-    "Bookookoorara",
-    "Bookram",
-    "Boolambayte",
-    "Boolaroo",
-    "Boolcarroll",
-    "Booligal",
-    "Boolijah",
-    "Boomanoomana",
-    "Boomerang Beach",
-    "Boomey",
-    "Boomi",
-    "Boomi Creek",
-    "Boona Mount",
-    "Boonal",
-    "Boonoo Boonoo",
-    "Boorabee Park",
-    "Booragul",
-    "Booral (NSW)",
-    "Boorga",
-    "Boorganna",
-    "Boorolong",
-    "Boorook",
-    "Boorooma",
-    "Booroorban",
-    "Boorowa",
-    "Bootawa",
-    "Booti Booti",
-    "Booyong",
-    "Bora Ridge",
-    "Borah Creek",
-    "Borambola",
-    "Border Ranges",
-    "Boree",
-    "Boree Creek",
-    "Borenore",
-    "Boro",
-    "Bossley Park",
-    "Bostobrick",
-    "Botany",
-    "Botobolar",
-    "Bottle Creek",
-    "Bouddi",
-    "Bourbah",
-    "Bourke",
-    "Bourkelands",
-    "Bournda",
-    "Bournewood",
-    "Bow Bowing",
-    "Bowan Park",
-    "Bowen Mountain",
-    "Bowenfels",
-    "Bowling Alley Point",
-    "Bowman",
-    "Bowman Farm",
-    "Bowmans Creek",
-    "Bowna",
-    "Bowning",
-    "Bowral",
-    "Bowraville",
-    "Box Head",
-    "Box Hill (NSW)",
-    "Boxers Creek",
-    "Boydtown",
-    "Bradbury (NSW)",
-    "Braefield",
-    "Braemar",
-    "Braemar Bay",
-    "Braidwood",
-    "Brandy Hill",
-    "Branxton",
-    "Braunstone",
-    "Brawboy",
-    "Bray Park (NSW)",
-    "Brays Creek",
-    "Brayton",
-    "Breadalbane (NSW)",
-    "Breakfast Creek",
-    "Breakfast Point",
-    "Bream Beach",
-    "Bredbo",
-    "Breelong",
-    "Breeza",
-    "Bretti",
-    "Brewarrina",
-    "Brewongle",
-    "Briarbrook",
-    "Bribbaree",
-    "Bridgman",
-    "Brierfield",
-    "Brighton-Le-Sands",
-    "Brightwaters",
-    "Bril Bril",
-    "Brimbin",
-    "Brindabella",
-    "Brinerville",
-    "Bringelly",
-    "Bringenbrong",
-    "Brisbane Grove",
-    "Broadmeadow",
-    "Broadwater (Bega Valley - NSW)",
-    "Broadwater (Richmond Valley - NSW)",
-    "Broadway",
-    "Brobenah",
-    "Brocklehurst",
-    "Brocklesby",
-    "Brockley",
-    "Brodies Plains",
-    "Brogans Creek",
-    "Brogers Creek",
-    "Brogo",
-    "Broke (NSW)",
-    "Broken Head",
-    "Broken Hill",
-    "Brombin",
-    "Bronte",
-    "Brookdale (NSW)",
-    "Brookfield (NSW)",
-    "Brooklana",
-    "Brooklet",
-    "Brooklyn (NSW)",
-    "Brookong",
-    "Brookvale",
-    "Brooman",
-    "Brooms Head",
-    "Broughams Gate",
-    "Broughton (NSW)",
-    "Broughton Vale",
-    "Broughton Village",
-    "Broulee",
-    "Brownlow Hill",
-    "Browns Creek",
-    "Browns Mountain",
-    "Brownsville",
-    "Brucedale",
-    "Bruie Plains",
-    "Bruinbun",
-    "Brumby Plains",
-    "Brundee",
-    "Brungle",
-    "Brungle Creek",
-    "Brunkerville",
-    "Brunswick Heads",
-    "Brushgrove",
-    "Brushy Creek",
-    "Buangla",
-    "Bucca (NSW)",
-    "Bucca Wauka",
-    "Buccarumbi",
-    "Buchanan (NSW)",
-    "Buckajo",
-    "Buckaroo",
-    "Buckenbowra",
-    "Buckenderra",
-    "Buckendoon",
-    "Bucketty",
-    "Buckra Bendinni",
-    "Budawang",
-    "Buddabadah",
-    "Budden",
-    "Budderoo",
-    "Buddong",
-    "Budgee Budgee (NSW)",
-    "Budgewoi",
-    "Budgewoi Peninsula",
-    "Budgong",
-    "Buff Point",
-    "Bugaldie",
-    "Bukalong",
-    "Bukkulla",
-    "Bulahdelah",
-    "Bulee",
-    "Bulga (NSW)",
-    "Bulga Forest",
-    "Bulgary",
-    "Bulla (NSW)",
-    "Bulla Creek",
-    "Bullaburra",
-    "Bullagreen",
-    "Bullarah",
-    "Bullatale",
-    "Bullawa Creek",
-    "Bulldog",
-    "Bulli",
-    "Bulliac",
-    "Bullio",
-    "Bulyeroi",
-    "Bumbaldry",
-    "Bumbalong",
-    "Bundabah",
-    "Bundagen",
-    "Bundanoon (NSW)",
-    "Bundarra",
-    "Bundeena",
-    "Bundella",
-    "Bundemar",
-    "Bundewallah",
-    "Bundook",
-    "Bundure",
-    "Bungaba",
-    "Bungabbee",
-    "Bungalora",
-    "Bungarby",
-    "Bungarribee",
-    "Bungawalbin",
-    "Bungendore",
-    "Bungonia",
-    "Bungowannah",
-    "Bungwahl",
-    "Bunnaloo",
-    "Bunnan",
-    "Bunyah",
-    "Bunyan",
-    "Burcher",
-    "Bureen",
-    "Burnt Bridge",
-    "Burnt Yards",
-    "Buronga",
-    "Burra (Queanbeyan-Palerang Regional - NSW)",
-    "Burra (Snowy Valleys - NSW)",
-    "Burra Creek",
-    "Burraboi",
-    "Burradoo",
-    "Burraga",
-    "Burragate",
-    "Burrandana",
-    "Burraneer",
-    "Burrangong",
-    "Burrapine",
-    "Burrawang",
-    "Burrell Creek",
-    "Burren Junction",
-    "Burrier",
-    "Burrill Lake",
-    "Burringbar",
-    "Burrinjuck",
-    "Burroway",
-    "Burrumbuttock",
-    "Burrundulla",
-    "Burrungubugge",
-    "Burwood (NSW)",
-    "Burwood Heights",
-    "Busby",
-    "Busbys Flat",
-    "Bushells Ridge",
-    "Buttaba",
-    "Buttai",
-    "Butterwick",
-    "Buxton (NSW)",
-    "Byabarra",
-    "Byadbo Wilderness",
-    "Byangum",
-    "Bylong",
-    "Byng",
-    "Byrock",
-    "Byron Bay",
-    "Byrrill Creek",
-    "Bywong",
-    "Cabarita (NSW)",
-    "Cabarita Beach",
-    "Cabbage Tree Island (Ballina - NSW)",
-    "Cabbage Tree Island (Mid-Coast - NSW)",
-    "Cabramatta",
-    "Cabramatta West",
-    "Cabramurra",
-    "Caddens",
-    "Cadgee (NSW)",
-    "Cadia",
-    "Caerleon",
-    "Caffreys Flat",
-    "Cairncross",
-    "Calala",
-    "Calamia",
-    "Calderwood",
-    "Caldwell",
-    "Calga",
-    "Califat",
-    "Calimo",
-    "Callaghan",
-    "Callaghans Creek",
-    "Callala Bay",
-    "Callala Beach",
-    "Calliope (NSW)",
-    "Caloola",
-    "Cambalong",
-    "Camberwell (NSW)",
-    "Cambewarra",
-    "Cambewarra Village",
-    "Camboon (NSW)",
-    "Cambra",
-    "Cambridge Gardens",
-    "Cambridge Park",
-    "Cambridge Plateau",
-    "Camden",
-    "Camden Head",
-    "Camden Park (NSW)",
-    "Camden South",
-    "Camellia",
-    "Cameron Park",
-    "Camerons Creek",
-    "Camira (NSW)",
-    "Cammeray",
-    "Camp Creek (NSW)",
-    "Campbelltown (NSW)",
-    "Camperdown (NSW)",
-    "Campsie",
-    "Campvale",
-    "Cams Wharf",
-    "Canada Bay",
-    "Canadian Lead",
-    "Canbelego",
-    "Candelo",
-    "Cangai",
-    "Caniaba",
-    "Canley Heights",
-    "Canley Vale",
-    "Canobolas",
-    "Canoelands",
-    "Canonba",
-    "Canowindra",
-    "Canterbury (NSW)",
-    "Canton Beach",
-    "Canyonleigh",
-    "Caparra",
-    "Capeen Creek",
-    "Capertee",
-    "Capoompeta",
-    "Captains Flat",
-    "Carabost",
-    "Caragabal",
-    "Carcalgong",
-    "Carcoar",
-    "Cardiff (NSW)",
-    "Cardiff Heights",
-    "Cardiff South",
-    "Carey Bay",
-    "Cargo",
-    "Carinda",
-    "Caringbah",
-    "Caringbah South",
-    "Carlaminda",
-    "Carlingford",
-    "Carlton (NSW)",
-    "Carnes Hill",
-    "Carnham",
-    "Carool",
-    "Caroona",
-    "Carrabolla",
-    "Carrai",
-    "Carramar (NSW)",
-    "Carrathool",
-    "Carrick (NSW)",
-    "Carrington (Mid-Coast - NSW)",
-    "Carrington (Newcastle - NSW)",
-    "Carrington Falls",
-    "Carroll",
-    "Carrowbrook",
-    "Carrs Creek",
-    "Carrs Island",
-    "Carrs Peninsula",
-    "Carss Park",
-    "Cartwright",
-    "Cartwrights Hill",
-    "Carwell",
-    "Carwoola",
-    "Cascade (NSW)",
-    "Casino",
-    "Cassilis (NSW)",
-    "Castle Cove",
-    "Castle Doyle",
-    "Castle Hill (NSW)",
-    "Castle Rock",
-    "Castlecrag",
-    "Castlereagh",
-    "Casuarina (NSW)",
-    "Casula",
-    "Catalina",
-    "Cataract",
-    "Cathcart (NSW)",
-    "Catherine Field",
-    "Catherine Hill Bay",
-    "Cathundral",
-    "Cattai",
-    "Cattle Creek (NSW)",
-    "Cavan (NSW)",
-    "Caves Beach",
-    "Cawdor (NSW)",
-    "Cawongla",
-    "Cecil Hills",
-    "Cecil Park",
-    "Cedar Brush Creek",
-    "Cedar Creek (Cessnock - NSW)",
-    "Cedar Creek (Tweed - NSW)",
-    "Cedar Party",
-    "Cedar Point",
-    "Cells River",
-    "Centennial Park (NSW)",
-    "Central Colo",
-    "Central Macdonald",
-    "Central Mangrove",
-    "Central Tilba",
-    "Cessnock",
-    "Chaelundi",
-    "Chain Valley Bay",
-    "Chakola",
-    "Chambigne",
-    "Charbon",
-    "Charles Sturt University",
-    "Charlestown (NSW)",
-    "Charleys Forest",
-    "Charlotte Bay",
-    "Charlton (NSW)",
-    "Charmhaven",
-    "Chatham Valley",
-    "Chatsbury",
-    "Chatswood",
-    "Chatswood West",
-    "Chatsworth (NSW)",
-    "Cheero Point",
-    "Cheltenham (NSW)",
-    "Cherry Tree Hill",
-    "Cherrybrook",
-    "Chester Hill",
-    "Chichester (NSW)",
-    "Chifley (NSW)",
-    "Chilcotts Creek",
-    "Chilcotts Grass",
-    "Chillingham",
-    "Chinderah",
-    "Chinnock",
-    "Chippendale",
-    "Chipping Norton",
-    "Chisholm (NSW)",
-    "Chiswick",
-    "Chittaway Bay",
-    "Chittaway Point",
-    "Chowan Creek",
-    "Chullora",
-    "Church Point",
-    "Clandulla",
-    "Clare (NSW)",
-    "Claremont Meadows",
-    "Clarence",
-    "Clarence Town",
-    "Clarendon (NSW)",
-    "Clarenza",
-    "Clareville",
-    "Claymore",
-    "Clear Creek",
-    "Clear Range",
-    "Clearfield",
-    "Clemton Park",
-    "Clergate",
-    "Cleveland (NSW)",
-    "Clifden",
-    "Cliftleigh",
-    "Clifton (NSW)",
-    "Clifton Grove",
-    "Clontarf (NSW)",
-    "Clothiers Creek",
-    "Clouds Creek",
-    "Clovelly",
-    "Clunes (NSW)",
-    "Clybucca",
-    "Clyde (NSW)",
-    "Clydesdale (NSW)",
-    "Coal Point",
-    "Coalcliff",
-    "Coaldale",
-    "Coasters Retreat",
-    "Cobaki",
-    "Cobaki Lakes",
-    "Cobar",
-    "Cobar Park",
-    "Cobargo",
-    "Cobark",
-    "Cobbadah",
-    "Cobbitty",
-    "Cobbora",
-    "Cobramunga",
-    "Cockwhy",
-    "Codrington (NSW)",
-    "Coffee Camp",
-    "Coffs Harbour",
-    "Coggan",
-    "Cogra Bay",
-    "Coila",
-    "Coldstream (NSW)",
-    "Coleambally",
-    "Colebee",
-    "Coledale",
-    "Colinroobie",
-    "Colinton (NSW)",
-    "Collarenebri",
-    "Collaroy (NSW)",
-    "Collaroy Plateau",
-    "Collector",
-    "Collendina",
-    "Collerina",
-    "Collie (NSW)",
-    "Collingullie",
-    "Collingwood (NSW)",
-    "Collins Creek",
-    "Collombatti",
-    "Collum Collum",
-    "Colly Blue",
-    "Colo (Bathurst Regional - NSW)",
-    "Colo (Hawkesbury - NSW)",
-    "Colo Heights",
-    "Colo Vale",
-    "Colongra",
-    "Colyton",
-    "Comara",
-    "Combaning",
-    "Combara",
-    "Comberton",
-    "Comboyne",
-    "Come By Chance",
-    "Comerong Island",
-    "Commissioners Creek",
-    "Como (NSW)",
-    "Comobella",
-    "Conargo",
-    "Concord",
-    "Concord West",
-    "Condell Park",
-    "Condobolin",
-    "Condong",
-    "Coneac",
-    "Congarinni",
-    "Congarinni North",
-    "Congewai",
-    "Congo",
-    "Conimbia",
-    "Coniston",
-    "Conjola",
-    "Conjola Park",
-    "Connells Point",
-    "Constitution Hill",
-    "Coogee (NSW)",
-    "Cookamidgera",
-    "Cookardinia",
-    "Cooks Gap",
-    "Cooks Hill",
-    "Cooks Myalls",
-    "Coolabah",
-    "Coolac",
-    "Coolagolite",
-    "Coolah",
-    "Coolamon",
-    "Coolangatta (NSW)",
-    "Coolangubra",
-    "Coolatai",
-    "Cooleman",
-    "Cooleys Creek",
-    "Coolgardie (NSW)",
-    "Coolongolook",
-    "Coolringdon",
-    "Coolumbooka",
-    "Coolumburra",
-    "Cooma (NSW)",
-    "Coomba Bay",
-    "Coomba Park",
-    "Coombadjha",
-    "Coombell",
-    "Coomealla",
-    "Coomoo Coomoo",
-    "Coonabarabran",
-    "Coonamble",
-    "Coongbar",
-    "Cooperabung",
-    "Coopernook",
-    "Coopers Gully",
-    "Coopers Shoot",
-    "Cooplacurripa",
-    "Coorabell",
-    "Cooranbong",
-    "Cootamundra",
-    "Cootralantra",
-    "Cooyal",
-    "Copacabana",
-    "Cope",
-    "Copeland",
-    "Copeton",
-    "Copmanhurst",
-    "Coppabella (NSW)",
-    "Copperhannia",
-    "Coraki",
-    "Coralville",
-    "Coramba",
-    "Corang",
-    "Corangula",
-    "Corbie Hill",
-    "Cordeaux",
-    "Cordeaux Heights",
-    "Coree",
-    "Coreen",
-    "Corindi Beach",
-    "Corinella (NSW)",
-    "Corlette",
-    "Corndale (NSW)",
-    "Corney Town",
-    "Cornwallis",
-    "Corobimilla",
-    "Corowa",
-    "Corrabare",
-    "Corrimal",
-    "Corrong",
-    "Corrowong",
-    "Corunna",
-    "Cottage Point",
-    "Cottonvale (NSW)",
-    "Cougal",
-    "Countegany",
-    "Courabyra",
-    "Couradda",
-    "Couragago",
-    "Couridjah",
-    "Coutts Crossing",
-    "Cow Flat",
-    "Cowabbie",
-    "Cowan",
-    "Cowper",
-    "Cowra",
-    "Coxs Creek",
-    "Coxs Crown",
-    "Crabbes Creek",
-    "Crackenback",
-    "Craigie (NSW)",
-    "Cranebrook",
-    "Crangan Bay",
-    "Craven",
-    "Craven Plateau",
-    "Crawford River",
-    "Crawney",
-    "Creel Bay",
-    "Creewah",
-    "Cremorne (NSW)",
-    "Cremorne Point",
-    "Crescent Head",
-    "Crestwood",
-    "Cringila",
-    "Croki",
-    "Cromer (NSW)",
-    "Cronulla",
-    "Crooble",
-    "Croobyar",
-    "Crooked Corner",
-    "Crookwell",
-    "Croom",
-    "Croppa Creek",
-    "Cross Roads (NSW)",
-    "Crosslands",
-    "Croudace Bay",
-    "Crowdy Bay",
-    "Crowdy Head",
-    "Crows Nest (NSW)",
-    "Crowther",
-    "Crowther Island",
-    "Croydon (NSW)",
-    "Croydon Park (NSW)",
-    "Crudine",
-    "Cryon",
-    "Crystal Creek (NSW)",
-    "Cubba",
-    "Cudal",
-    "Cudgegong",
-    "Cudgel",
-    "Cudgen",
-    "Cudgera Creek",
-    "Cudmirrah",
-    "Culburra Beach",
-    "Culcairn",
-    "Cullen Bullen",
-    "Cullenbone",
-    "Cullendore",
-    "Cullerin",
-    "Cullivel",
-    "Culmaran Creek",
-    "Cumbalum",
-    "Cumbandry",
-    "Cumberland Reach",
-    "Cumbo",
-    "Cumborah",
-    "Cumnock",
-    "Cundle Flat",
-    "Cundletown",
-    "Cundumbul",
-    "Cunjurong Point",
-    "Cunningar",
-    "Cunninyeuk",
-    "Curban",
-    "Curl Curl",
-    "Curlew Waters",
-    "Curlewis (NSW)",
-    "Curlwaa",
-    "Curra Creek",
-    "Currabubula",
-    "Curragh",
-    "Curramore (NSW)",
-    "Currans Hill",
-    "Currarong",
-    "Currawang",
-    "Currawarna",
-    "Curraweela",
-    "Curricabark",
-    "Currowan",
-    "Cuttabri",
-    "Cuttagee",
-    "Dabee",
-    "Daceyville",
-    "Dairy Arm",
-    "Dairy Flat",
-    "Dairymans Plains",
-    "Daleys Point",
-    "Dalgety",
-    "Dalmeny",
-    "Dalmorton",
-    "Dalswinton",
-    "Dalton",
-    "Dalwood (Ballina - NSW)",
-    "Dalwood (Singleton - NSW)",
-    "Dandaloo",
-    "Dandry",
-    "Dangar Island",
-    "Dangarsleigh",
-    "Dangelong",
-    "Dapto",
-    "Darawank",
-    "Darbalara",
-    "Darbys Falls",
-    "Dareton",
-    "Dargan",
-    "Dark Corner",
-    "Darkes Forest",
-    "Darkwood",
-    "Darling Point",
-    "Darlinghurst",
-    "Darlington (Singleton - NSW)",
-    "Darlington (Sydney - NSW)",
-    "Darlington Point",
-    "Darlow",
-    "Daroobalgie",
-    "Dartbrook",
-    "Daruka",
-    "Davidson",
-    "Davis Creek",
-    "Davistown",
-    "Dawes Point",
-    "Daysdale",
-    "Dean Park",
-    "Deauville",
-    "Debenham",
-    "Dee Why",
-    "Deep Creek (Clarence Valley - NSW)",
-    "Deep Creek (Kempsey - NSW)",
-    "Deep Creek (Kyogle - NSW)",
-    "Deepwater (NSW)",
-    "Deer Vale",
-    "Delegate",
-    "Delungra",
-    "Denham Court",
-    "Denhams Beach",
-    "Deniliquin",
-    "Denistone",
-    "Denistone East",
-    "Denistone West",
-    "Denman",
-    "Depot Beach",
-    "Derriwong",
-    "Deua",
-    "Deua River Valley",
-    "Devils Hole",
-    "Dewitt",
-    "Dharruk",
-    "Dhulura",
-    "Dhuragoon",
-    "Diamond Beach",
-    "Diamond Head",
-    "Diehard",
-    "Diggers Camp",
-    "Dignams Creek",
-    "Dilkoon",
-    "Dilpurra",
-    "Dingo Forest",
-    "Dinoga",
-    "Dirnaseer",
-    "Dirty Creek",
-    "Dobies Bight",
-    "Doctor George Mountain",
-    "Doctors Gap",
-    "Dog Rocks",
-    "Dolans Bay",
-    "Dolls Point",
-    "Dollys Flat",
-    "Dolphin Point",
-    "Dombarton",
-    "Donald Creek",
-    "Dondingalong",
-    "Doon Doon",
-    "Doonbah",
-    "Doonside",
-    "Dooralong",
-    "Dora Creek",
-    "Dorrigo",
-    "Dorrigo Mountain",
-    "Dorroughby",
-    "Double Bay",
-    "Doubtful Creek",
-    "Douglas Park",
-    "Dover Heights",
-    "Downside",
-    "Doyalson",
-    "Doyalson North",
-    "Doyles Creek",
-    "Doyles River",
-    "Drake",
-    "Drake Village",
-    "Drildool",
-    "Dripstone",
-    "Drummoyne",
-    "Dry Creek (NSW)",
-    "Dry Plain",
-    "Dubbo",
-    "Duck Creek",
-    "Duckenfield",
-    "Duckmaloi",
-    "Dudley",
-    "Duffys Forest",
-    "Dulguigan",
-    "Dulwich Hill",
-    "Dum Dum",
-    "Dumaresq",
-    "Dumaresq Island",
-    "Dumaresq Valley",
-    "Dumbudgery",
-    "Dunbible",
-    "Dunbogan",
-    "Duncans Creek",
-    "Dundas (NSW)",
-    "Dundas Valley",
-    "Dundee",
-    "Dundurrabin",
-    "Dunedoo",
-    "Dungarubba",
-    "Dungay",
-    "Dungeree",
-    "Dungog",
-    "Dungowan",
-    "Dunkeld (NSW)",
-    "Dunmore (NSW)",
-    "Dunolly (NSW)",
-    "Dunoon",
-    "Duns Creek",
-    "Dunville Loop",
-    "Dural (Hornsby - NSW)",
-    "Dural (Singleton - NSW)",
-    "Duramana",
-    "Duranbah",
-    "Duri",
-    "Duroby",
-    "Durran Durra",
-    "Durras North",
-    "Durren Durren",
-    "Duval",
-    "Dyers Crossing",
-    "Dyraaba",
-    "Dyrring",
-    "Eagle Vale",
-    "Eagleton",
-    "Earlwood",
-    "East Albury",
-    "East Ballina",
-    "East Branxton",
-    "East Coraki",
-    "East Corrimal",
-    "East Gosford",
-    "East Gresford",
-    "East Hills",
-    "East Jindabyne",
-    "East Kangaloon",
-    "East Kempsey",
-    "East Killara",
-    "East Kurrajong",
-    "East Lindfield",
-    "East Lismore",
-    "East Lynne",
-    "East Maitland",
-    "East Ryde",
-    "East Seaham",
-    "East Tamworth",
-    "East Wagga Wagga",
-    "East Wardell",
-    "Eastern Creek",
-    "Eastgardens",
-    "Eastlakes",
-    "Eastwood (NSW)",
-    "Eatonsville",
-    "Ebenezer (NSW)",
-    "Ebor",
-    "Eccleston",
-    "Edderton",
-    "Eden",
-    "Eden Creek",
-    "Edensor Park",
-    "Edenville",
-    "Edgecliff",
-    "Edgeroi",
-    "Edgeworth",
-    "Edith (NSW)",
-    "Edmondson Park",
-    "Edrom",
-    "Eenaweena",
-    "Eglinton (NSW)",
-    "Eighteen Mile",
-    "Elands",
-    "Elanora Heights",
-    "Elcombe",
-    "Elderslie (Camden - NSW)",
-    "Elderslie (Singleton - NSW)",
-    "Eleebana",
-    "Elermore Vale",
-    "Elizabeth Bay",
-    "Elizabeth Beach",
-    "Elizabeth Hills",
-    "Ellalong",
-    "Elland",
-    "Ellangowan (NSW)",
-    "Ellenborough",
-    "Ellerslie (Snowy Valleys - NSW)",
-    "Ellerslie (Wentworth - NSW)",
-    "Ellerston",
-    "Ellis Lane",
-    "Elong Elong",
-    "Elrington",
-    "Elsmore",
-    "Eltham (NSW)",
-    "Elvina Bay",
-    "Emerald Beach",
-    "Emerald Hill",
-    "Emerton",
-    "Emmaville",
-    "Empire Bay",
-    "Empire Vale",
-    "Emu Heights (NSW)",
-    "Emu Plains",
-    "Emu Swamp",
-    "Endrick",
-    "Enfield (NSW)",
-    "Engadine",
-    "Englorie Park",
-    "Enmore (Armidale Regional - NSW)",
-    "Enmore (Inner West - NSW)",
-    "Enngonia",
-    "Environa",
-    "Epping (NSW)",
-    "Eraring",
-    "Eremerang",
-    "Erigolia",
-    "Erin Vale",
-    "Erina",
-    "Erina Heights",
-    "Ermington",
-    "Erowal Bay",
-    "Errowanbang",
-    "Erskine Park",
-    "Erskineville",
-    "Erudgere",
-    "Eschol Park",
-    "Esk (NSW)",
-    "Essington",
-    "Estella",
-    "Ettalong Beach",
-    "Ettamogah",
-    "Ettrema",
-    "Ettrick (NSW)",
-    "Euabalong",
-    "Euabalong West",
-    "Euberta",
-    "Euchareena",
-    "Eucumbene",
-    "Eugowra",
-    "Eulah Creek",
-    "Eumungerie",
-    "Eunanoreenya",
-    "Eungai Creek",
-    "Eungai Rail",
-    "Eungella (NSW)",
-    "Eureka (NSW)",
-    "Eurimbla",
-    "Eurobodalla",
-    "Euroka",
-    "Euroley",
-    "Eurongilly",
-    "Eurunderee",
-    "Euston",
-    "Evans Head",
-    "Evans Plains",
-    "Eveleigh",
-    "Eviron",
-    "Ewingar",
-    "Ewingsdale",
-    "Exeter (NSW)",
-    "Failford",
-    "Fairfield (NSW)",
-    "Fairfield East",
-    "Fairfield Heights",
-    "Fairfield West",
-    "Fairholme",
-    "Fairlight",
-    "Fairy Hill",
-    "Fairy Meadow",
-    "Falbrook",
-    "Falconer",
-    "Falls Creek (NSW)",
-    "Far Meadow",
-    "Fargunyah",
-    "Farley",
-    "Farmborough Heights",
-    "Farnham",
-    "Farrants Hill",
-    "Farringdon",
-    "Fassifern (NSW)",
-    "Faulconbridge",
-    "Faulkland",
-    "Fawcetts Plain",
-    "Federal (NSW)",
-    "Fennell Bay",
-    "Fern Bay",
-    "Fern Gully",
-    "Fernances",
-    "Fernances Crossing",
-    "Fernbank Creek",
-    "Fernbrook",
-    "Fernhill",
-    "Fernleigh",
-    "Fernmount",
-    "Fernside",
-    "Fernvale (NSW)",
-    "Ferodale",
-    "Fiddletown",
-    "Fifield",
-    "Figtree",
-    "Findon Creek",
-    "Fine Flower",
-    "Fingal Bay",
-    "Fingal Head",
-    "Finley",
-    "Firefly",
-    "Fishermans Bay",
-    "Fishermans Paradise",
-    "Fishermans Reach",
-    "Fishers Hill",
-    "Fishing Point",
-    "Fitzgeralds Mount",
-    "Fitzgeralds Valley",
-    "Fitzroy Falls",
-    "Five Dock",
-    "Five Ways",
-    "Flat Tops",
-    "Fletcher (NSW)",
-    "Flinders (NSW)",
-    "Floraville",
-    "Forbes (NSW)",
-    "Forbes Creek",
-    "Forbes River",
-    "Forbesdale",
-    "Fords Bridge",
-    "Fordwich",
-    "Forest Glen (NSW)",
-    "Forest Grove (NSW)",
-    "Forest Hill (NSW)",
-    "Forest Land",
-    "Forest Lodge",
-    "Forest Reefs",
-    "Forestville (NSW)",
-    "Forresters Beach",
-    "Forster (NSW)",
-    "Fortis Creek",
-    "Fosters Valley",
-    "Fosterton",
-    "Fountaindale",
-    "Four Corners",
-    "Four Mile Creek (NSW)",
-    "Fowlers Gap",
-    "Foxground",
-    "Frazer Park",
-    "Frazers Creek",
-    "Frederickton",
-    "Freeburn Island",
-    "Freemans",
-    "Freemans Reach",
-    "Freemans Waterhole",
-    "Freemantle",
-    "French Park",
-    "Frenchs Forest",
-    "Freshwater (NSW)",
-    "Frog Rock",
-    "Frogmore",
-    "Frogs Hollow",
-    "Frying Pan",
-    "Fullerton",
-    "Fullerton Cove",
-    "Furracabad",
-    "Gables",
-    "Gadara",
-    "Gala Vale",
-    "Galambine",
-    "Galong",
-    "Galore",
-    "Galston",
-    "Ganbenang",
-    "Gangat",
-    "Ganmain",
-    "Garah",
-    "Garden Suburb",
-    "Garema",
-    "Garland",
-    "Garland Valley",
-    "Garoo",
-    "Garra",
-    "Garthowen",
-    "Gateshead",
-    "Gearys Flat",
-    "Geehi",
-    "Gelston Park",
-    "Gemalla",
-    "Geneva",
-    "Georges Creek (NSW)",
-    "Georges Hall",
-    "Georges Plains",
-    "Georgetown (NSW)",
-    "Georgica",
-    "Gerogery",
-    "Gerringong",
-    "Gerroa",
-    "Geurie",
-    "Ghinni Ghi",
-    "Ghinni Ghinni",
-    "Ghoolendaadi",
-    "Giants Creek",
-    "Gibberagee",
-    "Gibraltar Range",
-    "Gidginbung",
-    "Gidley",
-    "Gilead",
-    "Gilgai",
-    "Gilgandra",
-    "Gilgooma",
-    "Gilgunnia",
-    "Gillenbah",
-    "Gilletts Ridge",
-    "Gillieston Heights",
-    "Gilmandyke",
-    "Gilmore (NSW)",
-    "Gin Gin (NSW)",
-    "Gineroi",
-    "Ginghi",
-    "Gingkin",
-    "Girards Hill",
-    "Girilambone",
-    "Giro",
-    "Girral",
-    "Girralong",
-    "Girraween (NSW)",
-    "Girvan",
-    "Gladesville",
-    "Gladstone (NSW)",
-    "Glanmire (NSW)",
-    "Glebe (NSW)",
-    "Gledswood Hills",
-    "Glen Alice",
-    "Glen Allen",
-    "Glen Alpine",
-    "Glen Davis",
-    "Glen Elgin",
-    "Glen Fergus",
-    "Glen Innes",
-    "Glen Martin",
-    "Glen Nevis",
-    "Glen Oak",
-    "Glen Ward",
-    "Glen William",
-    "Glenbawn",
-    "Glenbrook",
-    "Glencoe (NSW)",
-    "Glendale (NSW)",
-    "Glendenning",
-    "Glendon",
-    "Glendon Brook",
-    "Glenelg (NSW)",
-    "Glenellen",
-    "Glenfield (NSW)",
-    "Glenfield Park",
-    "Glengarrie",
-    "Glenhaven",
-    "Gleniffer",
-    "Glenmore (NSW)",
-    "Glenmore Park",
-    "Glennies Creek",
-    "Glenning Valley",
-    "Glenorie",
-    "Glenquarry",
-    "Glenreagh",
-    "Glenridding",
-    "Glenrock (NSW)",
-    "Glenroy (Albury - NSW)",
-    "Glenroy (Snowy Valleys - NSW)",
-    "Glenthorne",
-    "Glenugie",
-    "Glenwood (NSW)",
-    "Glenworth Valley",
-    "Glossodia",
-    "Gloucester",
-    "Gloucester Tops",
-    "Goat Island",
-    "Gobarralong",
-    "Gobbagombalin",
-    "Gocup",
-    "Godfreys Creek",
-    "Gogeldrie",
-    "Gol Gol",
-    "Gollan",
-    "Golspie",
-    "Gongolgon",
-    "Gonn",
-    "Gooandra",
-    "Goobarragandra",
-    "Good Forest",
-    "Good Hope",
-    "Goodmans Ford",
-    "Goodnight",
-    "Goodooga",
-    "Goodwood Island",
-    "Googong",
-    "Goolgowi",
-    "Goolhi",
-    "Goolma",
-    "Goolmangar",
-    "Gooloogong",
-    "Goombargana",
-    "Goonellabah",
-    "Goonengerry",
-    "Goonoo Forest",
-    "Goonoo Goonoo",
-    "Goonumbla",
-    "Goorangoola",
-    "Goorianawa",
-    "Gordon (NSW)",
-    "Gorge Creek",
-    "Gormans Hill",
-    "Gorokan",
-    "Gosford",
-    "Gosforth",
-    "Gostwyck",
-    "Goulburn",
-    "Gouldsville",
-    "Gowan",
-    "Gowang",
-    "Gowrie (Singleton - NSW)",
-    "Gowrie (Tamworth Regional - NSW)",
-    "Grabben Gullen",
-    "Gradys Creek",
-    "Grafton",
-    "Gragin",
-    "Grahamstown",
-    "Graman",
-    "Grantham Farm",
-    "Grants Beach",
-    "Granville (NSW)",
-    "Grasmere",
-    "Grassy Head",
-    "Grattai",
-    "Gravesend",
-    "Grays Point",
-    "Great Mackerel Beach",
-    "Great Marlow",
-    "Green Cape",
-    "Green Creek",
-    "Green Forest",
-    "Green Gully (NSW)",
-    "Green Hills (Armidale Regional - NSW)",
-    "Green Hills (Snowy Valleys - NSW)",
-    "Green Pigeon",
-    "Green Point (Central Coast - NSW)",
-    "Green Point (Mid-Coast - NSW)",
-    "Green Valley (NSW)",
-    "Greenacre",
-    "Greendale (Bega Valley - NSW)",
-    "Greendale (Liverpool - NSW)",
-    "Greenethorpe",
-    "Greenfield Park",
-    "Greengrove",
-    "Greenhill (NSW)",
-    "Greenhills Beach",
-    "Greenlands (Singleton - NSW)",
-    "Greenlands (Snowy Monaro Regional - NSW)",
-    "Greenleigh",
-    "Greenridge",
-    "Greenwell Point",
-    "Greenwich",
-    "Greenwich Park",
-    "Greg Greg",
-    "Gregadoo",
-    "Gregory Hills",
-    "Greigs Flat",
-    "Grenfell",
-    "Gresford",
-    "Greta (NSW)",
-    "Greta Main",
-    "Grevillia",
-    "Greystanes",
-    "Griffith (NSW)",
-    "Grogan",
-    "Grong Grong",
-    "Grose Vale",
-    "Grose Wold",
-    "Grosses Plain",
-    "Growee",
-    "Guerilla Bay",
-    "Guildford (NSW)",
-    "Guildford West",
-    "Gulargambone",
-    "Gulf Creek",
-    "Gulgong",
-    "Gulmarrad",
-    "Gum Flat",
-    "Gum Scrub",
-    "Gumbalie",
-    "Gumble",
-    "Gumly Gumly",
-    "Gumma",
-    "Gunbar",
-    "Gundagai",
-    "Gundamulda",
-    "Gundaroo",
-    "Gundary",
-    "Gunderbooka",
-    "Gunderman",
-    "Gundy",
-    "Gungal",
-    "Gungalman",
-    "Gunnedah",
-    "Gunning",
-    "Gunning Gap",
-    "Gunningbland",
-    "Gunningrah",
-    "Guntawang",
-    "Gurley",
-    "Gurnang",
-    "Gurranang",
-    "Gurrundah",
-    "Guyong",
-    "Guyra",
-    "Gwabegar",
-    "Gwandalan",
-    "Gwynneville",
-    "Gymea",
-    "Gymea Bay",
-    "Haberfield",
-    "Hacks Ferry",
-    "Halekulani",
-    "Halfway Creek",
-    "Hallidays Point",
-    "Halloran",
-    "Halls Creek (NSW)",
-    "Hallsville",
-    "Halton",
-    "Hambledon Hill",
-    "Hamilton (NSW)",
-    "Hamilton East",
-    "Hamilton North",
-    "Hamilton South",
-    "Hamilton Valley",
-    "Hamlyn Terrace",
-    "Hammondville",
-    "Hampden Hall",
-    "Hampton (NSW)",
-    "Hanging Rock",
-    "Hanleys Creek",
-    "Hannam Vale",
-    "Hanwood",
-    "Harden",
-    "Hardys Bay",
-    "Harefield",
-    "Hargraves",
-    "Harolds Cross",
-    "Harparary",
-    "Harpers Hill",
-    "Harrington",
-    "Harrington Park",
-    "Harris Park",
-    "Hartley (NSW)",
-    "Hartley Vale",
-    "Hartwood",
-    "Hartys Plains",
-    "Harwood",
-    "Hassall Grove",
-    "Hassans Walls",
-    "Hastings Point",
-    "Hat Head",
-    "Hatfield",
-    "Havilah (NSW)",
-    "Hawkesbury Heights",
-    "Hawks Nest",
-    "Hay (NSW)",
-    "Hay South",
-    "Hayes Gap",
-    "Haymarket",
-    "Haystack",
-    "Hayters Hill",
-    "Haywards Bay",
-    "Hazelbrook",
-    "Hazelgrove",
-    "Heathcote (NSW)",
-    "Heatherbrae",
-    "Hebden",
-    "Hebersham",
-    "Heckenberg",
-    "Heddon Greta",
-    "Heifer Station",
-    "Helensburgh",
-    "Henley",
-    "Henty (NSW)",
-    "Hereford Hall",
-    "Hermidale",
-    "Hermitage Flat",
-    "Hernani",
-    "Herons Creek",
-    "Hexham (NSW)",
-    "Hickeys Creek",
-    "High Range",
-    "Higher Macdonald",
-    "Highfields (NSW)",
-    "Hill End (NSW)",
-    "Hill Top (Snowy Monaro Regional - NSW)",
-    "Hill Top (Wingecarribee - NSW)",
-    "Hilldale",
-    "Hillgrove (Armidale Regional - NSW)",
-    "Hillgrove (Wagga Wagga - NSW)",
-    "Hillsborough (Lake Macquarie - NSW)",
-    "Hillsborough (Maitland - NSW)",
-    "Hillsdale",
-    "Hillston",
-    "Hillville",
-    "Hillvue",
-    "Hinchinbrook (NSW)",
-    "Hinton",
-    "Hobartville",
-    "Hobbys Yards",
-    "Hogarth Range",
-    "Holbrook",
-    "Holgate",
-    "Hollisdale",
-    "Hollydeen",
-    "Holmesville",
-    "Holroyd",
-    "Holsworthy",
-    "Holts Flat",
-    "Home Rule",
-    "Homebush (NSW)",
-    "Homebush West",
-    "Homeleigh",
-    "Honeybugle",
-    "Hopefield",
-    "Hopkins Creek",
-    "Horningsea Park",
-    "Hornsby",
-    "Hornsby Heights",
-    "Horse Station Creek",
-    "Horseshoe Bend",
-    "Horseshoe Creek",
-    "Horsfield Bay",
-    "Horsley",
-    "Horsley Park",
-    "Hoskinstown",
-    "Hovells Creek",
-    "Howards Grass",
-    "Howell",
-    "Howes Valley",
-    "Howick (NSW)",
-    "Howlong",
-    "Hoxton Park",
-    "Humula",
-    "Hungerford (NSW)",
-    "Hunters Hill",
-    "Hunterview",
-    "Huntingdon",
-    "Huntingwood",
-    "Huntley (Orange - NSW)",
-    "Huntley (Wollongong - NSW)",
-    "Huntleys Cove",
-    "Huntleys Point",
-    "Huonbrook",
-    "Hurlstone Park",
-    "Hurstville",
-    "Hurstville Grove",
-    "Huskisson",
-    "Hyams Beach",
-    "Hydes Creek",
-    "Hyland Park",
-    "Hyndmans Creek",
-    "Ilarwill",
-    "Ilford",
-    "Illabo",
-    "Illaroo",
-    "Illawong",
-    "Iluka (NSW)",
-    "Indi",
-    "Ingebirah",
-    "Ingeegoodbee",
-    "Ingleburn",
-    "Ingleside",
-    "Innes View",
-    "Inverell",
-    "Invergordon (NSW)",
-    "Invergowrie",
-    "Iron Pot Creek",
-    "Ironbark (NSW)",
-    "Ironmungy",
-    "Irvington",
-    "Irymple (NSW)",
-    "Isabella",
-    "Islington",
-    "Ivanhoe (NSW)",
-    "Jackadgery",
-    "Jacks Creek",
-    "Jacksons Flat",
-    "Jacky Bulbin Flat",
-    "Jagumba",
-    "Jagungal Wilderness",
-    "Jamberoo",
-    "James Creek",
-    "Jamisontown",
-    "Jannali",
-    "Jaspers Brush",
-    "Jaunter",
-    "Jeir",
-    "Jellat Jellat",
-    "Jemalong",
-    "Jembaicumbene",
-    "Jennings",
-    "Jenolan",
-    "Jeogla",
-    "Jerangle",
-    "Jeremadra",
-    "Jeremy",
-    "Jerilderie",
-    "Jerrabattgulla",
-    "Jerrabomberra",
-    "Jerrara",
-    "Jerrawa",
-    "Jerrawangala",
-    "Jerrong",
-    "Jerrys Plains",
-    "Jerseyville",
-    "Jesmond",
-    "Jewells",
-    "Jews Lagoon",
-    "Jiggi",
-    "Jilliby",
-    "Jimenbuen",
-    "Jincumbilly",
-    "Jindabyne",
-    "Jinden",
-    "Jindera",
-    "Jingellic",
-    "Jingera",
-    "Joadja",
-    "Joes Box",
-    "Johns River",
-    "Jolly Nose",
-    "Jones Bridge",
-    "Jones Island",
-    "Jordan Springs",
-    "Judds Creek",
-    "Jugiong",
-    "Junction Hill",
-    "Junee",
-    "Junee Reefs",
-    "Kahibah",
-    "Kains Flat",
-    "Kalang",
-    "Kalaru",
-    "Kalkite",
-    "Kamarah",
-    "Kameruka",
-    "Kanahooka",
-    "Kanangra",
-    "Kandos",
-    "Kangaloon",
-    "Kangaroo Creek",
-    "Kangaroo Point (NSW)",
-    "Kangaroo Valley",
-    "Kangaroobie",
-    "Kangiara",
-    "Kangy Angy",
-    "Kanimbla (NSW)",
-    "Kanoona",
-    "Kanwal",
-    "Kapooka",
-    "Kaputar",
-    "Karaak Flat",
-    "Karabar",
-    "Karangi",
-    "Kareela",
-    "Kariong",
-    "Kars Springs",
-    "Karuah",
-    "Katoomba",
-    "Kayuga",
-    "Kearns",
-    "Kearsley",
-    "Keepit",
-    "Keera",
-    "Keerrong",
-    "Keinbah",
-    "Keiraville",
-    "Keith Hall",
-    "Kellys Plains",
-    "Kellyville",
-    "Kellyville Ridge",
-    "Kelso (NSW)",
-    "Kelvin",
-    "Kembla Grange",
-    "Kembla Heights",
-    "Kemps Creek",
-    "Kempsey",
-    "Kendall",
-    "Kenebri",
-    "Kennaicle Creek",
-    "Kensington (NSW)",
-    "Kenthurst",
-    "Kentlyn",
-    "Kentucky",
-    "Kentucky South",
-    "Kerewong",
-    "Keri Keri",
-    "Kerrabee",
-    "Kerrigundi",
-    "Kerrs Creek",
-    "Kew (NSW)",
-    "Keybarbin",
-    "Khancoban",
-    "Khatambuhl",
-    "Kia Ora (NSW)",
-    "Kiacatoo",
-    "Kiah",
-    "Kiama",
-    "Kiama Downs",
-    "Kiama Heights",
-    "Kianga (NSW)",
-    "Kiar",
-    "Kickabil",
-    "Kielvale",
-    "Kikiamah",
-    "Kikoira",
-    "Kilaben Bay",
-    "Kilgin",
-    "Kilgra",
-    "Killabakh",
-    "Killara (NSW)",
-    "Killarney Heights",
-    "Killarney Vale",
-    "Killawarra (NSW)",
-    "Killcare",
-    "Killcare Heights",
-    "Killiekrankie",
-    "Killimicat",
-    "Killingworth (NSW)",
-    "Killongbutta",
-    "Kimbriki",
-    "Kinchela",
-    "Kincumber",
-    "Kincumber South",
-    "Kindee",
-    "Kindervale",
-    "King Creek",
-    "Kingfisher Shores",
-    "Kinghorne",
-    "Kings Forest",
-    "Kings Langley",
-    "Kings Park (NSW)",
-    "Kings Plains (Blayney - NSW)",
-    "Kings Plains (Inverell - NSW)",
-    "Kings Point",
-    "Kingscliff",
-    "Kingsdale",
-    "Kingsford (NSW)",
-    "Kingsgate",
-    "Kingsgrove",
-    "Kingsland",
-    "Kingstown",
-    "Kingsvale",
-    "Kingswood (Bega Valley - NSW)",
-    "Kingswood (Penrith - NSW)",
-    "Kingswood (Tamworth Regional - NSW)",
-    "Kinvara",
-    "Kioloa",
-    "Kiora",
-    "Kippara",
-    "Kippaxs",
-    "Kippenduff",
-    "Kirkconnell",
-    "Kirkham",
-    "Kirrawee",
-    "Kirribilli",
-    "Kitchener",
-    "Kiwarrak",
-    "Klori",
-    "Knights Hill",
-    "Knockrow",
-    "Knorrit Flat",
-    "Knorrit Forest",
-    "Kogarah",
-    "Kogarah Bay",
-    "Kooba",
-    "Kookabookra",
-    "Koolewong",
-    "Koolkhan",
-    "Koonawarra",
-    "Koonorigan",
-    "Koonyum Range",
-    "Kooragang",
-    "Koorainghat",
-    "Koorawatha",
-    "Kooringal (NSW)",
-    "Kootingal",
-    "Koraleigh",
-    "Koreelah",
-    "Korora",
-    "Kosciuszko",
-    "Kotara",
-    "Kotara South",
-    "Krambach",
-    "Krawarree",
-    "Kremnos",
-    "Ku-ring-gai Chase",
-    "Kulnura",
-    "Kulwin (NSW)",
-    "Kunama",
-    "Kundabung",
-    "Kundibakh",
-    "Kundle Kundle",
-    "Kungala",
-    "Kunghur",
-    "Kunghur Creek",
-    "Kurmond",
-    "Kurnell",
-    "Kurraba Point",
-    "Kurrajong",
-    "Kurrajong Heights",
-    "Kurrajong Hills",
-    "Kurri Kurri",
-    "Kyalite",
-    "Kyarran",
-    "Kybeyan",
-    "Kyeamba",
-    "Kyeemagh",
-    "Kyle Bay",
-    "Kynnumboon",
-    "Kyogle",
-    "La Perouse",
-    "Lacmalac",
-    "Lade Vale",
-    "Ladysmith",
-    "Laffing Waters",
-    "Laggan",
-    "Lagoon Grass",
-    "Laguna",
-    "Lake Albert (NSW)",
-    "Lake Bathurst",
-    "Lake Brewster",
-    "Lake Burrendong",
-    "Lake Cargelligo",
-    "Lake Cathie",
-    "Lake Conjola",
-    "Lake Cowal",
-    "Lake George",
-    "Lake Haven",
-    "Lake Heights",
-    "Lake Hiawatha",
-    "Lake Hume Village",
-    "Lake Illawarra",
-    "Lake Innes",
-    "Lake Macquarie",
-    "Lake Munmorah",
-    "Lake Tabourie",
-    "Lake Wyangan",
-    "Lakelands (NSW)",
-    "Lakemba",
-    "Lakesland",
-    "Lakewood",
-    "Lalalty",
-    "Lalor Park",
-    "Lambs Valley (Glen Innes Severn - NSW)",
-    "Lambs Valley (Singleton - NSW)",
-    "Lambton",
-    "Landervale",
-    "Lane Cove",
-    "Lane Cove North",
-    "Lane Cove West",
-    "Langley Vale",
-    "Lanitza",
-    "Lankeys Creek",
-    "Lansdowne (Canterbury-Bankstown - NSW)",
-    "Lansdowne (Mid-Coast - NSW)",
-    "Lansdowne Forest",
-    "Lansvale",
-    "Lapstone",
-    "Larbert",
-    "Largs",
-    "Larnook",
-    "Larras Lee",
-    "Laughtondale",
-    "Laurel Hill",
-    "Laurieton",
-    "Lavadia",
-    "Lavender Bay",
-    "Laverstock",
-    "Lavington",
-    "Lawrence (NSW)",
-    "Lawson (NSW)",
-    "Leadville",
-    "Leconfield",
-    "Lee Creek",
-    "Leeton",
-    "Leets Vale",
-    "Leeville",
-    "Legume",
-    "Leichhardt (NSW)",
-    "Lemington",
-    "Lemon Tree",
-    "Lemon Tree Passage",
-    "Len Waters Estate",
-    "Lenaghan",
-    "Lennox Head",
-    "Leonay",
-    "Leppington",
-    "Lerida",
-    "Lethbridge Park",
-    "Leumeah",
-    "Leura",
-    "Levenstrath",
-    "Lewinsbrook",
-    "Lewis Ponds",
-    "Lewisham (NSW)",
-    "Leycester",
-    "Liberty Grove",
-    "Lidcombe",
-    "Liddell",
-    "Lidsdale",
-    "Lidster",
-    "Lightning Ridge",
-    "Lilli Pilli (Eurobodalla - NSW)",
-    "Lilli Pilli (Sutherland Shire - NSW)",
-    "Lillian Rock",
-    "Lilydale (NSW)",
-    "Lilyfield",
-    "Lilyvale (NSW)",
-    "Limbri",
-    "Limeburners Creek (Mid-Coast - NSW)",
-    "Limeburners Creek (Port Macquarie-Hastings - NSW)",
-    "Limekilns",
-    "Limerick",
-    "Limestone (NSW)",
-    "Limpinwood",
-    "Linburn",
-    "Linden (NSW)",
-    "Lindendale",
-    "Lindesay",
-    "Lindesay Creek",
-    "Lindfield",
-    "Lindifferon",
-    "Linley Point",
-    "Lionsville",
-    "Lisarow",
-    "Lismore (NSW)",
-    "Lismore Heights",
-    "Liston",
-    "Lithgow",
-    "Little Back Creek",
-    "Little Bay",
-    "Little Billabong",
-    "Little Forest",
-    "Little Hartley",
-    "Little Jacks Creek",
-    "Little Jilliby",
-    "Little Pelican",
-    "Little Plain",
-    "Little River (NSW)",
-    "Little Topar",
-    "Little Wobby",
-    "Littleton",
-    "Liverpool",
-    "Llanarth (NSW)",
-    "Llandilo",
-    "Llangothlin",
-    "Lloyd",
-    "Loadstone",
-    "Lochiel (NSW)",
-    "Lochinvar",
-    "Lockhart",
-    "Locksley (NSW)",
-    "Loftus",
-    "Loftville",
-    "Logans Crossing",
-    "Logie Brae",
-    "Londonderry (NSW)",
-    "Long Beach",
-    "Long Flat (NSW)",
-    "Long Jetty",
-    "Long Plain (Inverell - NSW)",
-    "Long Plain (Snowy Monaro Regional - NSW)",
-    "Long Point (Campbelltown - NSW)",
-    "Long Point (Singleton - NSW)",
-    "Longarm",
-    "Longreach (NSW)",
-    "Longueville",
-    "Loomberah",
-    "Lord Howe Island",
-    "Lords Hill",
-    "Lorn",
-    "Lorne (NSW)",
-    "Lost River",
-    "Lostock",
-    "Louisa Creek",
-    "Louth",
-    "Louth Park",
-    "Lovedale",
-    "Lovett Bay",
-    "Lowanna",
-    "Lower Acacia Creek",
-    "Lower Bago",
-    "Lower Belford",
-    "Lower Boro",
-    "Lower Bottle Creek",
-    "Lower Creek",
-    "Lower Duck Creek",
-    "Lower Dyraaba",
-    "Lower Lewis Ponds",
-    "Lower Macdonald",
-    "Lower Mangrove",
-    "Lower Pappinbarra",
-    "Lower Peacock",
-    "Lower Portland",
-    "Lower Southgate",
-    "Lowesdale",
-    "Lowther",
-    "Loxford",
-    "Lucas Heights",
-    "Lucknow (NSW)",
-    "Luddenham",
-    "Lue",
-    "Lugarno",
-    "Lurnea",
-    "Luskintyre",
-    "Lynchs Creek",
-    "Lyndhurst (Armidale Regional - NSW)",
-    "Lyndhurst (Blayney - NSW)",
-    "Lynwood (NSW)",
-    "Mabins Well",
-    "Macdonalds Creek",
-    "Macksville",
-    "Maclean",
-    "Macmasters Beach",
-    "Macquarie Fields",
-    "Macquarie Hills",
-    "Macquarie Links",
-    "Macquarie Marshes",
-    "Macquarie Park",
-    "Macquarie Pass",
-    "Maddens Plains",
-    "Maffra (NSW)",
-    "Magenta (NSW)",
-    "Magometon",
-    "Maianbar",
-    "Maimuru",
-    "Main Arm",
-    "Main Creek",
-    "Mairjimmy",
-    "Maison Dieu",
-    "Maitland (NSW)",
-    "Maitland Bar",
-    "Maitland Vale",
-    "Majors Creek (NSW)",
-    "Malabar",
-    "Malabugilmah",
-    "Maldon (NSW)",
-    "Mallabula",
-    "Mallan",
-    "Mallanganee",
-    "Mallee",
-    "Mallowa",
-    "Maloneys Beach",
-    "Malua Bay",
-    "Manar",
-    "Manchester Square",
-    "Mandagery",
-    "Mandalong",
-    "Mandemar",
-    "Mandurama",
-    "Mangerton",
-    "Mangoola",
-    "Mangoplah",
-    "Mangrove Creek",
-    "Mangrove Mountain",
-    "Manildra",
-    "Manilla",
-    "Manly (NSW)",
-    "Manly Vale",
-    "Mannering Park",
-    "Manning Point",
-    "Mannus",
-    "Manobalai",
-    "Manton (NSW)",
-    "Manyana",
-    "Maragle",
-    "Maraylya",
-    "Marayong",
-    "March",
-    "Marchmont",
-    "Mardi",
-    "Marengo (NSW)",
-    "Mares Run",
-    "Marinna",
-    "Marks Point",
-    "Markwell",
-    "Marlee",
-    "Marlo Merrican",
-    "Marlow",
-    "Marlowe",
-    "Marmong Point",
-    "Marom Creek",
-    "Maroota",
-    "Maroubra",
-    "Marrangaroo",
-    "Marrar",
-    "Marrickville",
-    "Marsden Park",
-    "Marsfield",
-    "Marshall Mount",
-    "Marshdale",
-    "Marthaguy",
-    "Martindale",
-    "Martins Creek",
-    "Martinsville",
-    "Marulan",
-    "Maryland (Newcastle - NSW)",
-    "Maryland (Tenterfield - NSW)",
-    "Marys Mount",
-    "Maryvale (NSW)",
-    "Maryville",
-    "Mascot",
-    "Matcham",
-    "Matheson",
-    "Mathoura",
-    "Matong",
-    "Matraville",
-    "Maude (NSW)",
-    "Maules Creek",
-    "Maxwell",
-    "Maybole",
-    "Mayers Flat",
-    "Mayfield (Newcastle - NSW)",
-    "Mayfield (Oberon - NSW)",
-    "Mayfield (Queanbeyan-Palerang Regional - NSW)",
-    "Mayfield (Shoalhaven - NSW)",
-    "Mayfield East",
-    "Mayfield North",
-    "Mayfield West",
-    "Mayrung",
-    "Mays Hill",
-    "Mayvale",
-    "McCullys Gap",
-    "McDougalls Hill",
-    "McGraths Hill",
-    "McKees Hill",
-    "McKellars Park",
-    "McLeans Ridges",
-    "McLeods Shoot",
-    "McMahons Point",
-    "McMahons Reef",
-    "Meadow Flat",
-    "Meadowbank (NSW)",
-    "Mebbin",
-    "Mebul",
-    "Medlow Bath",
-    "Medowie",
-    "Medway",
-    "Meerschaum Vale",
-    "Megalong Valley",
-    "Megan",
-    "Melbergen",
-    "Melinga",
-    "Mellong",
-    "Mellool",
-    "Melonba",
-    "Melrose Park (NSW)",
-    "Melville (NSW)",
-    "Memagong",
-    "Menah",
-    "Menai",
-    "Menangle",
-    "Menangle Park",
-    "Mendooran",
-    "Menindee",
-    "Merah North",
-    "Merewether",
-    "Merewether Heights",
-    "Merimbula",
-    "Meringo",
-    "Mernot",
-    "Meroo",
-    "Meroo Meadow",
-    "Merotherie",
-    "Merriangaah",
-    "Merricumbene",
-    "Merrigal",
-    "Merrill",
-    "Merriwa (NSW)",
-    "Merriwagga",
-    "Merrygoen",
-    "Merrylands",
-    "Merrylands West",
-    "Merungle Hill",
-    "Meryla",
-    "Metford",
-    "Methul",
-    "Metz",
-    "Miamley",
-    "Miandetta (NSW)",
-    "Micalo Island",
-    "Michelago",
-    "Middle Arm",
-    "Middle Brook",
-    "Middle Brother",
-    "Middle Cove",
-    "Middle Dural",
-    "Middle Falbrook",
-    "Middle Flat",
-    "Middle Pocket",
-    "Middleton Grange",
-    "Middlingbank",
-    "Midginbil",
-    "Mihi",
-    "Mila",
-    "Milbrodale",
-    "Milbrulong",
-    "Milkers Flat",
-    "Millah Murrah",
-    "Millbank (NSW)",
-    "Miller",
-    "Millers Forest",
-    "Millers Point",
-    "Millfield",
-    "Millie",
-    "Millingandi",
-    "Millthorpe",
-    "Milparinka",
-    "Milperra",
-    "Milroy (Gunnedah - NSW)",
-    "Milroy (Mid-Western Regional - NSW)",
-    "Milsons Passage",
-    "Milsons Point",
-    "Milton (NSW)",
-    "Milvale",
-    "Mimosa (NSW)",
-    "Minchinbury",
-    "Mindaribba",
-    "Mingoola (NSW)",
-    "Minimbah",
-    "Minjary",
-    "Minmi",
-    "Minnamurra",
-    "Minnie Water",
-    "Minore",
-    "Minto",
-    "Minto Heights",
-    "Mirador",
-    "Miranda (NSW)",
-    "Mirannie",
-    "Mirrabooka (NSW)",
-    "Mirrool",
-    "Missabotti",
-    "Mitchell (NSW)",
-    "Mitchells Flat",
-    "Mitchells Island",
-    "Mittagong",
-    "Moama",
-    "Modanville",
-    "Mogareeka",
-    "Mogendoura",
-    "Moggs Swamp",
-    "Mogilla",
-    "Mogo (Eurobodalla - NSW)",
-    "Mogo (Mid-Western Regional - NSW)",
-    "Mogo Creek",
-    "Mogood",
-    "Mograni",
-    "Mogriguy",
-    "Mole River",
-    "Moleville Creek",
-    "Mollyan",
-    "Mollymook",
-    "Mollymook Beach",
-    "Molong",
-    "Mona Vale",
-    "Monak",
-    "Monaltrie",
-    "Mondayong",
-    "Mondrook",
-    "Monga",
-    "Mongarlowe",
-    "Mongogarie",
-    "Monia Gap",
-    "Monivae",
-    "Monkerai",
-    "Monteagle",
-    "Montecollum",
-    "Montefiores",
-    "Monterey",
-    "Mooball",
-    "Moobi",
-    "Moogem",
-    "Mookerawa",
-    "Mookima Wybra",
-    "Moolarben",
-    "Moollattoo",
-    "Moolpa",
-    "Moombooldool",
-    "Moonan Brook",
-    "Moonan Flat",
-    "Moonbah",
-    "Moonbi",
-    "Moonbria",
-    "Mooneba",
-    "Moonee",
-    "Moonee Beach",
-    "Mooney Mooney",
-    "Mooney Mooney Creek",
-    "Moonpar",
-    "Mooral Creek",
-    "Moorara",
-    "Moorbel",
-    "Moore Creek",
-    "Moore Park",
-    "Moorebank",
-    "Moorilda",
-    "Moorland (NSW)",
-    "Moorong",
-    "Moorwatha",
-    "Moparrabah",
-    "Moppy",
-    "Morago",
-    "Morangarell",
-    "Morans Crossing",
-    "Moree",
-    "Morisset",
-    "Morisset Park",
-    "Morning Bay",
-    "Mororo",
-    "Morpeth",
-    "Mortdale",
-    "Mortlake (NSW)",
-    "Morton",
-    "Mortons Creek",
-    "Morts Estate",
-    "Morundah",
-    "Moruya",
-    "Moruya Heads",
-    "Morven (Glen Innes Severn - NSW)",
-    "Morven (Greater Hume Shire - NSW)",
-    "Mosman",
-    "Moss Vale",
-    "Mossgiel",
-    "Mossy Point",
-    "Moto",
-    "Moulamein",
-    "Mount Adrah",
-    "Mount Annan",
-    "Mount Aquila",
-    "Mount Arthur",
-    "Mount Austin",
-    "Mount Burrell",
-    "Mount Colah",
-    "Mount Collins",
-    "Mount Cooper (NSW)",
-    "Mount Darragh",
-    "Mount David",
-    "Mount Dee",
-    "Mount Druitt",
-    "Mount Elliot (NSW)",
-    "Mount Fairy",
-    "Mount Foster",
-    "Mount Frome",
-    "Mount George (NSW)",
-    "Mount Harris",
-    "Mount Hope (NSW)",
-    "Mount Horeb",
-    "Mount Hunter",
-    "Mount Hutton (NSW)",
-    "Mount Irvine",
-    "Mount Keira",
-    "Mount Kembla",
-    "Mount Kingiman",
-    "Mount Knowles",
-    "Mount Kuring-Gai",
-    "Mount Lambie",
-    "Mount Lewis",
-    "Mount Lindsey",
-    "Mount Marsden",
-    "Mount Marsh",
-    "Mount Mitchell",
-    "Mount Murray",
-    "Mount Olive (Oberon - NSW)",
-    "Mount Olive (Singleton - NSW)",
-    "Mount Ousley",
-    "Mount Panorama",
-    "Mount Pleasant (NSW)",
-    "Mount Pritchard",
-    "Mount Rankin",
-    "Mount Rivers",
-    "Mount Riverview",
-    "Mount Royal",
-    "Mount Russell",
-    "Mount Saint Thomas",
-    "Mount Seaview",
-    "Mount Tenandra",
-    "Mount Thorley",
-    "Mount Tomah",
-    "Mount Vernon",
-    "Mount Victoria",
-    "Mount View",
-    "Mount Vincent",
-    "Mount Warning",
-    "Mount Warrigal",
-    "Mount Werong",
-    "Mount White",
-    "Mount Wilson",
-    "Mountain Creek (NSW)",
-    "Mountain Lagoon",
-    "Mountain Top",
-    "Mountain View (NSW)",
-    "Mourquong",
-    "Mowbray Park",
-    "Mozart",
-    "Mudgee",
-    "Mulbring",
-    "Mulgoa",
-    "Mulgrave (NSW)",
-    "Mulguthrie",
-    "Muli Muli",
-    "Mulla",
-    "Mulla Creek",
-    "Mullaley",
-    "Mullamuddy",
-    "Mullaway",
-    "Mullengandra",
-    "Mullengudgery",
-    "Mullion",
-    "Mullion Creek",
-    "Mulloon",
-    "Mullumbimby",
-    "Mullumbimby Creek",
-    "Mulwala",
-    "Mulyandry",
-    "Mumbil",
-    "Mumblebone Plain",
-    "Mumbulla Mountain",
-    "Mummel",
-    "Mummulgum",
-    "Mundamia",
-    "Mundarlo",
-    "Munderoo",
-    "Mundongo",
-    "Mungay Creek",
-    "Munghorn",
-    "Mungindi (NSW)",
-    "Mungo",
-    "Mungo Brush",
-    "Munni",
-    "Munyabla",
-    "Murga",
-    "Murrah",
-    "Murrami",
-    "Murrawombie",
-    "Murray Downs",
-    "Murray Gorge",
-    "Murrays Beach",
-    "Murrays Run",
-    "Murrengenburg",
-    "Murrin Bridge",
-    "Murringo",
-    "Murrulebale",
-    "Murrumbateman",
-    "Murrumbo",
-    "Murrumbucca",
-    "Murrumburrah",
-    "Murrurundi",
-    "Murulla",
-    "Murwillumbah",
-    "Muscle Creek",
-    "Muswellbrook",
-    "Mutawintji",
-    "Muttama",
-    "Myall Creek",
-    "Myall Lake",
-    "Myall Park (NSW)",
-    "Myalla (NSW)",
-    "Mylestom",
-    "Mylneford",
-    "Myocum",
-    "Myola (NSW)",
-    "Myrtle Creek (NSW)",
-    "Myrtle Mountain",
-    "Myrtle Park",
-    "Myrtleville",
-    "Mystery Bay",
-    "Myuna Bay",
-    "Nabiac",
-    "Nadgee",
-    "Nambucca Heads",
-    "Namoi River",
-    "Nana Glen",
-    "Nangus",
-    "Nanima",
-    "Napoleon Reef",
-    "Naradhan",
-    "Narara",
-    "Narellan",
-    "Narellan Vale",
-    "Naremburn",
-    "Narooma",
-    "Narrabarba",
-    "Narrabeen",
-    "Narrabri",
-    "Narraburra",
-    "Narran Lake",
-    "Narrandera",
-    "Narrangullen",
-    "Narrawa",
-    "Narrawallee",
-    "Narraweena",
-    "Narromine",
-    "Narwee",
-    "Nashdale",
-    "Nashua",
-    "Nattai",
-    "Naughtons Gap",
-    "Neath",
-    "Nebea",
-    "Neilrex",
-    "Nelligen",
-    "Nelson (Bega Valley - NSW)",
-    "Nelson (The Hills Shire - NSW)",
-    "Nelson Bay (NSW)",
-    "Nelsons Plains",
-    "Nelungaloo",
-    "Nemingha",
-    "Nericon",
-    "Neringla",
-    "Nerong",
-    "Nerriga",
-    "Nerrigundah",
-    "Nethercote",
-    "Neurea",
-    "Neutral Bay",
-    "Never Never",
-    "Nevertire",
-    "Neville",
-    "New Berrima",
-    "New Brighton",
-    "New Buildings",
-    "New Italy",
-    "New Lambton",
-    "New Lambton Heights",
-    "New Mexico",
-    "New Park",
-    "New Valley",
-    "Newbold",
-    "Newbridge (NSW)",
-    "Newcastle",
-    "Newcastle East",
-    "Newcastle West",
-    "Newee Creek",
-    "Newington (NSW)",
-    "Newnes",
-    "Newnes Plateau",
-    "Newport (NSW)",
-    "Newrybar",
-    "Newstead (NSW)",
-    "Newton Boyd",
-    "Newtown (NSW)",
-    "Niagara Park",
-    "Niangala",
-    "Niemur",
-    "Nightcap",
-    "Nimbin",
-    "Nimmitabel",
-    "Nimmo",
-    "Nirimba Fields",
-    "Nobbys Creek",
-    "Nombi",
-    "Noona",
-    "Noorong",
-    "Nooroo",
-    "Norah Head",
-    "Noraville",
-    "Nords Wharf",
-    "Normanhurst",
-    "North Albury",
-    "North Arm (NSW)",
-    "North Arm Cove",
-    "North Avoca",
-    "North Balgowlah",
-    "North Batemans Bay",
-    "North Boambee Valley",
-    "North Bondi",
-    "North Bourke",
-    "North Brother",
-    "North Casino",
-    "North Curl Curl",
-    "North Dorrigo",
-    "North Epping",
-    "North Gosford",
-    "North Haven (NSW)",
-    "North Kellyville",
-    "North Lambton",
-    "North Lismore",
-    "North Macksville",
-    "North Manly",
-    "North Narooma",
-    "North Narrabeen",
-    "North Nowra",
-    "North Parramatta",
-    "North Richmond",
-    "North Rocks",
-    "North Rothbury",
-    "North Ryde",
-    "North Shore (NSW)",
-    "North St Marys",
-    "North Star",
-    "North Strathfield",
-    "North Sydney",
-    "North Tamworth",
-    "North Tumbulgum",
-    "North Turramurra",
-    "North Wagga Wagga",
-    "North Wahroonga",
-    "North Willoughby",
-    "North Wollongong",
-    "North Woodburn",
-    "North Yalgogrin",
-    "North Yeoval",
-    "Northangera",
-    "Northbridge (NSW)",
-    "Northmead",
-    "Northwood (NSW)",
-    "Norway",
-    "Norwest",
-    "Nowendoc",
-    "Nowley",
-    "Nowra",
-    "Nowra Hill",
-    "Nubba",
-    "Nulkaba",
-    "Nullamanna",
-    "Nullica",
-    "Nullo Mountain",
-    "Numbaa",
-    "Number One",
-    "Numbla Vale",
-    "Numbugga",
-    "Numeralla",
-    "Numinbah",
-    "Numulgi",
-    "Nunderi",
-    "Nundle",
-    "Nungatta",
-    "Nungatta South",
-    "Nurenmerenmong",
-    "Nymagee",
-    "Nymboida",
-    "Nyngan",
-    "Nyora (NSW)",
-    "Nyrang Creek",
-    "O'Connell (NSW)",
-    "Oak Flats",
-    "Oakdale (NSW)",
-    "Oakey Park",
-    "Oakhampton",
-    "Oakhampton Heights",
-    "Oakhurst (NSW)",
-    "Oaklands",
-    "Oakville",
-    "Oakwood (NSW)",
-    "Oallen",
-    "Oatlands (NSW)",
-    "Oatley",
-    "Oban",
-    "Obanvale",
-    "Oberne Creek",
-    "Oberon",
-    "Obley",
-    "Ocean Shores",
-    "Ogunbil",
-    "Old Adaminaby",
-    "Old Bar",
-    "Old Bonalbo",
-    "Old Erowal Bay",
-    "Old Grevillia",
-    "Old Guildford",
-    "Old Junee",
-    "Old Mill",
-    "Old Station",
-    "Old Toongabbie",
-    "Olinda (NSW)",
-    "Olney",
-    "Omadale",
-    "One Mile (NSW)",
-    "One Tree",
-    "Oolong",
-    "Ooma",
-    "Ootha",
-    "Ophir",
-    "Oran Park",
-    "Orange",
-    "Orange Grove (NSW)",
-    "Orangeville",
-    "Orchard Hills",
-    "Orient Point",
-    "Orton Park",
-    "Osborne (NSW)",
-    "Osterley (NSW)",
-    "Oswald",
-    "Otford",
-    "Oura",
-    "Ourimbah",
-    "Ournie",
-    "Owens Gap",
-    "Oxford Falls",
-    "Oxley (Balranald - NSW)",
-    "Oxley (Warren - NSW)",
-    "Oxley Island",
-    "Oxley Park",
-    "Oxley Vale",
-    "Oyster Bay",
-    "Oyster Cove (NSW)",
-    "Packsaddle",
-    "Paddington (NSW)",
-    "Paddys Flat (Kyogle - NSW)",
-    "Paddys Flat (Snowy Monaro Regional - NSW)",
-    "Paddys River (Snowy Valleys - NSW)",
-    "Paddys River (Wingecarribee - NSW)",
-    "Padstow",
-    "Padstow Heights",
-    "Pagans Flat",
-    "Pages Creek",
-    "Pages River",
-    "Pagewood",
-    "Palarang",
-    "Palerang",
-    "Paling Yards (Bathurst Regional - NSW)",
-    "Paling Yards (Oberon - NSW)",
-    "Pallal",
-    "Pallamallawa",
-    "Palm Beach (NSW)",
-    "Palm Grove (NSW)",
-    "Palmdale (NSW)",
-    "Palmers Channel",
-    "Palmers Island",
-    "Palmers Oaky",
-    "Palmvale",
-    "Palmwoods (NSW)",
-    "Pambula",
-    "Pambula Beach",
-    "Pampoolah",
-    "Pan Ban",
-    "Panania",
-    "Pangee",
-    "Panuara",
-    "Pappinbarra",
-    "Para",
-    "Paradise (NSW)",
-    "Paringi",
-    "Parkes (NSW)",
-    "Parkesbourne",
-    "Parklea",
-    "Parkville (NSW)",
-    "Parma",
-    "Parramatta",
-    "Parraweena",
-    "Patchs Beach",
-    "Paterson (NSW)",
-    "Patonga",
-    "Paupong",
-    "Paxton",
-    "Paynes Crossing",
-    "Paytens Bridge",
-    "Peacock Creek",
-    "Peak Hill (NSW)",
-    "Peak View",
-    "Peakhurst",
-    "Peakhurst Heights",
-    "Pearces Creek",
-    "Pearl Beach",
-    "Peats Ridge",
-    "Pebbly Beach",
-    "Peel",
-    "Peelwood",
-    "Pejar",
-    "Pelaw Main",
-    "Pelican (NSW)",
-    "Pelton",
-    "Pembrooke",
-    "Pemulwuy",
-    "Pendle Hill",
-    "Pennant Hills",
-    "Penrith",
-    "Penrose",
-    "Penshurst (NSW)",
-    "Pericoe",
-    "Perisher Valley",
-    "Perrys Crossing",
-    "Perthville",
-    "Petersham",
-    "Pheasants Nest",
-    "Phegans Bay",
-    "Phillip Bay",
-    "Phoenix Park",
-    "Piallamore",
-    "Piallaway",
-    "Piambong",
-    "Picketts Valley",
-    "Picnic Point",
-    "Picton (NSW)",
-    "Pigeonbah",
-    "Piggabeen",
-    "Pikapene",
-    "Pillar Valley",
-    "Pilliga",
-    "Pilot Wilderness",
-    "Pimlico (NSW)",
-    "Pimlico Island",
-    "Pinbeyan",
-    "Pindaroi",
-    "Pindimar",
-    "Pine Camp",
-    "Pine Clump",
-    "Pine Grove (NSW)",
-    "Pine Lodge (NSW)",
-    "Pine Ridge",
-    "Pine Valley",
-    "Piney Range",
-    "Pinkett",
-    "Pinnacle (NSW)",
-    "Pinnacle Swamp",
-    "Pinny Beach",
-    "Piora",
-    "Pipeclay",
-    "Pitnacree",
-    "Pitt Town",
-    "Pitt Town Bottoms",
-    "Pleasant Hills",
-    "Pleasure Point",
-    "Plumpton (NSW)",
-    "Point Clare",
-    "Point Frederick",
-    "Point Piper",
-    "Point Wolstoncroft",
-    "Pointer Mountain",
-    "Pokolbin",
-    "Pola Creek",
-    "Polo Flat",
-    "Pomeroy",
-    "Pomona (NSW)",
-    "Ponto",
-    "Pooncarie",
-    "Port Botany",
-    "Port Hacking",
-    "Port Kembla",
-    "Port Macquarie",
-    "Port Stephens",
-    "Porters Creek",
-    "Porters Retreat",
-    "Portland (NSW)",
-    "Possum Brush",
-    "Possum Creek",
-    "Potato Point",
-    "Pottery Estate",
-    "Potts Hill",
-    "Potts Point",
-    "Pottsville",
-    "Prairiewood",
-    "Premer",
-    "Prestons",
-    "Pretty Beach (Central Coast - NSW)",
-    "Pretty Beach (Shoalhaven - NSW)",
-    "Pretty Pine",
-    "Primbee",
-    "Primrose Valley",
-    "Prospect (NSW)",
-    "Providence Portal",
-    "Pucawan",
-    "Puddledock",
-    "Pulganbar",
-    "Pullabooka",
-    "Pulletop",
-    "Pumpenbil",
-    "Punchbowl (Canterbury-Bankstown - NSW)",
-    "Punchbowl (Clarence Valley - NSW)",
-    "Purfleet",
-    "Purlewaugh",
-    "Putney",
-    "Putta Bucca",
-    "Putty",
-    "Pyangle",
-    "Pymble",
-    "Pyramul",
-    "Pyree",
-    "Pyrmont",
-    "Quaama",
-    "Quakers Hill",
-    "Quambone",
-    "Quanda",
-    "Quandary",
-    "Quandialla",
-    "Queanbeyan",
-    "Queanbeyan East",
-    "Queanbeyan West",
-    "Queens Park (NSW)",
-    "Queens Pinch",
-    "Queenscliff (NSW)",
-    "Quialigo",
-    "Quidong",
-    "Quiera",
-    "Quipolly",
-    "Quirindi",
-    "Quorrobolong",
-    "Raby",
-    "Raglan (NSW)",
-    "Rainbow Flat",
-    "Rainbow Reach",
-    "Raleigh",
-    "Ramornie",
-    "Ramsgate",
-    "Ramsgate Beach",
-    "Rand",
-    "Randwick",
-    "Rangari",
-    "Rangers Valley",
-    "Rankin Park",
-    "Rankins Springs",
-    "Rannock",
-    "Rappville",
-    "Rathmines",
-    "Ravensdale",
-    "Ravenswood (NSW)",
-    "Ravensworth (NSW)",
-    "Rawdon Island",
-    "Rawdon Vale",
-    "Raworth",
-    "Rawsonville",
-    "Raymond Terrace",
-    "Razorback",
-    "Red Head",
-    "Red Hill (Snowy Valleys - NSW)",
-    "Red Hill (Tamworth Regional - NSW)",
-    "Red Hill (Warren - NSW)",
-    "Red Range",
-    "Red Rock",
-    "Red Rocks",
-    "Redbank (NSW)",
-    "Redbournberry",
-    "Reddestone",
-    "Redfern",
-    "Redhead",
-    "Redlands",
-    "Reedy Creek (NSW)",
-    "Reedy Swamp",
-    "Reefton (NSW)",
-    "Regents Park (NSW)",
-    "Regentville",
-    "Reids Flat",
-    "Reidsdale",
-    "Rennie",
-    "Reno",
-    "Renwick",
-    "Repentance Creek",
-    "Repton",
-    "Reserve Creek",
-    "Retreat (NSW)",
-    "Revesby",
-    "Revesby Heights",
-    "Rhine Falls",
-    "Rhodes",
-    "Richards",
-    "Richlands (NSW)",
-    "Richmond (NSW)",
-    "Richmond Hill (NSW)",
-    "Richmond Lowlands",
-    "Richmond Vale",
-    "Rileys Hill",
-    "Ringwood (NSW)",
-    "Riverlea",
-    "Riverside (NSW)",
-    "Riverstone",
-    "Rivertree",
-    "Riverview (NSW)",
-    "Riverwood",
-    "Rixs Creek",
-    "Rob Roy",
-    "Robertson (NSW)",
-    "Robin Hill",
-    "Rock Flat",
-    "Rock Forest",
-    "Rock Valley",
-    "Rockdale",
-    "Rockley",
-    "Rockley Mount",
-    "Rockton",
-    "Rocky Creek (Gwydir - NSW)",
-    "Rocky Creek (Inverell - NSW)",
-    "Rocky Glen",
-    "Rocky Hall",
-    "Rocky Plain (NSW)",
-    "Rocky Point (NSW)",
-    "Rocky River (Tenterfield - NSW)",
-    "Rocky River (Uralla - NSW)",
-    "Rodd Point",
-    "Rollands Plains",
-    "Rookhurst",
-    "Rookwood (NSW)",
-    "Rooty Hill",
-    "Ropes Crossing",
-    "Rose Bay (NSW)",
-    "Rose Valley (Kiama - NSW)",
-    "Rose Valley (Snowy Monaro Regional - NSW)",
-    "Rosebank",
-    "Roseberg",
-    "Roseberry",
-    "Roseberry Creek",
-    "Rosebery (NSW)",
-    "Rosebrook (NSW)",
-    "Rosedale (NSW)",
-    "Rosehill (NSW)",
-    "Roselands",
-    "Rosemeadow",
-    "Rosemeath",
-    "Roseville",
-    "Roseville Chase",
-    "Rosewood (Port Macquarie-Hastings - NSW)",
-    "Rosewood (Snowy Valleys - NSW)",
-    "Roslyn",
-    "Rossglen",
-    "Rossgole",
-    "Rossi",
-    "Rossmore (NSW)",
-    "Rothbury",
-    "Roto",
-    "Rouchel",
-    "Rouchel Brook",
-    "Roughit",
-    "Round Mountain",
-    "Round Swamp",
-    "Rous",
-    "Rous Mill",
-    "Rouse Hill",
-    "Rowan",
-    "Rowena",
-    "Rowlands Creek",
-    "Royal National Park",
-    "Royalla",
-    "Rozelle",
-    "Ruby Creek",
-    "Rufus",
-    "Rugby",
-    "Rukenvale",
-    "Run-o-Waters",
-    "Running Stream",
-    "Runnyford",
-    "Ruse",
-    "Rushcutters Bay",
-    "Rushes Creek",
-    "Rushforth",
-    "Russell Lea",
-    "Russell Vale",
-    "Rutherford",
-    "Ruthven",
-    "Ryan (NSW)",
-    "Rydal",
-    "Rydalmere",
-    "Ryde",
-    "Rye Park",
-    "Ryhope",
-    "Rylstone",
-    "Sackville",
-    "Sackville North",
-    "Saddleback Mountain",
-    "Sadleir",
-    "Safety Beach (NSW)",
-    "Salamander Bay",
-    "Salisbury (NSW)",
-    "Salisbury Plains",
-    "Sallys Flat",
-    "Salt Ash",
-    "Saltwater",
-    "San Isidore",
-    "San Remo (NSW)",
-    "Sancrox",
-    "Sanctuary Point",
-    "Sandbar",
-    "Sandgate (NSW)",
-    "Sandigo",
-    "Sandilands (NSW)",
-    "Sandon (NSW)",
-    "Sandringham (NSW)",
-    "Sandy Beach",
-    "Sandy Creek (Cobar - NSW)",
-    "Sandy Creek (Upper Hunter Shire - NSW)",
-    "Sandy Crossing",
-    "Sandy Flat",
-    "Sandy Gully (NSW)",
-    "Sandy Hill",
-    "Sandy Hollow",
-    "Sandy Point (NSW)",
-    "Sanger",
-    "Sans Souci",
-    "Sapphire",
-    "Sapphire Beach",
-    "Saratoga",
-    "Sassafras (NSW)",
-    "Saumarez",
-    "Saumarez Ponds",
-    "Savernake",
-    "Sawpit Creek",
-    "Sawtell",
-    "Sawyers Gully",
-    "Scarborough (NSW)",
-    "Scheyville",
-    "Schofields",
-    "Scone",
-    "Scotia",
-    "Scotland Island",
-    "Scotts Creek (NSW)",
-    "Scotts Flat",
-    "Scotts Head",
-    "Seaforth (NSW)",
-    "Seaham",
-    "Seahampton",
-    "Seal Rocks",
-    "Sebastopol (NSW)",
-    "Sedgefield",
-    "Seelands",
-    "Sefton",
-    "Segenhoe",
-    "Seven Hills (NSW)",
-    "Seven Oaks",
-    "Sextonville",
-    "Shadforth (NSW)",
-    "Shallow Bay",
-    "Shalvey",
-    "Shanes Park",
-    "Shannon Brook",
-    "Shannon Vale",
-    "Shannondale",
-    "Shannons Flat",
-    "Shark Creek",
-    "Sharps Creek",
-    "Sheedys Gully",
-    "Shell Cove",
-    "Shellharbour",
-    "Shellharbour City Centre",
-    "Shelly Beach (NSW)",
-    "Sherwood (Clarence Valley - NSW)",
-    "Sherwood (Kempsey - NSW)",
-    "Sherwood (Kyogle - NSW)",
-    "Shoal Bay (NSW)",
-    "Shoalhaven Heads",
-    "Shooters Hill",
-    "Shortland",
-    "Silent Grove",
-    "Silverdale (NSW)",
-    "Silverton (NSW)",
-    "Silverwater (Lake Macquarie - NSW)",
-    "Silverwater (Parramatta - NSW)",
-    "Simpkins Creek",
-    "Singleton (NSW)",
-    "Singleton Heights",
-    "Singleton Military Area",
-    "Singletons Mill",
-    "Six Mile Swamp",
-    "Skennars Head",
-    "Skillion Flat",
-    "Skinners Shoot",
-    "Sleepy Hollow",
-    "Smeaton Grange",
-    "Smiggin Holes",
-    "Smithfield (NSW)",
-    "Smiths Creek (Clarence Valley - NSW)",
-    "Smiths Creek (Kyogle - NSW)",
-    "Smiths Creek (Tweed - NSW)",
-    "Smiths Lake",
-    "Smithtown",
-    "Snakes Plain",
-    "Snowball",
-    "Snowy Plain",
-    "Sodwalls",
-    "Sofala",
-    "Soldiers Point",
-    "Somersby",
-    "Somerton (NSW)",
-    "South Albury",
-    "South Arm (Clarence Valley - NSW)",
-    "South Arm (Nambucca Valley - NSW)",
-    "South Ballina",
-    "South Bathurst",
-    "South Bowenfels",
-    "South Coogee",
-    "South Durras",
-    "South Golden Beach",
-    "South Grafton",
-    "South Granville",
-    "South Gundagai",
-    "South Gundurimba",
-    "South Guyra",
-    "South Hurstville",
-    "South Kempsey",
-    "South Lismore",
-    "South Littleton",
-    "South Maitland",
-    "South Maroota",
-    "South Murwillumbah",
-    "South Nowra",
-    "South Pambula",
-    "South Penrith",
-    "South Tamworth",
-    "South Turramurra",
-    "South Wentworthville",
-    "South West Rocks",
-    "South Windsor",
-    "South Wolumla",
-    "Southampton (NSW)",
-    "Southgate",
-    "Speers Point",
-    "Speewa",
-    "Spencer",
-    "Spicers Creek",
-    "Spicketts Creek",
-    "Splitters Creek",
-    "Spring Creek (NSW)",
-    "Spring Farm (NSW)",
-    "Spring Flat",
-    "Spring Grove",
-    "Spring Hill (Orange - NSW)",
-    "Spring Hill (Wollongong - NSW)",
-    "Spring Mountain (NSW)",
-    "Spring Plains",
-    "Spring Ridge",
-    "Spring Terrace",
-    "Springdale (NSW)",
-    "Springdale Heights",
-    "Springfield (Central Coast - NSW)",
-    "Springfield (Snowy Monaro Regional - NSW)",
-    "Springrange",
-    "Springside (NSW)",
-    "Springvale (NSW)",
-    "Springwood (NSW)",
-    "St Albans (NSW)",
-    "St Andrews (NSW)",
-    "St Clair (Penrith - NSW)",
-    "St Clair (Singleton - NSW)",
-    "St Fillans",
-    "St George (NSW)",
-    "St Georges Basin",
-    "St Helens Park",
-    "St Huberts Island",
-    "St Ives (NSW)",
-    "St Ives Chase",
-    "St Johns Park",
-    "St Leonards (NSW)",
-    "St Marys (NSW)",
-    "St Peters (NSW)",
-    "Stanborough",
-    "Stanbridge",
-    "Stanford Merthyr",
-    "Stanhope (NSW)",
-    "Stanhope Gardens",
-    "Stanmore (NSW)",
-    "Stannifer",
-    "Stannum",
-    "Stanwell Park",
-    "Stanwell Tops",
-    "State Mine Gully",
-    "Steam Plains",
-    "Steeple Flat",
-    "Stewarts Brook",
-    "Stewarts River",
-    "Stockinbingal",
-    "Stockrington",
-    "Stockton (NSW)",
-    "Stockyard Creek (NSW)",
-    "Stokers Siding",
-    "Stonehenge (NSW)",
-    "Stonequarry",
-    "Stony Chute",
-    "Stony Creek (Bega Valley - NSW)",
-    "Stony Creek (Mid-Western Regional - NSW)",
-    "Stony Crossing",
-    "Stotts Creek",
-    "Stratford (NSW)",
-    "Strathcedar",
-    "Stratheden",
-    "Strathfield (NSW)",
-    "Strathfield South",
-    "Stroud",
-    "Stroud Hill",
-    "Stroud Road",
-    "Stuart Town",
-    "Stuarts Point",
-    "Stubbo",
-    "Stud Park",
-    "Suffolk Park",
-    "Sugarloaf (NSW)",
-    "Summer Hill (Dungog - NSW)",
-    "Summer Hill (Inner West - NSW)",
-    "Summer Hill Creek",
-    "Summer Island",
-    "Summerland Point",
-    "Sun Valley (NSW)",
-    "Sunny Corner",
-    "Sunset Strip (NSW)",
-    "Sunshine (NSW)",
-    "Sunshine Bay",
-    "Suntop",
-    "Surf Beach (NSW)",
-    "Surfside",
-    "Surry Hills",
-    "Sussex Inlet",
-    "Sutherland (NSW)",
-    "Sutton (NSW)",
-    "Sutton Forest",
-    "Swan Bay (Port Stephens - NSW)",
-    "Swan Bay (Richmond Valley - NSW)",
-    "Swan Creek (NSW)",
-    "Swan Vale",
-    "Swanbrook",
-    "Swanhaven",
-    "Swans Crossing",
-    "Swansea (NSW)",
-    "Swansea Heads",
-    "Sweetmans Creek",
-    "Sydenham (NSW)",
-    "Sydney",
-    "Sydney Olympic Park",
-    "Sylvania",
-    "Sylvania Waters",
-    "Tabbil Creek",
-    "Tabbimoble",
-    "Tabbita",
-    "Table Top",
-    "Tabulam",
-    "Tacoma",
-    "Tacoma South",
-    "Tahlee",
-    "Tahmoor",
-    "Talarm",
-    "Talawanta",
-    "Talbingo",
-    "Tallawang",
-    "Tallawong",
-    "Tallimba",
-    "Tallong",
-    "Tallowal",
-    "Tallowwood Ridge",
-    "Tallwood",
-    "Tallwoods Village",
-    "Talmalmo",
-    "Talofa",
-    "Taloumbi",
-    "Tamarama",
-    "Tamban",
-    "Tambar Springs",
-    "Tambaroora",
-    "Taminda",
-    "Tamworth",
-    "Tanglewood",
-    "Tanilba Bay",
-    "Tanja",
-    "Tannas Mount",
-    "Tantangara",
-    "Tantawangalo",
-    "Tantonan",
-    "Tapitallee",
-    "Tara (NSW)",
-    "Taradale (NSW)",
-    "Tarago",
-    "Taralga",
-    "Tarana",
-    "Tarban",
-    "Tarbuck Bay",
-    "Tarcutta",
-    "Taree",
-    "Taree South",
-    "Taren Point",
-    "Tarlo",
-    "Tarraganda",
-    "Tarrawanna",
-    "Tarriaro",
-    "Tarro",
-    "Tascott",
-    "Tatham",
-    "Tathra",
-    "Tatton",
-    "Taylors Arm",
-    "Taylors Beach (NSW)",
-    "Taylors Flat",
-    "Tea Gardens",
-    "Telarah",
-    "Telegraph Point",
-    "Telopea",
-    "Temagog",
-    "Temora",
-    "Tempe",
-    "Ten Mile Hollow",
-    "Tenambit",
-    "Tenandra",
-    "Tennyson (NSW)",
-    "Tennyson Point",
-    "Tenterden (NSW)",
-    "Tenterfield",
-    "Teralba",
-    "Terania Creek",
-    "Terara",
-    "Teridgerie",
-    "Termeil",
-    "Terrabella",
-    "Terrace Creek",
-    "Terragon",
-    "Terramungamine",
-    "Terranora",
-    "Terreel",
-    "Terrey Hills",
-    "Terrigal",
-    "Terry Hie Hie",
-    "Teven",
-    "Tewinga",
-    "Texas (NSW)",
-    "Thalgarrah",
-    "Tharbogang",
-    "The Angle",
-    "The Basin (NSW)",
-    "The Bight",
-    "The Branch",
-    "The Brothers",
-    "The Channon",
-    "The Devils Wilderness",
-    "The Entrance",
-    "The Entrance North",
-    "The Freshwater",
-    "The Gap (Richmond Valley - NSW)",
-    "The Gap (Wagga Wagga - NSW)",
-    "The Glen (NSW)",
-    "The Gulf",
-    "The Hatch",
-    "The Hill",
-    "The Junction",
-    "The Lagoon",
-    "The Marra",
-    "The Meadows",
-    "The Oaks",
-    "The Pilliga",
-    "The Pinnacles",
-    "The Pocket",
-    "The Ponds",
-    "The Ridgeway",
-    "The Risk",
-    "The Rock",
-    "The Rocks (Bathurst Regional - NSW)",
-    "The Rocks (Sydney - NSW)",
-    "The Sandon",
-    "The Slopes",
-    "The Whiteman",
-    "Theresa Creek (NSW)",
-    "Theresa Park",
-    "Thirldene",
-    "Thirlmere",
-    "Thirroul",
-    "Thora",
-    "Thornleigh",
-    "Thornton (NSW)",
-    "Thredbo",
-    "Thrumster",
-    "Thuddungra",
-    "Thule",
-    "Thumb Creek",
-    "Thurgoona",
-    "Thyra",
-    "Tianjara",
-    "Tibbuc",
-    "Tibooburra",
-    "Tichborne",
-    "Tichular",
-    "Tighes Hill",
-    "Tilba Tilba",
-    "Tilbuster",
-    "Tilligerry Creek",
-    "Tilpa",
-    "Timbarra (NSW)",
-    "Timbillica",
-    "Timbumburi",
-    "Timor (NSW)",
-    "Tindarey",
-    "Tinderry",
-    "Tingha",
-    "Tingira Heights",
-    "Tinonee",
-    "Tinpot",
-    "Tintenbar",
-    "Tintinhull",
-    "Tiona",
-    "Tipperary (NSW)",
-    "Tiri",
-    "Tirrannaville",
-    "Titaatee Creek",
-    "Tocal",
-    "Tocumwal",
-    "Tolbar",
-    "Tolland",
-    "Tolwong",
-    "Tomago",
-    "Tomakin",
-    "Tomalla",
-    "Tombong",
-    "Tomboye",
-    "Tomerong",
-    "Tomewin",
-    "Tomingley",
-    "Tomki",
-    "Toms Creek",
-    "Tonderburine",
-    "Tongarra",
-    "Toogong",
-    "Tooleybuc",
-    "Toolijooa",
-    "Tooloom",
-    "Tooloon",
-    "Tooma",
-    "Toongabbie (NSW)",
-    "Toongi",
-    "Toonumbar",
-    "Tooranie",
-    "Tooraweenah",
-    "Toormina",
-    "Toorooka",
-    "Toothdale",
-    "Tootool",
-    "Toowoon Bay",
-    "Topi Topi",
-    "Toronto",
-    "Torrington (NSW)",
-    "Torryburn (Dungog - NSW)",
-    "Torryburn (Uralla - NSW)",
-    "Totnes Valley",
-    "Tottenham (NSW)",
-    "Touga",
-    "Toukley",
-    "Towallum",
-    "Towamba",
-    "Townsend",
-    "Towradgi",
-    "Towrang",
-    "Tralee",
-    "Trangie",
-    "Tregeagle",
-    "Tregear",
-    "Trenayr",
-    "Trentham Cliffs",
-    "Trewilga",
-    "Triamble",
-    "Triangle Flat",
-    "Trundle",
-    "Trungley Hall",
-    "Trunkey Creek",
-    "Tubbamurra",
-    "Tubbul",
-    "Tucabia",
-    "Tucki Tucki",
-    "Tuckombil",
-    "Tuckurimba",
-    "Tuena",
-    "Tuggerah",
-    "Tuggerawong",
-    "Tugrabakh",
-    "Tullakool",
-    "Tullamore",
-    "Tullarwalla",
-    "Tullera",
-    "Tullibigeal",
-    "Tullimbar",
-    "Tulloona",
-    "Tullymorgan",
-    "Tumbarumba",
-    "Tumbi Umbi",
-    "Tumblong",
-    "Tumbulgum",
-    "Tumorrama",
-    "Tumut",
-    "Tumut Plains",
-    "Tuncester",
-    "Tuncurry",
-    "Tunglebung",
-    "Tuntable Creek",
-    "Tuppal",
-    "Tura Beach",
-    "Turill",
-    "Turlinjah",
-    "Turners Flat",
-    "Turondale",
-    "Tuross",
-    "Tuross Head",
-    "Turramurra",
-    "Turrawan",
-    "Turrella",
-    "Turvey Park",
-    "Tweed Heads",
-    "Tweed Heads South",
-    "Tweed Heads West",
-    "Twelve Mile",
-    "Twelve Mile Creek",
-    "Twelve Mile Peg",
-    "Twenty Forests",
-    "Twin Rivers",
-    "Two Mile Flat",
-    "Tyagarah",
-    "Tyalgum",
-    "Tyalgum Creek",
-    "Tygalgah",
-    "Tyndale",
-    "Tyringham",
-    "Uarbry",
-    "Uki",
-    "Ulamambri",
-    "Ulan",
-    "Ulladulla",
-    "Ulmarra",
-    "Ulong",
-    "Ultimo",
-    "Umina Beach",
-    "Unanderra",
-    "Underbank",
-    "Undercliffe",
-    "Ungarie",
-    "Unumgar",
-    "Upper Allyn",
-    "Upper Bingara",
-    "Upper Burringbar",
-    "Upper Bylong",
-    "Upper Colo",
-    "Upper Coopers Creek",
-    "Upper Copmanhurst",
-    "Upper Corindi",
-    "Upper Crystal Creek",
-    "Upper Dartbrook",
-    "Upper Duck Creek",
-    "Upper Duroby",
-    "Upper Eden Creek",
-    "Upper Fine Flower",
-    "Upper Growee",
-    "Upper Horseshoe Creek",
-    "Upper Horton",
-    "Upper Kangaroo River",
-    "Upper Kangaroo Valley",
-    "Upper Karuah River",
-    "Upper Lansdowne",
-    "Upper Macdonald",
-    "Upper Main Arm",
-    "Upper Mangrove",
-    "Upper Manilla",
-    "Upper Mongogarie",
-    "Upper Myall",
-    "Upper Nile",
-    "Upper Orara",
-    "Upper Pappinbarra",
-    "Upper Rollands Plains",
-    "Upper Rouchel",
-    "Upper Taylors Arm",
-    "Upper Tooloom",
-    "Upper Turon",
-    "Upper Wilsons Creek",
-    "Upsalls Creek",
-    "Uralba",
-    "Uralla (NSW)",
-    "Urana",
-    "Urangeline",
-    "Urangeline East",
-    "Uranquinty",
-    "Urawilkie",
-    "Urbenville",
-    "Uriarra",
-    "Urila",
-    "Urliup",
-    "Urunga",
-    "Utungun",
-    "Vacy",
-    "Vale Of Clwydd",
-    "Valentine",
-    "Valery",
-    "Valla",
-    "Valla Beach",
-    "Valley Heights",
-    "Varroville",
-    "Vaucluse",
-    "Verges Creek",
-    "Verona",
-    "Villawood",
-    "Vincentia",
-    "Vineyard",
-    "Violet Hill",
-    "Vittoria (NSW)",
-    "Voyager Point",
-    "Wadalba",
-    "Wadbilliga",
-    "Wadeville",
-    "Wagga Wagga",
-    "Wagstaffe",
-    "Wahroonga",
-    "Waitara",
-    "Waitui",
-    "Wakefield",
-    "Wakeley",
-    "Wakool",
-    "Walang",
-    "Walbundrie",
-    "Walcha",
-    "Walcha Road",
-    "Waldegrave",
-    "Walgett",
-    "Walla Walla",
-    "Wallabadah",
-    "Wallabi Point",
-    "Wallacetown",
-    "Wallacia",
-    "Wallaga Lake",
-    "Wallagoot",
-    "Wallalong",
-    "Wallamore",
-    "Wallanbah",
-    "Wallangra",
-    "Wallanthery",
-    "Wallarah",
-    "Wallaringa",
-    "Wallarobba",
-    "Wallaroo (NSW)",
-    "Wallendbeen",
-    "Wallerawang",
-    "Walleroobie",
-    "Wallingat",
-    "Wallis Lake",
-    "Wallsend",
-    "Walmer (NSW)",
-    "Wamban",
-    "Wambangalang",
-    "Wamberal",
-    "Wamboin",
-    "Wambool",
-    "Wambrook",
-    "Wanaaring",
-    "Wandandian",
-    "Wandella (NSW)",
-    "Wandera",
-    "Wandook",
-    "Wandsworth",
-    "Wang Wauk",
-    "Wanganella",
-    "Wanganui",
-    "Wangi Wangi",
-    "Wantabadgery",
-    "Wantagong",
-    "Wantiool",
-    "Wapengo",
-    "Warabrook",
-    "Waratah (NSW)",
-    "Waratah West",
-    "Warburn",
-    "Wardell",
-    "Wardrop Valley",
-    "Wards Mistake",
-    "Wards River",
-    "Wareemba",
-    "Warialda",
-    "Warialda Rail",
-    "Warilla",
-    "Warkworth",
-    "Warners Bay",
-    "Warnervale",
-    "Warrabah",
-    "Warraderry",
-    "Warragai Creek",
-    "Warragamba",
-    "Warragoon",
-    "Warrah",
-    "Warrah Creek",
-    "Warrah Ridge",
-    "Warral",
-    "Warranulla",
-    "Warrawee",
-    "Warrawidgee",
-    "Warrawong",
-    "Warrazambil Creek",
-    "Warregah Island",
-    "Warrell Creek",
-    "Warren",
-    "Warri",
-    "Warriewood",
-    "Warrimoo",
-    "Warroo (NSW)",
-    "Warrumbungle",
-    "Warwick Farm",
-    "Washpool (Clarence Valley - NSW)",
-    "Washpool (Mid-Coast - NSW)",
-    "Watagan",
-    "Watanobbi",
-    "Waterfall",
-    "Waterloo (NSW)",
-    "Watersleigh",
-    "Waterview",
-    "Waterview Heights",
-    "Watsons Bay",
-    "Watsons Creek (NSW)",
-    "Wattamolla",
-    "Wattamondara",
-    "Wattle Flat (NSW)",
-    "Wattle Grove (NSW)",
-    "Wattle Ponds",
-    "Wattle Ridge (NSW)",
-    "Watton",
-    "Wauchope",
-    "Waugorah",
-    "Waukivory",
-    "Waverley (NSW)",
-    "Waverly",
-    "Waverton",
-    "Way Way",
-    "Wayo",
-    "Weabonga",
-    "Wean",
-    "Webbers Creek",
-    "Webbs Creek",
-    "Wedderburn (NSW)",
-    "Wee Jasper",
-    "Wee Waa",
-    "Weedallion",
-    "Weemelah",
-    "Weetaliba",
-    "Weethalle",
-    "Weilmoringle",
-    "Weismantels",
-    "Welaregang",
-    "Welby",
-    "Wellingrove",
-    "Wellington (NSW)",
-    "Wellington Vale",
-    "Wells Crossing",
-    "Wendoree Park",
-    "Wentworth (NSW)",
-    "Wentworth Falls",
-    "Wentworth Point",
-    "Wentworthville",
-    "Werai",
-    "Wereboldera",
-    "Wermatong",
-    "Werombi",
-    "Werri Beach",
-    "Werrikimbe",
-    "Werrington",
-    "Werrington County",
-    "Werrington Downs",
-    "Werris Creek",
-    "West Albury",
-    "West Ballina",
-    "West Bathurst",
-    "West Bungawalbin",
-    "West Coraki",
-    "West Gosford",
-    "West Haven",
-    "West Hoxton",
-    "West Kempsey",
-    "West Nowra",
-    "West Pennant Hills",
-    "West Pymble",
-    "West Ryde",
-    "West Tamworth",
-    "West Wallsend",
-    "West Wiangaree",
-    "West Wollongong",
-    "West Wyalong",
-    "Westbrook (NSW)",
-    "Westdale (Snowy Valleys - NSW)",
-    "Westdale (Tamworth Regional - NSW)",
-    "Westleigh",
-    "Westmead",
-    "Weston (NSW)",
-    "Westwood (NSW)",
-    "Wetherill Park",
-    "Wetuppa",
-    "Whalan",
-    "Whale Beach",
-    "Wheeler Heights",
-    "Wheeny Creek",
-    "Wheeo",
-    "Wherrol Flat",
-    "Whian Whian",
-    "Whiporie",
-    "White Cliffs",
-    "White Rock (NSW)",
-    "Whitebridge",
-    "Whiteman Creek",
-    "Whitlow",
-    "Whittingham",
-    "Whitton",
-    "Whoota",
-    "Wiagdon",
-    "Wiangaree",
-    "Wiarborough",
-    "Wickham (NSW)",
-    "Widden",
-    "Widgelli",
-    "Wilberforce (NSW)",
-    "Wilbetree",
-    "Wilcannia",
-    "Wild Cattle Creek",
-    "Wildes Meadow",
-    "Wiley Park",
-    "Willala",
-    "Willawarrin",
-    "Willbriggie",
-    "Willi Willi",
-    "Williamsdale",
-    "Williamtown",
-    "Willigobung",
-    "Willina",
-    "Willmot",
-    "Willoughby (NSW)",
-    "Willoughby East",
-    "Willow Tree",
-    "Willow Vale (Kiama - NSW)",
-    "Willow Vale (Wingecarribee - NSW)",
-    "Willsons Downfall",
-    "Willurah",
-    "Wilpinjong",
-    "Wilsons Creek",
-    "Wilton (NSW)",
-    "Wimbledon",
-    "Wimborne",
-    "Winburndale",
-    "Windale",
-    "Windang",
-    "Windella",
-    "Windellama",
-    "Windera (NSW)",
-    "Windermere (NSW)",
-    "Windermere Park",
-    "Windeyer (NSW)",
-    "Windowie",
-    "Windradyne",
-    "Windsor (NSW)",
-    "Windsor Downs",
-    "Windy",
-    "Winegrove",
-    "Wingadee",
-    "Wingello",
-    "Wingen",
-    "Wingham",
-    "Winifred",
-    "Winmalee",
-    "Winston Hills",
-    "Winton (NSW)",
-    "Wirlinga",
-    "Wirraba",
-    "Wirragulla",
-    "Wirrimah",
-    "Wirrimbi",
-    "Wirrinya",
-    "Wisemans Creek",
-    "Wisemans Ferry",
-    "Wittitrin",
-    "Wog Wog (Bega Valley - NSW)",
-    "Wog Wog (Queanbeyan-Palerang Regional - NSW)",
-    "Woko",
-    "Wolgan Valley",
-    "Wollangambe",
-    "Wollar",
-    "Wollemi",
-    "Wolli Creek",
-    "Wollogorang",
-    "Wollombi",
-    "Wollomombi",
-    "Wollongbar",
-    "Wollongong",
-    "Wollstonecraft",
-    "Wollumboola",
-    "Wollun",
-    "Wolumla",
-    "Wombarra",
-    "Wombat",
-    "Wombat Creek (NSW)",
-    "Wombeyan Caves",
-    "Womboota",
-    "Womerah",
-    "Wonboyn",
-    "Wonboyn North",
-    "Wondabyne",
-    "Wondalga",
-    "Wongarbon",
-    "Wongawilli",
-    "Wongo Creek",
-    "Wongwibinda",
-    "Woodberry",
-    "Woodbine (NSW)",
-    "Woodburn (Richmond Valley - NSW)",
-    "Woodburn (Shoalhaven - NSW)",
-    "Woodcroft (NSW)",
-    "Woodenbong",
-    "Woodford (NSW)",
-    "Woodford Island",
-    "Woodhill (NSW)",
-    "Woodhouselee",
-    "Woodlands (Eurobodalla - NSW)",
-    "Woodlands (Wingecarribee - NSW)",
-    "Woodlawn",
-    "Woodpark",
-    "Woodrising",
-    "Woodside (NSW)",
-    "Woodsreef",
-    "Woodstock (Cowra - NSW)",
-    "Woodstock (Inverell - NSW)",
-    "Woodstock (Shoalhaven - NSW)",
-    "Woodview",
-    "Woodville (NSW)",
-    "Woody Head",
-    "Woolbrook",
-    "Woolgarlo",
-    "Woolgoolga",
-    "Wooli",
-    "Woollahra",
-    "Woollamia",
-    "Woolloomooloo",
-    "Woolners Arm",
-    "Woolomin",
-    "Woolooma",
-    "Woolooware",
-    "Wooloweyah",
-    "Woolwich",
-    "Woomargama",
-    "Woombah",
-    "Woongarrah",
-    "Woonona",
-    "Wootton",
-    "Wooyung",
-    "Worlds End (NSW)",
-    "Woronora",
-    "Woronora Dam",
-    "Woronora Heights",
-    "Worrigee",
-    "Worrowing Heights",
-    "Woy Woy",
-    "Woy Woy Bay",
-    "Wrathall",
-    "Wrights Beach",
-    "Wrights Creek (NSW)",
-    "Wuuluman",
-    "Wyalong",
-    "Wyan",
-    "Wyanbene",
-    "Wyangala",
-    "Wyangle",
-    "Wybong",
-    "Wybung",
-    "Wyee",
-    "Wyee Point",
-    "Wylie Creek",
-    "Wylies Flat",
-    "Wymah",
-    "Wyndham (NSW)",
-    "Wyneden",
-    "Wyoming",
-    "Wyong",
-    "Wyong Creek",
-    "Wyongah",
-    "Wyrallah",
-    "Yabbra",
-    "Yadboro",
-    "Yagon",
-    "Yagoona",
-    "Yalbraith",
-    "Yallah",
-    "Yallaroi",
-    "Yalwal",
-    "Yamba (NSW)",
-    "Yambulla",
-    "Yanco",
-    "Yanderra",
-    "Yanga",
-    "Yankees Creek",
-    "Yannergee",
-    "Yantabulla",
-    "Yaouk",
-    "Yarara",
-    "Yarra",
-    "Yarrabandai",
-    "Yarrabin",
-    "Yarragal",
-    "Yarragrin",
-    "Yarragundry",
-    "Yarrahapinni",
-    "Yarramalong",
-    "Yarraman (NSW)",
-    "Yarramundi",
-    "Yarranbella",
-    "Yarrangobilly",
-    "Yarras (Bathurst Regional - NSW)",
-    "Yarras (Port Macquarie-Hastings - NSW)",
-    "Yarratt Forest",
-    "Yarravel",
-    "Yarrawa",
-    "Yarrawarrah",
-    "Yarrawonga (NSW)",
-    "Yarrawonga Park",
-    "Yarrie Lake",
-    "Yarrow",
-    "Yarrowford",
-    "Yarrowitch",
-    "Yarrowyck",
-    "Yass",
-    "Yass River",
-    "Yathella",
-    "Yattalunga (NSW)",
-    "Yatte Yattah",
-    "Yaven Creek",
-    "Yelgun",
-    "Yellow Dam",
-    "Yellow Pinch",
-    "Yellow Rock (Blue Mountains - NSW)",
-    "Yellow Rock (Shellharbour - NSW)",
-    "Yenda (NSW)",
-    "Yengo National Park",
-    "Yennora",
-    "Yeoval",
-    "Yerong Creek",
-    "Yerranderie",
-    "Yerrinbool",
-    "Yerriyong",
-    "Yessabah",
-    "Yetholme",
-    "Yetman",
-    "Yippin Creek",
-    "Yoogali",
-    "Yorklea",
-    "Young",
-    "Yowie Bay",
-    "Yowrie",
-    "Yullundry",
-    "Yuraygir",
-    "Zara",
-    "Zetland",
-    "No usual address (NSW)",
-    "Migratory - Offshore - Shipping (NSW)",
-    "Abbeyard",
-    "Abbotsford (Vic.)",
-    "Aberfeldie",
-    "Aberfeldy",
-    "Acheron",
-    "Ada",
-    "Adams Estate",
-    "Addington",
-    "Adelaide Lead",
-    "Agnes",
-    "Aintree",
-    "Aire Valley",
-    "Aireys Inlet",
-    "Airly",
-    "Airport West",
-    "Albacutya",
-    "Albanvale",
-    "Albert Park (Vic.)",
-    "Alberton (Vic.)",
-    "Alberton West",
-    "Albion (Vic.)",
-    "Alexandra (Vic.)",
-    "Alfredton",
-    "Allambee",
-    "Allambee Reserve",
-    "Allambee South",
-    "Allans Flat",
-    "Allansford",
-    "Allendale",
-    "Allestree",
-    "Alma (Vic.)",
-    "Almonds",
-    "Almurta",
-    "Alphington",
-    "Altona (Vic.)",
-    "Altona Meadows",
-    "Altona North",
-    "Alvie",
-    "Amherst",
-    "Amor",
-    "Amphitheatre",
-    "Anakie",
-    "Ancona",
-    "Anderson",
-    "Anglers Rest",
-    "Anglesea",
-    "Annuello",
-    "Antwerp",
-    "Apollo Bay (Vic.)",
-    "Appin (Vic.)",
-    "Appin South",
-    "Apsley (Vic.)",
-    "Ararat",
-    "Arawata",
-    "Arbuckle",
-    "Arcadia (Vic.)",
-    "Arcadia South",
-    "Archdale",
-    "Archdale Junction",
-    "Archerton",
-    "Archies Creek",
-    "Ardeer",
-    "Ardmona",
-    "Areegra",
-    "Argyle (Vic.)",
-    "Armadale (Vic.)",
-    "Armstrong",
-    "Armstrong Creek (Vic.)",
-    "Arnold (Vic.)",
-    "Arnold West",
-    "Arthurs Creek",
-    "Arthurs Seat",
-    "Ascot (Ballarat - Vic.)",
-    "Ascot (Greater Bendigo - Vic.)",
-    "Ascot Vale",
-    "Ashbourne (Vic.)",
-    "Ashburton",
-    "Ashwood",
-    "Aspendale",
-    "Aspendale Gardens",
-    "Athlone",
-    "Attwood",
-    "Aubrey",
-    "Auchmore",
-    "Avalon",
-    "Avenel",
-    "Avoca (Vic.)",
-    "Avon Plains",
-    "Avondale Heights",
-    "Avonmore",
-    "Avonsleigh",
-    "Axe Creek",
-    "Axedale",
-    "Ayrford",
-    "Bacchus Marsh",
-    "Baddaginnie",
-    "Badger Creek",
-    "Bael Bael",
-    "Bagshot",
-    "Bagshot North",
-    "Bahgallah",
-    "Bailieston",
-    "Bairnsdale",
-    "Bakery Hill",
-    "Balaclava (Vic.)",
-    "Bald Hills (Vic.)",
-    "Balintore",
-    "Ballan",
-    "Ballangeich",
-    "Ballapur",
-    "Ballarat Central",
-    "Ballarat East",
-    "Ballarat North",
-    "Ballendella",
-    "Balliang",
-    "Balliang East",
-    "Ballyrogan",
-    "Balmattum",
-    "Balmoral (Vic.)",
-    "Balnarring",
-    "Balnarring Beach",
-    "Balook",
-    "Balwyn",
-    "Balwyn North",
-    "Bamawm",
-    "Bamawm Extension",
-    "Bambra",
-    "Bamganie",
-    "Bandiana",
-    "Bangerang",
-    "Bangholme",
-    "Bannerton",
-    "Bannockburn (Vic.)",
-    "Banyan",
-    "Banyena",
-    "Baranduda",
-    "Barfold",
-    "Baringhup",
-    "Baringhup West",
-    "Barjarg",
-    "Barkers Creek",
-    "Barkly (Vic.)",
-    "Barkstead",
-    "Barmah",
-    "Barnadown",
-    "Barnawartha",
-    "Barnawartha North",
-    "Baromi",
-    "Barongarook",
-    "Barongarook West",
-    "Barrabool",
-    "Barrakee",
-    "Barramunga",
-    "Barraport",
-    "Barraport West",
-    "Barrys Reef",
-    "Barunah Park",
-    "Barunah Plains",
-    "Barwidgee",
-    "Barwite",
-    "Barwon Downs",
-    "Barwon Heads",
-    "Basalt (Vic.)",
-    "Bass",
-    "Batesford",
-    "Bathumi",
-    "Baw Baw (Vic.)",
-    "Baw Baw Village",
-    "Baxter",
-    "Bayindeen",
-    "Bayles",
-    "Baynton (Vic.)",
-    "Bayswater (Vic.)",
-    "Bayswater North",
-    "Beaconsfield (Vic.)",
-    "Beaconsfield Upper",
-    "Bealiba",
-    "Bearii",
-    "Bears Lagoon",
-    "Beauchamp",
-    "Beaufort (Vic.)",
-    "Beaumaris (Vic.)",
-    "Beazleys Bridge",
-    "Beeac",
-    "Beech Forest",
-    "Beechworth",
-    "Beenak",
-    "Belgrave",
-    "Belgrave Heights",
-    "Belgrave South",
-    "Bell Park",
-    "Bell Post Hill",
-    "Bellarine",
-    "Bellbird Creek",
-    "Bellbrae",
-    "Bellbridge",
-    "Bellellen",
-    "Bellfield (Banyule - Vic.)",
-    "Bellfield (Northern Grampians - Vic.)",
-    "Bells Beach",
-    "Belmont (Vic.)",
-    "Bemm River",
-    "Bena",
-    "Benalla",
-    "Benambra",
-    "Benayeo",
-    "Bend Of Islands",
-    "Bendigo",
-    "Bendoc",
-    "Bengworden",
-    "Benjeroop",
-    "Benloch",
-    "Bennison",
-    "Bentleigh",
-    "Bentleigh East",
-    "Benwerrin",
-    "Beremboke",
-    "Berrimal",
-    "Berringa",
-    "Berringama",
-    "Berriwillock",
-    "Berrybank",
-    "Berrys Creek",
-    "Berwick",
-    "Bessiebelle",
-    "Bet Bet",
-    "Bete Bolong",
-    "Bete Bolong North",
-    "Bethanga",
-    "Betley",
-    "Beulah (Vic.)",
-    "Beverford",
-    "Beveridge",
-    "Big Desert",
-    "Big Hill (Greater Bendigo - Vic.)",
-    "Big Hill (Surf Coast - Vic.)",
-    "Big Pats Creek",
-    "Biggara",
-    "Billabong",
-    "Bimbourie",
-    "Bindi",
-    "Binginwarri",
-    "Bingo Munjie",
-    "Birchip",
-    "Birchip West",
-    "Birdwoodton",
-    "Birregurra",
-    "Bittern",
-    "Black Hill (Vic.)",
-    "Black Range (Vic.)",
-    "Black Rock (Vic.)",
-    "Blackburn",
-    "Blackburn North",
-    "Blackburn South",
-    "Blackwarry",
-    "Blackwood (Vic.)",
-    "Blairgowrie",
-    "Blakeville",
-    "Blampied",
-    "Blind Bight",
-    "Blowhard",
-    "Bo Peep",
-    "Bobinawarrah",
-    "Bochara",
-    "Bogong",
-    "Boho",
-    "Boho South",
-    "Boigbeat",
-    "Boinka",
-    "Boisdale",
-    "Bolangum",
-    "Bolinda",
-    "Bolton",
-    "Bolwarra (Vic.)",
-    "Bolwarrah",
-    "Bona Vista",
-    "Bonang",
-    "Bonbeach",
-    "Bonegilla",
-    "Boneo",
-    "Bonn",
-    "Bonnie Brook",
-    "Bonnie Doon (Vic.)",
-    "Bonshaw (Vic.)",
-    "Bookaar",
-    "Boola",
-    "Boolarong",
-    "Boolarra",
-    "Boolarra South",
-    "Boole Poole",
-    "Boolite",
-    "Boomahnoomoonah",
-    "Boonah (Vic.)",
-    "Boorcan",
-    "Boorhaman",
-    "Boorhaman East",
-    "Boorhaman North",
-    "Boorolite",
-    "Boorool",
-    "Boort",
-    "Boosey",
-    "Boralma",
-    "Bornes Hill",
-    "Boronia",
-    "Borung",
-    "Bostocks Creek",
-    "Botanic Ridge",
-    "Boundary Bend",
-    "Bowenvale",
-    "Boweya",
-    "Boweya North",
-    "Bowmans Forest",
-    "Bowser",
-    "Box Hill (Vic.)",
-    "Box Hill North",
-    "Box Hill South",
-    "Boxwood",
-    "Bradford",
-    "Bradvale",
-    "Braeside",
-    "Brandy Creek (Vic.)",
-    "Branxholme",
-    "Bravington",
-    "Braybrook",
-    "Breakaway Creek",
-    "Breakwater",
-    "Breamlea",
-    "Brenanah",
-    "Brewster",
-    "Briagolong",
-    "Briar Hill",
-    "Bridge Creek",
-    "Bridgewater (Vic.)",
-    "Bridgewater North",
-    "Bridgewater On Loddon",
-    "Bright (Vic.)",
-    "Brighton (Vic.)",
-    "Brighton East",
-    "Brim",
-    "Brimboal",
-    "Brimin",
-    "Brimpaen",
-    "Bringalbert",
-    "Brit Brit",
-    "Broadford",
-    "Broadmeadows (Vic.)",
-    "Broadwater (Vic.)",
-    "Brodribb River",
-    "Broken Creek",
-    "Bromley",
-    "Brookfield (Vic.)",
-    "Brooklyn (Vic.)",
-    "Brookville",
-    "Broomfield",
-    "Broughton (Vic.)",
-    "Brown Hill (Vic.)",
-    "Browns Plains (Vic.)",
-    "Bruarong",
-    "Brucknell",
-    "Brumby",
-    "Brunswick (Vic.)",
-    "Brunswick East",
-    "Brunswick West",
-    "Bruthen",
-    "Buangor",
-    "Buchan",
-    "Buchan South",
-    "Buckland (Vic.)",
-    "Buckley",
-    "Buckley Swamp",
-    "Buckrabanyule",
-    "Budgee Budgee (Vic.)",
-    "Budgeree",
-    "Budgerum East",
-    "Buffalo",
-    "Buffalo River",
-    "Bulart",
-    "Buldah",
-    "Bulga (Vic.)",
-    "Bulgana",
-    "Bulla (Vic.)",
-    "Bullaharre",
-    "Bullarook",
-    "Bullarto",
-    "Bullarto South",
-    "Bulleen",
-    "Bullengarook",
-    "Bullioh",
-    "Bullumwaal",
-    "Buln Buln",
-    "Buln Buln East",
-    "Bumberrah",
-    "Bunbartha",
-    "Bundalaguah",
-    "Bundalong",
-    "Bundalong South",
-    "Bundara",
-    "Bunding",
-    "Bundoora (Vic.)",
-    "Bung Bong",
-    "Bungador",
-    "Bungal",
-    "Bungalally",
-    "Bungaree (Vic.)",
-    "Bungeet",
-    "Bungeet West",
-    "Bungil (Vic.)",
-    "Bunguluke",
-    "Buninyong",
-    "Bunkers Hill",
-    "Bunyip",
-    "Bunyip North",
-    "Buragwonduc",
-    "Burkes Bridge",
-    "Burkes Flat",
-    "Burnbank",
-    "Burnewang",
-    "Burnley",
-    "Burnside (Vic.)",
-    "Burnside Heights",
-    "Burramboot",
-    "Burramine",
-    "Burramine South",
-    "Burrowye",
-    "Burrumbeet",
-    "Burwood (Vic.)",
-    "Burwood East",
-    "Bushfield",
-    "Bushy Park (Vic.)",
-    "Butchers Ridge",
-    "Buxton (Vic.)",
-    "Byaduk",
-    "Byaduk North",
-    "Byawatha",
-    "Bylands",
-    "Byrneside",
-    "Cabarita (Vic.)",
-    "Cabbage Tree",
-    "Cabbage Tree Creek",
-    "Cadello",
-    "Cairnlea",
-    "Calder Park",
-    "Caldermeade",
-    "California Gully",
-    "Calivil",
-    "Callawadda",
-    "Callignee",
-    "Callignee North",
-    "Callignee South",
-    "Calrossie",
-    "Calulu",
-    "Cambarville",
-    "Camberwell (Vic.)",
-    "Cambrian Hill",
-    "Campbellfield",
-    "Campbells Bridge",
-    "Campbells Creek",
-    "Campbells Forest",
-    "Campbelltown (Vic.)",
-    "Camperdown (Vic.)",
-    "Canadian",
-    "Canary Island",
-    "Caniambo",
-    "Cann River",
-    "Cannie",
-    "Cannons Creek",
-    "Cannum",
-    "Canterbury (Vic.)",
-    "Cape Bridgewater",
-    "Cape Clear",
-    "Cape Conran",
-    "Cape Otway",
-    "Cape Paterson",
-    "Cape Schanck",
-    "Cape Woolamai",
-    "Capel Sound",
-    "Capels Crossing",
-    "Carag Carag",
-    "Caralulup",
-    "Caramut",
-    "Carapooee",
-    "Carapooee West",
-    "Carapook",
-    "Carboor",
-    "Cardigan",
-    "Cardigan Village",
-    "Cardinia",
-    "Cardross",
-    "Cargerie",
-    "Carina (Vic.)",
-    "Caringal",
-    "Carisbrook",
-    "Carlisle River",
-    "Carlsruhe",
-    "Carlton (Vic.)",
-    "Carlton North",
-    "Carlyle",
-    "Carnegie",
-    "Carngham",
-    "Caroline Springs",
-    "Carpendeit",
-    "Carrajung",
-    "Carrajung Lower",
-    "Carrajung South",
-    "Carranballac",
-    "Carron",
-    "Carrum",
-    "Carrum Downs",
-    "Carwarp",
-    "Cashmore",
-    "Cassilis (Vic.)",
-    "Castella",
-    "Casterton",
-    "Castle Creek (Vic.)",
-    "Castle Donnington",
-    "Castlemaine",
-    "Catani",
-    "Cathcart (Vic.)",
-    "Cathkin",
-    "Catumnal",
-    "Caulfield",
-    "Caulfield East",
-    "Caulfield North",
-    "Caulfield South",
-    "Caveat",
-    "Cavendish",
-    "Ceres",
-    "Chadstone",
-    "Chandlers Creek",
-    "Chapel Flat",
-    "Chapple Vale",
-    "Charam",
-    "Charlemont",
-    "Charleroi",
-    "Charlton (Vic.)",
-    "Chatsworth (Vic.)",
-    "Chelsea",
-    "Chelsea Heights",
-    "Cheltenham (Vic.)",
-    "Chepstowe",
-    "Cherokee",
-    "Cherrypool",
-    "Cheshunt",
-    "Cheshunt South",
-    "Chesney Vale",
-    "Chetwynd",
-    "Chewton",
-    "Chewton Bushlands",
-    "Childers (Vic.)",
-    "Chillingollah",
-    "Chiltern",
-    "Chiltern Valley",
-    "Chinangin",
-    "Chinkapook",
-    "Chintin",
-    "Chirnside Park",
-    "Chirrip",
-    "Chocolyn",
-    "Christmas Hills (Vic.)",
-    "Chum Creek",
-    "Churchill (Vic.)",
-    "Churchill Island",
-    "Chute",
-    "Clarendon (Vic.)",
-    "Claretown",
-    "Clarinda",
-    "Clarkefield",
-    "Clarkes Hill",
-    "Clayton",
-    "Clayton South",
-    "Clear Lake",
-    "Clematis",
-    "Clifton Creek",
-    "Clifton Hill",
-    "Clifton Springs",
-    "Clonbinane",
-    "Clover Flat",
-    "Cloverlea",
-    "Club Terrace",
-    "Clunes (Vic.)",
-    "Clyde (Vic.)",
-    "Clyde North",
-    "Clydebank",
-    "Clydesdale (Vic.)",
-    "Coalville",
-    "Cobains",
-    "Cobaw",
-    "Cobbannah",
-    "Cobberas",
-    "Cobblebank",
-    "Cobden",
-    "Cobram",
-    "Cobram East",
-    "Cobrico",
-    "Cobungra",
-    "Coburg",
-    "Coburg North",
-    "Cocamba",
-    "Cochranes Creek",
-    "Cockatoo (Vic.)",
-    "Cocoroc",
-    "Codrington (Vic.)",
-    "Coghills Creek",
-    "Cohuna",
-    "Coimadai",
-    "Cokum",
-    "Colac",
-    "Colac Colac",
-    "Colac East",
-    "Colac West",
-    "Colbinabbin",
-    "Colbrook",
-    "Coldstream (Vic.)",
-    "Coleraine",
-    "Colignan",
-    "Collingwood (Vic.)",
-    "Combienbar",
-    "Concongella",
-    "Condah",
-    "Congupna",
-    "Connewarre",
-    "Connewirricoo",
-    "Coojar",
-    "Coolaroo",
-    "Cooma (Vic.)",
-    "Coomboona",
-    "Coomoora",
-    "Coongulla",
-    "Coonooer Bridge",
-    "Coonooer West",
-    "Cooriemungle",
-    "Cope Cope",
-    "Cora Lynn",
-    "Corack",
-    "Corack East",
-    "Coragulac",
-    "Coral Bank",
-    "Corindhap",
-    "Corinella (Vic.)",
-    "Corio",
-    "Corndale (Vic.)",
-    "Cornella",
-    "Cornishtown",
-    "Coronet Bay",
-    "Corop",
-    "Cororooke",
-    "Corringle",
-    "Corryong",
-    "Corunnun",
-    "Cosgrove (Vic.)",
-    "Cosgrove South",
-    "Costerfield",
-    "Cotswold",
-    "Cottles Bridge",
-    "Cowa",
-    "Cowangie",
-    "Cowes",
-    "Cowleys Creek",
-    "Cowwarr",
-    "Craigie (Vic.)",
-    "Craigieburn",
-    "Cranbourne",
-    "Cranbourne East",
-    "Cranbourne North",
-    "Cranbourne South",
-    "Cranbourne West",
-    "Creek Junction",
-    "Creek View",
-    "Creightons Creek",
-    "Cremorne (Vic.)",
-    "Cressy (Vic.)",
-    "Creswick",
-    "Creswick North",
-    "Crib Point",
-    "Crookayan",
-    "Crooked River",
-    "Cross Roads (Vic.)",
-    "Crossley",
-    "Crossover",
-    "Crowlands",
-    "Croxton East",
-    "Croydon (Vic.)",
-    "Croydon Hills",
-    "Croydon North",
-    "Croydon South",
-    "Crymelon",
-    "Cudgee",
-    "Cudgewa",
-    "Culgoa",
-    "Culla",
-    "Cullen",
-    "Cullulleraine",
-    "Cundare",
-    "Cundare North",
-    "Curdies River",
-    "Curdievale",
-    "Curlewis (Vic.)",
-    "Curyo",
-    "Dadswells Bridge",
-    "Daisy Hill (Vic.)",
-    "Dales Creek",
-    "Dallas",
-    "Dalmore",
-    "Daltons Bridge",
-    "Dalyenong",
-    "Dalyston",
-    "Dandenong",
-    "Dandenong North",
-    "Dandenong South",
-    "Dandongadale",
-    "Dargo",
-    "Darley",
-    "Darlimurla",
-    "Darlington (Vic.)",
-    "Darnum",
-    "Darraweit Guim",
-    "Darriman",
-    "Dartmoor (Vic.)",
-    "Dartmouth",
-    "Dawson (Vic.)",
-    "Daylesford",
-    "Dean",
-    "Deans Marsh",
-    "Deanside",
-    "Deddick Valley",
-    "Dederang",
-    "Deep Lead",
-    "Deepdene (Vic.)",
-    "Deer Park",
-    "Delacombe",
-    "Delahey",
-    "Delatite",
-    "Delburn",
-    "Delegate River",
-    "Denicull Creek",
-    "Denison",
-    "Dennington",
-    "Denver",
-    "Deptford",
-    "Derby (Vic.)",
-    "Dereel",
-    "Dergholm",
-    "Derrimut",
-    "Derrinal",
-    "Derrinallum",
-    "Devenish",
-    "Devils River",
-    "Devon Meadows",
-    "Devon North",
-    "Dewhurst",
-    "Dhurringile",
-    "Diamond Creek",
-    "Digby",
-    "Diggers Rest",
-    "Diggora",
-    "Dimboola",
-    "Dingee",
-    "Dingley Village",
-    "Dingwall",
-    "Dinner Plain",
-    "Dixie (Vic.)",
-    "Dixons Creek",
-    "Dobie",
-    "Docker",
-    "Dockers Plains",
-    "Docklands",
-    "Doctors Flat",
-    "Dollar",
-    "Don Valley",
-    "Donald",
-    "Doncaster",
-    "Doncaster East",
-    "Donnybrook (Vic.)",
-    "Donvale",
-    "Dooboobetic",
-    "Dooen",
-    "Dookie",
-    "Dookie College",
-    "Doreen",
-    "Dorodong",
-    "Double Bridges",
-    "Douglas (Vic.)",
-    "Doveton",
-    "Dreeite",
-    "Dreeite South",
-    "Driffield",
-    "Drik Drik",
-    "Dromana",
-    "Dropmore",
-    "Drouin",
-    "Drouin East",
-    "Drouin South",
-    "Drouin West",
-    "Drumanure",
-    "Drumborg",
-    "Drumcondra",
-    "Drummartin",
-    "Drummond",
-    "Drummond North",
-    "Drung",
-    "Dry Diggings",
-    "Drysdale",
-    "Duchembegarra",
-    "Dumbalk",
-    "Dumbalk North",
-    "Dumosa",
-    "Dunach",
-    "Dundonnell",
-    "Dunkeld (Vic.)",
-    "Dunluce",
-    "Dunneworthy",
-    "Dunnstown",
-    "Dunolly (Vic.)",
-    "Dunrobin",
-    "Durdidwarrah",
-    "Durham Lead",
-    "Durham Ox",
-    "Dutson",
-    "Dutson Downs",
-    "Dutton Way",
-    "Duverney",
-    "Eagle Point",
-    "Eaglehawk",
-    "Eaglehawk North",
-    "Eaglemont",
-    "Earlston",
-    "East Bairnsdale",
-    "East Bendigo",
-    "East Geelong",
-    "East Melbourne",
-    "East Sale",
-    "East Wangaratta",
-    "East Warburton",
-    "Eastern View",
-    "Eastville",
-    "Eastwood (Vic.)",
-    "Ebden",
-    "Echuca",
-    "Echuca Village",
-    "Echuca West",
-    "Ecklin South",
-    "Eddington",
-    "Eden Park",
-    "Edenhope",
-    "Edgecombe",
-    "Edi",
-    "Edi Upper",
-    "Edithvale",
-    "Eganstown",
-    "Eildon",
-    "Elaine",
-    "Eldorado",
-    "Elevated Plains",
-    "Elingamite",
-    "Elingamite North",
-    "Elizabeth Island",
-    "Ellaswood",
-    "Ellerslie (Vic.)",
-    "Elliminyt",
-    "Ellinbank",
-    "Elmhurst",
-    "Elmore",
-    "Elphinstone (Vic.)",
-    "Elsternwick",
-    "Eltham (Vic.)",
-    "Eltham North",
-    "Elwood",
-    "Emerald (Vic.)",
-    "Emu",
-    "Emu Creek (Vic.)",
-    "Endeavour Hills",
-    "Enfield (Vic.)",
-    "Englefield",
-    "Enochs Point",
-    "Ensay",
-    "Ensay North",
-    "Eppalock",
-    "Epping (Vic.)",
-    "Epsom (Vic.)",
-    "Ercildoune",
-    "Erica",
-    "Errinundra",
-    "Eskdale (Vic.)",
-    "Esmond",
-    "Essendon",
-    "Essendon Fields",
-    "Essendon North",
-    "Essendon West",
-    "Eumemmerring",
-    "Eurack",
-    "Eureka (Vic.)",
-    "Euroa",
-    "Eurobin",
-    "Evansford",
-    "Eversley",
-    "Everton",
-    "Everton Upper",
-    "Exford",
-    "Eynesbury",
-    "Fairbank",
-    "Fairfield (Vic.)",
-    "Fairhaven",
-    "Fairley",
-    "Fairy Dell (Campaspe - Vic.)",
-    "Fairy Dell (East Gippsland - Vic.)",
-    "Falls Creek (Vic.)",
-    "Faraday",
-    "Fawcett",
-    "Fawkner",
-    "Fentons Creek",
-    "Ferguson (Vic.)",
-    "Fern Hill",
-    "Fernbank",
-    "Ferndale (Vic.)",
-    "Fernihurst",
-    "Fernshaw",
-    "Ferntree Gully",
-    "Ferny Creek",
-    "Fiery Flat",
-    "Fingal (Vic.)",
-    "Fish Creek",
-    "Fish Point",
-    "Fiskville",
-    "Fitzroy (Vic.)",
-    "Fitzroy North",
-    "Flaggy Creek",
-    "Flagstaff",
-    "Flamingo Beach",
-    "Flemington",
-    "Flinders (Vic.)",
-    "Flora Hill",
-    "Flowerdale (Vic.)",
-    "Flynn (Vic.)",
-    "Flynns Creek",
-    "Footscray",
-    "Forbes (Vic.)",
-    "Forest Hill (Vic.)",
-    "Forge Creek",
-    "Forrest (Vic.)",
-    "Foster",
-    "Foster North",
-    "Fosterville",
-    "Foxhow",
-    "Framlingham",
-    "Framlingham East",
-    "Franklinford",
-    "Frankston",
-    "Frankston North",
-    "Frankston South",
-    "Fraser Rise",
-    "Freeburgh",
-    "French Island",
-    "Frenchmans",
-    "Freshwater Creek",
-    "Fryerstown",
-    "Fulham (Vic.)",
-    "Fumina",
-    "Fumina South",
-    "Fyans Creek",
-    "Fyansford",
-    "Gaffneys Creek",
-    "Gainsborough",
-    "Gannawarra",
-    "Gapsted",
-    "Gardenvale",
-    "Garfield",
-    "Garfield North",
-    "Garibaldi",
-    "Garvoc",
-    "Gateway Island",
-    "Gatum",
-    "Gazette",
-    "Geelong",
-    "Geelong West",
-    "Gelantipy",
-    "Gellibrand",
-    "Gellibrand Lower",
-    "Gelliondale",
-    "Gembrook",
-    "Genoa",
-    "Gentle Annie",
-    "Georges Creek (Vic.)",
-    "Gerahmin",
-    "Gerang Gerung",
-    "Gerangamete",
-    "Germania",
-    "Germantown (Vic.)",
-    "Gerrigerrup",
-    "Gherang",
-    "Gheringhap",
-    "Ghin Ghin",
-    "Giffard",
-    "Giffard West",
-    "Gil Gil",
-    "Gilderoy",
-    "Gillieston",
-    "Gillum",
-    "Gipsy Point",
-    "Girgarre",
-    "Girgarre East",
-    "Gisborne",
-    "Gisborne South",
-    "Gladfield (Vic.)",
-    "Gladstone Park",
-    "Gladysdale",
-    "Glen Alvie",
-    "Glen Creek",
-    "Glen Forbes",
-    "Glen Huntly",
-    "Glen Iris (Vic.)",
-    "Glen Park",
-    "Glen Valley",
-    "Glen Waverley",
-    "Glen Wills",
-    "Glenaire",
-    "Glenaladale",
-    "Glenalbyn",
-    "Glenaroua",
-    "Glenbrae",
-    "Glenburn",
-    "Glendaruel",
-    "Glendonald",
-    "Glenfalloch",
-    "Glenfyne",
-    "Glengarry (Vic.)",
-    "Glengarry North",
-    "Glengarry West",
-    "Glengower",
-    "Glenhope",
-    "Glenhope East",
-    "Glenisla",
-    "Glenlee (Vic.)",
-    "Glenlofty",
-    "Glenlogie",
-    "Glenloth",
-    "Glenloth East",
-    "Glenluce",
-    "Glenlyon (Vic.)",
-    "Glenmaggie",
-    "Glenmore (Vic.)",
-    "Glenorchy (Vic.)",
-    "Glenormiston North",
-    "Glenormiston South",
-    "Glenpatrick",
-    "Glenrowan",
-    "Glenrowan West",
-    "Glenroy (Vic.)",
-    "Glenthompson",
-    "Glomar Beach",
-    "Gnarwarre",
-    "Gnotuk",
-    "Gobarup",
-    "Gobur",
-    "Golden Beach (Vic.)",
-    "Golden Gully",
-    "Golden Point (Ballarat - Vic.)",
-    "Golden Point (Mount Alexander - Vic.)",
-    "Golden Square",
-    "Goldie",
-    "Goldsborough (Vic.)",
-    "Gong Gong",
-    "Gonn Crossing",
-    "Goomalibee",
-    "Goon Nure",
-    "Goongerah",
-    "Gooram",
-    "Gooramadda",
-    "Goorambat",
-    "Goornong",
-    "Gooroc",
-    "Gorae",
-    "Gorae West",
-    "Gordon (Vic.)",
-    "Gormandale",
-    "Goroke",
-    "Goschen",
-    "Goughs Bay",
-    "Goulburn Weir",
-    "Gowanbrae",
-    "Gowanford",
-    "Gowangardie",
-    "Gowar East",
-    "Gower",
-    "Grahamvale",
-    "Grampians",
-    "Grand Ridge",
-    "Grangefields",
-    "Granite Rock",
-    "Grantville",
-    "Granya",
-    "Grassdale (Vic.)",
-    "Grassmere",
-    "Grays Bridge",
-    "Graytown",
-    "Gre Gre",
-    "Gre Gre North",
-    "Gre Gre South",
-    "Great Western",
-    "Gredgwin",
-    "Green Gully (Vic.)",
-    "Greendale (Vic.)",
-    "Greenhill (Vic.)",
-    "Greens Creek (Vic.)",
-    "Greensborough",
-    "Greenvale (Vic.)",
-    "Greenwald",
-    "Grenville",
-    "Greta (Vic.)",
-    "Greta South",
-    "Greta West",
-    "Grey River",
-    "Gringegalgona",
-    "Gritjurk",
-    "Grovedale",
-    "Gruyere",
-    "Guildford (Vic.)",
-    "Gunbower",
-    "Gundowring",
-    "Gunyah",
-    "Guys Forest",
-    "Guys Hill",
-    "Gymbowen",
-    "Haddon",
-    "Hadfield",
-    "Hallam",
-    "Hallora",
-    "Halls Gap",
-    "Hallston",
-    "Hamilton (Vic.)",
-    "Hamlyn Heights",
-    "Hampton (Vic.)",
-    "Hampton East",
-    "Hampton Park",
-    "Hansonville",
-    "Happy Valley (Golden Plains - Vic.)",
-    "Happy Valley (Swan Hill - Vic.)",
-    "Harcourt",
-    "Harcourt North",
-    "Harkaway",
-    "Harkness",
-    "Harmers Haven",
-    "Harrietville",
-    "Harrow",
-    "Harston",
-    "Hastings (Vic.)",
-    "Hattah",
-    "Havelock",
-    "Haven",
-    "Havilah (Vic.)",
-    "Hawkesdale",
-    "Hawkhurst",
-    "Hawthorn (Vic.)",
-    "Hawthorn East",
-    "Hazel Park",
-    "Hazelwood",
-    "Hazelwood North",
-    "Hazelwood South",
-    "Healesville",
-    "Heath Hill",
-    "Heathcote (Vic.)",
-    "Heathcote Junction",
-    "Heathcote South",
-    "Heatherton",
-    "Heathmere",
-    "Heathmont",
-    "Hedley",
-    "Heidelberg",
-    "Heidelberg Heights",
-    "Heidelberg West",
-    "Hensley Park",
-    "Henty (Vic.)",
-    "Hepburn",
-    "Hepburn Springs",
-    "Herne Hill (Vic.)",
-    "Hernes Oak",
-    "Hesket",
-    "Hesse",
-    "Hexham (Vic.)",
-    "Heyfield",
-    "Heytesbury Lower",
-    "Heywood",
-    "Hiamdale",
-    "Hiawatha",
-    "High Camp",
-    "Highett",
-    "Highlands",
-    "Highton",
-    "Hilgay",
-    "Hill End (Vic.)",
-    "Hillcrest (Vic.)",
-    "Hilldene",
-    "Hillside (East Gippsland - Vic.)",
-    "Hillside (Melton - Vic.)",
-    "Hinnomunjie",
-    "Hmas Cerberus",
-    "Hoddles Creek",
-    "Hollands Landing",
-    "Homebush (Vic.)",
-    "Homerton",
-    "Homewood",
-    "Hopetoun (Vic.)",
-    "Hopetoun Park",
-    "Hoppers Crossing",
-    "Hordern Vale",
-    "Horfield",
-    "Horsham",
-    "Hotham Heights",
-    "Hotspur",
-    "Howes Creek",
-    "Howitt Plains",
-    "Howqua",
-    "Howqua Hills",
-    "Howqua Inlet",
-    "Hughesdale",
-    "Humevale",
-    "Hunter",
-    "Hunterston",
-    "Huntingdale (Vic.)",
-    "Huntly",
-    "Huntly North",
-    "Huon",
-    "Huon Creek",
-    "Hurstbridge",
-    "Icy Creek",
-    "Iguana Creek",
-    "Illabarook",
-    "Illawarra",
-    "Illowa",
-    "Indented Head",
-    "Indigo Valley",
-    "Inglewood (Vic.)",
-    "Ingliston",
-    "Invergordon (Vic.)",
-    "Inverleigh",
-    "Inverloch",
-    "Invermay (Vic.)",
-    "Invermay Park",
-    "Iona",
-    "Iraak",
-    "Irishtown (Vic.)",
-    "Ironbark (Vic.)",
-    "Irrewarra",
-    "Irrewillipe",
-    "Irrewillipe East",
-    "Irymple (Vic.)",
-    "Ivanhoe (Vic.)",
-    "Ivanhoe East",
-    "Jacana",
-    "Jack River",
-    "Jackass Flat",
-    "Jacob Creek",
-    "Jam Jerrup",
-    "Jamieson (Vic.)",
-    "Jan Juc",
-    "Jancourt",
-    "Jancourt East",
-    "Jarklin",
-    "Jarrahmond",
-    "Jarvis Creek",
-    "Jeeralang",
-    "Jeeralang Junction",
-    "Jeetho",
-    "Jeffcott",
-    "Jeffcott North",
-    "Jeparit",
-    "Jericho (Vic.)",
-    "Jeruk",
-    "Jil Jil",
-    "Jindivick",
-    "Joel Joel",
-    "Joel South",
-    "Johanna",
-    "Johnsonville",
-    "Joyces Creek",
-    "Jumbuk",
-    "Jumbunna",
-    "Junction Village",
-    "Jungaburra",
-    "Junortoun",
-    "Kaarimba",
-    "Kadnook",
-    "Kalimna",
-    "Kalimna West",
-    "Kalkallo",
-    "Kalkee",
-    "Kallista",
-    "Kalorama",
-    "Kalpienung",
-    "Kamarooka",
-    "Kamarooka North",
-    "Kanagulk",
-    "Kancoona",
-    "Kangaroo Flat (Vic.)",
-    "Kangaroo Ground",
-    "Kaniva",
-    "Kanumbra",
-    "Kanya",
-    "Kanyapella",
-    "Karabeal",
-    "Kardella",
-    "Kardella South",
-    "Kariah",
-    "Karnak",
-    "Karramomus",
-    "Karyrie",
-    "Katamatite",
-    "Katamatite East",
-    "Katandra",
-    "Katandra West",
-    "Katunga",
-    "Kawarren",
-    "Kealba",
-    "Keely",
-    "Keilor",
-    "Keilor Downs",
-    "Keilor East",
-    "Keilor Lodge",
-    "Keilor North",
-    "Keilor Park",
-    "Kellalac",
-    "Kelvin View",
-    "Kenley",
-    "Kenmare (Vic.)",
-    "Kennedys Creek",
-    "Kennett River",
-    "Kennington",
-    "Kensington (Vic.)",
-    "Kerang",
-    "Kerang East",
-    "Kergunyah",
-    "Kergunyah South",
-    "Kernot",
-    "Kerrie",
-    "Kerrisdale",
-    "Kevington",
-    "Kew (Vic.)",
-    "Kew East",
-    "Kewell",
-    "Keysborough",
-    "Kialla",
-    "Kialla East",
-    "Kialla West",
-    "Kiata",
-    "Kiewa",
-    "Kilcunda",
-    "Killara (Glenelg - Vic.)",
-    "Killara (Wodonga - Vic.)",
-    "Killarney (Vic.)",
-    "Killawarra (Vic.)",
-    "Killingworth (Vic.)",
-    "Kilmany",
-    "Kilmore",
-    "Kilmore East",
-    "Kilsyth",
-    "Kilsyth South",
-    "Kimbolton (Vic.)",
-    "King Valley",
-    "Kinglake",
-    "Kinglake Central",
-    "Kinglake West",
-    "Kingower",
-    "Kings Park (Vic.)",
-    "Kingsbury",
-    "Kingston (Vic.)",
-    "Kingsville",
-    "Kinnabulla",
-    "Kinypanial",
-    "Kirkstall",
-    "Kirwans Bridge",
-    "Kithbrook",
-    "Knebsworth",
-    "Knockwood",
-    "Knowsley",
-    "Knoxfield",
-    "Koallah",
-    "Koetong",
-    "Kolora",
-    "Kongwak",
-    "Konongwootong",
-    "Koo Wee Rup",
-    "Koo Wee Rup North",
-    "Kooloonong",
-    "Koonda",
-    "Koondrook",
-    "Koonoomoo",
-    "Koonwarra",
-    "Kooreh",
-    "Koorlong",
-    "Koornalla",
-    "Kooroocheang",
-    "Koorool",
-    "Koorooman",
-    "Kooyong",
-    "Koriella",
-    "Korobeit",
-    "Koroit",
-    "Korong Vale",
-    "Koroop",
-    "Korumburra",
-    "Korumburra South",
-    "Korweinguboora",
-    "Kotta",
-    "Kotupna",
-    "Koyuga",
-    "Krowera",
-    "Kulwin (Vic.)",
-    "Kunat",
-    "Kurraca",
-    "Kurraca West",
-    "Kurting",
-    "Kurunjang",
-    "Kyabram",
-    "Kyabram South",
-    "Kyneton",
-    "Kyneton South",
-    "Kyvalley",
-    "Laanecoorie",
-    "Laang",
-    "Labertouche",
-    "Laceby",
-    "Ladys Pass",
-    "Laen",
-    "Laen East",
-    "Laen North",
-    "Lah",
-    "Laharum",
-    "Lake Boga",
-    "Lake Bolac",
-    "Lake Bunga",
-    "Lake Charm",
-    "Lake Condah",
-    "Lake Eildon",
-    "Lake Eppalock",
-    "Lake Fyans",
-    "Lake Gardens",
-    "Lake Goldsmith",
-    "Lake Lonsdale",
-    "Lake Marmal",
-    "Lake Meran",
-    "Lake Mundi",
-    "Lake Powell",
-    "Lake Rowan",
-    "Lake Tyers",
-    "Lake Tyers Beach",
-    "Lake Tyrrell",
-    "Lake Wellington",
-    "Lake Wendouree",
-    "Lake Wongan",
-    "Lakes Entrance",
-    "Lal Lal",
-    "Lalbert",
-    "Lalor",
-    "Lamplough",
-    "Lancaster",
-    "Lance Creek",
-    "Lancefield",
-    "Landsborough (Vic.)",
-    "Landsborough West",
-    "Lang Lang",
-    "Lang Lang East",
-    "Langdons Hill",
-    "Langi Kal Kal",
-    "Langi Logan",
-    "Langkoop",
-    "Langley",
-    "Langsborough",
-    "Langwarrin",
-    "Langwarrin South",
-    "Lara",
-    "Lardner",
-    "Larpent",
-    "Lascelles",
-    "Launching Place",
-    "Lauriston",
-    "Lavers Hill",
-    "Laverton (Vic.)",
-    "Laverton North",
-    "Lawler",
-    "Lawloit",
-    "Lawrence (Vic.)",
-    "Leaghur",
-    "Learmonth (Vic.)",
-    "Ledcourt",
-    "Leichardt",
-    "Leigh Creek (Vic.)",
-    "Leitchville",
-    "Lemnos",
-    "Leneva",
-    "Leonards Hill",
-    "Leongatha",
-    "Leongatha North",
-    "Leongatha South",
-    "Leopold",
-    "Lerderderg",
-    "Leslie Manor",
-    "Lethbridge",
-    "Lexton",
-    "Licola",
-    "Licola North",
-    "Lillico (Vic.)",
-    "Lillicur",
-    "Lillimur",
-    "Lilliput",
-    "Lilydale (Vic.)",
-    "Lima",
-    "Lima East",
-    "Lima South",
-    "Limestone (Vic.)",
-    "Lindenow",
-    "Lindenow South",
-    "Lindsay",
-    "Lindsay Point",
-    "Linga",
-    "Linton",
-    "Liparoo",
-    "Lismore (Vic.)",
-    "Litchfield",
-    "Little Desert",
-    "Little Hampton",
-    "Little River (Vic.)",
-    "Llanelly",
-    "Llowalong",
-    "Loch",
-    "Loch Sport",
-    "Loch Valley",
-    "Lockington",
-    "Locksley (Vic.)",
-    "Lockwood",
-    "Lockwood South",
-    "Loddon Vale",
-    "Logan",
-    "Londrigan",
-    "Long Forest",
-    "Long Gully",
-    "Longerenong",
-    "Longford (Vic.)",
-    "Longlea",
-    "Longwarry",
-    "Longwarry North",
-    "Longwood (Vic.)",
-    "Longwood East",
-    "Lorne (Vic.)",
-    "Lorquon",
-    "Lovely Banks",
-    "Lower Moira",
-    "Lower Norton",
-    "Lower Plenty",
-    "Loy Yang",
-    "Lubeck",
-    "Lucas",
-    "Lucknow (Vic.)",
-    "Lucyvale",
-    "Lurg",
-    "Lynbrook",
-    "Lyndhurst (Vic.)",
-    "Lyons (Vic.)",
-    "Lyonville",
-    "Lysterfield",
-    "Lysterfield South",
-    "Macarthur (Vic.)",
-    "Macclesfield (Vic.)",
-    "Macedon",
-    "Macks Creek",
-    "Macleod (Vic.)",
-    "Macorna",
-    "Macorna North",
-    "Macs Cove",
-    "Madalya",
-    "Maddingley",
-    "Mafeking",
-    "Maffra (Vic.)",
-    "Maffra West Upper",
-    "Magpie",
-    "Maiden Gully",
-    "Maidstone",
-    "Mailors Flat",
-    "Main Lead",
-    "Main Ridge",
-    "Maindample",
-    "Maintongoon",
-    "Major Plains",
-    "Majorca",
-    "Maldon (Vic.)",
-    "Mallacoota",
-    "Malmsbury",
-    "Malvern (Vic.)",
-    "Malvern East",
-    "Mambourin",
-    "Manangatang",
-    "Mandurang",
-    "Mandurang South",
-    "Mangalore (Vic.)",
-    "Manifold Heights",
-    "Mannerim",
-    "Mannibadar",
-    "Manns Beach",
-    "Manor Lakes",
-    "Manorina",
-    "Mansfield (Vic.)",
-    "Maramingo Creek",
-    "Marcus Hill",
-    "Mardan",
-    "Marengo (Vic.)",
-    "Maribyrnong",
-    "Marionvale",
-    "Markwood",
-    "Marlbed",
-    "Marlo",
-    "Marnoo",
-    "Marnoo East",
-    "Marnoo West",
-    "Marong",
-    "Maroona",
-    "Marraweeney",
-    "Marshall",
-    "Marthavale",
-    "Marungi",
-    "Maryborough (Vic.)",
-    "Maryknoll",
-    "Marysville",
-    "Maryvale (Vic.)",
-    "Massey",
-    "Matlock",
-    "Maude (Vic.)",
-    "McCrae",
-    "McIntyre",
-    "McKenzie Creek",
-    "McKenzie Hill",
-    "McKinnon",
-    "McLoughlins Beach",
-    "McMahons Creek",
-    "McMillans",
-    "Mead",
-    "Meadow Creek",
-    "Meadow Heights",
-    "Meatian",
-    "Meeniyan",
-    "Meering West",
-    "Meerlieu",
-    "Melbourne",
-    "Melbourne Airport",
-    "Melton (Vic.)",
-    "Melton South",
-    "Melton West",
-    "Melville Forest",
-    "Melwood",
-    "Mena Park",
-    "Mentone",
-    "Menzies Creek",
-    "Mepunga",
-    "Mepunga East",
-    "Mepunga West",
-    "Merbein",
-    "Merbein South",
-    "Merbein West",
-    "Meredith",
-    "Meringur",
-    "Merino",
-    "Mernda",
-    "Merriang",
-    "Merriang South",
-    "Merricks",
-    "Merricks Beach",
-    "Merricks North",
-    "Merrigum",
-    "Merrijig (East Gippsland - Vic.)",
-    "Merrijig (Mansfield - Vic.)",
-    "Merrimu",
-    "Merrinee",
-    "Merton",
-    "Metcalfe",
-    "Metcalfe East",
-    "Metung",
-    "Mia Mia (Vic.)",
-    "Mickleham",
-    "Middle Creek",
-    "Middle Park (Vic.)",
-    "Middle Tarwin",
-    "Miepoll",
-    "Miga Lake",
-    "Milawa",
-    "Mildura",
-    "Mill Park",
-    "Millbrook (Vic.)",
-    "Millgrove",
-    "Milloo",
-    "Milltown",
-    "Milnes Bridge",
-    "Mincha",
-    "Mincha West",
-    "Miners Rest",
-    "Mingay",
-    "Minhamite",
-    "Minimay",
-    "Mininera",
-    "Minjah",
-    "Minmindie",
-    "Minyip",
-    "Miowera",
-    "Miralie",
-    "Miram",
-    "Mirboo",
-    "Mirboo North",
-    "Mirimbah",
-    "Mirranatwa",
-    "Mitcham (Vic.)",
-    "Mitchell Park (Vic.)",
-    "Mitchellstown",
-    "Mitiamo",
-    "Mitre",
-    "Mitta Mitta",
-    "Mittyack",
-    "Mockinya",
-    "Modella",
-    "Modewarre",
-    "Moe",
-    "Moe South",
-    "Moggs Creek",
-    "Moglonemby",
-    "Mokepilly",
-    "Molesworth (Vic.)",
-    "Moliagul",
-    "Molka",
-    "Mollongghip",
-    "Mologa",
-    "Molyullah",
-    "Monbulk",
-    "Monegeetta",
-    "Mongans Bridge",
-    "Monomak",
-    "Monomeith",
-    "Mont Albert",
-    "Mont Albert North",
-    "Montgomery",
-    "Montmorency",
-    "Montrose (Vic.)",
-    "Moolap",
-    "Moolerr",
-    "Moolort",
-    "Moonambel",
-    "Moondarra",
-    "Moonee Ponds",
-    "Moonlight Flat (Central Goldfields - Vic.)",
-    "Moonlight Flat (Mount Alexander - Vic.)",
-    "Moora (Vic.)",
-    "Moorabbin",
-    "Moorabbin Airport",
-    "Moorabool",
-    "Mooralla",
-    "Moorilim",
-    "Moormbool West",
-    "Moornapa",
-    "Moorngag",
-    "Moorooduc",
-    "Mooroolbark",
-    "Mooroopna",
-    "Mooroopna North",
-    "Mooroopna North West",
-    "Moranding",
-    "Mordialloc",
-    "Morgiana",
-    "Moriac",
-    "Mornington (Vic.)",
-    "Moroka",
-    "Morrisons",
-    "Morrl Morrl",
-    "Mortlake (Vic.)",
-    "Morton Plains",
-    "Morwell",
-    "Mossiface",
-    "Mount Alfred",
-    "Mount Beauty",
-    "Mount Beckworth",
-    "Mount Best",
-    "Mount Bolton",
-    "Mount Bruno",
-    "Mount Buffalo",
-    "Mount Buller",
-    "Mount Burnett",
-    "Mount Bute",
-    "Mount Camel",
-    "Mount Cameron",
-    "Mount Clear",
-    "Mount Cole",
-    "Mount Cole Creek",
-    "Mount Cottrell",
-    "Mount Dandenong",
-    "Mount Doran",
-    "Mount Dryden",
-    "Mount Duneed",
-    "Mount Eccles",
-    "Mount Egerton",
-    "Mount Eliza",
-    "Mount Emu",
-    "Mount Evelyn",
-    "Mount Franklin",
-    "Mount Glasgow",
-    "Mount Helen",
-    "Mount Hooghly",
-    "Mount Lonarch",
-    "Mount Macedon",
-    "Mount Major",
-    "Mount Martha",
-    "Mount Mercer",
-    "Mount Moriac",
-    "Mount Napier",
-    "Mount Pleasant (Vic.)",
-    "Mount Prospect",
-    "Mount Richmond",
-    "Mount Rowan",
-    "Mount Sabine",
-    "Mount Tassie",
-    "Mount Taylor",
-    "Mount Toolebewong",
-    "Mount Wallace",
-    "Mount Waverley",
-    "Mountain Bay",
-    "Mountain View (Vic.)",
-    "Moutajup",
-    "Moyhu",
-    "Moyreisk",
-    "Moyston",
-    "Muckatah",
-    "Muckleford",
-    "Muckleford South",
-    "Mudgegonga",
-    "Mulgrave (Vic.)",
-    "Mumbannar",
-    "Mundoona",
-    "Munro",
-    "Muntham",
-    "Murchison (Vic.)",
-    "Murchison East",
-    "Murchison North",
-    "Murgheboluc",
-    "Murmungee",
-    "Murnungin",
-    "Murphys Creek (Vic.)",
-    "Murra Warra",
-    "Murrabit",
-    "Murrabit West",
-    "Murrawee",
-    "Murray-sunset",
-    "Murraydale",
-    "Murrayville",
-    "Murrindal",
-    "Murrindindi",
-    "Murroon",
-    "Murrumbeena",
-    "Murtoa",
-    "Musk",
-    "Musk Vale",
-    "Muskerry",
-    "Myall (Buloke - Vic.)",
-    "Myall (Gannawarra - Vic.)",
-    "Myamyn",
-    "Myers Flat",
-    "Myola (Vic.)",
-    "Myrniong",
-    "Myrrhee",
-    "Myrtle Creek (Vic.)",
-    "Myrtlebank",
-    "Myrtleford",
-    "Mysia",
-    "Mystic Park",
-    "Mywee",
-    "Nagambie",
-    "Nalangil",
-    "Nalinga",
-    "Nambrok",
-    "Nandaly",
-    "Nangana",
-    "Nangeela",
-    "Nangiloc",
-    "Nanneella",
-    "Nap Nap Marra",
-    "Napoleons",
-    "Nar Nar Goon",
-    "Nar Nar Goon North",
-    "Narbethong",
-    "Nareeb",
-    "Nareen",
-    "Nareewillock",
-    "Nariel Valley",
-    "Naring",
-    "Naringal",
-    "Naringal East",
-    "Naroghid",
-    "Narracan",
-    "Narraport",
-    "Narrapumelap South",
-    "Narrawong",
-    "Narre Warren",
-    "Narre Warren East",
-    "Narre Warren North",
-    "Narre Warren South",
-    "Narrung (Vic.)",
-    "Nathalia",
-    "Natimuk",
-    "Natte Yallock",
-    "Natya",
-    "Navarre",
-    "Navigators",
-    "Nayook",
-    "Neds Corner",
-    "Neereman",
-    "Neerim",
-    "Neerim East",
-    "Neerim Junction",
-    "Neerim North",
-    "Neerim South",
-    "Neilborough",
-    "Nelse",
-    "Nelson (Vic.)",
-    "Nerrena",
-    "Nerrin Nerrin",
-    "Nerrina",
-    "Nerring",
-    "Netherby (Vic.)",
-    "Neuarpurr",
-    "New Gisborne",
-    "Newborough",
-    "Newbridge (Vic.)",
-    "Newbury",
-    "Newcomb",
-    "Newfield",
-    "Newham",
-    "Newhaven",
-    "Newington (Vic.)",
-    "Newlands Arm",
-    "Newlyn",
-    "Newlyn North",
-    "Newmerella",
-    "Newport (Vic.)",
-    "Newry",
-    "Newstead (Vic.)",
-    "Newtown (Golden Plains - Vic.)",
-    "Newtown (Greater Geelong - Vic.)",
-    "Nhill",
-    "Nichols Point",
-    "Nicholson (Vic.)",
-    "Niddrie",
-    "Nilma",
-    "Nilma North",
-    "Ninda",
-    "Nine Mile (Vic.)",
-    "Nintingbool",
-    "Ninyeunook",
-    "Nirranda",
-    "Nirranda East",
-    "Nirranda South",
-    "Noble Park",
-    "Noble Park North",
-    "Noojee",
-    "Noorat",
-    "Noorat East",
-    "Noorinbee",
-    "Noorinbee North",
-    "Noradjuha",
-    "Norlane",
-    "Normanville (Vic.)",
-    "Norong",
-    "North Bendigo",
-    "North Blackwood",
-    "North Geelong",
-    "North Melbourne",
-    "North Shore (Vic.)",
-    "North Wangaratta",
-    "North Warrandyte",
-    "North Wonthaggi",
-    "Northcote",
-    "Northwood (Vic.)",
-    "Norval",
-    "Notting Hill",
-    "Nowa Nowa",
-    "Nowhere Creek",
-    "Nowie",
-    "Nug Nug",
-    "Nuggetty",
-    "Nulla Vale",
-    "Nullawarre",
-    "Nullawarre North",
-    "Nullawil",
-    "Numurkah",
-    "Nunawading",
-    "Nungurner",
-    "Nunniong",
-    "Nurcoung",
-    "Nurrabiel",
-    "Nurran",
-    "Nutfield",
-    "Nyah",
-    "Nyah West",
-    "Nyarrin",
-    "Nyerimilang",
-    "Nyora (Vic.)",
-    "Nyrraby",
-    "Oak Park",
-    "Oaklands Junction",
-    "Oakleigh",
-    "Oakleigh East",
-    "Oakleigh South",
-    "Oakvale",
-    "Ocean Grange",
-    "Ocean Grove",
-    "Officer",
-    "Officer South",
-    "Old Tallangatta",
-    "Olinda (Vic.)",
-    "Ombersley",
-    "Omeo",
-    "Omeo Valley",
-    "Ondit",
-    "Orbost",
-    "Orford (Vic.)",
-    "Ormond",
-    "Orrvale",
-    "Osbornes Flat",
-    "Outtrim",
-    "Ouyen",
-    "Ovens",
-    "Oxley (Vic.)",
-    "Oxley Flats",
-    "Ozenkadnook",
-    "Paaratte",
-    "Painswick",
-    "Pakenham",
-    "Pakenham South",
-    "Pakenham Upper",
-    "Panitya (Vic.)",
-    "Panmure",
-    "Panton Hill",
-    "Paradise (Vic.)",
-    "Paradise Beach",
-    "Paraparap",
-    "Park Orchards",
-    "Parkdale",
-    "Parkville (Vic.)",
-    "Parwan",
-    "Paschendale",
-    "Pascoe Vale",
-    "Pascoe Vale South",
-    "Pastoria",
-    "Pastoria East",
-    "Patchewollock",
-    "Patho",
-    "Patterson Lakes",
-    "Patyah",
-    "Paynesville (Vic.)",
-    "Pearcedale",
-    "Pearsondale",
-    "Peechelba",
-    "Peechelba East",
-    "Pelluebla",
-    "Pennyroyal",
-    "Penshurst (Vic.)",
-    "Pental Island",
-    "Pentland Hills",
-    "Percydale",
-    "Peronne",
-    "Perry Bridge",
-    "Peterborough (Vic.)",
-    "Petticoat Creek",
-    "Pheasant Creek (Vic.)",
-    "Piangil",
-    "Picola",
-    "Picola West",
-    "Piedmont",
-    "Pier Milan",
-    "Pigeon Ponds",
-    "Piggoreet",
-    "Pimpinio",
-    "Pine Grove (Vic.)",
-    "Pine Lodge (Vic.)",
-    "Pine Mountain (Vic.)",
-    "Pine View",
-    "Pioneer Bay",
-    "Pipers Creek",
-    "Pira",
-    "Piries",
-    "Pirron Yallock",
-    "Pitfield",
-    "Pittong",
-    "Plenty (Vic.)",
-    "Plumpton (Vic.)",
-    "Point Cook",
-    "Point Leo",
-    "Point Lonsdale",
-    "Point Wilson",
-    "Polisbet",
-    "Pomborneit",
-    "Pomborneit East",
-    "Pomborneit North",
-    "Pomonal",
-    "Pompapiel",
-    "Poolaijelo",
-    "Pootilla",
-    "Poowong",
-    "Poowong East",
-    "Poowong North",
-    "Porcupine Ridge",
-    "Porepunkah",
-    "Port Albert",
-    "Port Campbell",
-    "Port Fairy",
-    "Port Franklin",
-    "Port Melbourne",
-    "Port Welshpool",
-    "Portarlington",
-    "Portland (Vic.)",
-    "Portland North",
-    "Portland West",
-    "Portsea",
-    "Pound Creek",
-    "Powelltown",
-    "Powers Creek",
-    "Powlett Plains",
-    "Prahran",
-    "Prairie (Vic.)",
-    "Pranjip",
-    "Preston (Vic.)",
-    "Princes Hill",
-    "Princetown",
-    "Puckapunyal",
-    "Pura Pura",
-    "Purdeet",
-    "Purnim",
-    "Purnim West",
-    "Pyalong",
-    "Pyramid Hill",
-    "Quambatook",
-    "Quandong",
-    "Quantong",
-    "Quarry Hill",
-    "Queenscliff (Vic.)",
-    "Raglan (Vic.)",
-    "Rainbow",
-    "Ranceby",
-    "Rathscar",
-    "Rathscar West",
-    "Ravenhall",
-    "Ravenswood (Vic.)",
-    "Ravenswood South",
-    "Rawson",
-    "Raymond Island",
-    "Raywood",
-    "Red Cliffs",
-    "Red Hill (Vic.)",
-    "Red Hill South",
-    "Red Lion",
-    "Redan",
-    "Redbank (Vic.)",
-    "Redcastle",
-    "Redesdale",
-    "Reedy Creek (Vic.)",
-    "Reedy Dam",
-    "Reedy Flat",
-    "Reedy Lake",
-    "Reefton (Vic.)",
-    "Research",
-    "Reservoir (Vic.)",
-    "Reynard",
-    "Rheola",
-    "Rhyll",
-    "Rhymney",
-    "Riachella",
-    "Rich Avon",
-    "Rich Avon East",
-    "Rich Avon West",
-    "Richmond (Vic.)",
-    "Richmond Plains",
-    "Riddells Creek",
-    "Riggs Creek",
-    "Ringwood (Vic.)",
-    "Ringwood East",
-    "Ringwood North",
-    "Ripplebrook",
-    "Rippleside",
-    "Ripponlea",
-    "Riverside (Vic.)",
-    "Riverslea",
-    "Robertsons Beach",
-    "Robinvale",
-    "Rochester (Vic.)",
-    "Rochford",
-    "Rockbank",
-    "Rocklands",
-    "Rocklyn",
-    "Rocky Point (Vic.)",
-    "Rokeby (Vic.)",
-    "Rokewood",
-    "Rokewood Junction",
-    "Romsey",
-    "Rosanna",
-    "Rose River",
-    "Rosebery (Vic.)",
-    "Rosebrook (Vic.)",
-    "Rosebud",
-    "Rosedale (Vic.)",
-    "Roses Gap",
-    "Rosewhite",
-    "Roslynmead",
-    "Ross Creek (Vic.)",
-    "Rossbridge",
-    "Rostron",
-    "Rowsley",
-    "Rowville",
-    "Roxburgh Park",
-    "Rubicon",
-    "Ruby",
-    "Ruffy",
-    "Running Creek (Vic.)",
-    "Runnymede (Vic.)",
-    "Rupanyup",
-    "Rushworth",
-    "Russells Bridge",
-    "Rutherglen",
-    "Ryans",
-    "Ryanston",
-    "Rye",
-    "Rythdale",
-    "Safety Beach (Vic.)",
-    "Sailors Falls",
-    "Sailors Gully",
-    "Sailors Hill",
-    "Sale",
-    "Salisbury West",
-    "Samaria",
-    "San Remo (Vic.)",
-    "Sandford (Vic.)",
-    "Sandhill Lake",
-    "Sandhurst",
-    "Sandon (Vic.)",
-    "Sandringham (Vic.)",
-    "Sandy Creek (Vic.)",
-    "Sandy Point (Vic.)",
-    "Sargood",
-    "Sarsfield",
-    "Sassafras (Vic.)",
-    "Sawmill Settlement",
-    "Scarsdale",
-    "Scoresby",
-    "Scotchmans Lead",
-    "Scotsburn",
-    "Scotts Creek (Vic.)",
-    "Sea Lake",
-    "Seabrook",
-    "Seacombe",
-    "Seaford (Vic.)",
-    "Seaholme",
-    "Seaspray",
-    "Seaton (Vic.)",
-    "Seaview",
-    "Sebastian",
-    "Sebastopol (Vic.)",
-    "Seddon (Vic.)",
-    "Sedgwick",
-    "Selby",
-    "Selwyn (Vic.)",
-    "Separation Creek",
-    "Serpentine (Vic.)",
-    "Serviceton",
-    "Seville",
-    "Seville East",
-    "Seymour (Vic.)",
-    "Shady Creek",
-    "Shays Flat",
-    "She Oaks",
-    "Sheans Creek",
-    "Sheep Hills",
-    "Shelbourne",
-    "Shelford",
-    "Shelley (Vic.)",
-    "Shepherds Flat",
-    "Shepparton",
-    "Shepparton East",
-    "Shepparton North",
-    "Sherbrooke",
-    "Shoreham",
-    "Sidonia",
-    "Silvan",
-    "Silverleaves",
-    "Simpson (Vic.)",
-    "Simpsons Creek",
-    "Simson",
-    "Skenes Creek",
-    "Skenes Creek North",
-    "Skibo",
-    "Skinners Flat",
-    "Skipton",
-    "Skye (Vic.)",
-    "Slaty Creek",
-    "Smeaton",
-    "Smiths Beach",
-    "Smiths Gully",
-    "Smokeytown",
-    "Smoko",
-    "Smythes Creek",
-    "Smythesdale",
-    "Snake Island",
-    "Snake Valley",
-    "Soldiers Hill (Vic.)",
-    "Somers",
-    "Somerton (Vic.)",
-    "Somerville (Vic.)",
-    "Sorrento (Vic.)",
-    "South Dudley",
-    "South Geelong",
-    "South Kingsville",
-    "South Melbourne",
-    "South Morang",
-    "South Purrumbete",
-    "South Wharf",
-    "South Yarra",
-    "Southbank",
-    "Southern Cross (Vic.)",
-    "Spargo Creek",
-    "Speed",
-    "Spotswood",
-    "Spring Gully (Vic.)",
-    "Spring Hill (Vic.)",
-    "Springbank",
-    "Springdallah",
-    "Springfield (Buloke - Vic.)",
-    "Springfield (Macedon Ranges - Vic.)",
-    "Springhurst",
-    "Springmount",
-    "Springvale (Vic.)",
-    "Springvale South",
-    "St Albans (Vic.)",
-    "St Albans Park",
-    "St Andrews (Vic.)",
-    "St Andrews Beach",
-    "St Arnaud",
-    "St Arnaud East",
-    "St Arnaud North",
-    "St Clair (Vic.)",
-    "St Germains",
-    "St Helena",
-    "St Helens (Vic.)",
-    "St Helens Plains",
-    "St James (Vic.)",
-    "St Kilda (Vic.)",
-    "St Kilda East",
-    "St Kilda West",
-    "St Leonards (Vic.)",
-    "Staceys Bridge",
-    "Staffordshire Reef",
-    "Staghorn Flat",
-    "Stanhope (Vic.)",
-    "Stanley (Vic.)",
-    "Staughton Vale",
-    "Stavely",
-    "Stawell",
-    "Steels Creek",
-    "Steiglitz (Vic.)",
-    "Stewarton (Vic.)",
-    "Stirling (Vic.)",
-    "Stockdale",
-    "Stockyard Hill",
-    "Stonehaven",
-    "Stoneleigh (Vic.)",
-    "Stony Creek (Central Goldfields - Vic.)",
-    "Stony Creek (South Gippsland - Vic.)",
-    "Stonyford",
-    "Stradbroke",
-    "Strangways",
-    "Straten",
-    "Stratford (Vic.)",
-    "Strath Creek",
-    "Strathallan",
-    "Strathbogie",
-    "Strathdale",
-    "Strathdownie",
-    "Strathewen",
-    "Strathfieldsaye",
-    "Strathkellar",
-    "Strathlea",
-    "Strathmerton",
-    "Strathmore (Vic.)",
-    "Strathmore Heights",
-    "Strathtulloh",
-    "Streatham",
-    "Strzelecki (Vic.)",
-    "Stuart Mill",
-    "Sugarloaf (Vic.)",
-    "Sugarloaf Creek",
-    "Suggan Buggan",
-    "Sulky",
-    "Summerlands",
-    "Sunbury",
-    "Sunday Creek",
-    "Sunderland Bay",
-    "Sunset Strip (Vic.)",
-    "Sunshine (Vic.)",
-    "Sunshine North",
-    "Sunshine West",
-    "Surf Beach (Vic.)",
-    "Surrey Hills",
-    "Sutherland (Vic.)",
-    "Sutherlands Creek",
-    "Sutton (Vic.)",
-    "Sutton Grange",
-    "Swan Bay (Vic.)",
-    "Swan Hill",
-    "Swan Hill West",
-    "Swan Island",
-    "Swan Marsh",
-    "Swan Reach (Vic.)",
-    "Swanpool",
-    "Swanwater",
-    "Swanwater West",
-    "Swifts Creek",
-    "Sydenham (Vic.)",
-    "Sylvaterre",
-    "Tabberabbera",
-    "Tabilk",
-    "Tabor",
-    "Taggerty",
-    "Tahara",
-    "Tahara Bridge",
-    "Tahara West",
-    "Talbot (Vic.)",
-    "Talgarno",
-    "Tallandoon",
-    "Tallangatta",
-    "Tallangatta East",
-    "Tallangatta South",
-    "Tallangatta Valley",
-    "Tallarook",
-    "Tallygaroopna",
-    "Tambo Crossing",
-    "Tambo Upper",
-    "Tamboon",
-    "Tamboritha",
-    "Taminick",
-    "Tamleugh",
-    "Tamleugh North",
-    "Tandarook",
-    "Tandarra",
-    "Tangambalanga",
-    "Tanjil",
-    "Tanjil Bren",
-    "Tanjil South",
-    "Tanwood",
-    "Tanybryn",
-    "Taradale (Vic.)",
-    "Tarcombe",
-    "Tarilta",
-    "Tarnagulla",
-    "Tarneit",
-    "Tarnook",
-    "Taroon",
-    "Tarra Valley",
-    "Tarranyurk",
-    "Tarraville",
-    "Tarrawarra",
-    "Tarrawingee",
-    "Tarrayoukyan",
-    "Tarrengower",
-    "Tarrenlea",
-    "Tarrington",
-    "Tarrone",
-    "Tarwin",
-    "Tarwin Lower",
-    "Tatong",
-    "Tatura",
-    "Tatura East",
-    "Tatyoon",
-    "Tawonga",
-    "Tawonga South",
-    "Taylor Bay",
-    "Taylors Hill",
-    "Taylors Lakes",
-    "Teal Point",
-    "Tecoma",
-    "Teddywaddy",
-    "Teddywaddy West",
-    "Teesdale (Vic.)",
-    "Telangatuk East",
-    "Telford",
-    "Telopea Downs",
-    "Templestowe",
-    "Templestowe Lower",
-    "Tempy",
-    "Tenby Point",
-    "Tennyson (Vic.)",
-    "Terang",
-    "Terip Terip",
-    "Terrappee",
-    "Terrick Terrick",
-    "Terrick Terrick East",
-    "Tesbury",
-    "Tetoora Road",
-    "Thalia",
-    "The Basin (Vic.)",
-    "The Cove",
-    "The Gurdies",
-    "The Heart",
-    "The Honeysuckles",
-    "The Patch",
-    "The Sisters",
-    "Thologolong",
-    "Thomastown",
-    "Thomson (Baw Baw - Vic.)",
-    "Thomson (Greater Geelong - Vic.)",
-    "Thoona",
-    "Thornbury",
-    "Thornhill Park",
-    "Thornton (Vic.)",
-    "Thorpdale",
-    "Thorpdale South",
-    "Thowgla Valley",
-    "Three Bridges",
-    "Timbarra (Vic.)",
-    "Timboon",
-    "Timboon West",
-    "Timmering",
-    "Timor (Vic.)",
-    "Timor West",
-    "Tinamba",
-    "Tinamba West",
-    "Tintaldra",
-    "Tittybong",
-    "Tol Tol",
-    "Tolmie",
-    "Tom Groggin",
-    "Tongala",
-    "Tonghi Creek",
-    "Tongio",
-    "Tonimbuk",
-    "Tooan",
-    "Tooborac",
-    "Toolamba",
-    "Toolamba West",
-    "Toolangi",
-    "Toolern Vale",
-    "Toolleen",
-    "Toolome",
-    "Toolondo",
-    "Toolong",
-    "Toombon",
-    "Toongabbie (Vic.)",
-    "Toora (Vic.)",
-    "Toora North",
-    "Tooradin",
-    "Toorak",
-    "Toorloo Arm",
-    "Toorongo",
-    "Tootgarook",
-    "Torquay (Vic.)",
-    "Torrita",
-    "Torrumbarry",
-    "Torwood",
-    "Tostaree",
-    "Tottenham (Vic.)",
-    "Tottington",
-    "Tourello",
-    "Towan",
-    "Towaninny",
-    "Towaninny South",
-    "Tower Hill",
-    "Towong",
-    "Towong Upper",
-    "Trafalgar (Vic.)",
-    "Trafalgar East",
-    "Trafalgar South",
-    "Tragowel",
-    "Traralgon",
-    "Traralgon East",
-    "Traralgon South",
-    "Travancore",
-    "Trawalla",
-    "Trawool",
-    "Traynors Lagoon",
-    "Tremont",
-    "Trentham",
-    "Trentham East",
-    "Tresco",
-    "Tresco West",
-    "Trida",
-    "Truganina",
-    "Tubbut",
-    "Tuerong",
-    "Tulkara",
-    "Tullamarine",
-    "Tungamah",
-    "Turoar",
-    "Turriff",
-    "Turriff East",
-    "Turtons Creek",
-    "Tutye",
-    "Tyaak",
-    "Tyabb",
-    "Tyenna (Vic.)",
-    "Tyers",
-    "Tylden",
-    "Tynong",
-    "Tynong North",
-    "Tyntynder",
-    "Tyntynder South",
-    "Tyrendarra",
-    "Tyrendarra East",
-    "Tyrrell",
-    "Tyrrell Downs",
-    "Ullina",
-    "Ullswater",
-    "Ultima",
-    "Ultima East",
-    "Ulupna",
-    "Undera",
-    "Underbool",
-    "Upotipotpon",
-    "Upper Ferntree Gully",
-    "Upper Gundowring",
-    "Upper Lurg",
-    "Upper Plenty",
-    "Upper Ryans Creek",
-    "Upton Hill",
-    "Upwey",
-    "Valencia Creek",
-    "Vasey",
-    "Vaughan",
-    "Vectis",
-    "Ventnor (Vic.)",
-    "Venus Bay (Vic.)",
-    "Vermont",
-    "Vermont South",
-    "Vervale",
-    "Vesper",
-    "Victoria Point (Vic.)",
-    "Victoria Valley (Vic.)",
-    "Viewbank",
-    "Vinifera",
-    "Violet Town",
-    "Vite Vite",
-    "Vite Vite North",
-    "W Tree",
-    "Waaia",
-    "Waanyarra",
-    "Waarre",
-    "Wabonga",
-    "Waggarandall",
-    "Wahgunyah",
-    "Wahring",
-    "Wail",
-    "Wairewa",
-    "Waitchie",
-    "Wal Wal",
-    "Waldara",
-    "Walhalla",
-    "Walhalla East",
-    "Walkerville (Vic.)",
-    "Walkerville North",
-    "Walkerville South",
-    "Wallace",
-    "Wallacedale",
-    "Wallagaraugh",
-    "Wallaloo",
-    "Wallaloo East",
-    "Wallan",
-    "Wallinduc",
-    "Wallington",
-    "Wallup",
-    "Walmer (Vic.)",
-    "Walpa",
-    "Walpeup",
-    "Walwa",
-    "Wandana Heights",
-    "Wandella (Vic.)",
-    "Wandiligong",
-    "Wandin East",
-    "Wandin North",
-    "Wando Bridge",
-    "Wando Vale",
-    "Wandong",
-    "Wandown",
-    "Wangandary",
-    "Wangarabell",
-    "Wangaratta (Vic.)",
-    "Wangaratta South",
-    "Wangie",
-    "Wangoom",
-    "Wannon",
-    "Wantirna",
-    "Wantirna South",
-    "Waranga Shores",
-    "Waratah Bay",
-    "Warburton (Vic.)",
-    "Wareek",
-    "Wargan",
-    "Warmur",
-    "Warncoort",
-    "Warne",
-    "Warneet",
-    "Warrabkook",
-    "Warracknabeal",
-    "Warragul",
-    "Warragul South",
-    "Warragul West",
-    "Warrak",
-    "Warrandyte",
-    "Warrandyte South",
-    "Warranwood",
-    "Warrayure",
-    "Warrenbayne",
-    "Warrenheip",
-    "Warrenmang",
-    "Warrion",
-    "Warrnambool",
-    "Warrock",
-    "Warrong",
-    "Wartook",
-    "Watchem",
-    "Watchem West",
-    "Watchupga",
-    "Waterford Park",
-    "Waterholes",
-    "Waterloo (Vic.)",
-    "Waterways",
-    "Watsonia",
-    "Watsonia North",
-    "Watsons Creek (Vic.)",
-    "Wattle Bank",
-    "Wattle Creek",
-    "Wattle Flat (Vic.)",
-    "Wattle Glen",
-    "Wattle Hill (Vic.)",
-    "Waubra",
-    "Waurn Ponds",
-    "Waygara",
-    "Weatherboard",
-    "Wedderburn (Vic.)",
-    "Wedderburn Junction",
-    "Wee Wee Rup",
-    "Weeaproinah",
-    "Weering",
-    "Weerite",
-    "Wehla",
-    "Weir Views",
-    "Wellsford",
-    "Welshmans Reef",
-    "Welshpool (Vic.)",
-    "Wemen",
-    "Wendouree",
-    "Wensleydale",
-    "Wentworth (Vic.)",
-    "Werneth",
-    "Werona",
-    "Werribee",
-    "Werribee South",
-    "Werrimull",
-    "Wesburn",
-    "West Bendigo",
-    "West Creek",
-    "West Footscray",
-    "West Melbourne",
-    "West Wodonga",
-    "Westbury (Vic.)",
-    "Westby",
-    "Westmeadows",
-    "Westmere",
-    "Whanregarwen",
-    "Wharparilla",
-    "Wheatsheaf",
-    "Wheelers Hill",
-    "Whipstick",
-    "Whirily",
-    "White Hills (Vic.)",
-    "Whiteheads Creek",
-    "Whitelaw",
-    "Whitfield (Vic.)",
-    "Whitlands",
-    "Whittington",
-    "Whittlesea",
-    "Whoorel",
-    "Whorouly",
-    "Whorouly East",
-    "Whorouly South",
-    "Whroo",
-    "Wickliffe",
-    "Wilby",
-    "Wild Dog Valley (Vic.)",
-    "Wildwood",
-    "Wilkur",
-    "Willangie",
-    "Willatook",
-    "Willaura",
-    "Willaura North",
-    "Willenabrina",
-    "Williams Landing",
-    "Williamstown (Vic.)",
-    "Williamstown North",
-    "Willow Grove",
-    "Willowmavin",
-    "Willowvale (Vic.)",
-    "Willung",
-    "Willung South",
-    "Wilsons Hill",
-    "Wilsons Promontory",
-    "Wimbledon Heights",
-    "Winchelsea",
-    "Winchelsea South",
-    "Windermere (Vic.)",
-    "Windsor (Vic.)",
-    "Wingan River",
-    "Wingeel",
-    "Winjallok",
-    "Winlaton",
-    "Winnambool",
-    "Winnap",
-    "Winnindoo",
-    "Winslow",
-    "Winter Valley",
-    "Winton (Vic.)",
-    "Winton North",
-    "Wirrate",
-    "Wiseleigh",
-    "Wodonga",
-    "Wollert",
-    "Wombat Creek (Vic.)",
-    "Wombelano",
-    "Won Wron",
-    "Wonga",
-    "Wonga Park",
-    "Wongarra",
-    "Wongungarra",
-    "Wonnangatta",
-    "Wonthaggi",
-    "Wonwondah",
-    "Wonyip",
-    "Wood Wood",
-    "Woodend (Vic.)",
-    "Woodend North",
-    "Woodfield",
-    "Woodford (Vic.)",
-    "Woodglen",
-    "Woodhouse",
-    "Woodleigh (Vic.)",
-    "Woods Point (Vic.)",
-    "Woodside (Vic.)",
-    "Woodside Beach",
-    "Woodstock (Vic.)",
-    "Woodstock On Loddon",
-    "Woodstock West",
-    "Woodvale (Vic.)",
-    "Wool Wool",
-    "Woolamai",
-    "Woolenook",
-    "Woolshed Flat (Vic.)",
-    "Woolsthorpe",
-    "Woomelang",
-    "Wooragee",
-    "Woorarra East",
-    "Woorarra West",
-    "Wooreen",
-    "Woori Yallock",
-    "Woorinen",
-    "Woorinen North",
-    "Woorinen South",
-    "Woorndoo",
-    "Wooroonook",
-    "Woosang",
-    "Wootong Vale",
-    "Worrowing",
-    "Wrathung",
-    "Wrixon",
-    "Wroxham",
-    "Wuk Wuk",
-    "Wulgulmerang",
-    "Wulgulmerang East",
-    "Wulgulmerang West",
-    "Wunghnu",
-    "Wurdiboluc",
-    "Wurruk",
-    "Wy Yung",
-    "Wycheproof",
-    "Wycheproof South",
-    "Wychitella",
-    "Wychitella North",
-    "Wye River",
-    "Wyelangta",
-    "Wyndham Vale",
-    "Wyuna (Vic.)",
-    "Wyuna East",
-    "Yaapeet",
-    "Yabba North",
-    "Yabba South",
-    "Yackandandah",
-    "Yalca",
-    "Yalla-Y-Poora",
-    "Yallambie",
-    "Yallourn",
-    "Yallourn North",
-    "Yalmy",
-    "Yambuk",
-    "Yambuna",
-    "Yan Yean",
-    "Yanac",
-    "Yanakie",
-    "Yando",
-    "Yandoit",
-    "Yandoit Hills",
-    "Yangery",
-    "Yangoura",
-    "Yannathan",
-    "Yapeen",
-    "Yarck",
-    "Yarpturk",
-    "Yarra Glen",
-    "Yarra Junction",
-    "Yarraberb",
-    "Yarragon",
-    "Yarragon South",
-    "Yarram",
-    "Yarrambat",
-    "Yarraville",
-    "Yarrawalla",
-    "Yarrawonga (Vic.)",
-    "Yarrawonga South",
-    "Yarroweyah",
-    "Yatchaw",
-    "Yawong Hills",
-    "Yea",
-    "Yellingbo",
-    "Yelta (Vic.)",
-    "Yendon",
-    "Yeo",
-    "Yeodene",
-    "Yering",
-    "Yeungroon",
-    "Yeungroon East",
-    "Yielima",
-    "Yinnar",
-    "Yinnar South",
-    "York Plains (Vic.)",
-    "Youanmite",
-    "Youarang",
-    "Yulecart",
-    "Yundool",
-    "Yuroke",
-    "Yuulong",
-    "Zeerust",
-    "Zumsteins",
-    "No usual address (Vic.)",
-    "Migratory - Offshore - Shipping (Vic.)",
-    "Abbeywood",
-    "Abbotsford (Qld)",
-    "Abercorn",
-    "Abergowrie",
-    "Abingdon Downs",
-    "Abington (Qld)",
-    "Acacia Ridge",
-    "Acland",
-    "Adare",
-    "Adavale",
-    "Adelaide Park",
-    "Advancetown",
-    "Aeroglen",
-    "Agnes Water",
-    "Airdmillan",
-    "Airlie Beach",
-    "Airville",
-    "Aitkenvale",
-    "Alabama Hill",
-    "Albany Creek",
-    "Alberta",
-    "Alberton (Qld)",
-    "Albinia",
-    "Albion (Brisbane - Qld)",
-    "Albion (Richmond - Qld)",
-    "Alderley",
-    "Aldershot",
-    "Aldoga",
-    "Alexandra (Qld)",
-    "Alexandra Headland",
-    "Alexandra Hills",
-    "Algester",
-    "Alice Creek",
-    "Alice River",
-    "Allan",
-    "Allandale (Qld)",
-    "Allenstown",
-    "Allenview",
-    "Alligator Creek (Mackay - Qld)",
-    "Alligator Creek (Townsville - Qld)",
-    "Allora",
-    "Alloway",
-    "Almaden",
-    "Aloomba",
-    "Alpha",
-    "Alsace",
-    "Alton Downs",
-    "Alva",
-    "Amamoor",
-    "Amamoor Creek",
-    "Amaroo (Qld)",
-    "Amber",
-    "Amberley",
-    "Ambrose",
-    "Amby",
-    "Amiens",
-    "Amity",
-    "Anakie Siding",
-    "Andergrove",
-    "Anderleigh",
-    "Andromache",
-    "Anduramba",
-    "Annandale (Qld)",
-    "Annerley",
-    "Anstead",
-    "Anthony",
-    "Antigua",
-    "Apple Tree Creek",
-    "Applethorpe",
-    "Arafura Sea",
-    "Araluen (Qld)",
-    "Aramac",
-    "Aramara",
-    "Arana Hills",
-    "Aranbanga",
-    "Aratula (Qld)",
-    "Arbouin",
-    "Arcadia (Qld)",
-    "Arcadia Valley",
-    "Archer River",
-    "Archerfield",
-    "Arcturus",
-    "Argyll",
-    "Armstrong Beach",
-    "Armstrong Creek (Qld)",
-    "Aroona",
-    "Arriga",
-    "Arundel",
-    "Ascot (Brisbane - Qld)",
-    "Ascot (Toowoomba - Qld)",
-    "Ashfield (Qld)",
-    "Ashgrove",
-    "Ashmore",
-    "Ashwell",
-    "Aspley",
-    "Atherton",
-    "Athol",
-    "Atkinsons Dam",
-    "Aubigny",
-    "Auburn (Qld)",
-    "Auchenflower",
-    "Augathella",
-    "Augustine Heights",
-    "Aurukun",
-    "Austinville",
-    "Avenell Heights",
-    "Avoca (Qld)",
-    "Avoca Vale",
-    "Avondale (Qld)",
-    "Ayr",
-    "Babinda (Qld)",
-    "Back Plains",
-    "Badu Island",
-    "Baffle Creek",
-    "Baffle West",
-    "Bahrs Scrub",
-    "Bajool",
-    "Bakers Bend",
-    "Bakers Creek (Qld)",
-    "Baking Board",
-    "Balberra",
-    "Balcomba",
-    "Bald Hills (Qld)",
-    "Bald Knob",
-    "Balgal Beach",
-    "Balgowan (Qld)",
-    "Ball Bay",
-    "Ballandean",
-    "Ballard",
-    "Ballaroo",
-    "Ballogie",
-    "Balmoral (Qld)",
-    "Balmoral Ridge",
-    "Balnagowan",
-    "Bamaga",
-    "Bambaroo",
-    "Bamboo",
-    "Bamboo Creek",
-    "Ban Ban",
-    "Ban Ban Springs",
-    "Banana",
-    "Bancroft",
-    "Bangalee (Qld)",
-    "Banks Creek",
-    "Banks Pocket",
-    "Banksia Beach",
-    "Bannockburn (Qld)",
-    "Banyo",
-    "Bapaume",
-    "Barakula",
-    "Baralaba",
-    "Barambah",
-    "Barcaldine",
-    "Bardon",
-    "Baree",
-    "Barellan Point",
-    "Bargara",
-    "Bargunyah",
-    "Baringa",
-    "Barker Creek Flat",
-    "Barkly (Qld)",
-    "Barlil",
-    "Barlows Hill",
-    "Barlyne",
-    "Barmaryee",
-    "Barmoya",
-    "Barnard",
-    "Barney Point",
-    "Barney View",
-    "Baroondah",
-    "Barramornie",
-    "Barratta (Qld)",
-    "Barrine",
-    "Barringha",
-    "Barringun",
-    "Barron",
-    "Barron Gorge",
-    "Bartle Frere",
-    "Barwidgi",
-    "Basalt (Qld)",
-    "Basilisk",
-    "Basin Pocket",
-    "Battery Hill",
-    "Bauhinia",
-    "Bauple",
-    "Bauple Forest",
-    "Bayrick",
-    "Bayview Heights",
-    "Beach Holm",
-    "Beachmere",
-    "Beaconsfield (Qld)",
-    "Beatrice",
-    "Beaudesert",
-    "Beaver Rock",
-    "Bedourie",
-    "Beebo",
-    "Beecher",
-    "Beechmont",
-    "Beelbee",
-    "Beelbi Creek",
-    "Beenaam Valley",
-    "Beenleigh",
-    "Beerburrum",
-    "Beeron",
-    "Beerwah",
-    "Begonia",
-    "Beilba",
-    "Belcong",
-    "Belgian Gardens",
-    "Belivah",
-    "Bell (Qld)",
-    "Bella Creek",
-    "Bellara",
-    "Bellbird Park",
-    "Bellbowrie",
-    "Bellenden Ker",
-    "Bellevue (Qld)",
-    "Bellfield (Qld)",
-    "Belli Park",
-    "Bellmere",
-    "Bells Bridge",
-    "Bells Creek",
-    "Bellthorpe",
-    "Belmont (Qld)",
-    "Belmunda",
-    "Belvedere",
-    "Belyando",
-    "Bemerside",
-    "Benair",
-    "Benaraby",
-    "Benarkin",
-    "Benarkin North",
-    "Benholme",
-    "Benobble",
-    "Benowa",
-    "Bentley Park",
-    "Berajondo",
-    "Berat",
-    "Bergen",
-    "Berrinba",
-    "Berserker",
-    "Bethania",
-    "Biarra",
-    "Biboohra",
-    "Biddaddaba",
-    "Biddeston",
-    "Bidwill (Qld)",
-    "Biggenden",
-    "Biggera Waters",
-    "Bilinga",
-    "Billa Billa",
-    "Biloela",
-    "Bilyana",
-    "Bindebango",
-    "Bingegang",
-    "Bingil Bay",
-    "Binjour",
-    "Binna Burra (Qld)",
-    "Birdsville",
-    "Birkalla",
-    "Birkdale",
-    "Birnam (Scenic Rim - Qld)",
-    "Birnam (Toowoomba - Qld)",
-    "Birtinya",
-    "Black Duck Creek",
-    "Black Jack",
-    "Black Mountain (Qld)",
-    "Black River (Qld)",
-    "Black Snake",
-    "Blackall",
-    "Blackbull",
-    "Blackbutt (Qld)",
-    "Blackbutt North",
-    "Blackbutt South",
-    "Blackdown",
-    "Blackrock",
-    "Blacks Beach",
-    "Blacksoil",
-    "Blackstone",
-    "Blackswamp",
-    "Blackwater",
-    "Blairmore",
-    "Blanchview",
-    "Blantyre",
-    "Blaxland (Qld)",
-    "Blenheim",
-    "Bli Bli",
-    "Bloomfield",
-    "Bloomsbury",
-    "Blue Mountain",
-    "Blue Mountain Heights",
-    "Bluewater",
-    "Bluewater Park",
-    "Bluff",
-    "Blythdale",
-    "Boatman",
-    "Bogandilla",
-    "Bogie",
-    "Bohle",
-    "Bohle Plains",
-    "Boigu Island",
-    "Bokarina",
-    "Bollier",
-    "Bollon",
-    "Bolwarra (Qld)",
-    "Bombeeta",
-    "Bon Accord",
-    "Bondoola",
-    "Bongaree",
-    "Bongeen",
-    "Bonnie Doon (Qld)",
-    "Bonogin",
-    "Bonshaw (Qld)",
-    "Bony Mountain",
-    "Boodua",
-    "Boogan",
-    "Booie",
-    "Boolboonda",
-    "Boolburra",
-    "Boompa",
-    "Boonah (Qld)",
-    "Boonara",
-    "Boonarga",
-    "Boondall",
-    "Boondandilla",
-    "Boondooma",
-    "Boonooroo",
-    "Boonooroo Plains",
-    "Booral (Qld)",
-    "Booroobin",
-    "Booubyjan",
-    "Booval",
-    "Booyal",
-    "Borallon",
-    "Boreen Point",
-    "Boronia Heights",
-    "Bororen",
-    "Boulder Creek",
-    "Bouldercombe",
-    "Boulia",
-    "Bountiful Islands",
-    "Bowen",
-    "Bowen Hills",
-    "Bowenville",
-    "Boyland",
-    "Boyne Island",
-    "Boyne Valley",
-    "Boynedale",
-    "Boyneside",
-    "Boynewood",
-    "Bracalba",
-    "Bracewell",
-    "Bracken Ridge",
-    "Braemeadows",
-    "Braemore",
-    "Bramston Beach",
-    "Branch Creek",
-    "Branchview",
-    "Brandon",
-    "Brandy Creek (Qld)",
-    "Branyan",
-    "Brassall",
-    "Bray Park (Qld)",
-    "Breadalbane (Qld)",
-    "Breakaway",
-    "Breddan",
-    "Brendale",
-    "Bribie Island North",
-    "Bridgeman Downs",
-    "Bridges",
-    "Brigalow",
-    "Brightly",
-    "Brighton (Qld)",
-    "Brightview",
-    "Brigooda",
-    "Bringalily",
-    "Brinsmead",
-    "Brisbane Airport",
-    "Brisbane City",
-    "Broadbeach",
-    "Broadbeach Waters",
-    "Broadmere",
-    "Broadwater (Qld)",
-    "Broken River",
-    "Bromelton",
-    "Brookfield (Qld)",
-    "Brookhill",
-    "Brooklands",
-    "Brookstead",
-    "Brookwater",
-    "Brooloo",
-    "Brooweena",
-    "Broughton (Qld)",
-    "Brovinia",
-    "Browns Plains (Qld)",
-    "Broxburn",
-    "Brush Creek",
-    "Bryden",
-    "Brymaroo",
-    "Buaraba",
-    "Buaraba South",
-    "Bucasia",
-    "Bucca (Qld)",
-    "Buccan",
-    "Buckingham (Qld)",
-    "Buckland (Qld)",
-    "Buddina",
-    "Buderim",
-    "Budgee",
-    "Bukali",
-    "Bulgun",
-    "Bulimba",
-    "Bullcamp",
-    "Bulleringa",
-    "Bulli Creek",
-    "Bulloo Downs",
-    "Bullyard",
-    "Bulwer",
-    "Bunburra",
-    "Bundaberg Central",
-    "Bundaberg East",
-    "Bundaberg North",
-    "Bundaberg South",
-    "Bundaberg West",
-    "Bundall",
-    "Bundamba",
-    "Bundi",
-    "Bundoora (Qld)",
-    "Bungaban",
-    "Bungadoo",
-    "Bungalow",
-    "Bungeworgorai",
-    "Bungil (Qld)",
-    "Bungundarra",
-    "Bungunya",
-    "Bunjurgen",
-    "Bunya",
-    "Bunya Creek",
-    "Bunya Mountains",
-    "Burbank",
-    "Burdell",
-    "Burgowan",
-    "Burketown",
-    "Burleigh",
-    "Burleigh Heads",
-    "Burleigh Waters",
-    "Burncluith",
-    "Burnett Creek",
-    "Burnett Heads",
-    "Burnside (Qld)",
-    "Burpengary",
-    "Burpengary East",
-    "Burra Burri",
-    "Burrar Islet",
-    "Burrum Heads",
-    "Burrum River",
-    "Burrum Town",
-    "Burton (Qld)",
-    "Burua",
-    "Bushland Beach",
-    "Bushley",
-    "Butchers Creek",
-    "Buxton (Qld)",
-    "Bybera",
-    "Byee",
-    "Byellee",
-    "Byfield",
-    "Bymount",
-    "Byrnestown",
-    "Cabarlah",
-    "Caboolture",
-    "Caboolture South",
-    "Caboonbah",
-    "Cadarga",
-    "Caffey",
-    "Cainbable",
-    "Cairdbeign",
-    "Cairns City",
-    "Cairns North",
-    "Calamvale",
-    "Calavos",
-    "Calcium",
-    "Caldervale",
-    "Calen",
-    "Calgoa",
-    "Calico Creek",
-    "Calingunee",
-    "Callandoon",
-    "Callemondah",
-    "Callide",
-    "Calliope (Qld)",
-    "Caloundra",
-    "Caloundra West",
-    "Calvert (Qld)",
-    "Camboon (Qld)",
-    "Cambooya",
-    "Cambridge (Qld)",
-    "Cambroon",
-    "Cameby",
-    "Cameron Corner",
-    "Camira (Qld)",
-    "Camooweal",
-    "Camp Creek (Qld)",
-    "Camp Hill",
-    "Camp Mountain",
-    "Campaspe",
-    "Campbell Creek",
-    "Campbells Pocket",
-    "Campwin Beach",
-    "Canaga",
-    "Canal Creek",
-    "Cania",
-    "Canina",
-    "Cannindah",
-    "Canning Creek",
-    "Canningvale",
-    "Cannon Creek (Scenic Rim - Qld)",
-    "Cannon Creek (Southern Downs - Qld)",
-    "Cannon Hill",
-    "Cannon Valley",
-    "Cannonvale",
-    "Canoona",
-    "Canungra",
-    "Capalaba",
-    "Cape Cleveland",
-    "Cape Conway",
-    "Cape Gloucester",
-    "Cape Hillsborough",
-    "Cape Tribulation",
-    "Capella",
-    "Captain Creek",
-    "Captains Mountain",
-    "Caravonica",
-    "Carbine Creek",
-    "Carbrook",
-    "Cardstone",
-    "Cardwell",
-    "Carina (Qld)",
-    "Carina Heights",
-    "Carindale",
-    "Carmila",
-    "Carmoo",
-    "Carnarvon Park",
-    "Carneys Creek",
-    "Carole Park",
-    "Caroline Crossing",
-    "Carpendale",
-    "Carpentaria",
-    "Carrandotta",
-    "Carrara",
-    "Carrington (Qld)",
-    "Carruchan",
-    "Carseldine",
-    "Carstairs",
-    "Carters Ridge",
-    "Cashmere",
-    "Cassowary",
-    "Castaways Beach",
-    "Castle Creek (Qld)",
-    "Castle Hill (Qld)",
-    "Cattle Creek (North Burnett - Qld)",
-    "Cattle Creek (Toowoomba - Qld)",
-    "Causeway Lake",
-    "Cawarral",
-    "Cawdor (Qld)",
-    "Cecil Plains",
-    "Cedar Creek (Logan - Qld)",
-    "Cedar Creek (Moreton Bay - Qld)",
-    "Cedar Grove",
-    "Cedar Pocket",
-    "Cedar Vale",
-    "Cedarton",
-    "Cement Mills",
-    "Centenary Heights",
-    "Ceratodus",
-    "Chahpingah",
-    "Chambers Flat",
-    "Chances Plain",
-    "Chandler (Qld)",
-    "Chapel Hill (Qld)",
-    "Charlestown (Qld)",
-    "Charleville",
-    "Charlton (Qld)",
-    "Charlwood",
-    "Charters Towers City",
-    "Chatsworth (Qld)",
-    "Cheeseborough",
-    "Chelmer",
-    "Chelmsford",
-    "Chelona",
-    "Cheltenham (Qld)",
-    "Cherbourg",
-    "Chermside",
-    "Chermside West",
-    "Cherry Creek",
-    "Cherry Gully",
-    "Cherwell",
-    "Chevallum",
-    "Chewko",
-    "Childers (Qld)",
-    "Chillagoe",
-    "Chinchilla",
-    "Chinghee Creek",
-    "Chirnside",
-    "Christmas Creek",
-    "Churchable",
-    "Churchill (Qld)",
-    "Chuwar",
-    "Cinnabar",
-    "Clagiraba",
-    "Clairview",
-    "Clara Creek",
-    "Claraville",
-    "Clare (Qld)",
-    "Clarendon (Qld)",
-    "Clarke Creek",
-    "Clayfield",
-    "Clear Island Waters",
-    "Clear Mountain",
-    "Clemant",
-    "Clermont",
-    "Cleveland (Qld)",
-    "Clifford",
-    "Clifton (Qld)",
-    "Clifton Beach (Qld)",
-    "Clinton (Qld)",
-    "Clintonvale",
-    "Cloncurry",
-    "Clontarf (Moreton Bay - Qld)",
-    "Clontarf (Toowoomba - Qld)",
-    "Closeburn",
-    "Cloyna",
-    "Cluden",
-    "Clumber",
-    "Coal Creek",
-    "Coalbank",
-    "Coalfalls",
-    "Coalstoun Lakes",
-    "Cobbs Hill",
-    "Cobraball",
-    "Cockatoo (Qld)",
-    "Coconuts",
-    "Coen",
-    "Coes Creek",
-    "Coles Creek",
-    "Colevale",
-    "Coleyville",
-    "Colinton (Qld)",
-    "Collaroy (Qld)",
-    "College View",
-    "Collingwood Park (Qld)",
-    "Collinsville (Qld)",
-    "Colosseum",
-    "Columbia",
-    "Columboola",
-    "Comet",
-    "Commissioners Flat",
-    "Como (Qld)",
-    "Comoon Loop",
-    "Cona Creek",
-    "Condamine",
-    "Condamine Farms",
-    "Condamine Plains",
-    "Condon",
-    "Conjuboy",
-    "Conondale",
-    "Consuelo",
-    "Conway",
-    "Conway Beach",
-    "Coochiemudlo Island",
-    "Coochin",
-    "Coochin Creek",
-    "Cooee Bay",
-    "Cooeeimbardi",
-    "Cooktown",
-    "Coolabine",
-    "Coolabunia",
-    "Cooladdi",
-    "Coolana",
-    "Coolangatta (Qld)",
-    "Coolbie",
-    "Coolmunda",
-    "Cooloola",
-    "Cooloola Cove",
-    "Cooloolabin",
-    "Coolum Beach",
-    "Coombabah",
-    "Coomera",
-    "Coominglah",
-    "Coominglah Forest",
-    "Coominya",
-    "Coomoo",
-    "Coomrith",
-    "Coonambula",
-    "Coonarr",
-    "Coondoo",
-    "Coongoola",
-    "Coopers Plains",
-    "Coorada",
-    "Cooran",
-    "Cooranga",
-    "Cooroibah",
-    "Cooroo Lands",
-    "Coorooman",
-    "Cooroy",
-    "Cooroy Mountain",
-    "Coorparoo",
-    "Coorumba",
-    "Coorumbene",
-    "Cootharaba",
-    "Coowonga",
-    "Cooya Beach",
-    "Cooyar",
-    "Coppabella (Qld)",
-    "Coquette Point",
-    "Coral Cove",
-    "Coral Sea",
-    "Coralie",
-    "Corbould Park",
-    "Cordalba",
-    "Cordelia",
-    "Corella",
-    "Corfield",
-    "Corinda",
-    "Coringa",
-    "Corndale (Qld)",
-    "Cornubia",
-    "Cornwall (Qld)",
-    "Cosgrove (Qld)",
-    "Cotherstone",
-    "Cotswold Hills",
-    "Cottonvale (Qld)",
-    "Coulson",
-    "Coverty",
-    "Cow Bay",
-    "Cowan Cowan",
-    "Cowley",
-    "Cowley Beach",
-    "Cowley Creek",
-    "Cracow",
-    "Craiglie",
-    "Craignish",
-    "Cranbrook (Qld)",
-    "Cranley",
-    "Crawford",
-    "Crediton",
-    "Cremorne (Qld)",
-    "Cressbrook",
-    "Cressbrook Creek",
-    "Crestmead",
-    "Crinum",
-    "Croftby",
-    "Crohamhurst",
-    "Cromarty",
-    "Crossdale",
-    "Crossroads",
-    "Crowley Vale",
-    "Crownthorpe",
-    "Crows Nest (Qld)",
-    "Croydon (Qld)",
-    "Cryna",
-    "Crystal Brook (Qld)",
-    "Crystal Creek (Qld)",
-    "Crystalbrook",
-    "Cullinane",
-    "Cungulla",
-    "Cunnamulla",
-    "Cunningham (Qld)",
-    "Curra",
-    "Currajah",
-    "Currajong",
-    "Curramore (Qld)",
-    "Currimundi",
-    "Currumbin",
-    "Currumbin Valley",
-    "Currumbin Waters",
-    "Curtis Island",
-    "Cushnie",
-    "Cutella",
-    "Cuttaburra",
-    "Cynthia",
-    "Cypress Gardens",
-    "D'Aguilar",
-    "Dagmar",
-    "Dagun",
-    "Daintree",
-    "Daisy Hill (Qld)",
-    "Dajarra",
-    "Dakabin",
-    "Dakenba",
-    "Dalbeg",
-    "Dalby",
-    "Dalcouth",
-    "Dalga",
-    "Dallarnil",
-    "Dalma",
-    "Dalrymple Creek",
-    "Dalrymple Heights",
-    "Dalveen",
-    "Dalwogon",
-    "Dalysford",
-    "Damascus",
-    "Damper Creek",
-    "Danbulla",
-    "Danderoo",
-    "Dangore",
-    "Daradgee",
-    "Dargal Road",
-    "Darling Heights",
-    "Darlington (Qld)",
-    "Darr Creek",
-    "Darra",
-    "Darts Creek",
-    "Dauan Island",
-    "Daveson",
-    "Dayboro",
-    "Daymar",
-    "Deagon",
-    "Deception Bay",
-    "Dedin",
-    "Deebing Heights",
-    "Deep Creek (Qld)",
-    "Deepwater (Qld)",
-    "Deeragun",
-    "Deeral",
-    "Degarra",
-    "Degilbo",
-    "Delan",
-    "Delaneys Creek",
-    "Depot Hill",
-    "Derri Derra",
-    "Derrymore",
-    "Desailly",
-    "Deuchar",
-    "Devereux Creek",
-    "Devon Park (Qld)",
-    "Diamantina Lakes",
-    "Diamond Valley",
-    "Diamondvale",
-    "Diamondy",
-    "Dicky Beach",
-    "Didcot",
-    "Diddillibah",
-    "Diglum",
-    "Dimbulah",
-    "Dingo",
-    "Dingo Beach",
-    "Dingo Pocket",
-    "Dinmore",
-    "Dirnbir",
-    "Dirranbandi",
-    "Dittmer",
-    "Diwan",
-    "Dixalea",
-    "Dixie (Qld)",
-    "Djarawong",
-    "Djiru",
-    "Djuan",
-    "Doctor Creek",
-    "Dolphin Heads",
-    "Domville",
-    "Donnybrook (Qld)",
-    "Doolandella",
-    "Doolbi",
-    "Doomadgee",
-    "Doonan",
-    "Doongul",
-    "Dotswood",
-    "Doughboy",
-    "Douglas (Toowoomba - Qld)",
-    "Douglas (Townsville - Qld)",
-    "Dowar Islet",
-    "Downsfield",
-    "Dows Creek",
-    "Draper",
-    "Drayton",
-    "Drewvale",
-    "Drillham",
-    "Drillham South",
-    "Drinan",
-    "Dromedary (Qld)",
-    "Duaringa",
-    "Duchess",
-    "Duckinwilla",
-    "Ducklo",
-    "Dugandan",
-    "Duingal",
-    "Dulacca",
-    "Dulong",
-    "Dululu",
-    "Dumbleton",
-    "Dumgree",
-    "Dumpy Creek",
-    "Dundarrah",
-    "Dundas (Qld)",
-    "Dundathu",
-    "Dundowran",
-    "Dundowran Beach",
-    "Dunk",
-    "Dunkeld (Qld)",
-    "Dunmora",
-    "Dunmore (Qld)",
-    "Dunnrock",
-    "Dunwich",
-    "Durack (Qld)",
-    "Durah",
-    "Durham",
-    "Durham Downs",
-    "Durong",
-    "Dutton Park",
-    "Dutton River",
-    "Dykehead",
-    "Dysart (Qld)",
-    "Eagle Farm",
-    "Eagleby",
-    "Eaglefield",
-    "Earlville",
-    "East Barron",
-    "East Brisbane",
-    "East Cooyar",
-    "East Creek",
-    "East Deep Creek",
-    "East End",
-    "East Feluga",
-    "East Greenmount",
-    "East Haldon",
-    "East Innisfail",
-    "East Ipswich",
-    "East Mackay",
-    "East Nanango",
-    "East Palmerston",
-    "East Russell",
-    "East Toowoomba",
-    "East Trinity",
-    "Eastern Heights",
-    "Eaton (Qld)",
-    "Eatons Hill",
-    "Ebbw Vale",
-    "Ebenezer (Qld)",
-    "Edens Landing",
-    "Edge Hill",
-    "Edmonton",
-    "Edward River",
-    "Eerwah Vale",
-    "Egypt",
-    "Eidsvold",
-    "Eidsvold East",
-    "Eidsvold West",
-    "Eight Mile Creek (Qld)",
-    "Eight Mile Plains",
-    "Eimeo",
-    "Einasleigh",
-    "El Arish",
-    "Elaman Creek",
-    "Elanora",
-    "Elbow Valley",
-    "Electra",
-    "Elgin (Qld)",
-    "Elgin Vale",
-    "Eli Waters",
-    "Elimbah",
-    "Ellangowan (Qld)",
-    "Ellen Grove",
-    "Ellerbeck",
-    "Ellesmere",
-    "Ellinjaa",
-    "Ellinthorp",
-    "Elliott (Qld)",
-    "Elliott Heads",
-    "Ellis Beach",
-    "Elphinstone (Isaac - Qld)",
-    "Elphinstone (Toowoomba - Qld)",
-    "Emerald (Qld)",
-    "Emu Creek (Qld)",
-    "Emu Park",
-    "Emu Vale",
-    "England Creek",
-    "Enoggera",
-    "Enoggera Reservoir",
-    "Epsom (Qld)",
-    "Erakala",
-    "Eromanga",
-    "Erub Island",
-    "Esk (Qld)",
-    "Eskdale (Qld)",
-    "Esmeralda",
-    "Etna Creek",
-    "Eton",
-    "Etty Bay",
-    "Eubenangee",
-    "Eudlo",
-    "Eukey",
-    "Euleilah",
-    "Eulo",
-    "Eumamurrin",
-    "Eumundi",
-    "Eungella (Qld)",
-    "Eungella Dam",
-    "Eungella Hinterland",
-    "Euramo",
-    "Eureka (Qld)",
-    "Eurella",
-    "Eurimbula",
-    "Eurombah",
-    "Eurong",
-    "Euthulla",
-    "Evans Landing",
-    "Evanslea",
-    "Evelyn",
-    "Evergreen",
-    "Everton Hills",
-    "Everton Park",
-    "Fairdale",
-    "Fairfield (Qld)",
-    "Fairney View",
-    "Fairy Bower",
-    "Fairyland",
-    "Fairymead",
-    "Farleigh",
-    "Farnborough",
-    "Farnsfield",
-    "Farrars Creek",
-    "Fassifern (Qld)",
-    "Fassifern Valley",
-    "Federal (Qld)",
-    "Felton",
-    "Felton South",
-    "Feluga",
-    "Ferney",
-    "Fernvale (Qld)",
-    "Ferny Glen",
-    "Ferny Grove",
-    "Ferny Hills",
-    "Ficks Crossing",
-    "Fielding",
-    "Fifteen Mile",
-    "Fig Tree Pocket",
-    "Finch Hatton",
-    "Finlayvale",
-    "Finnie",
-    "Fisher (Qld)",
-    "Fishermans Pocket",
-    "Fishery Falls",
-    "Fitzgerald Creek",
-    "Fitzgibbon",
-    "Fitzroy Island",
-    "Flagstone",
-    "Flagstone Creek",
-    "Flametree",
-    "Flaxton",
-    "Fletcher (Qld)",
-    "Fletcher Creek",
-    "Fleurbaix",
-    "Flinders View",
-    "Flinton",
-    "Florence Bay",
-    "Flying Fish Point",
-    "Flying Fox (Qld)",
-    "Fordsdale",
-    "Foreshores",
-    "Forest Creek",
-    "Forest Glen (Qld)",
-    "Forest Hill (Qld)",
-    "Forest Lake",
-    "Forest Ridge",
-    "Forest Springs",
-    "Forestdale",
-    "Foresthome",
-    "Forestvale",
-    "Fork Lagoons",
-    "Formartin",
-    "Forrest Beach (Qld)",
-    "Forsayth",
-    "Fortitude Valley",
-    "Forty Mile",
-    "Fossilbrook",
-    "Foulden",
-    "Four Ways",
-    "Foxdale",
-    "Frankfield",
-    "Fraser Island",
-    "Frazerview",
-    "Fredericksfield",
-    "Freestone",
-    "Frenches Creek",
-    "Frenchville",
-    "Freshwater (Qld)",
-    "Freshwater Point",
-    "Friday Pocket",
-    "Fulham (Qld)",
-    "Gadgarra",
-    "Gaeta",
-    "Gailes",
-    "Gainsford",
-    "Gairloch",
-    "Gamboola",
-    "Gangalidda",
-    "Garbutt",
-    "Gargett",
-    "Garnant",
-    "Garners Beach",
-    "Garradunga",
-    "Garrawalt",
-    "Gatton",
-    "Gaven",
-    "Gayndah",
-    "Gaythorne",
-    "Geebung",
-    "Geham",
-    "Gemini Mountains",
-    "Georgetown (Qld)",
-    "Georgina (Qld)",
-    "Germantown (Qld)",
-    "Gheerulla",
-    "Ghinghinda",
-    "Gidya",
-    "Gigoomgan",
-    "Gilbert River",
-    "Gilberton (Etheridge - Qld)",
-    "Gilberton (Gold Coast - Qld)",
-    "Gilla",
-    "Gilldora",
-    "Gilston",
-    "Gin Gin (Qld)",
-    "Gindie",
-    "Gindoran",
-    "Ginoondan",
-    "Girraween (Qld)",
-    "Giru",
-    "Givelda",
-    "Gladfield (Qld)",
-    "Gladstone Central",
-    "Gladstone Harbour",
-    "Glamorgan Vale",
-    "Glan Devon",
-    "Glanmire (Qld)",
-    "Glass House Mountains",
-    "Glastonbury",
-    "Glebe (Qld)",
-    "Glen Allyn",
-    "Glen Aplin",
-    "Glen Boughton",
-    "Glen Cairn",
-    "Glen Echo",
-    "Glen Eden",
-    "Glen Esk",
-    "Glen Isla",
-    "Glen Niven",
-    "Glen Russell",
-    "Glen Ruth",
-    "Glenarbon",
-    "Glenaubyn",
-    "Glenaven",
-    "Glenbar",
-    "Glencoe (Qld)",
-    "Glendale (Qld)",
-    "Glenden",
-    "Gleneagle",
-    "Glenella",
-    "Glenfern (Qld)",
-    "Glengallan",
-    "Glenhaughton",
-    "Glenlee (Qld)",
-    "Glenleigh",
-    "Glenlogan",
-    "Glenlyon (Qld)",
-    "Glenmoral",
-    "Glenmorgan",
-    "Glenorchy (Qld)",
-    "Glenore Grove",
-    "Glenrae",
-    "Glenrock (Qld)",
-    "Glenroy (Qld)",
-    "Glenvale",
-    "Glenview",
-    "Glenwood (Qld)",
-    "Godwin Beach",
-    "Gogango",
-    "Golden Beach (Qld)",
-    "Golden Fleece",
-    "Goldfields",
-    "Goldsborough (Qld)",
-    "Gooburrum",
-    "Good Night",
-    "Goodar",
-    "Goodger",
-    "Goodna",
-    "Goodwood (Qld)",
-    "Googa Creek",
-    "Goolboo",
-    "Goolman",
-    "Goomally",
-    "Goombi",
-    "Goomboorian",
-    "Goombungee",
-    "Goomburra",
-    "Goomeri",
-    "Goomeribong",
-    "Goondi",
-    "Goondi Bend",
-    "Goondi Hill",
-    "Goondiwindi",
-    "Goorganga Creek",
-    "Goorganga Plains",
-    "Gooroolba",
-    "Gootchie",
-    "Goovigen",
-    "Goowarra",
-    "Goranba",
-    "Gordon Park",
-    "Gordonbrook",
-    "Gordonstone",
-    "Gordonvale",
-    "Gore",
-    "Gowrie Junction",
-    "Gowrie Little Plain",
-    "Gowrie Mountain",
-    "Gowrie Station",
-    "Gracemere",
-    "Graceville",
-    "Grahams Creek",
-    "Granadilla",
-    "Grand Secret",
-    "Grandchester",
-    "Grange (Qld)",
-    "Granite Vale",
-    "Grantham",
-    "Granville (Qld)",
-    "Grapetree",
-    "Grassdale (Qld)",
-    "Grasstree Beach",
-    "Grays Gate",
-    "Great Sandy Strait",
-    "Green Hill",
-    "Green Island",
-    "Greenbank",
-    "Greenlake",
-    "Greenlands (Qld)",
-    "Greenmount (Mackay - Qld)",
-    "Greenmount (Toowoomba - Qld)",
-    "Greens Creek (Qld)",
-    "Greenslopes",
-    "Greenswamp",
-    "Greenup",
-    "Greenvale (Qld)",
-    "Greenview",
-    "Greenwood (Qld)",
-    "Gregors Creek",
-    "Gregory (Qld)",
-    "Gregory River (Bundaberg - Qld)",
-    "Gregory River (Whitsunday - Qld)",
-    "Greycliffe",
-    "Greymare",
-    "Griffin",
-    "Groganville",
-    "Groomsville",
-    "Groper Creek",
-    "Grosmont",
-    "Grosvenor",
-    "Guanaba",
-    "Guijar Islet",
-    "Gulf Of Carpentaria",
-    "Gulliver",
-    "Gulngai",
-    "Guluguba",
-    "Gumdale",
-    "Gumlow",
-    "Gumlu",
-    "Gunalda",
-    "Gundiah",
-    "Gungaloon",
-    "Gunnawarra",
-    "Gunnewin",
-    "Gunpowder",
-    "Gunyarra",
-    "Gurgeena",
-    "Gurulmundi",
-    "Guthalungra",
-    "Gwambegwine",
-    "Gympie",
-    "Habana",
-    "Haden",
-    "Haigslea",
-    "Hail Creek",
-    "Haliday Bay",
-    "Halifax",
-    "Halliford",
-    "Haly Creek",
-    "Hamilton (Qld)",
-    "Hamilton Creek",
-    "Hamilton Plains",
-    "Hampden (Qld)",
-    "Hampton (Qld)",
-    "Hannaford",
-    "Happy Valley (Qld)",
-    "Harlaxton",
-    "Harlin",
-    "Harrami",
-    "Harriet",
-    "Harristown",
-    "Harrisville",
-    "Hatton Vale",
-    "Hawkins Creek",
-    "Hawkwood",
-    "Hawthorne",
-    "Hay Point",
-    "Hazeldean",
-    "Hazledean",
-    "Headington Hill",
-    "Healy",
-    "Heathwood",
-    "Heatley",
-    "Hebel",
-    "Helens Hill",
-    "Helensvale",
-    "Helidon",
-    "Helidon Spa",
-    "Hemmant",
-    "Hendon (Qld)",
-    "Hendra",
-    "Herberton",
-    "Heritage Park",
-    "Hermit Park",
-    "Herston",
-    "Hervey Range",
-    "Hibernia",
-    "Hidden Valley (Qld)",
-    "Hideaway Bay",
-    "Highbury (Qld)",
-    "Highfields (Qld)",
-    "Highgate Hill",
-    "Highgrove",
-    "Highland Park",
-    "Highland Plains (Maranoa - Qld)",
-    "Highland Plains (Toowoomba - Qld)",
-    "Highvale",
-    "Highworth",
-    "Hillcrest (Qld)",
-    "Hillview",
-    "Hinchinbrook (Qld)",
-    "Hirstglen",
-    "Hivesville",
-    "Hodgleigh",
-    "Hodgson",
-    "Hodgson Vale",
-    "Holland Park",
-    "Holland Park West",
-    "Holloways Beach",
-    "Hollywell",
-    "Holmview",
-    "Holroyd River",
-    "Home Hill",
-    "Homebush (Qld)",
-    "Homestead",
-    "Hookswood",
-    "Hope Island",
-    "Hope Vale",
-    "Hopeland (Qld)",
-    "Horn",
-    "Horse Camp",
-    "Horse Creek",
-    "Horseshoe Bay",
-    "Horseshoe Lagoon",
-    "Horton",
-    "Howard",
-    "Howitt",
-    "Hoya",
-    "Hudson",
-    "Hughenden",
-    "Hull Heads",
-    "Humboldt",
-    "Humeburn",
-    "Humphery",
-    "Hunchy",
-    "Hungerford (Qld)",
-    "Hurricane",
-    "Hutton Creek",
-    "Hyde Park (Qld)",
-    "Iama Island",
-    "Idalia",
-    "Ideraway",
-    "Ilbilbie",
-    "Ilfracombe",
-    "Ilkley",
-    "Illinbah",
-    "Image Flat",
-    "Imbil",
-    "Inala",
-    "Indooroopilly",
-    "Ingham",
-    "Inglestone",
-    "Inglewood (Qld)",
-    "Ingoldsby",
-    "Injinoo",
-    "Injune",
-    "Inkerman (Qld)",
-    "Innes Park",
-    "Innisfail",
-    "Innisfail Estate",
-    "Innisplain",
-    "Innot Hot Springs",
-    "Inskip",
-    "Inverlaw",
-    "Inverness",
-    "Ipswich",
-    "Iredale",
-    "Iron Range",
-    "Ironbark (Qld)",
-    "Irongate",
-    "Ironpot (Livingstone - Qld)",
-    "Ironpot (South Burnett - Qld)",
-    "Irvinebank",
-    "Irvingdale",
-    "Isis Central",
-    "Isis River",
-    "Isisford",
-    "Isla",
-    "Island Plantation",
-    "Iveragh",
-    "Ivory Creek",
-    "Jackson",
-    "Jackson North",
-    "Jackson South",
-    "Jacobs Well",
-    "Jaffa",
-    "Jaggan",
-    "Jambin",
-    "Jamboree Heights",
-    "Jandowae",
-    "Japoonvale",
-    "Jardine",
-    "Jardine River",
-    "Jarra Creek",
-    "Jarvisfield",
-    "Jeebropilly",
-    "Jellinbah",
-    "Jensen",
-    "Jericho (Qld)",
-    "Jerona",
-    "Jimboomba",
-    "Jimbour East",
-    "Jimbour West",
-    "Jimna",
-    "Jindalee (Qld)",
-    "Jinghi",
-    "Jobs Gate",
-    "Johnsons Hill",
-    "Johnstown",
-    "Jollys Lookout",
-    "Jondaryan",
-    "Jones Gully",
-    "Jones Hill",
-    "Josephville",
-    "Joskeleigh",
-    "Joyner",
-    "Jubilee Heights",
-    "Jubilee Pocket",
-    "Julago",
-    "Julatten",
-    "Julia Creek",
-    "Junabee",
-    "Junction View",
-    "Jundah",
-    "Kaban",
-    "Kabra",
-    "Kagaru",
-    "Kaimkillenbun",
-    "Kairabah",
-    "Kairi",
-    "Kalapa",
-    "Kalbar",
-    "Kalinga",
-    "Kalkadoon",
-    "Kalkie",
-    "Kallangur",
-    "Kalpowar",
-    "Kalunga",
-    "Kamerunga",
-    "Kandanga",
-    "Kandanga Creek",
-    "Kangaroo Point (Qld)",
-    "Kanigan",
-    "Kanimbla (Qld)",
-    "Kapaldo",
-    "Karalee",
-    "Karana Downs",
-    "Karara",
-    "Karawatha",
-    "Karrabin",
-    "Karragarra Island",
-    "Karron",
-    "Karumba",
-    "Kawana",
-    "Kawl Kawl",
-    "Kawungan",
-    "Kearneys Spring",
-    "Kedron",
-    "Kelsey Creek",
-    "Kelso (Qld)",
-    "Kelvin Grove",
-    "Kelvinhaugh",
-    "Kemmis",
-    "Kenilworth",
-    "Kenmore",
-    "Kenmore Hills",
-    "Kennedy",
-    "Kensington (Qld)",
-    "Kensington Grove",
-    "Kents Lagoon",
-    "Kents Pocket",
-    "Kentville",
-    "Keperra",
-    "Kepnock",
-    "Keppel Sands",
-    "Keriri Island",
-    "Kerry",
-    "Kewarra Beach",
-    "Keysland",
-    "Kholo",
-    "Khosh Bulduk",
-    "Kia Ora (Qld)",
-    "Kiamba",
-    "Kianga (Qld)",
-    "Kidaman Creek",
-    "Kiels Mountain",
-    "Kilbirnie",
-    "Kilcoy",
-    "Kilcummin",
-    "Kilkivan",
-    "Killaloe",
-    "Killarney (Qld)",
-    "Kilmorey Falls",
-    "Kimberley (Qld)",
-    "Kin Kin",
-    "Kin Kora",
-    "Kinbombi",
-    "Kinchant Dam",
-    "Kincora",
-    "Kindon",
-    "King Scrub",
-    "Kingaham",
-    "Kingaroy",
-    "Kings Beach",
-    "Kings Creek",
-    "Kings Siding",
-    "Kingsholme",
-    "Kingsthorpe",
-    "Kingston (Qld)",
-    "Kinka Beach",
-    "Kinkuna",
-    "Kinleymore",
-    "Kinnoul",
-    "Kioma",
-    "Kippa-Ring",
-    "Kirknie",
-    "Kirkwood",
-    "Kirrama",
-    "Kirwan",
-    "Kitoba",
-    "Kleinton",
-    "Knapp Creek",
-    "Koah",
-    "Kobble Creek",
-    "Kogan",
-    "Kokotungo",
-    "Kolonga",
-    "Koombooloomba",
-    "Koongal",
-    "Kooralbyn",
-    "Kooralgin",
-    "Kooringal (Qld)",
-    "Kooroomool",
-    "Kooroongarra",
-    "Koumala",
-    "Kowanyama",
-    "Kowguran",
-    "Kragra",
-    "Kulangoor",
-    "Kulgun",
-    "Kullogum",
-    "Kulpi",
-    "Kuluin",
-    "Kumbarilla",
-    "Kumbia",
-    "Kunda Park",
-    "Kunioon",
-    "Kunwarara",
-    "Kuraby",
-    "Kuranda",
-    "Kureelpa",
-    "Kureen",
-    "Kuridala",
-    "Kurrimine Beach",
-    "Kurrowah",
-    "Kurumbul",
-    "Kurwongbah",
-    "Kuttabul",
-    "Kybong",
-    "Kynuna",
-    "Kyoomba",
-    "Labrador",
-    "Laceys Creek",
-    "Laglan",
-    "Lagoon Pocket",
-    "Laguna Quays",
-    "Laidley",
-    "Laidley Creek West",
-    "Laidley Heights",
-    "Laidley North",
-    "Laidley South",
-    "Lake Barrine",
-    "Lake Borumba",
-    "Lake Clarendon",
-    "Lake Eacham",
-    "Lake Macdonald",
-    "Lake Manchester",
-    "Lake Mary",
-    "Lake Monduran",
-    "Lake Proserpine",
-    "Lake Tinaroo",
-    "Lake Wivenhoe",
-    "Lakefield",
-    "Lakeland",
-    "Lakes Creek",
-    "Lakeside",
-    "Lamb Island",
-    "Lamb Range",
-    "Lamington (Qld)",
-    "Lammermoor",
-    "Landers Shoot",
-    "Landsborough (Qld)",
-    "Lanefield",
-    "Langlands",
-    "Langlo",
-    "Langshaw",
-    "Lannercost",
-    "Lansdowne (Qld)",
-    "Lanskey",
-    "Larapinta (Qld)",
-    "Laravale",
-    "Lark Hill",
-    "Laura (Qld)",
-    "Lavelle",
-    "Lawes",
-    "Lawgi Dawes",
-    "Lawn Hill",
-    "Lawnton",
-    "Leafdale",
-    "Lefthand Branch",
-    "Leichhardt (Qld)",
-    "Lemontree",
-    "Leslie",
-    "Leslie Dam",
-    "Lethebrook",
-    "Leyburn",
-    "Leydens Hill",
-    "Lilydale (Qld)",
-    "Lilyvale (Central Highlands - Qld)",
-    "Lilyvale (Toowoomba - Qld)",
-    "Limestone (Qld)",
-    "Limestone Creek",
-    "Limestone Ridges",
-    "Limevale",
-    "Linden (Qld)",
-    "Linthorpe",
-    "Linville",
-    "Little Mountain",
-    "Little Mulgrave",
-    "Lizard",
-    "Llanarth (Qld)",
-    "Loch Lomond",
-    "Lochington",
-    "Lockhart River",
-    "Lockrose",
-    "Lockyer (Qld)",
-    "Lockyer Waters",
-    "Logan Central",
-    "Logan Reserve",
-    "Logan Village",
-    "Loganholme",
-    "Loganlea",
-    "Lonesome Creek",
-    "Long Flat (Qld)",
-    "Long Pocket",
-    "Longreach (Qld)",
-    "Lota",
-    "Lotus Creek",
-    "Low Isles",
-    "Lower Beechmont",
-    "Lower Cowley",
-    "Lower Cressbrook",
-    "Lower Daintree",
-    "Lower Mount Walker",
-    "Lower Tenthill",
-    "Lower Tully",
-    "Lower Wonga",
-    "Lowesby",
-    "Lowestoff",
-    "Lowmead",
-    "Lowood",
-    "Lucinda",
-    "Lumeah (Qld)",
-    "Lumholtz",
-    "Lundavra",
-    "Luscombe",
-    "Lutwyche",
-    "Lynam",
-    "Lyndhurst (Qld)",
-    "Lyndside",
-    "Lyons (Qld)",
-    "Lyra",
-    "Lytton",
-    "Ma Ma Creek",
-    "Maadi",
-    "Maalan",
-    "Maaroom",
-    "Mabuiag Island",
-    "Macalister",
-    "Macalister Range",
-    "Macfarlane",
-    "Macgregor (Qld)",
-    "Machans Beach",
-    "Machine Creek",
-    "Mackay",
-    "Mackay Harbour",
-    "Mackenzie (Brisbane - Qld)",
-    "Mackenzie (Central Highlands - Qld)",
-    "Mackenzie River",
-    "Macknade",
-    "Maclagan",
-    "Macleay Island",
-    "Magnolia",
-    "Maidenhead",
-    "Maidenwell",
-    "Main Beach",
-    "Majors Creek (Qld)",
-    "Malanda",
-    "Malarga",
-    "Maleny",
-    "Malling",
-    "Malmoe",
-    "Malpas-Trenton",
-    "Malu",
-    "Mamu",
-    "Manapouri",
-    "Mandalay",
-    "Mango Hill",
-    "Manly (Qld)",
-    "Manly West",
-    "Mannuem",
-    "Manoora (Qld)",
-    "Mansfield (Qld)",
-    "Mantuan Downs",
-    "Manumbar",
-    "Manunda",
-    "Manyung",
-    "Mapleton",
-    "Mapoon",
-    "Maramie",
-    "Marburg",
-    "Marcoola",
-    "Marcus Beach",
-    "Mareeba",
-    "Margate (Qld)",
-    "Maria Creeks",
-    "Marian",
-    "Marlborough",
-    "Marmadua",
-    "Marmor",
-    "Marodian",
-    "Maroochy River",
-    "Maroochydore",
-    "Maroon",
-    "Maroondan",
-    "Marsden",
-    "Marshlands",
-    "Martyville",
-    "Maryborough (Qld)",
-    "Maryborough West",
-    "Marys Creek",
-    "Maryvale (Livingstone - Qld)",
-    "Maryvale (Southern Downs - Qld)",
-    "Masig Island",
-    "Massie",
-    "Maudsland",
-    "Maxwelton",
-    "May Downs",
-    "McCutcheon",
-    "McDesme",
-    "McDowall",
-    "McEwens Beach",
-    "McIlwraith",
-    "McIntosh Creek",
-    "McKinlay",
-    "Meadowbrook",
-    "Meadowvale",
-    "Meandarra",
-    "Meikleville Hill",
-    "Melawondi",
-    "Meldale",
-    "Melrose (Qld)",
-    "Memerambi",
-    "Mena Creek",
-    "Mentmore",
-    "Menzies (Qld)",
-    "Mer Island",
-    "Meridan Plains",
-    "Meringandan",
-    "Meringandan West",
-    "Merlwood",
-    "Mermaid Beach",
-    "Mermaid Waters",
-    "Merrimac",
-    "Merritts Creek",
-    "Merryburn",
-    "Merryvale",
-    "Mia Mia (Qld)",
-    "Miallo",
-    "Miami",
-    "Miara",
-    "Mica Creek",
-    "Middle Park (Qld)",
-    "Middle Ridge",
-    "Middlebrook",
-    "Middlemount",
-    "Middleton (Qld)",
-    "Midge Point",
-    "Midgee (Qld)",
-    "Midgenoo",
-    "Midgeree Bar",
-    "Mighell",
-    "Milbong",
-    "Miles",
-    "Miles End",
-    "Milford",
-    "Millaa Millaa",
-    "Millaroo",
-    "Millbank (Qld)",
-    "Millchester",
-    "Millmerran",
-    "Millmerran Downs",
-    "Millmerran Woods",
-    "Millstream (Qld)",
-    "Millwood",
-    "Milman",
-    "Milora",
-    "Milton (Qld)",
-    "Mimosa (Qld)",
-    "Min Min",
-    "Minbun",
-    "Minden",
-    "Minerva",
-    "Mingela",
-    "Mingo",
-    "Mingoola (Qld)",
-    "Minnamoolka",
-    "Minnie Downs",
-    "Minyama",
-    "Mirani",
-    "Miriam Vale",
-    "Mirriwinni",
-    "Missen Flat",
-    "Mission Beach",
-    "Mission River",
-    "Mitchell (Qld)",
-    "Mitchelton",
-    "Miva",
-    "Moa Island",
-    "Moffat Beach",
-    "Moffatdale",
-    "Moggill",
-    "Molangul",
-    "Molendinar",
-    "Mon Repos",
-    "Mona Mona",
-    "Mona Park",
-    "Monal",
-    "Monarch Glen",
-    "Monduran",
-    "Mondure",
-    "Monkland",
-    "Monogorilby",
-    "Mons",
-    "Monsildale",
-    "Monto",
-    "Montrose (Southern Downs - Qld)",
-    "Montrose (Western Downs - Qld)",
-    "Montville",
-    "Moodlu",
-    "Mooga",
-    "Moogerah",
-    "Moola",
-    "Moolboolaman",
-    "Mooloo",
-    "Mooloolaba",
-    "Mooloolah Valley",
-    "Moombra",
-    "Moomin",
-    "Moondooner",
-    "Moonford",
-    "Moongan",
-    "Moonie",
-    "Moorang",
-    "Moore",
-    "Moore Park Beach",
-    "Moores Pocket",
-    "Moorina (Qld)",
-    "Moorland (Qld)",
-    "Mooroobool",
-    "Moorooka",
-    "Moraby",
-    "Moranbah",
-    "Morayfield",
-    "Moregatta",
-    "Moresby (Qld)",
-    "Moreton Bay",
-    "Moreton Island",
-    "Morgan Park",
-    "Morganville",
-    "Morinish",
-    "Morinish South",
-    "Morningside",
-    "Mornington (Qld)",
-    "Morton Vale",
-    "Morven (Qld)",
-    "Morwincha",
-    "Mosman Park (Qld)",
-    "Mosquito Creek",
-    "Mossman",
-    "Mossman Gorge",
-    "Mothar Mountain",
-    "Motley",
-    "Mount Abundance",
-    "Mount Alford",
-    "Mount Alma",
-    "Mount Archer (Rockhampton - Qld)",
-    "Mount Archer (Somerset - Qld)",
-    "Mount Barney",
-    "Mount Beppo",
-    "Mount Berryman",
-    "Mount Bindango",
-    "Mount Binga",
-    "Mount Britton",
-    "Mount Byron",
-    "Mount Carbine",
-    "Mount Chalmers",
-    "Mount Charlton",
-    "Mount Colliery",
-    "Mount Coolon",
-    "Mount Coolum",
-    "Mount Coot-tha",
-    "Mount Cotton",
-    "Mount Crosby",
-    "Mount Darry",
-    "Mount Debateable",
-    "Mount Delaney",
-    "Mount Edwards",
-    "Mount Elliot (Qld)",
-    "Mount Emlyn",
-    "Mount Enniskillen",
-    "Mount Forbes",
-    "Mount Fox",
-    "Mount French",
-    "Mount Gardiner",
-    "Mount Garnet",
-    "Mount Gipps",
-    "Mount Glorious",
-    "Mount Gravatt",
-    "Mount Gravatt East",
-    "Mount Hallen",
-    "Mount Howe",
-    "Mount Hutton (Qld)",
-    "Mount Irving",
-    "Mount Isa",
-    "Mount Isa City",
-    "Mount Jukes",
-    "Mount Julian",
-    "Mount Kelly",
-    "Mount Kilcoy",
-    "Mount Kynoch",
-    "Mount Larcom",
-    "Mount Lawless",
-    "Mount Lindesay (Qld)",
-    "Mount Lofty",
-    "Mount Louisa",
-    "Mount Low",
-    "Mount Luke",
-    "Mount Macarthur",
-    "Mount Mackay",
-    "Mount Maria",
-    "Mount Marlow",
-    "Mount Marrow",
-    "Mount Marshall",
-    "Mount Martin",
-    "Mount Mceuen",
-    "Mount Mee",
-    "Mount Mellum",
-    "Mount Moffatt",
-    "Mount Molar",
-    "Mount Molloy",
-    "Mount Morgan",
-    "Mount Moriah",
-    "Mount Mort",
-    "Mount Mulgrave",
-    "Mount Mulligan",
-    "Mount Murchison",
-    "Mount Nathan",
-    "Mount Nebo",
-    "Mount Ommaney",
-    "Mount Ossa",
-    "Mount Pelion",
-    "Mount Perry",
-    "Mount Peter",
-    "Mount Pleasant (Mackay - Qld)",
-    "Mount Pleasant (Moreton Bay - Qld)",
-    "Mount Pluto",
-    "Mount Rascal",
-    "Mount Rooper",
-    "Mount Samson",
-    "Mount Sheridan (Qld)",
-    "Mount St John",
-    "Mount Stanley",
-    "Mount Steadman",
-    "Mount Stuart (Qld)",
-    "Mount Sturt",
-    "Mount Surprise",
-    "Mount Surround",
-    "Mount Sylvia",
-    "Mount Tabor",
-    "Mount Tarampa",
-    "Mount Tom",
-    "Mount Tully",
-    "Mount Tyson",
-    "Mount Urah",
-    "Mount Walker (Qld)",
-    "Mount Walker West",
-    "Mount Warren Park",
-    "Mount Whitestone",
-    "Mount Wyatt",
-    "Mountain Camp",
-    "Mountain Creek (Qld)",
-    "Moura",
-    "Mourilyan",
-    "Mourilyan Harbour",
-    "Mowbray (Qld)",
-    "Mowbullan",
-    "Moy Pocket",
-    "Mp Creek",
-    "Muckadilla",
-    "Mudgeeraba",
-    "Mudjimba",
-    "Mudlo",
-    "Muirlea",
-    "Mulambin",
-    "Mulara",
-    "Muldu",
-    "Mulgildie",
-    "Mulgowie",
-    "Mulgrave (Qld)",
-    "Mullett Creek",
-    "Munbilla",
-    "Munbura",
-    "Munderra",
-    "Mundingburra",
-    "Mundoo",
-    "Mundoolun",
-    "Mundowran",
-    "Mundubbera",
-    "Mungabunda",
-    "Mungallala",
-    "Mungallala South",
-    "Mungalli",
-    "Mungar",
-    "Mungindi (Qld)",
-    "Mungungo",
-    "Mungy",
-    "Muniganeen",
-    "Munna Creek",
-    "Munro Plains",
-    "Munruben",
-    "Murarrie",
-    "Murgon",
-    "Murphys Creek (Qld)",
-    "Murray",
-    "Murray Upper",
-    "Murrays Bridge",
-    "Murrigal",
-    "Murrumba",
-    "Murrumba Downs",
-    "Murweh",
-    "Mutarnee",
-    "Mutchilba",
-    "Mutdapilly",
-    "Muttaburra",
-    "Myall Park (Qld)",
-    "Myrtlevale",
-    "Mysterton",
-    "Nahrunda",
-    "Nambour",
-    "Nanango",
-    "Nandi",
-    "Nandowrie",
-    "Nangram",
-    "Nangwee",
-    "Nankin",
-    "Nanum",
-    "Narangba",
-    "Narko",
-    "Nathan",
-    "Natural Bridge",
-    "Nearum",
-    "Nebine",
-    "Nebo",
-    "Neerdie",
-    "Nelly Bay",
-    "Nerada",
-    "Nerang",
-    "Neranwood",
-    "Nerimbera",
-    "Netherby (Qld)",
-    "Netherdale",
-    "Neumgna",
-    "Neurum",
-    "Neusa Vale",
-    "Nevilton",
-    "New Auckland",
-    "New Beith",
-    "New Chum",
-    "New Farm",
-    "New Harbourline",
-    "New Mapoon",
-    "New Moonta",
-    "Newell",
-    "Newlands (Qld)",
-    "Newmarket",
-    "Newport (Qld)",
-    "Newstead (Qld)",
-    "Newtown (Ipswich - Qld)",
-    "Newtown (Toowoomba - Qld)",
-    "Ngatjan",
-    "Nicholson (Qld)",
-    "Nikenbah",
-    "Nindaroo",
-    "Ninderry",
-    "Nindooinbah",
-    "Nine Mile (Qld)",
-    "Nine Mile Creek",
-    "Ningi",
-    "Nirimba (Qld)",
-    "Nive",
-    "No 4 Branch",
-    "No 5 Branch",
-    "No 6 Branch",
-    "Noah",
-    "Nobby",
-    "Noccundra",
-    "Nome",
-    "Noorama",
-    "Noorindoo",
-    "Noosa Heads",
-    "Noosa North Shore",
-    "Noosaville",
-    "Norman Gardens",
-    "Norman Park",
-    "Normanton",
-    "North Aramara",
-    "North Arm (Qld)",
-    "North Booval",
-    "North Branch (Southern Downs - Qld)",
-    "North Branch (Toowoomba - Qld)",
-    "North Bungunya",
-    "North Deep Creek",
-    "North Eton",
-    "North Gregory",
-    "North Ipswich",
-    "North Isis",
-    "North Johnstone",
-    "North Lakes",
-    "North Mackay",
-    "North Maclagan",
-    "North Maclean",
-    "North Maleny",
-    "North Stradbroke Island",
-    "North Talwood",
-    "North Tivoli",
-    "North Toowoomba",
-    "North Ward",
-    "Northgate (Qld)",
-    "Northhead",
-    "Norville",
-    "Norwell",
-    "Norwin",
-    "Nudgee",
-    "Nudgee Beach",
-    "Nukku",
-    "Numinbah Valley",
-    "Nundah",
-    "Nundubbermere",
-    "Nutgrove",
-    "Nychum",
-    "O'Bil Bil",
-    "O'Briens Hill",
-    "O'Connell (Qld)",
-    "O'Reilly",
-    "Oak Beach",
-    "Oak Valley (Qld)",
-    "Oakdale (Qld)",
-    "Oakenden",
-    "Oakey",
-    "Oakey Creek",
-    "Oakhurst (Qld)",
-    "Oakview",
-    "Oakwood (Qld)",
-    "Oaky Creek",
-    "Oberina",
-    "Obi Obi",
-    "Obum Obum",
-    "Ocean View",
-    "Ogmore",
-    "Okeden",
-    "Old Cooranga",
-    "Old Talgai",
-    "Oman Ama",
-    "One Mile (Qld)",
-    "Oombabeer",
-    "Oonoonba",
-    "Ooralea",
-    "Opalton",
-    "Orallo",
-    "Orange Creek",
-    "Orange Hill",
-    "Orient",
-    "Orion",
-    "Ormeau",
-    "Ormeau Hills",
-    "Ormiston",
-    "Osborne (Qld)",
-    "Ottaba",
-    "Owanyilla",
-    "Owens Creek",
-    "Oxenford",
-    "Oxford",
-    "Oxley (Qld)",
-    "Oyster Creek",
-    "Pacific Haven",
-    "Pacific Heights",
-    "Pacific Paradise",
-    "Pacific Pines",
-    "Packers Camp",
-    "Paddington (Qld)",
-    "Paddys Green",
-    "Paget",
-    "Palen Creek",
-    "Palgrave",
-    "Pallara",
-    "Pallarenda",
-    "Palm Beach (Qld)",
-    "Palm Cove",
-    "Palm Grove (Qld)",
-    "Palm Island",
-    "Palmer (Qld)",
-    "Palmerston (Qld)",
-    "Palmtree",
-    "Palmview",
-    "Palmwoods (Qld)",
-    "Palmyra (Qld)",
-    "Paluma",
-    "Pampas",
-    "Paradise Point",
-    "Park Avenue",
-    "Park Ridge",
-    "Park Ridge South",
-    "Parkhurst",
-    "Parkinson",
-    "Parklands (Qld)",
-    "Parknook",
-    "Parkside (Qld)",
-    "Parkwood (Qld)",
-    "Parramatta Park",
-    "Parrearra",
-    "Pasha",
-    "Passchendaele",
-    "Paterson (Qld)",
-    "Patrick Estate",
-    "Pauls Pocket",
-    "Peachester",
-    "Peacock Siding",
-    "Peak Crossing",
-    "Pechey",
-    "Peel Island",
-    "Peeramon",
-    "Pelham (Qld)",
-    "Pelican (Qld)",
-    "Pelican Waters",
-    "Pentland",
-    "Penwhaupell",
-    "Peranga",
-    "Peregian Beach",
-    "Peregian Springs",
-    "Perseverance",
-    "Perwillowen",
-    "Petford",
-    "Petrie",
-    "Petrie Terrace",
-    "Pheasant Creek (Qld)",
-    "Philpott",
-    "Pialba",
-    "Pickanjinnie",
-    "Picnic Bay",
-    "Pie Creek",
-    "Pierces Creek",
-    "Pikedale",
-    "Pikes Creek",
-    "Pile Gully",
-    "Pilerwa",
-    "Pilton",
-    "Pimlico (Qld)",
-    "Pimpama",
-    "Pimpimbudgee",
-    "Pin Gin Hill",
-    "Pinbarren",
-    "Pindi Pindi",
-    "Pine Creek (Qld)",
-    "Pine Hills",
-    "Pine Mountain (Qld)",
-    "Pinelands (Qld)",
-    "Pinevale",
-    "Pinjarra Hills",
-    "Pink Lily",
-    "Pinkenba",
-    "Pinnacle (Qld)",
-    "Pinnacles",
-    "Pioneer (Qld)",
-    "Pioneers Rest",
-    "Pirrinuan",
-    "Pittsworth",
-    "Piturie",
-    "Placid Hills",
-    "Plainby",
-    "Plainland",
-    "Pleystowe",
-    "Point Arkwright",
-    "Point Lookout",
-    "Point Vernon",
-    "Pomona (Qld)",
-    "Pony Hills",
-    "Poona",
-    "Porcupine",
-    "Pormpuraaw",
-    "Port Alma",
-    "Port Curtis",
-    "Port Douglas",
-    "Port Of Brisbane",
-    "Portsmith",
-    "Poruma Island",
-    "Postmans Ridge",
-    "Pozieres",
-    "Prairie (Qld)",
-    "Pratten",
-    "Prawle",
-    "Prenzlau",
-    "Preston (Lockyer Valley - Qld)",
-    "Preston (Whitsunday - Qld)",
-    "Priestdale",
-    "Prince Henry Heights",
-    "Prince Of Wales",
-    "Promisedland",
-    "Proserpine",
-    "Prospect (Qld)",
-    "Proston",
-    "Pullenvale",
-    "Punchs Creek",
-    "Punsand",
-    "Purga",
-    "Purrawunda",
-    "Queenton",
-    "Quilpie",
-    "Quinalow",
-    "Qunaba",
-    "Racecourse",
-    "Raceview",
-    "Radford",
-    "Raglan (Qld)",
-    "Railway Estate",
-    "Rainbow Beach",
-    "Ramsay (Qld)",
-    "Rangemore (Burdekin - Qld)",
-    "Rangemore (Toowoomba - Qld)",
-    "Ranges Bridge",
-    "Rangeville",
-    "Rangewood",
-    "Ransome",
-    "Rasmussen",
-    "Rathdowney",
-    "Ravensbourne",
-    "Ravenshoe",
-    "Ravenswood (Qld)",
-    "Ravensworth (Qld)",
-    "Rawbelle",
-    "Red Hill (Brisbane - Qld)",
-    "Red Hill (Western Downs - Qld)",
-    "Red River",
-    "Redbank (Qld)",
-    "Redbank Creek",
-    "Redbank Plains",
-    "Redcliffe (Qld)",
-    "Redford",
-    "Redgate (Qld)",
-    "Redhill Farms",
-    "Redland Bay",
-    "Redlynch",
-    "Redridge",
-    "Redwood",
-    "Reedy Creek (Qld)",
-    "Reesville",
-    "Regency Downs",
-    "Regents Park (Qld)",
-    "Reid River",
-    "Reids Creek",
-    "Retro",
-    "Rewan",
-    "Rhydding",
-    "Richlands (Qld)",
-    "Richmond (Mackay - Qld)",
-    "Richmond (Richmond - Qld)",
-    "Richmond Hill (Qld)",
-    "Ridgelands",
-    "Ridgewood (Qld)",
-    "Rifle Range",
-    "Ringtail Creek",
-    "Ringwood (Qld)",
-    "Riordanvale",
-    "Ripley",
-    "Rita Island",
-    "River Heads",
-    "River Ranch",
-    "Riverbend",
-    "Riverhills",
-    "Riverleigh",
-    "Riversleigh",
-    "Riverton (Qld)",
-    "Riverview (Qld)",
-    "Roadvale",
-    "Robertson (Qld)",
-    "Robina",
-    "Roche Creek",
-    "Rochedale",
-    "Rochedale South",
-    "Rockhampton City",
-    "Rockingham (Qld)",
-    "Rocklea (Qld)",
-    "Rockmount",
-    "Rocksberg",
-    "Rockside",
-    "Rockville",
-    "Rocky Creek (Qld)",
-    "Rocky Point (Douglas - Qld)",
-    "Rocky Point (Weipa - Qld)",
-    "Rockyview",
-    "Rodds Bay",
-    "Rodgers Creek",
-    "Rolleston",
-    "Rollingstone",
-    "Roma",
-    "Rookwood (Qld)",
-    "Ropeley",
-    "Rosalie Plains",
-    "Rosedale (Qld)",
-    "Rosehill (Qld)",
-    "Rosella",
-    "Rosemount",
-    "Roseneath",
-    "Rosenthal Heights",
-    "Rosevale (Qld)",
-    "Rosewood (Qld)",
-    "Ross Creek (Qld)",
-    "Ross River",
-    "Rosslea",
-    "Rosslyn",
-    "Rossmoya",
-    "Rossvale",
-    "Rossville",
-    "Rothwell",
-    "Round Hill (Qld)",
-    "Roundstone",
-    "Rowes Bay",
-    "Royston",
-    "Rubyanna",
-    "Rules Beach",
-    "Runaway Bay",
-    "Runcorn",
-    "Rungoo",
-    "Running Creek (Qld)",
-    "Runnymede (Qld)",
-    "Rural View",
-    "Rush Creek",
-    "Russell Island",
-    "Ryan (Qld)",
-    "Ryeford",
-    "Rywung",
-    "Sabine",
-    "Sadliers Crossing",
-    "Saibai Island",
-    "Salisbury (Qld)",
-    "Samford Valley",
-    "Samford Village",
-    "Samsonvale",
-    "Sandgate (Qld)",
-    "Sandiford",
-    "Sandringham (Qld)",
-    "Sandstone Point",
-    "Sandy Camp",
-    "Sandy Creek (Qld)",
-    "Sandy Pocket",
-    "Sandy Ridges",
-    "Sapphire Central",
-    "Sarabah",
-    "Sarina",
-    "Sarina Beach",
-    "Sarina Range",
-    "Saunders Beach",
-    "Savannah",
-    "Saxby",
-    "Scarborough (Qld)",
-    "Scarness",
-    "Scotchy Pocket",
-    "Scottville",
-    "Scrub Creek",
-    "Scrubby Creek (Blackall Tambo - Qld)",
-    "Scrubby Creek (Gympie - Qld)",
-    "Scrubby Mountain",
-    "Seaforth (Qld)",
-    "Seisia",
-    "Selene",
-    "Selwyn (Qld)",
-    "Septimus",
-    "Seven Hills (Qld)",
-    "Seventeen Mile",
-    "Seventeen Mile Rocks",
-    "Seventeen Seventy",
-    "Seventy Mile",
-    "Severnlea",
-    "Sexton",
-    "Shailer Park",
-    "Shannonvale",
-    "Sharon",
-    "Shaw",
-    "Sheep Station Creek",
-    "Shelburne",
-    "Sheldon",
-    "Shell Pocket",
-    "Shelly Beach (Sunshine Coast - Qld)",
-    "Shelly Beach (Townsville - Qld)",
-    "Sherwood (Qld)",
-    "Shirbourne",
-    "Shoal Point",
-    "Shoalwater (Qld)",
-    "Shorncliffe",
-    "Shute Harbour",
-    "Silkstone",
-    "Silkwood",
-    "Silky Oak",
-    "Silver Creek",
-    "Silver Ridge",
-    "Silver Spur",
-    "Silver Valley",
-    "Silverbark Ridge",
-    "Silverdale (Qld)",
-    "Silverleaf",
-    "Silverleigh",
-    "Silverwood",
-    "Simmie",
-    "Sinnamon Park",
-    "Sippy Downs",
-    "Skyring Reserve",
-    "Slacks Creek",
-    "Slade Point",
-    "Sladevale",
-    "Smithfield (Qld)",
-    "Smithlea",
-    "Soldiers Hill (Qld)",
-    "Somerset (Qld)",
-    "Somerset Dam",
-    "Sommariva",
-    "Somme",
-    "South Bingera",
-    "South Brisbane",
-    "South East Nanango",
-    "South Gladstone",
-    "South Innisfail",
-    "South Isis",
-    "South Johnstone",
-    "South Kolan",
-    "South Mackay",
-    "South Maclean",
-    "South Mission Beach",
-    "South Nanango",
-    "South Ripley",
-    "South Stradbroke",
-    "South Talwood",
-    "South Toowoomba",
-    "South Townsville",
-    "South Trees",
-    "South Wellesley Islands",
-    "South Yaamba",
-    "Southbrook",
-    "Southedge",
-    "Southern Cross (Qld)",
-    "Southern Lamington",
-    "Southern Moreton Bay Islands",
-    "Southport (Qld)",
-    "Southside",
-    "Southwood",
-    "Speedwell",
-    "Speewah",
-    "Splinter Creek",
-    "Split Yard Creek",
-    "Spreadborough",
-    "Spring Bluff",
-    "Spring Creek (Banana - Qld)",
-    "Spring Creek (Lockyer Valley - Qld)",
-    "Spring Creek (Toowoomba - Qld)",
-    "Spring Hill (Qld)",
-    "Spring Mountain (Qld)",
-    "Springbrook",
-    "Springdale (Qld)",
-    "Springfield (Ipswich - Qld)",
-    "Springfield (Mareeba - Qld)",
-    "Springfield Central",
-    "Springfield Lakes",
-    "Springlands",
-    "Springside (Qld)",
-    "Springsure",
-    "Springvale (Qld)",
-    "Springwood (Qld)",
-    "Spurgeon",
-    "St Agnes (Qld)",
-    "St Aubyn",
-    "St George (Qld)",
-    "St Helens (Fraser Coast - Qld)",
-    "St Helens (Toowoomba - Qld)",
-    "St Helens Beach",
-    "St Kilda (Qld)",
-    "St Lawrence",
-    "St Lucia",
-    "St Mary",
-    "St Ruth",
-    "Staaten",
-    "Stafford",
-    "Stafford Heights",
-    "Stalworth",
-    "Stamford",
-    "Stanage",
-    "Stanmore (Qld)",
-    "Stanthorpe",
-    "Stanwell",
-    "Stapylton",
-    "Starcke",
-    "Steiglitz (Qld)",
-    "Stewart Creek Valley",
-    "Stewarton (Qld)",
-    "Stockhaven",
-    "Stockleigh",
-    "Stockton (Qld)",
-    "Stockyard (Livingstone - Qld)",
-    "Stockyard (Lockyer Valley - Qld)",
-    "Stokes",
-    "Stonehenge (Barcoo - Qld)",
-    "Stonehenge (Toowoomba - Qld)",
-    "Stonelands",
-    "Stoneleigh (Qld)",
-    "Stones Corner",
-    "Stony Creek (Qld)",
-    "Storm King",
-    "Stoters Hill",
-    "Stratford (Qld)",
-    "Strathdickie",
-    "Strathfield (Qld)",
-    "Strathmore (Qld)",
-    "Strathpine",
-    "Stretton",
-    "Struck Oil",
-    "Stuart (Qld)",
-    "Sturt (Qld)",
-    "Sugarloaf (Southern Downs - Qld)",
-    "Sugarloaf (Whitsunday - Qld)",
-    "Sujeewong",
-    "Summerholm",
-    "Sumner",
-    "Sun Valley (Qld)",
-    "Sundown (Cassowary Coast - Qld)",
-    "Sundown (Southern Downs - Qld)",
-    "Sunny Nook",
-    "Sunnybank",
-    "Sunnybank Hills",
-    "Sunnyside (Qld)",
-    "Sunrise Beach",
-    "Sunset",
-    "Sunshine Acres",
-    "Sunshine Beach",
-    "Surat",
-    "Surfers Paradise",
-    "Susan River",
-    "Suttor",
-    "Svensson Heights",
-    "Swan Creek (Qld)",
-    "Swanbank",
-    "Swanfels",
-    "Swans Lagoon",
-    "Sweers Island",
-    "Syndicate",
-    "Taabinga",
-    "Tablelands (Gladstone - Qld)",
-    "Tablelands (South Burnett - Qld)",
-    "Tabooba",
-    "Tabragalba",
-    "Taigum",
-    "Takilberan",
-    "Takura",
-    "Talaroo",
-    "Taldora",
-    "Talegalla Weir",
-    "Talgai",
-    "Tallai",
-    "Tallebudgera",
-    "Tallebudgera Valley",
-    "Tallegalla",
-    "Tam O'Shanter",
-    "Tamaree",
-    "Tambo",
-    "Tamborine",
-    "Tamborine Mountain",
-    "Tamrookum",
-    "Tamrookum Creek",
-    "Tanah Merah",
-    "Tanawha",
-    "Tanbar",
-    "Tanby",
-    "Tandora",
-    "Tandur",
-    "Tangorin",
-    "Tannum Sands",
-    "Tannymorel",
-    "Tansey",
-    "Tara (Qld)",
-    "Taragoola",
-    "Tarampa",
-    "Taranganba",
-    "Tarawera",
-    "Targinnie",
-    "Taringa",
-    "Tarome",
-    "Taromeo",
-    "Tarong",
-    "Taroom",
-    "Taroomball",
-    "Tarragindi",
-    "Tarramba",
-    "Tarzali",
-    "Taunton (Qld)",
-    "Taylors Beach (Qld)",
-    "Te Kowai",
-    "Teddington",
-    "Teebar",
-    "Teelah",
-    "Teelba",
-    "Telina",
-    "Tellebang",
-    "Templin",
-    "Teneriffe",
-    "Tennyson (Qld)",
-    "Terrica",
-    "Teviotville",
-    "Tewantin",
-    "Texas (Qld)",
-    "Thabeban",
-    "Thagoona",
-    "Thallon",
-    "Thane",
-    "Thanes Creek",
-    "Thangool",
-    "Thargomindah",
-    "The Bluff (Ipswich - Qld)",
-    "The Bluff (Toowoomba - Qld)",
-    "The Caves",
-    "The Common",
-    "The Dawn",
-    "The Dimonds",
-    "The Falls",
-    "The Gap (Brisbane - Qld)",
-    "The Gap (Mount Isa - Qld)",
-    "The Glen (Qld)",
-    "The Gums",
-    "The Head",
-    "The Hermitage",
-    "The Keppels",
-    "The Leap",
-    "The Limits",
-    "The Mine",
-    "The Narrows (Qld)",
-    "The Palms",
-    "The Percy Group",
-    "The Pines (Qld)",
-    "The Range (Qld)",
-    "The Summit",
-    "Theebine",
-    "Theodore (Qld)",
-    "Theresa Creek (Qld)",
-    "Thinoomba",
-    "Thompson Point",
-    "Thoopara",
-    "Thornborough",
-    "Thorndale",
-    "Thorneside",
-    "Thornlands",
-    "Thornton (Qld)",
-    "Thornton Beach",
-    "Thornville",
-    "Three Moon",
-    "Three Rivers",
-    "Thulimbah",
-    "Thuringowa Central",
-    "Thursday Island",
-    "Tiaro",
-    "Tieri",
-    "Tin Can Bay",
-    "Tinana",
-    "Tinana South",
-    "Tinaroo",
-    "Tinbeerwah",
-    "Tingalpa",
-    "Tingoora",
-    "Tingun",
-    "Tinnanbar",
-    "Tipton",
-    "Tirroan",
-    "Tivoli",
-    "Togara",
-    "Toko",
-    "Tolga",
-    "Toll",
-    "Toobanna",
-    "Toobeah",
-    "Toogoolawah",
-    "Toogoom",
-    "Toolakea",
-    "Toolara Forest",
-    "Toolburra",
-    "Toolooa",
-    "Toomulla",
-    "Toondahra",
-    "Toonpan",
-    "Toorbul",
-    "Toowong",
-    "Toowoomba City",
-    "Top Camp",
-    "Topaz",
-    "Torbanlea",
-    "Torquay (Qld)",
-    "Torrens Creek",
-    "Torres Strait",
-    "Torrington (Qld)",
-    "Towen Mountain",
-    "Towers Hill",
-    "Town Common",
-    "Townson",
-    "Townsville City",
-    "Townview",
-    "Traveston",
-    "Trebonne",
-    "Tregony",
-    "Trinity Beach",
-    "Trinity Park",
-    "Trotter Creek",
-    "Trunding",
-    "Tuan",
-    "Tuan Forest",
-    "Tuchekoi",
-    "Tuckerang",
-    "Tuen",
-    "Tugun",
-    "Tully",
-    "Tully Heads",
-    "Tummaville",
-    "Tumoulin",
-    "Tungamull",
-    "Turallin",
-    "Turkey Beach",
-    "Turrawulla",
-    "Twin Waters",
-    "Two Mile",
-    "Tyrconnel",
-    "Ugar Island",
-    "Ulogie",
-    "Umagico",
-    "Umbiram",
-    "Underwood (Qld)",
-    "Undullah",
-    "Upper Barron",
-    "Upper Brookfield",
-    "Upper Caboolture",
-    "Upper Coomera",
-    "Upper Cooyar Creek",
-    "Upper Daintree",
-    "Upper Daradgee",
-    "Upper Dawson",
-    "Upper Flagstone",
-    "Upper Freestone",
-    "Upper Glastonbury",
-    "Upper Haughton",
-    "Upper Kandanga",
-    "Upper Kedron",
-    "Upper Lockyer",
-    "Upper Mount Gravatt",
-    "Upper Pilton",
-    "Upper Pinelands",
-    "Upper Stone",
-    "Upper Tenthill",
-    "Upper Warrego",
-    "Upper Wheatvale",
-    "Upper Yarraman",
-    "Urangan",
-    "Urraween",
-    "Utchee Creek",
-    "V Gate",
-    "Valdora",
-    "Vale View",
-    "Valentine Plains",
-    "Valkyrie",
-    "Valley Of Lagoons",
-    "Varsity Lakes",
-    "Vasa Views",
-    "Ventnor (Qld)",
-    "Veradilla",
-    "Veresdale",
-    "Veresdale Scrub",
-    "Vernor",
-    "Verrierdale",
-    "Veteran",
-    "Victoria Hill",
-    "Victoria Plains",
-    "Victoria Plantation",
-    "Victoria Point (Qld)",
-    "Victoria Vale",
-    "Victory Heights (Qld)",
-    "Villeneuve",
-    "Vincent",
-    "Vinegar Hill",
-    "Virginia (Qld)",
-    "Wacol",
-    "Wahoon",
-    "Waikola",
-    "Wainui",
-    "Wairuna",
-    "Wakerley",
-    "Walhallow",
-    "Walkamin",
-    "Walkers Point",
-    "Walkerston",
-    "Walkervale",
-    "Wallaces Creek",
-    "Wallaman",
-    "Wallangarra",
-    "Wallaroo (Qld)",
-    "Wallaville",
-    "Walliebum",
-    "Walligan",
-    "Walloon",
-    "Wallu",
-    "Wallumbilla",
-    "Wallumbilla North",
-    "Wallumbilla South",
-    "Walmul",
-    "Walter Hill",
-    "Walter Lever Estate",
-    "Walterhall",
-    "Wamuran",
-    "Wamuran Basin",
-    "Wandal",
-    "Wandoan",
-    "Wangan",
-    "Wangaratta (Qld)",
-    "Wangetti",
-    "Wanjuru",
-    "Wanora",
-    "Warana",
-    "Warburton (Qld)",
-    "Ward",
-    "Warenda",
-    "Warkon",
-    "Warner",
-    "Warnoah",
-    "Warnung",
-    "Warra",
-    "Warraber Islet",
-    "Warrami",
-    "Warrill View",
-    "Warroo (Qld)",
-    "Warrubullen",
-    "Warwick (Qld)",
-    "Washpool (Qld)",
-    "Watalgan",
-    "Wateranga",
-    "Waterford (Qld)",
-    "Waterford West",
-    "Waterloo (Qld)",
-    "Watsons Crossing",
-    "Watsonville",
-    "Wattle Camp",
-    "Wattle Grove (Qld)",
-    "Wattle Ridge (Qld)",
-    "Wattlebank",
-    "Waua Islet",
-    "Waugh Pocket",
-    "Wavell Heights",
-    "Waverley (Qld)",
-    "Wealwandangie",
-    "Webb",
-    "Weengallon",
-    "Weerriba",
-    "Weipa Airport",
-    "Weir River",
-    "Welcome Creek",
-    "Wellcamp",
-    "Wellesley (Qld)",
-    "Wellesley Islands",
-    "Wellington Point",
-    "Welsby",
-    "Wengenville",
-    "Wenlock",
-    "Weranga",
-    "Weribone",
-    "West End (Brisbane - Qld)",
-    "West End (Townsville - Qld)",
-    "West Gladstone",
-    "West Haldon",
-    "West Ipswich",
-    "West Mackay",
-    "West Point",
-    "West Prairie",
-    "West Rockhampton",
-    "West Stowe",
-    "West Wellesley Islands",
-    "West Woombye",
-    "Westbrook (Qld)",
-    "Westcourt",
-    "Western Creek (Qld)",
-    "Westgrove",
-    "Westlake",
-    "Westmar",
-    "Westvale",
-    "Westwood (Qld)",
-    "Wetheron",
-    "Weyba Downs",
-    "Wharps",
-    "Wheatlands",
-    "Wheatvale",
-    "Whetstone",
-    "Whichello",
-    "White Mountain",
-    "White Patch",
-    "White Rock (Cairns - Qld)",
-    "White Rock (Ipswich - Qld)",
-    "Whiteside",
-    "Whitfield (Qld)",
-    "Whitsundays",
-    "Whyanbeel",
-    "Widgee",
-    "Widgee Crossing North",
-    "Widgee Crossing South",
-    "Widgeegoara",
-    "Wieambilla",
-    "Wights Mountain",
-    "Wigton",
-    "Wildash",
-    "Wilkesdale",
-    "Willawong",
-    "Willow Vale (Qld)",
-    "Willowbank",
-    "Willows",
-    "Willowvale (Qld)",
-    "Wills",
-    "Wilson Beach",
-    "Wilson Valley",
-    "Wilsons Plains",
-    "Wilsons Pocket",
-    "Wilsonton",
-    "Wilsonton Heights",
-    "Wilston",
-    "Winchester",
-    "Windaroo",
-    "Windera (Qld)",
-    "Windermere (Qld)",
-    "Windeyer (Qld)",
-    "Windorah",
-    "Windsor (Qld)",
-    "Winfield",
-    "Winston",
-    "Winton (Qld)",
-    "Winwill",
-    "Winya",
-    "Wishart (Qld)",
-    "Withcott",
-    "Witheren",
-    "Witta",
-    "Wivenhoe Hill",
-    "Wivenhoe Pocket",
-    "Wiyarra",
-    "Woleebee",
-    "Wolfang",
-    "Wolffdene",
-    "Wolvi",
-    "Womalilla",
-    "Womblebank",
-    "Womina",
-    "Wonbah",
-    "Wonbah Forest",
-    "Wondai",
-    "Wondalli",
-    "Wondecla",
-    "Wondunna",
-    "Wonga Beach",
-    "Wongabel",
-    "Wongaling Beach",
-    "Wongawallan",
-    "Wonglepong",
-    "Woocoo",
-    "Woodbine (Qld)",
-    "Woodbury (Qld)",
-    "Woodend (Qld)",
-    "Wooderson",
-    "Woodford (Qld)",
-    "Woodgate",
-    "Woodhill (Qld)",
-    "Woodlands (Qld)",
-    "Woodleigh (Qld)",
-    "Woodmillar",
-    "Woodridge (Qld)",
-    "Woodstock (Qld)",
-    "Woodwark",
-    "Woody Point",
-    "Woolein",
-    "Woolgar",
-    "Woolloongabba",
-    "Woolmar",
-    "Woolmer",
-    "Woolooga",
-    "Woolooman",
-    "Wooloowin",
-    "Woolshed",
-    "Woombye",
-    "Woondum",
-    "Woongarra",
-    "Woongoolba",
-    "Woopen Creek",
-    "Woorabinda",
-    "Woorim",
-    "Wooroolin",
-    "Wooroona",
-    "Wooroonden",
-    "Wooroonooran (Cairns - Qld)",
-    "Wooroonooran (Cassowary Coast - Qld)",
-    "Wootha",
-    "Woowoonga",
-    "Woree",
-    "Worongary",
-    "Wowan",
-    "Wrattens Forest",
-    "Wrights Creek (Qld)",
-    "Wrotham",
-    "Wujal Wujal",
-    "Wulguru",
-    "Wulkuraka",
-    "Wunjunga",
-    "Wura",
-    "Wurdong Heights",
-    "Wurtulla",
-    "Wuruma Dam",
-    "Wutul",
-    "Wyaga",
-    "Wyalla",
-    "Wyandra",
-    "Wyaralong",
-    "Wyberba",
-    "Wycarbah",
-    "Wychie",
-    "Wycombe",
-    "Wynnum",
-    "Wynnum West",
-    "Wyreema",
-    "Wyuna (Qld)",
-    "Yaamba",
-    "Yabulu",
-    "Yagaburne",
-    "Yagoonya",
-    "Yalangur",
-    "Yalboroo",
-    "Yamanto",
-    "Yandaran",
-    "Yandarlo",
-    "Yandilla",
-    "Yandina",
-    "Yandina Creek",
-    "Yangan",
-    "Yargullen",
-    "Yaroomba",
-    "Yarrabah",
-    "Yarrabilba",
-    "Yarraden",
-    "Yarraman (Qld)",
-    "Yarranlea",
-    "Yarrol",
-    "Yarwun",
-    "Yatala",
-    "Yeerongpilly",
-    "Yelarbon",
-    "Yenda (Qld)",
-    "Yengarie",
-    "Yeppoon",
-    "Yeronga",
-    "Yerra",
-    "Yimbun",
-    "Yorkeys Knob",
-    "Yowah",
-    "Yugar",
-    "Yulabilla",
-    "Yuleba",
-    "Yuleba North",
-    "Yuleba South",
-    "Yungaburra",
-    "Yuruga",
-    "Zillmere",
-    "Zilzie",
-    "No usual address (Qld)",
-    "Migratory - Offshore - Shipping (Qld)",
-    "Aberfoyle Park",
-    "Adelaide",
-    "Adelaide Airport",
-    "Agery",
-    "Alawoona",
-    "Albert Park (SA)",
-    "Alberton (SA)",
-    "Aldgate",
-    "Aldinga",
-    "Aldinga Beach",
-    "Alford",
-    "Allenby Gardens",
-    "Allendale East",
-    "Allendale North",
-    "Alma (SA)",
-    "Altona (SA)",
-    "Amata",
-    "American Beach",
-    "American River",
-    "Amyton",
-    "Anama",
-    "Anangu Pitjantjatjara Yankunytjatjara",
-    "Andamooka",
-    "Andamooka Station",
-    "Andrews",
-    "Andrews Farm",
-    "Angas Plains",
-    "Angas Valley",
-    "Angaston",
-    "Angle Park",
-    "Angle Vale",
-    "Anna Creek",
-    "Annadale",
-    "Antechamber Bay",
-    "Apamurra",
-    "Apoinga",
-    "Appila",
-    "Arcoona",
-    "Ardrossan",
-    "Arkaroola",
-    "Armagh",
-    "Arno Bay",
-    "Arthurton",
-    "Ascot Park",
-    "Ashbourne (SA)",
-    "Ashford (SA)",
-    "Ashton",
-    "Ashville",
-    "Athelstone",
-    "Athol Park",
-    "Auburn (SA)",
-    "Auldana",
-    "Australia Plains",
-    "Avenue Range",
-    "Avoca Dell",
-    "Avon (SA)",
-    "Back Valley",
-    "Bagot Well",
-    "Baird Bay",
-    "Bakara",
-    "Bakara Well",
-    "Balaklava",
-    "Bald Hills (SA)",
-    "Baldina",
-    "Balgowan (SA)",
-    "Balhannah",
-    "Ballast Head",
-    "Bangham",
-    "Bangor (SA)",
-    "Banksia Park",
-    "Barabba",
-    "Barinia",
-    "Barmera",
-    "Barna",
-    "Barndioota",
-    "Baroota",
-    "Barossa Goldfields",
-    "Barunga Gap",
-    "Basket Range",
-    "Baudin Beach",
-    "Bay Of Shoals",
-    "Beachport",
-    "Beatty",
-    "Beaufort (SA)",
-    "Beaumont (SA)",
-    "Beaumonts",
-    "Bedford Park",
-    "Beetaloo Valley",
-    "Belair",
-    "Belalie East",
-    "Belalie North",
-    "Bellevue Heights",
-    "Beltana",
-    "Beltana Station",
-    "Belton",
-    "Belvidere",
-    "Benbournie",
-    "Berri",
-    "Bethany",
-    "Bethel",
-    "Beulah Park",
-    "Beverley (SA)",
-    "Bibaringa",
-    "Big Bend",
-    "Biggs Flat",
-    "Billiatt",
-    "Binnum",
-    "Birchmore",
-    "Birdwood (SA)",
-    "Birkenhead",
-    "Black Forest",
-    "Black Hill (SA)",
-    "Black Point",
-    "Black Rock (SA)",
-    "Black Springs (SA)",
-    "Blackfellows Caves",
-    "Blackfellows Creek",
-    "Blackford",
-    "Blackwood (SA)",
-    "Blair Athol (SA)",
-    "Blakeview",
-    "Blakiston",
-    "Blanche Harbor",
-    "Blanchetown",
-    "Bletchley",
-    "Blewitt Springs",
-    "Blinman",
-    "Bluff Beach",
-    "Blyth",
-    "Boatswain Point",
-    "Bockelberg",
-    "Boconnoc Park",
-    "Bolivar",
-    "Bolto",
-    "Booborowie",
-    "Bookpurnong",
-    "Bool Lagoon",
-    "Booleroo Centre",
-    "Boolgun",
-    "Boonerdo",
-    "Boors Plain",
-    "Bordertown",
-    "Bordertown South",
-    "Borrika",
-    "Boston",
-    "Bowden",
-    "Bower",
-    "Bowhill",
-    "Bowillia",
-    "Bowmans",
-    "Bradbury (SA)",
-    "Brady Creek",
-    "Brahma Lodge",
-    "Bramfield",
-    "Bray",
-    "Brenda Park",
-    "Brentwood (SA)",
-    "Bridgewater (SA)",
-    "Bright (SA)",
-    "Brighton (SA)",
-    "Brimbago",
-    "Brinkley",
-    "Brinkworth",
-    "Broadview",
-    "Brompton",
-    "Brooker",
-    "Brooklyn Park",
-    "Broughton River Valley",
-    "Brown Beach",
-    "Brown Hill Creek",
-    "Brownlow",
-    "Brownlow Ki",
-    "Bruce (SA)",
-    "Brukunga",
-    "Buchanan (SA)",
-    "Buchfelde",
-    "Buckingham (SA)",
-    "Buckland Park",
-    "Buckleboo",
-    "Bugle Hut",
-    "Bugle Ranges",
-    "Bull Creek (SA)",
-    "Bumbunga",
-    "Bunbury (SA)",
-    "Bundaleer Gardens",
-    "Bundaleer North",
-    "Bundey",
-    "Bungama",
-    "Bungaree (SA)",
-    "Burdett",
-    "Burnsfield",
-    "Burnside (SA)",
-    "Burra (SA)",
-    "Burra Eastern Districts",
-    "Burrungule",
-    "Burton (SA)",
-    "Bute",
-    "Butler (SA)",
-    "Cadell",
-    "Cadgee (SA)",
-    "Calca",
-    "Caliph",
-    "Callington",
-    "Calomba",
-    "Caloote",
-    "Calperum Station",
-    "Caltowie",
-    "Caltowie North",
-    "Caltowie West",
-    "Cambrai",
-    "Camden Park (SA)",
-    "Campbelltown (SA)",
-    "Campoona",
-    "Cannawigara",
-    "Canowie",
-    "Canowie Belt",
-    "Canunda",
-    "Cape Borda",
-    "Cape Douglas",
-    "Cape Jaffa",
-    "Cape Jervis",
-    "Caralue",
-    "Carawa",
-    "Carcuma",
-    "Carew",
-    "Carey Gully",
-    "Caroline",
-    "Carpenter Rocks",
-    "Carrickalinga",
-    "Carrieton",
-    "Cassini",
-    "Castambul",
-    "Caurnamont",
-    "Cavan (SA)",
-    "Cavenagh",
-    "Caveton",
-    "Ceduna",
-    "Ceduna Waters",
-    "Chaffey",
-    "Chain Of Ponds",
-    "Chandada",
-    "Chandlers Hill",
-    "Chapel Hill (SA)",
-    "Chapman Bore",
-    "Charleston",
-    "Charlton Gully",
-    "Charra",
-    "Cheltenham (SA)",
-    "Cherry Gardens",
-    "Cherryville",
-    "Chilpenunda",
-    "Chinaman Wells",
-    "Chinbingina",
-    "Chiton",
-    "Chowilla",
-    "Christie Downs",
-    "Christies Beach",
-    "Clapham",
-    "Clare (SA)",
-    "Clarence Gardens",
-    "Clarence Park",
-    "Clarendon (SA)",
-    "Clay Wells",
-    "Claypans",
-    "Clayton Bay",
-    "Clearview",
-    "Cleland",
-    "Clements Gap",
-    "Cleve",
-    "Clinton (SA)",
-    "Clinton Centre",
-    "Clovelly Park",
-    "Cobdogla",
-    "Cocata",
-    "Cockaleechie",
-    "Cockatoo Valley",
-    "Cockburn",
-    "Coffin Bay",
-    "Colebatch",
-    "Coles",
-    "College Park",
-    "Colley",
-    "Collinsfield",
-    "Collinsville (SA)",
-    "Collinswood",
-    "Colonel Light Gardens",
-    "Colton",
-    "Comaum",
-    "Commissariat Point",
-    "Commonwealth Hill",
-    "Compton",
-    "Concordia",
-    "Condowie",
-    "Conmurra",
-    "Coober Pedy",
-    "Coobowie",
-    "Cooke Plains",
-    "Coolillie",
-    "Cooltong",
-    "Coomandook",
-    "Coombe",
-    "Coomooroo",
-    "Coomunga",
-    "Coonalpyn",
-    "Coonamia",
-    "Coonawarra (SA)",
-    "Coorabie",
-    "Coorong",
-    "Cootra",
-    "Copeville",
-    "Copley (SA)",
-    "Corny Point",
-    "Coromandel East",
-    "Coromandel Valley",
-    "Cortlinye",
-    "Corunna Station",
-    "Coulta",
-    "Cowandilla",
-    "Cowell",
-    "Cowirra",
-    "Cradock",
-    "Crafers",
-    "Crafers West",
-    "Craigburn Farm",
-    "Craigmore",
-    "Crescent",
-    "Cromer (SA)",
-    "Cross Roads (SA)",
-    "Croydon (SA)",
-    "Croydon Park (SA)",
-    "Crystal Brook (SA)",
-    "Cudlee Creek",
-    "Culburra",
-    "Cultana",
-    "Cumberland Park",
-    "Cummins",
-    "Cungena",
-    "Cunliffe",
-    "Cunningham (SA)",
-    "Cunyarie",
-    "Curramulka",
-    "Currency Creek",
-    "Custon",
-    "Cuttlefish Bay",
-    "Cygnet River",
-    "D'Estrees Bay",
-    "Dalkey",
-    "Danggali",
-    "Darke Peak",
-    "Darlington (SA)",
-    "Davenport (SA)",
-    "Daveyston",
-    "Davoren Park",
-    "Daw Park",
-    "Dawesley",
-    "Dawson (SA)",
-    "De Mole River",
-    "Deep Creek (SA)",
-    "Deepwater (SA)",
-    "Delamere (SA)",
-    "Denial Bay",
-    "Dernancourt",
-    "Devlins Pound",
-    "Devon Park (SA)",
-    "Dingabledinga",
-    "Direk",
-    "Dismal Swamp",
-    "Donovans",
-    "Dorset Vale",
-    "Douglas Point",
-    "Dover Gardens",
-    "Dowlingville",
-    "Dry Creek (SA)",
-    "Dublin",
-    "Duck Ponds",
-    "Dudley East",
-    "Dudley Park (SA)",
-    "Dudley West",
-    "Dulwich",
-    "Duncan",
-    "Dutton",
-    "Dutton East",
-    "East Moonta",
-    "Eastwood (SA)",
-    "Eba",
-    "Eba Anchorage",
-    "Ebenezer (SA)",
-    "Echunga",
-    "Eden Hills",
-    "Eden Valley",
-    "Edillilie",
-    "Edinburgh",
-    "Edinburgh North",
-    "Edithburgh",
-    "Edwardstown",
-    "Eight Mile Creek (SA)",
-    "Elizabeth",
-    "Elizabeth Downs",
-    "Elizabeth East",
-    "Elizabeth Grove",
-    "Elizabeth North",
-    "Elizabeth Park",
-    "Elizabeth South",
-    "Elizabeth Vale",
-    "Elliston",
-    "Elwomple",
-    "Emu Bay",
-    "Emu Downs",
-    "Emu Flat (SA)",
-    "Encounter Bay",
-    "Enfield (SA)",
-    "Erindale",
-    "Erith",
-    "Erskine (SA)",
-    "Ethelton",
-    "Ettrick (SA)",
-    "Eudunda",
-    "Eurelia",
-    "Euromina",
-    "Evandale (SA)",
-    "Evanston",
-    "Evanston Gardens",
-    "Evanston Park",
-    "Evanston South",
-    "Everard Central",
-    "Everard Park",
-    "Exeter (SA)",
-    "Eyre",
-    "Fairview Park",
-    "False Bay",
-    "Farina",
-    "Farrell Flat",
-    "Felixstow",
-    "Ferryden Park",
-    "Field",
-    "Findon",
-    "Finniss",
-    "Firle",
-    "Fischer",
-    "Fisher (SA)",
-    "Fisherman Bay",
-    "Fitzroy (SA)",
-    "Five Miles",
-    "Flagstaff Hill",
-    "Flaxley",
-    "Flaxman Valley",
-    "Flinders Chase",
-    "Flinders Park",
-    "Flinders Ranges",
-    "Florina Station",
-    "Fords",
-    "Forest Range",
-    "Forestville (SA)",
-    "Forreston",
-    "Forster (SA)",
-    "Foul Bay",
-    "Fountain",
-    "Fox",
-    "Frahns",
-    "Frances",
-    "Franklyn",
-    "Frankton",
-    "Frayville",
-    "Freeling",
-    "Frewville",
-    "Frome Downs",
-    "Fulham (SA)",
-    "Fulham Gardens",
-    "Fullarton",
-    "Furner",
-    "Galga",
-    "Gammon Ranges",
-    "Garden Island (SA)",
-    "Gawler (SA)",
-    "Gawler Belt",
-    "Gawler East",
-    "Gawler Ranges",
-    "Gawler River",
-    "Gawler South",
-    "Gawler West",
-    "Gemmells",
-    "Georgetown (SA)",
-    "Gepps Cross",
-    "Geranium",
-    "Geranium Plains",
-    "Gerard",
-    "German Creek",
-    "German Flat",
-    "Germein Bay",
-    "Gidgealpa",
-    "Gifford Hill",
-    "Gilberton (SA)",
-    "Giles Corner",
-    "Gillentown",
-    "Gilles Plains",
-    "Gillman",
-    "Gladstone (SA)",
-    "Glandore",
-    "Glanville",
-    "Glen Osmond",
-    "Glenalta",
-    "Glenburnie",
-    "Glencoe (SA)",
-    "Glendambo",
-    "Glenelg (SA)",
-    "Glenelg East",
-    "Glenelg North",
-    "Glenelg South",
-    "Glengowrie",
-    "Glenroy (SA)",
-    "Glenside",
-    "Glenunga",
-    "Globe Derby Park",
-    "Glossop",
-    "Glynde",
-    "Golden Grove",
-    "Golden Heights",
-    "Gomersal",
-    "Good Hope Landing",
-    "Goodwood (SA)",
-    "Goolwa",
-    "Goolwa Beach",
-    "Goolwa North",
-    "Goolwa South",
-    "Gosse",
-    "Gould Creek",
-    "Goyder",
-    "Grace Plains",
-    "Grampus",
-    "Grange (SA)",
-    "Green Fields",
-    "Green Hills Range",
-    "Green Patch",
-    "Greenacres",
-    "Greenhill (SA)",
-    "Greenock",
-    "Greenways",
-    "Greenwith",
-    "Gulfview Heights",
-    "Gulnare",
-    "Gum Creek",
-    "Gumeracha",
-    "Gurra Gurra",
-    "Hackham",
-    "Hackham West",
-    "Hacklins Corner",
-    "Hackney",
-    "Hahndorf",
-    "Haines",
-    "Halbury",
-    "Halidon",
-    "Hallelujah Hills",
-    "Hallett",
-    "Hallett Cove",
-    "Hambidge",
-    "Hamilton (SA)",
-    "Hamley",
-    "Hamley Bridge",
-    "Hammond",
-    "Hampden (SA)",
-    "Hampstead Gardens",
-    "Hansborough",
-    "Hanson",
-    "Happy Valley (SA)",
-    "Hardwicke Bay",
-    "Hardy",
-    "Harrogate",
-    "Hart (SA)",
-    "Hartley (SA)",
-    "Haslam",
-    "Hatherleigh",
-    "Hawker (SA)",
-    "Hawson",
-    "Hawthorn (SA)",
-    "Hawthorndene",
-    "Hay Flat",
-    "Hay Valley",
-    "Hayborough",
-    "Hazelwood Park",
-    "Heathfield",
-    "Heathpool",
-    "Hectorville",
-    "Hendon (SA)",
-    "Henley Beach",
-    "Henley Beach South",
-    "Hewett",
-    "Highbury (SA)",
-    "Highgate (SA)",
-    "Highland Valley",
-    "Hill River (SA)",
-    "Hillbank",
-    "Hillcrest (SA)",
-    "Hillier",
-    "Hilltown",
-    "Hilton (SA)",
-    "Hincks",
-    "Hindmarsh (SA)",
-    "Hindmarsh Island",
-    "Hindmarsh Tiers",
-    "Hindmarsh Valley",
-    "Holden Hill",
-    "Holder (SA)",
-    "Holder Siding",
-    "Honiton",
-    "Hope Forest",
-    "Hope Gap",
-    "Hope Valley (SA)",
-    "Hornsdale",
-    "Horsnell Gully",
-    "Hoskin Corner",
-    "Houghton",
-    "Hove",
-    "Hoyleton",
-    "Huddleston",
-    "Humbug Scrub",
-    "Huntfield Heights",
-    "Hyde Park (SA)",
-    "Hynam",
-    "Ingle Farm",
-    "Inglewood (SA)",
-    "Ingomar",
-    "Inkerman (SA)",
-    "Inkster",
-    "Inman Valley",
-    "Innamincka",
-    "Inneston",
-    "Iron Knob",
-    "Ironbank",
-    "Ironstone",
-    "Island Beach",
-    "Island Lagoon",
-    "Iwantja",
-    "Jabuk",
-    "James Well",
-    "Jamestown",
-    "Jamieson (SA)",
-    "Jericho (SA)",
-    "Jerusalem",
-    "Jervois",
-    "Joanna",
-    "Johnburgh",
-    "Joslin",
-    "Julanka Holdings",
-    "Julia",
-    "Jupiter Creek",
-    "Kadina",
-    "Kainton",
-    "Kalamurina",
-    "Kalanbi",
-    "Kalangadoo",
-    "Kalbeeba",
-    "Kaldoonera",
-    "Kalka",
-    "Kallora",
-    "Kaltjiti",
-    "Kangarilla",
-    "Kangaroo Flat (SA)",
-    "Kangaroo Head",
-    "Kangaroo Inn",
-    "Kanmantoo",
-    "Kanni",
-    "Kanpi",
-    "Kanyaka",
-    "Kapinnie",
-    "Kappawanta",
-    "Kapunda",
-    "Karatta",
-    "Karcultaby",
-    "Karkoo",
-    "Karoonda",
-    "Karte",
-    "Katarapko",
-    "Keilira",
-    "Keith",
-    "Kellidie Bay",
-    "Kelly",
-    "Kensington (SA)",
-    "Kensington Gardens",
-    "Kensington Park",
-    "Kent Town",
-    "Kenton Valley",
-    "Kepa",
-    "Keppoch",
-    "Kersbrook",
-    "Keswick",
-    "Keswick Terminal",
-    "Keyneton",
-    "Ki Ki",
-    "Kiana",
-    "Kidman Park",
-    "Kielpa",
-    "Kilburn",
-    "Kilkenny",
-    "Kimba",
-    "Kingoonya",
-    "Kings Park (SA)",
-    "Kingscote",
-    "Kingsford (SA)",
-    "Kingston On Murray",
-    "Kingston Park",
-    "Kingston Se",
-    "Kingswood (SA)",
-    "Klemzig",
-    "Kohinoor",
-    "Kondoolka",
-    "Kongal",
-    "Kongorong",
-    "Koolgera",
-    "Koolunga",
-    "Koolywurtie",
-    "Koonamore",
-    "Koongawa",
-    "Koonibba",
-    "Koonoona",
-    "Koonunga",
-    "Koorine",
-    "Kooroona",
-    "Koppamurra",
-    "Koppio",
-    "Korunye",
-    "Kringin",
-    "Krondorf",
-    "Krongart",
-    "Kudla",
-    "Kuitpo",
-    "Kuitpo Colony",
-    "Kulpara",
-    "Kurralta Park",
-    "Kyancutta",
-    "Kybunga",
-    "Kybybolite",
-    "Kyeema",
-    "Laffer",
-    "Lake Albert (SA)",
-    "Lake Alexandrina",
-    "Lake Carlet",
-    "Lake Everard",
-    "Lake Eyre",
-    "Lake Frome",
-    "Lake Gairdner",
-    "Lake Gilles",
-    "Lake Macfarlane",
-    "Lake Plains",
-    "Lake Torrens",
-    "Lake View",
-    "Lameroo",
-    "Langhorne Creek",
-    "Langs Landing",
-    "Largs Bay",
-    "Largs North",
-    "Laura (SA)",
-    "Laura Bay",
-    "Leabrook",
-    "Leasingham",
-    "Leawood Gardens",
-    "Leigh Creek (SA)",
-    "Leigh Creek Station",
-    "Leighton",
-    "Lenswood",
-    "Lewiston",
-    "Light Pass",
-    "Lightsview",
-    "Lincoln National Park",
-    "Linden Park",
-    "Lindley",
-    "Lindon",
-    "Linwood",
-    "Lipson",
-    "Little Douglas",
-    "Littlehampton",
-    "Lobethal",
-    "Lochaber",
-    "Lochiel (SA)",
-    "Lock",
-    "Lockleys",
-    "Long Flat (SA)",
-    "Long Plains",
-    "Longwood (SA)",
-    "Lonsdale",
-    "Louth Bay",
-    "Loveday",
-    "Lowan Vale",
-    "Lowbank",
-    "Lower Broughton",
-    "Lower Hermitage",
-    "Lower Inman Valley",
-    "Lower Light",
-    "Lower Mitcham",
-    "Loxton",
-    "Loxton North",
-    "Lucindale",
-    "Lucky Bay",
-    "Lyndhurst (SA)",
-    "Lyndoch",
-    "Lynton",
-    "Lyrup",
-    "Maaoupe",
-    "Mabel Creek",
-    "Macclesfield (SA)",
-    "Macdonald Park",
-    "Macgillivray",
-    "Macumba",
-    "Magarey",
-    "Magdala",
-    "Maggea",
-    "Magill",
-    "Mahanewo",
-    "Maitland (SA)",
-    "Makin",
-    "Malinong",
-    "Mallala",
-    "Malpas",
-    "Maltee",
-    "Malvern (SA)",
-    "Mambray Creek",
-    "Mangalo",
-    "Manna Hill",
-    "Mannanarie",
-    "Manningham",
-    "Mannum",
-    "Manoora (SA)",
-    "Mansfield Park",
-    "Mantung",
-    "Marama",
-    "Marananga",
-    "Marble Hill",
-    "Marcollat",
-    "Marden",
-    "Marino",
-    "Marion",
-    "Marion Bay (SA)",
-    "Markaranka",
-    "Marks Landing",
-    "Marla",
-    "Marleston",
-    "Marola",
-    "Marrabel",
-    "Marree",
-    "Marryatville",
-    "Maryvale (SA)",
-    "Maslin Beach",
-    "Matta Flat",
-    "Maude (SA)",
-    "Mawson Lakes",
-    "Mayfield (SA)",
-    "Maylands (SA)",
-    "McBean Pound",
-    "McCallum",
-    "McCracken",
-    "McHarg Creek",
-    "McLaren Flat",
-    "McLaren Vale",
-    "Meadows",
-    "Medindie",
-    "Medindie Gardens",
-    "Melrose (SA)",
-    "Melrose Park (SA)",
-    "Melton (SA)",
-    "Meningie",
-    "Meningie East",
-    "Meningie West",
-    "Menzies (SA)",
-    "Mercunda",
-    "Merghiny",
-    "Meribah",
-    "Merriton",
-    "Middle Beach",
-    "Middle River",
-    "Middleback Range",
-    "Middleton (SA)",
-    "Midgee (SA)",
-    "Mil-Lel",
-    "Milang",
-    "Mile End",
-    "Mile End South",
-    "Milendella",
-    "Millbrook (SA)",
-    "Millicent",
-    "Millswood",
-    "Miltalie",
-    "Mimili",
-    "Minbrie",
-    "Minburra",
-    "Mindarie (SA)",
-    "Mingbool",
-    "Minlaton",
-    "Minnipa",
-    "Mintaro",
-    "Minvalara",
-    "Miranda (SA)",
-    "Mitcham (SA)",
-    "Mitchell (SA)",
-    "Mitchell Park (SA)",
-    "Mitchellville",
-    "Moana",
-    "Mobilong",
-    "Moculta",
-    "Modbury",
-    "Modbury Heights",
-    "Modbury North",
-    "Moerlong",
-    "Monarto",
-    "Monarto South",
-    "Monash (SA)",
-    "Monbulla",
-    "Mongolata",
-    "Montacute",
-    "Montarra",
-    "Monteith",
-    "Moockra",
-    "Moody",
-    "Mooleulooloo",
-    "Moonaree",
-    "Moonta",
-    "Moonta Bay",
-    "Moonta Mines",
-    "Moorak",
-    "Moorlands",
-    "Moorook",
-    "Moorook South",
-    "Moppa",
-    "Morchard",
-    "Morgan",
-    "Morn Hill",
-    "Morphett Vale",
-    "Morphetts Flat",
-    "Morphettville",
-    "Mortana",
-    "Moseley",
-    "Mosquito Hill",
-    "Motpena",
-    "Mount Barker (SA)",
-    "Mount Barker Junction",
-    "Mount Barker Springs",
-    "Mount Barker Summit",
-    "Mount Benson",
-    "Mount Bryan",
-    "Mount Bryan East",
-    "Mount Burr",
-    "Mount Charles",
-    "Mount Compass",
-    "Mount Cooper (SA)",
-    "Mount Crawford",
-    "Mount Damper",
-    "Mount Drummond",
-    "Mount Dutton Bay",
-    "Mount Gambier",
-    "Mount George (SA)",
-    "Mount Hope (SA)",
-    "Mount Ive",
-    "Mount Jagged",
-    "Mount Joy",
-    "Mount Light",
-    "Mount Magnificent",
-    "Mount Mary",
-    "Mount Mcintyre",
-    "Mount Mckenzie",
-    "Mount Observation (SA)",
-    "Mount Osmond",
-    "Mount Pleasant (SA)",
-    "Mount Schank",
-    "Mount Serle",
-    "Mount Templeton",
-    "Mount Torrens",
-    "Mount Wedge",
-    "Mount Willoughby",
-    "Moyhall",
-    "Mudamuckla",
-    "Mulgundawa",
-    "Mullaquana",
-    "Muloorina",
-    "Mundallio",
-    "Mundic Creek",
-    "Mundoo Island",
-    "Mundoora",
-    "Mundulla",
-    "Mundulla West",
-    "Mungeranie",
-    "Munno Para",
-    "Munno Para Downs",
-    "Munno Para West",
-    "Murbko",
-    "Murdinga",
-    "Murlong",
-    "Murputja - Nyapari",
-    "Murrawong",
-    "Murray Bridge",
-    "Murray Bridge East",
-    "Murray Bridge North",
-    "Murray Bridge South",
-    "Murray Town",
-    "Murtho",
-    "Muston",
-    "Mutooroo",
-    "Mylor",
-    "Mypolonga",
-    "Myponga",
-    "Myponga Beach",
-    "Myrtle Bank (SA)",
-    "Nackara",
-    "Nadia",
-    "Naidia",
-    "Nailsworth",
-    "Nain",
-    "Nairne",
-    "Nalyappa",
-    "Nangkita",
-    "Nangwarry",
-    "Nantawarra",
-    "Napperby",
-    "Naracoorte",
-    "Narridy",
-    "Narrung (SA)",
-    "Naturi",
-    "Neales Flat",
-    "Nectar Brook",
-    "Nelshaby",
-    "Nene Valley",
-    "Nepabunna",
-    "Nepean Bay",
-    "Netherby (SA)",
-    "Netherton",
-    "Netley",
-    "New Port",
-    "New Residence",
-    "New Town (SA)",
-    "New Well",
-    "Newland",
-    "Newton",
-    "Ngapala",
-    "Ngarkat",
-    "Nildottie",
-    "Ninnes",
-    "Noarlunga Centre",
-    "Noarlunga Downs",
-    "Nora Creina",
-    "Normanville (SA)",
-    "North Adelaide",
-    "North Beach (SA)",
-    "North Booborowie",
-    "North Brighton",
-    "North Cape",
-    "North Haven (SA)",
-    "North Moonta",
-    "North Plympton",
-    "North Shields",
-    "North West Bend",
-    "North Yelta",
-    "Northern Heights",
-    "Northfield",
-    "Northgate (SA)",
-    "Norton Summit",
-    "Norwood (SA)",
-    "Notts Well",
-    "Novar Gardens",
-    "Nullarbor",
-    "Nunjikompita",
-    "Nuriootpa",
-    "Nurom",
-    "Nurragi",
-    "O'Halloran Hill",
-    "O'Sullivan Beach",
-    "Oak Valley (SA)",
-    "Oakbank",
-    "Oakden",
-    "Oakden Hills",
-    "Oaklands Park",
-    "Ob Flat",
-    "Olary",
-    "Old Calperum",
-    "Old Noarlunga",
-    "Old Reynella",
-    "Old Teal Flat",
-    "Olympic Dam",
-    "One Tree Hill",
-    "Onkaparinga Hills",
-    "Oodla Wirra",
-    "Oodnadatta",
-    "Orroroo",
-    "Osborne (SA)",
-    "Ottoway",
-    "Outer Harbor",
-    "Overland Corner",
-    "Ovingham",
-    "Owen",
-    "Padthaway",
-    "Paechtown",
-    "Pages Flat",
-    "Paisley",
-    "Palkagee",
-    "Pallamana",
-    "Palmer (SA)",
-    "Pandurra",
-    "Panitya (SA)",
-    "Panorama",
-    "Para Hills",
-    "Para Hills West",
-    "Para Vista",
-    "Parachilna",
-    "Paracombe",
-    "Paradise (SA)",
-    "Parafield",
-    "Parafield Gardens",
-    "Parakylia",
-    "Paralowie",
-    "Paramatta",
-    "Paratoo",
-    "Parawa",
-    "Parham",
-    "Parilla",
-    "Paringa",
-    "Paris Creek",
-    "Park Holme",
-    "Parkside (SA)",
-    "Parnaroo",
-    "Parndana",
-    "Parrakie",
-    "Parsons Beach",
-    "Paruna",
-    "Pasadena",
-    "Paskeville",
-    "Pata",
-    "Payneham",
-    "Payneham South",
-    "Peake",
-    "Pearlah",
-    "Peebinga",
-    "Peep Hill",
-    "Pekina",
-    "Pelican Lagoon",
-    "Pelican Point (SA)",
-    "Pellaring Flat",
-    "Penfield",
-    "Penfield Gardens",
-    "Penneshaw",
-    "Pennington",
-    "Penola",
-    "Penong",
-    "Penrice",
-    "Penwortham",
-    "Perlubie",
-    "Perponda",
-    "Peterborough (SA)",
-    "Peterhead",
-    "Petersville",
-    "Petherick",
-    "Petina",
-    "Petwood",
-    "Pewsey Vale",
-    "Piccadilly (SA)",
-    "Piednippie",
-    "Pike River",
-    "Pimba",
-    "Pimbaacla",
-    "Pine Creek (SA)",
-    "Pine Creek Station",
-    "Pine Hill",
-    "Pine Point",
-    "Pinery",
-    "Pinkawillinie",
-    "Pinkerton Plains",
-    "Pinks Beach",
-    "Pinnaroo",
-    "Pipalyatjara",
-    "Pirie East",
-    "Pleasant Park",
-    "Plympton",
-    "Plympton Park",
-    "Point Boston",
-    "Point Lowly",
-    "Point Pass",
-    "Point Pearce",
-    "Point Souttar",
-    "Point Sturt",
-    "Point Turton",
-    "Polda",
-    "Polish Hill River",
-    "Poltalloch",
-    "Pompoota",
-    "Ponde",
-    "Poochera",
-    "Pooginagoric",
-    "Pooginook",
-    "Poonindie",
-    "Pooraka",
-    "Porky Flat",
-    "Port Adelaide",
-    "Port Arthur (SA)",
-    "Port Augusta",
-    "Port Augusta West",
-    "Port Bonython",
-    "Port Broughton",
-    "Port Davis",
-    "Port Elliot",
-    "Port Gawler",
-    "Port Germein",
-    "Port Gibbon",
-    "Port Hughes",
-    "Port Julia",
-    "Port Kenny",
-    "Port Lincoln",
-    "Port Macdonnell",
-    "Port Mannum",
-    "Port Moorowie",
-    "Port Neill",
-    "Port Noarlunga",
-    "Port Noarlunga South",
-    "Port Paterson",
-    "Port Pirie",
-    "Port Pirie South",
-    "Port Pirie West",
-    "Port Rickaby",
-    "Port Victoria",
-    "Port Vincent",
-    "Port Wakefield",
-    "Port Willunga",
-    "Porter Lagoon",
-    "Price",
-    "Proof Range",
-    "Prospect (SA)",
-    "Prospect Hill",
-    "Pukatja",
-    "Puntabie",
-    "Punthari",
-    "Punyelroo",
-    "Pureba",
-    "Purnong",
-    "Pyap",
-    "Pyap West",
-    "Pygery",
-    "Qualco",
-    "Queenstown (SA)",
-    "Quorn",
-    "Racecourse Bay",
-    "Ramco",
-    "Ramco Heights",
-    "Ramsay (SA)",
-    "Rapid Bay",
-    "Red Creek",
-    "Redbanks",
-    "Redhill",
-    "Redwood Park",
-    "Reedy Creek (SA)",
-    "Reeves Plains",
-    "Regency Park",
-    "Reid (SA)",
-    "Rendelsham",
-    "Renmark",
-    "Renmark North",
-    "Renmark South",
-    "Renmark West",
-    "Renown Park",
-    "Reynella",
-    "Reynella East",
-    "Rhynie",
-    "Richmond (SA)",
-    "Ridgehaven",
-    "Ridleyton",
-    "Risdon Park",
-    "Risdon Park South",
-    "Riverglades",
-    "Riverglen",
-    "Riverton (SA)",
-    "Robe",
-    "Robertstown",
-    "Rochester (SA)",
-    "Rockleigh",
-    "Rocky Camp",
-    "Rocky Gully (SA)",
-    "Rocky Plain (SA)",
-    "Rocky Point (SA)",
-    "Rogues Point",
-    "Rose Park",
-    "Rosedale (SA)",
-    "Rosetown",
-    "Rosewater",
-    "Roseworthy",
-    "Rosslyn Park",
-    "Rostrevor",
-    "Rowland Flat",
-    "Roxby Downs",
-    "Royal Park",
-    "Royston Park",
-    "Rudall",
-    "SA Remainder",
-    "Saddleworth",
-    "Saints",
-    "Salisbury (SA)",
-    "Salisbury Downs",
-    "Salisbury East",
-    "Salisbury Heights",
-    "Salisbury North",
-    "Salisbury Park",
-    "Salisbury Plain",
-    "Salisbury South",
-    "Salt Creek",
-    "Salter Springs",
-    "Saltia",
-    "Sampson Flat",
-    "Sandalwood",
-    "Sandergrove",
-    "Sanderston",
-    "Sandilands (SA)",
-    "Sandleton",
-    "Sandy Creek (SA)",
-    "Sandy Grove",
-    "Sapphiretown",
-    "Sceale Bay",
-    "Schell Well",
-    "Scott Creek",
-    "Seacliff",
-    "Seacliff Park",
-    "Seacombe Gardens",
-    "Seacombe Heights",
-    "Seaford (SA)",
-    "Seaford Heights",
-    "Seaford Meadows",
-    "Seaford Rise",
-    "Seal Bay",
-    "Seaton (SA)",
-    "Seaview Downs",
-    "Sebastopol (SA)",
-    "Second Valley",
-    "Sedan",
-    "Seddon (SA)",
-    "Sefton Park",
-    "Sellicks Beach",
-    "Sellicks Hill",
-    "Semaphore",
-    "Semaphore Park",
-    "Semaphore South",
-    "Senior",
-    "Seppeltsfield",
-    "Sevenhill",
-    "Shaugh",
-    "Shea-Oak Log",
-    "Sheaoak Flat",
-    "Sheidow Park",
-    "Sheringa",
-    "Sherlock (SA)",
-    "Sherwood (SA)",
-    "Short",
-    "Silverton (SA)",
-    "Skye (SA)",
-    "Sleaford",
-    "Smithfield (SA)",
-    "Smithfield Plains",
-    "Smoky Bay",
-    "Snowtown",
-    "Solomon",
-    "Solomontown",
-    "Somerton Park",
-    "South Brighton",
-    "South Hummocks",
-    "South Kilkerran",
-    "South Plympton",
-    "Southend",
-    "Spalding (SA)",
-    "Spectacle Lake",
-    "Spence (SA)",
-    "Spring Farm (SA)",
-    "Spring Gully (SA)",
-    "Springfield (SA)",
-    "Springton",
-    "Square Mile",
-    "St Agnes (SA)",
-    "St Clair (SA)",
-    "St Georges",
-    "St Ives (SA)",
-    "St Johns",
-    "St Kilda (SA)",
-    "St Kitts",
-    "St Marys (SA)",
-    "St Morris",
-    "St Peters (SA)",
-    "Stanley (SA)",
-    "Stanley Flat",
-    "Stansbury",
-    "Steelton",
-    "Steinfeld",
-    "Stephenston",
-    "Stepney",
-    "Stewart Range",
-    "Stirling (SA)",
-    "Stirling North",
-    "Stockport",
-    "Stockwell",
-    "Stockyard Creek (SA)",
-    "Stockyard Plain",
-    "Stokes Bay",
-    "Stone Hut",
-    "Stone Well",
-    "Stonyfell",
-    "Stow",
-    "Strathalbyn (SA)",
-    "Streaky Bay",
-    "Struan",
-    "Stuart (SA)",
-    "Stuarts Creek",
-    "Stun'Sail Boom",
-    "Sturt (SA)",
-    "Sturt Vale",
-    "Sultana Point",
-    "Summertown",
-    "Sunlands",
-    "Sunnybrae",
-    "Sunnydale",
-    "Sunnyside (SA)",
-    "Sunnyvale",
-    "Surrey Downs",
-    "Sutherlands",
-    "Suttontown",
-    "Swan Reach (SA)",
-    "Swanport",
-    "Swede Flat",
-    "Tailem Bend",
-    "Taldra",
-    "Talia",
-    "Tantanoola",
-    "Tanunda",
-    "Taperoo",
-    "Taplan",
-    "Taratap",
-    "Tarcoola",
-    "Tarcowie",
-    "Tarlee",
-    "Tarnma",
-    "Tarpeena",
-    "Tatachilla",
-    "Taunton (SA)",
-    "Taylorville",
-    "Tea Tree Gully",
-    "Teal Flat",
-    "Telowie",
-    "Templers",
-    "Tennyson (SA)",
-    "Tepko",
-    "Teringie",
-    "Terowie",
-    "The Gap (SA)",
-    "The Pines (SA)",
-    "The Range (SA)",
-    "Thebarton",
-    "Thevenard",
-    "Thomas Plain",
-    "Thompson Beach",
-    "Thorngate",
-    "Thornlea",
-    "Thrington",
-    "Tiatukia",
-    "Tickera",
-    "Tiddy Widdy Beach",
-    "Tieyon",
-    "Tilley Swamp",
-    "Tintinara",
-    "Tolderol",
-    "Tonsley",
-    "Tooligie",
-    "Tooperang",
-    "Toora (SA)",
-    "Toorak Gardens",
-    "Tootenilla",
-    "Torrens Island",
-    "Torrens Park",
-    "Torrens Vale",
-    "Torrensville",
-    "Tothill Belt",
-    "Tothill Creek",
-    "Totness",
-    "Towitta",
-    "Tranmere (SA)",
-    "Trinity Gardens",
-    "Trott Park",
-    "Truro",
-    "Tulka",
-    "Tumby Bay",
-    "Tungkillo",
-    "Tunkalilla",
-    "Tusmore",
-    "Two Wells",
-    "Tyringa",
-    "Ucolta",
-    "Uley",
-    "Uleybury",
-    "Ulooloo",
-    "Ulyerra",
-    "Undalya",
-    "Underdale",
-    "Ungarra",
-    "Unley",
-    "Unley Park",
-    "Uno",
-    "Upper Hermitage",
-    "Upper Sturt",
-    "Uraidla",
-    "Urania",
-    "Urrbrae",
-    "Uworra",
-    "Vale Park",
-    "Valley View",
-    "Veitch",
-    "Venus Bay (SA)",
-    "Verdun",
-    "Verran",
-    "Victor Harbor",
-    "Vine Vale",
-    "Virginia (SA)",
-    "Vista",
-    "Vivonne Bay",
-    "Waddikee",
-    "Waikerie",
-    "Waitpinga",
-    "Walker Flat",
-    "Walkerville (SA)",
-    "Walkley Heights",
-    "Wall Flat",
-    "Wallala",
-    "Wallaroo (SA)",
-    "Wallaroo Mines",
-    "Wallaroo Plain",
-    "Walloway",
-    "Waltowa",
-    "Wami Kata",
-    "Wanbi",
-    "Wandana (SA)",
-    "Wandearah East",
-    "Wandearah West",
-    "Wandilo",
-    "Wangary",
-    "Wangolina",
-    "Wanilla",
-    "Wappilka",
-    "Warburto",
-    "Ward Belt",
-    "Ward Hill",
-    "Warnertown",
-    "Warnes",
-    "Warooka",
-    "Warradale",
-    "Warramboo",
-    "Washpool (SA)",
-    "Wasleys",
-    "Watarru",
-    "Watchman",
-    "Waterfall Gully",
-    "Waterloo (SA)",
-    "Waterloo Corner",
-    "Watervale",
-    "Watraba",
-    "Wattle Flat (SA)",
-    "Wattle Park",
-    "Wattle Range",
-    "Wattle Range East",
-    "Wauraltee",
-    "Wayville",
-    "Webb Beach",
-    "Wedge Island (SA)",
-    "Weeroona Island",
-    "Weetulta",
-    "Welland",
-    "Wellington (SA)",
-    "Wellington East",
-    "Wepar",
-    "West Beach (SA)",
-    "West Bundaleer",
-    "West Croydon",
-    "West Hindmarsh",
-    "West Lakes",
-    "West Lakes Shore",
-    "West Range",
-    "West Richmond",
-    "Westall",
-    "Westbourne Park",
-    "Western Flat",
-    "Western River",
-    "Wharminda",
-    "White Hill",
-    "White Hut",
-    "White Sands",
-    "White Well Corner",
-    "Whites Flat",
-    "Whites River",
-    "Whites Valley",
-    "Whitwarta",
-    "Whyalla",
-    "Whyalla Barson",
-    "Whyalla Jenkins",
-    "Whyalla Norrie",
-    "Whyalla Playford",
-    "Whyalla Stuart",
-    "Whyte Yarcowie",
-    "Wigley Flat",
-    "Wilcherry",
-    "Wild Dog Valley (SA)",
-    "Wild Horse Plains",
-    "Wilgena",
-    "Willalo",
-    "Willalooka",
-    "Willamulka",
-    "Willaston",
-    "William Creek",
-    "Williamstown (SA)",
-    "Willippa",
-    "Willochra",
-    "Willoughby (SA)",
-    "Willow Creek",
-    "Willow Springs",
-    "Willowie",
-    "Willson River",
-    "Willunga",
-    "Willunga Hill",
-    "Willunga South",
-    "Willyaroo",
-    "Wilmington",
-    "Windsor (SA)",
-    "Windsor Gardens",
-    "Wingfield",
-    "Winkie",
-    "Winninowie",
-    "Winulta",
-    "Wirrabara",
-    "Wirraminna",
-    "Wirrega",
-    "Wirrina Cove",
-    "Wirrulla",
-    "Wisanger",
-    "Wistow",
-    "Witera",
-    "Wokurna",
-    "Wolseley",
-    "Wombats Rest",
-    "Wongulla",
-    "Wongyarra",
-    "Wonna",
-    "Wonuarra",
-    "Woodchester",
-    "Woodcroft (SA)",
-    "Woodforde",
-    "Woodlane",
-    "Woodleigh (SA)",
-    "Woods Point (SA)",
-    "Woodside (SA)",
-    "Woodville (SA)",
-    "Woodville Gardens",
-    "Woodville North",
-    "Woodville Park",
-    "Woodville South",
-    "Woodville West",
-    "Wool Bay",
-    "Woolpunda",
-    "Woolshed Flat (SA)",
-    "Woolsheds",
-    "Woolumbool",
-    "Woolundunga",
-    "Woomera",
-    "Worlds End (SA)",
-    "Worrolong",
-    "Wrattonbully",
-    "Wudinna",
-    "Wunkar",
-    "Wye",
-    "Wynarka",
-    "Wynn Vale",
-    "Wyomi",
-    "Yacka",
-    "Yadlamalka",
-    "Yahl",
-    "Yalanda",
-    "Yalata",
-    "Yallunda Flat",
-    "Yalpara",
-    "Yamba (SA)",
-    "Yanerbie",
-    "Yaninee",
-    "Yankalilla",
-    "Yantanabie",
-    "Yanyarrie",
-    "Yardea",
-    "Yarrah",
-    "Yatala Vale",
-    "Yatina",
-    "Yattalunga (SA)",
-    "Yeelanna",
-    "Yellabinna",
-    "Yelta (SA)",
-    "Yinkanie",
-    "Yongala",
-    "Yorke Valley",
-    "Yorketown",
-    "Younghusband",
-    "Younghusband Holdings",
-    "Yumali",
-    "Yumbarra",
-    "Yundi",
-    "Yunta",
-    "Zadows Landing",
-    "No usual address (SA)",
-    "Migratory - Offshore - Shipping (SA)",
-    "Abba River",
-    "Abbey",
-    "Acton Park (WA)",
-    "Adamsvale",
-    "Ajana",
-    "Albany",
-    "Aldersyde",
-    "Alexander Heights",
-    "Alexandra Bridge",
-    "Alfred Cove",
-    "Alkimos",
-    "Allanooka",
-    "Allanson",
-    "Alma (WA)",
-    "Ambania",
-    "Ambergate",
-    "Amelup",
-    "Angelo River",
-    "Anketell",
-    "Anniebrook",
-    "Antonymyre",
-    "Applecross",
-    "Ardath",
-    "Ardross",
-    "Argyle (WA)",
-    "Armadale (WA)",
-    "Arrino",
-    "Arrowsmith",
-    "Arrowsmith East",
-    "Arthur River (WA)",
-    "Ascot (WA)",
-    "Ashby (WA)",
-    "Ashendon",
-    "Ashfield (WA)",
-    "Attadale",
-    "Atwell",
-    "Aubin Grove",
-    "Augusta",
-    "Australind",
-    "Aveley",
-    "Avon Valley National Park",
-    "Baandee",
-    "Babakin",
-    "Babbage Island",
-    "Badgebup",
-    "Badgerin Rock",
-    "Badgin",
-    "Badgingarra",
-    "Badjaling",
-    "Bailup",
-    "Bakers Hill",
-    "Balbarrup",
-    "Balcatta",
-    "Baldivis",
-    "Balga",
-    "Balingup",
-    "Balkuling",
-    "Balla Balla",
-    "Balladong",
-    "Balladonia",
-    "Ballajura",
-    "Ballaying",
-    "Ballidu",
-    "Bally Bally",
-    "Bambun",
-    "Bandy Creek",
-    "Bandya",
-    "Banjup",
-    "Banksia Grove",
-    "Banksiadale",
-    "Bannister (WA)",
-    "Barbalin",
-    "Barberton",
-    "Barrabup",
-    "Barragup",
-    "Barrow Island",
-    "Baskerville",
-    "Bassendean (WA)",
-    "Bateman",
-    "Baudin",
-    "Baynton (WA)",
-    "Bayonet Head",
-    "Bayswater (WA)",
-    "Beachlands",
-    "Beacon",
-    "Beaconsfield (WA)",
-    "Beadell",
-    "Beaufort River",
-    "Beaumont (WA)",
-    "Beckenham",
-    "Bedford",
-    "Bedfordale",
-    "Beechboro",
-    "Beechina",
-    "Beedelup",
-    "Beela",
-    "Beelerup",
-    "Beeliar",
-    "Beenong",
-    "Beermullah",
-    "Bejoording",
-    "Beldon",
-    "Belhus",
-    "Bellevue (WA)",
-    "Belmont (WA)",
-    "Bencubbin",
-    "Benger",
-    "Benjaberring",
-    "Benjinup",
-    "Bennett Springs",
-    "Bentley (WA)",
-    "Beresford",
-    "Berkshire Valley",
-    "Bernier Island",
-    "Bertram",
-    "Beverley (WA)",
-    "Bibra Lake",
-    "Bickley",
-    "Bicton",
-    "Biddelia",
-    "Big Grove",
-    "Bilbarin",
-    "Bilingurr",
-    "Bimbijy",
-    "Bindi Bindi",
-    "Bindoon",
-    "Bindoon Training Area",
-    "Binduli",
-    "Binningup",
-    "Binnu",
-    "Birchmont",
-    "Bluff Point",
-    "Blythewood",
-    "Boallia",
-    "Bobalong",
-    "Bodallin",
-    "Boddington",
-    "Boilup",
-    "Bokal",
-    "Bolgart",
-    "Bonnie Rock",
-    "Bonniefield",
-    "Boodarie",
-    "Boodarockin",
-    "Bookara",
-    "Boonanarring",
-    "Boorabbin",
-    "Booragoon",
-    "Booralaming",
-    "Boorara",
-    "Boorara Brook",
-    "Bootenal",
-    "Boothendarra",
-    "Boranup",
-    "Borden",
-    "Borderdale",
-    "Bornholm",
-    "Boscabel",
-    "Boulder",
-    "Boundain",
-    "Bouvard",
-    "Bovell",
-    "Bow Bridge",
-    "Bowelling",
-    "Bowes",
-    "Bowgada",
-    "Boxwood Hill",
-    "Boya",
-    "Boyanup",
-    "Boyatup",
-    "Boyerine",
-    "Boyup Brook",
-    "Brabham",
-    "Bramley",
-    "Brazier",
-    "Breera",
-    "Bremer Bay",
-    "Brentwood (WA)",
-    "Breton Bay",
-    "Bridgetown",
-    "Brigadoon",
-    "Bringo",
-    "Broadwater (WA)",
-    "Broadwood",
-    "Brockman",
-    "Broke (WA)",
-    "Brookdale (WA)",
-    "Brookhampton",
-    "Brookton",
-    "Broome",
-    "Broomehill East",
-    "Broomehill Village",
-    "Broomehill West",
-    "Brown Hill (WA)",
-    "Brown Range",
-    "Bruce Rock",
-    "Brunswick (WA)",
-    "Buckingham (WA)",
-    "Buckland (WA)",
-    "Bulgarra",
-    "Bull Creek (WA)",
-    "Bullabulling",
-    "Bullaring",
-    "Buller",
-    "Bullfinch",
-    "Bullock Hills",
-    "Bullsbrook",
-    "Bulong",
-    "Bulyee",
-    "Bunbury (WA)",
-    "Bundanoon (WA)",
-    "Buniche",
-    "Bunjil",
-    "Buntine",
-    "Burakin",
-    "Buraminya",
-    "Burekup",
-    "Burges",
-    "Burlong",
-    "Burma Road",
-    "Burns Beach",
-    "Burnside (WA)",
-    "Burracoppin",
-    "Burran Rock",
-    "Burrup",
-    "Burswood",
-    "Bushmead",
-    "Busselton",
-    "Butler (WA)",
-    "Byford",
-    "Cable Beach",
-    "Cadoux",
-    "Caiguna",
-    "Calingiri",
-    "Calista",
-    "Caljie",
-    "Callcup",
-    "Camballin",
-    "Cambridge Gulf",
-    "Camillo",
-    "Cancanning",
-    "Cane",
-    "Canna",
-    "Canning Mills",
-    "Canning Vale",
-    "Cannington",
-    "Cape Arid",
-    "Cape Burney",
-    "Cape Le Grand",
-    "Cape Range National Park",
-    "Capel",
-    "Capel River",
-    "Capricorn",
-    "Caraban",
-    "Carabooda",
-    "Carani",
-    "Carbla",
-    "Carbunup River",
-    "Cardiff (WA)",
-    "Cardup",
-    "Carey Park",
-    "Carine",
-    "Carlisle",
-    "Carlotta",
-    "Carmel",
-    "Carnamah",
-    "Carnarvon",
-    "Carrabin",
-    "Carramar (WA)",
-    "Carrolup",
-    "Cartmeticup",
-    "Cascade (WA)",
-    "Castletown",
-    "Casuarina (WA)",
-    "Cataby",
-    "Catterick",
-    "Caversham",
-    "Centennial Park (WA)",
-    "Cervantes",
-    "Chadwick",
-    "Champion Lakes",
-    "Chandler (WA)",
-    "Changerup",
-    "Channybearup",
-    "Chapman Hill",
-    "Charley Creek",
-    "Cherry Tree Pool",
-    "Cheynes",
-    "Chichester (WA)",
-    "Chidlow",
-    "Chittering",
-    "Chowerup",
-    "Churchlands",
-    "City Beach",
-    "Clackline",
-    "Claremont (WA)",
-    "Clarkson",
-    "Cleary",
-    "Cleaverville",
-    "Clifton (WA)",
-    "Cloverdale",
-    "Coblinine",
-    "Coburn",
-    "Cockburn Central",
-    "Cocklebiddy",
-    "Codjatotine",
-    "Cold Harbour",
-    "Collanilling",
-    "College Grove",
-    "Collie (WA)",
-    "Collie Burn",
-    "Collingwood Heights",
-    "Collingwood Park (WA)",
-    "Collins",
-    "Commodine",
-    "Como (WA)",
-    "Condingup",
-    "Connolly",
-    "Contine",
-    "Coodanup",
-    "Coogee (WA)",
-    "Cookernup",
-    "Cooladar Hill",
-    "Coolbellup",
-    "Coolbinia",
-    "Coolcalalaya",
-    "Coolgardie (WA)",
-    "Cooljarloo",
-    "Cooloongup",
-    "Coolup",
-    "Coomalbidgup",
-    "Coomberdale",
-    "Coonabidgee",
-    "Coondle",
-    "Coorow",
-    "Cooya Pooya",
-    "Copley (WA)",
-    "Coral Bay",
-    "Corinthia",
-    "Corrigin",
-    "Cosmo Newbery",
-    "Cossack (WA)",
-    "Cottesloe",
-    "Courtenay",
-    "Cowalellup",
-    "Cowalla",
-    "Cowaramup",
-    "Cowcowing",
-    "Coyrecup",
-    "Craigie (WA)",
-    "Cramphorne",
-    "Cranbrook (WA)",
-    "Crawley",
-    "Crooked Brook",
-    "Crossman",
-    "Crowea",
-    "Cuballing",
-    "Cubbine",
-    "Cue",
-    "Culham",
-    "Cullacabardee",
-    "Cullalla",
-    "Cundeelee",
-    "Cunderdin",
-    "Cundinup",
-    "Cunjardine",
-    "Currambine",
-    "Cuthbert",
-    "Daadenning Creek",
-    "Daggar Hills",
-    "Daglish",
-    "Dale",
-    "Daliak",
-    "Dalkeith",
-    "Dalwallinu",
-    "Dalyellup",
-    "Dalyup",
-    "Dampier",
-    "Dampier Archipelago",
-    "Dampier Peninsula",
-    "Dandanning",
-    "Dandaragan",
-    "Dangin",
-    "Darch",
-    "Dardadine",
-    "Dardanup",
-    "Dardanup West",
-    "Darkan",
-    "Darling Downs",
-    "Darlington (WA)",
-    "Darradup",
-    "Dartmoor (WA)",
-    "Dartnall",
-    "Datatine",
-    "Davenport (WA)",
-    "Dawesville",
-    "Dayton",
-    "De Grey",
-    "Deanmill",
-    "Deepdale",
-    "Deepdene (WA)",
-    "Denbarker",
-    "Denham",
-    "Denmark",
-    "Derby (WA)",
-    "Devils Creek",
-    "Dewars Pool",
-    "Diamond Tree",
-    "Dianella",
-    "Dindiloa",
-    "Dingup",
-    "Dinninup",
-    "Dirk Hartog Island",
-    "Dixvale",
-    "Djugun",
-    "Dongara",
-    "Dongolocking",
-    "Donnelly River",
-    "Donnybrook (WA)",
-    "Doodenanning",
-    "Doodlakine",
-    "Dorre Island",
-    "Doubleview",
-    "Dowerin",
-    "Drome",
-    "Drummond Cove",
-    "Dryandra",
-    "Drysdale River",
-    "Dudawa",
-    "Dudinin",
-    "Dudley Park (WA)",
-    "Dukin",
-    "Dulbelling",
-    "Dulyalbin",
-    "Dumbarton",
-    "Dumberning",
-    "Dumbleyung",
-    "Duncraig",
-    "Dundas (WA)",
-    "Dunn Rock",
-    "Dunsborough",
-    "Durack (WA)",
-    "Duranillin",
-    "Durawah",
-    "Dwarda",
-    "Dwellingup",
-    "Eagle Bay",
-    "East Augusta",
-    "East Ballidu",
-    "East Beverley",
-    "East Bowes",
-    "East Bunbury",
-    "East Cannington",
-    "East Carnarvon",
-    "East Chapman",
-    "East Damboring",
-    "East Fremantle",
-    "East Lyons River",
-    "East Munglinup",
-    "East Murchison",
-    "East Nabawa",
-    "East Nannup",
-    "East Newdegate",
-    "East Perth",
-    "East Pingelly",
-    "East Popanyinning",
-    "East Rockingham",
-    "East Victoria Park",
-    "East Wickepin",
-    "East Yuna",
-    "Eastbrook",
-    "Eaton (WA)",
-    "Eden Hill",
-    "Edgewater",
-    "Eganu",
-    "Eglinton (WA)",
-    "Eighty Mile Beach",
-    "Elabbin",
-    "Elachbutting",
-    "Elgin (WA)",
-    "Elleker",
-    "Ellenbrook",
-    "Ellendale (WA)",
-    "Embleton",
-    "Emu Flat (WA)",
-    "Emu Point",
-    "Eneabba",
-    "Ennuin",
-    "Eradu",
-    "Eradu South",
-    "Erskine (WA)",
-    "Esperance",
-    "Etmilyn",
-    "Eucla",
-    "Eurardy",
-    "Ewlyamartup",
-    "Exmouth",
-    "Exmouth Gulf",
-    "Fairbridge",
-    "Falcon",
-    "Ferguson (WA)",
-    "Ferndale (WA)",
-    "Feysville",
-    "Fimiston",
-    "Finucane",
-    "Fitzgerald (WA)",
-    "Fitzgerald River National Park",
-    "Fitzroy Crossing",
-    "Flint",
-    "Floreat",
-    "Flynn (WA)",
-    "Forest Grove (WA)",
-    "Forest Hill (WA)",
-    "Forrest (WA)",
-    "Forrest Beach (WA)",
-    "Forrestania",
-    "Forrestdale",
-    "Forrestfield",
-    "Fortescue (WA)",
-    "Frankland River",
-    "Fraser Range",
-    "Fremantle",
-    "Furnissdale",
-    "Gabalong",
-    "Gabbadah",
-    "Gabbin",
-    "Gairdner",
-    "Gap Ridge",
-    "Garden Island (WA)",
-    "Gascoyne Junction",
-    "Gascoyne River",
-    "Geegully Creek",
-    "Gelorup",
-    "Geographe",
-    "Georgina (WA)",
-    "Geraldton",
-    "Ghooli",
-    "Gibb",
-    "Gibson",
-    "Gibson Desert North",
-    "Gibson Desert South",
-    "Gidgegannup",
-    "Gilgering",
-    "Gillimanning",
-    "Gillingarra",
-    "Gilroyd",
-    "Gingerah",
-    "Gingin",
-    "Ginginup",
-    "Girrawheen",
-    "Gledhow",
-    "Glen Forrest",
-    "Glen Iris (WA)",
-    "Glen Mervyn",
-    "Glencoe (WA)",
-    "Glendalough",
-    "Glenfield (WA)",
-    "Glenlynn",
-    "Glenoran",
-    "Glentromie",
-    "Gnangara",
-    "Gnarabup",
-    "Gnoorea",
-    "Gnowangerup",
-    "Gnowellen",
-    "Golden Bay",
-    "Goode Beach",
-    "Goodlands",
-    "Goomalling",
-    "Goomarin",
-    "Gooseberry Hill",
-    "Gorge Rock",
-    "Gorrie",
-    "Gosnells",
-    "Gracetown",
-    "Granville (WA)",
-    "Grass Patch",
-    "Grass Valley",
-    "Green Head",
-    "Green Range",
-    "Green Valley (WA)",
-    "Greenbushes",
-    "Greenfields",
-    "Greenhills",
-    "Greenmount (WA)",
-    "Greenough",
-    "Greenwood (WA)",
-    "Greenwoods Valley",
-    "Gregory (WA)",
-    "Grey",
-    "Greys Plain",
-    "Grimwade",
-    "Guilderton",
-    "Guildford (WA)",
-    "Gundaring",
-    "Gunyidi",
-    "Gutha",
-    "Gwambygine",
-    "Gwelup",
-    "Gwindinup",
-    "Hacketts Gully",
-    "Halls Creek (WA)",
-    "Halls Head",
-    "Hamel",
-    "Hamelin Bay",
-    "Hamelin Pool",
-    "Hamersley",
-    "Hamersley Range",
-    "Hamilton Hill",
-    "Hammond Park",
-    "Hannans",
-    "Harris River",
-    "Harrisdale",
-    "Harrismith",
-    "Harvey",
-    "Hastings (WA)",
-    "Hatter Hill",
-    "Hay (WA)",
-    "Haynes",
-    "Hazelmere",
-    "Hazelvale",
-    "Heathridge",
-    "Helena Valley",
-    "Henderson",
-    "Henley Brook",
-    "Henty (WA)",
-    "Herdsman",
-    "Herne Hill (WA)",
-    "Herron",
-    "Hester",
-    "Hester Brook",
-    "Higginsville",
-    "High Wycombe",
-    "Highbury (WA)",
-    "Highgate (WA)",
-    "Hilbert",
-    "Hill River (WA)",
-    "Hillarys",
-    "Hillman",
-    "Hillside (WA)",
-    "Hilton (WA)",
-    "Hindmarsh (WA)",
-    "Hines Hill",
-    "Hithergreen",
-    "Hocking",
-    "Hoddys Well",
-    "Hoffman",
-    "Holleton",
-    "Holmwood",
-    "Holt Rock",
-    "Holyoake",
-    "Hope Valley (WA)",
-    "Hopeland (WA)",
-    "Hopetoun (WA)",
-    "Horrocks",
-    "Houtman Abrolhos",
-    "Hovea",
-    "Howatharra",
-    "Howick (WA)",
-    "Hulongine",
-    "Huntingdale (WA)",
-    "Hyden",
-    "Ikewa",
-    "Iluka (WA)",
-    "Indee",
-    "Inggarda",
-    "Inglehope",
-    "Inglewood (WA)",
-    "Inkpen",
-    "Innaloo",
-    "Innawanga",
-    "Irishtown (WA)",
-    "Irrunytju",
-    "Irwin",
-    "Israelite Bay",
-    "Isseka",
-    "Jackitup",
-    "Jacup",
-    "Jalbarragup",
-    "Jaloran",
-    "Jandabup",
-    "Jandakot",
-    "Jane Brook",
-    "Jardee",
-    "Jarlmadangah Burru",
-    "Jarrahdale",
-    "Jarrahwood",
-    "Jelcobine",
-    "Jennacubbine",
-    "Jennapullin",
-    "Jerdacuttup",
-    "Jerramungup",
-    "Jibberding",
-    "Jigalong",
-    "Jilakin",
-    "Jindalee (WA)",
-    "Jindong",
-    "Jingalup",
-    "Jitarning",
-    "Jolimont",
-    "Joondalup",
-    "Joondanna",
-    "Julimar",
-    "Juna Downs",
-    "Jurien Bay",
-    "Kadathinni",
-    "Kalamunda",
-    "Kalannie",
-    "Kalbarri",
-    "Kalbarri National Park",
-    "Kalgan",
-    "Kalgoorlie",
-    "Kalgup",
-    "Kallaroo",
-    "Kaloorup",
-    "Kalumburu",
-    "Kambalda East",
-    "Kambalda West",
-    "Kangaroo Gully",
-    "Kanowna",
-    "Kanpa",
-    "Karakin",
-    "Karalundi",
-    "Karawara",
-    "Kardinya",
-    "Karijini",
-    "Karlgarin",
-    "Karlkurla",
-    "Karloning",
-    "Karloo",
-    "Karnup",
-    "Karragullen",
-    "Karrakatta",
-    "Karrakup",
-    "Karramindie",
-    "Karranadgin",
-    "Karratha",
-    "Karratha Industrial Estate",
-    "Karridale",
-    "Karrinyup",
-    "Karroun Hill",
-    "Katanning",
-    "Katrine",
-    "Kauring",
-    "Kealy",
-    "Kebaringup",
-    "Kellerberrin",
-    "Kelmscott",
-    "Kendenup",
-    "Kenmare (WA)",
-    "Kennedy Range",
-    "Kensington (WA)",
-    "Kentdale",
-    "Kenwick",
-    "Keralup",
-    "Kewdale",
-    "Keysbrook",
-    "Kiara",
-    "Kimbolton (WA)",
-    "King Leopold Ranges",
-    "King River",
-    "Kings Park (WA)",
-    "Kingsford (WA)",
-    "Kingsley",
-    "Kingston (WA)",
-    "Kinross",
-    "Kirk Rock",
-    "Kirup",
-    "Kojaneerup South",
-    "Kojarena",
-    "Kojonup",
-    "Kokeby",
-    "Kondinin",
-    "Kondut",
-    "Konnongorring",
-    "Koojan",
-    "Kookynie",
-    "Koolanooka",
-    "Koolyanobbing",
-    "Koomberkine",
-    "Koondoola",
-    "Koongamia",
-    "Koorda",
-    "Korbel",
-    "Kordabup",
-    "Korrelocking",
-    "Kronkup",
-    "Kudardup",
-    "Kuender",
-    "Kukerin",
-    "Kulikup",
-    "Kulin",
-    "Kulin West",
-    "Kulja",
-    "Kumarina",
-    "Kundat Djaru",
-    "Kunjin",
-    "Kununoppin",
-    "Kununurra",
-    "Kupartiya",
-    "Kurnalpi",
-    "Kurrenkutten",
-    "Kweda",
-    "Kwelkan",
-    "Kwinana Beach",
-    "Kwinana Town Centre",
-    "Kwolyin",
-    "Lagrange",
-    "Lake Argyle",
-    "Lake Austin",
-    "Lake Biddy",
-    "Lake Brown",
-    "Lake Camm",
-    "Lake Carnegie",
-    "Lake Clifton",
-    "Lake Coogee",
-    "Lake Darlot",
-    "Lake Deborah",
-    "Lake Grace",
-    "Lake Hinds",
-    "Lake Jasper",
-    "Lake King",
-    "Lake Margarette",
-    "Lake Muir",
-    "Lake Ninan",
-    "Lake Toolbrunup",
-    "Lake Wells",
-    "Lakelands (WA)",
-    "Lamington (WA)",
-    "Lancelin",
-    "Landsdale",
-    "Lange",
-    "Langford",
-    "Latham (WA)",
-    "Lathlain",
-    "Laverton (WA)",
-    "Learmonth (WA)",
-    "Leda",
-    "Ledge Point",
-    "Leederville",
-    "Leeman",
-    "Leeming",
-    "Leeuwin",
-    "Leinster",
-    "Lennard Brook",
-    "Leonora",
-    "Leschenault",
-    "Lesley",
-    "Lesmurdie",
-    "Lexia",
-    "Lime Lake",
-    "Linfarne",
-    "Little Grove",
-    "Little Italy",
-    "Little Sandy Desert",
-    "Lockier",
-    "Lockridge",
-    "Lockyer (WA)",
-    "Lol Gray",
-    "Londonderry (WA)",
-    "Lort River",
-    "Lowden",
-    "Lower Chittering",
-    "Lower Hotham",
-    "Lower King",
-    "Lowlands",
-    "Ludlow",
-    "Lumeah (WA)",
-    "Lyalls Mill",
-    "Lyndon",
-    "Lynwood (WA)",
-    "Macleod (WA)",
-    "Maddington",
-    "Madeley",
-    "Madora Bay",
-    "Madura",
-    "Magenta (WA)",
-    "Magitup",
-    "Mahogany Creek",
-    "Mahomets Flats",
-    "Maida Vale",
-    "Maitland (WA)",
-    "Malabaine",
-    "Malaga",
-    "Malebelling",
-    "Mallee Hill",
-    "Malmalling",
-    "Malyalling",
-    "Mandogalup",
-    "Mandurah",
-    "Manjimup",
-    "Manmanning",
-    "Manning",
-    "Mantamaru",
-    "Manypeaks",
-    "Marangaroo",
-    "Maranup",
-    "Marbelup",
-    "Marble Bar",
-    "Marchagee",
-    "Mardella",
-    "Mardie",
-    "Margaret River (WA)",
-    "Mariginiup",
-    "Marmion",
-    "Marne",
-    "Marracoonda",
-    "Marradong",
-    "Marrah",
-    "Marrinup",
-    "Martin",
-    "Marvel Loch",
-    "Marybrook",
-    "Massey Bay",
-    "Maya",
-    "Mayanup",
-    "Maylands (WA)",
-    "McAlinden",
-    "McBeath",
-    "McKail",
-    "Meadow",
-    "Meadow Springs",
-    "Meckering",
-    "Meda",
-    "Medina",
-    "Meekatharra",
-    "Meeking",
-    "Meelon",
-    "Meenaar",
-    "Meerup",
-    "Melaleuca",
-    "Melville (WA)",
-    "Menora",
-    "Menzies (WA)",
-    "Merilup",
-    "Merivale",
-    "Merkanooka",
-    "Merredin",
-    "Merriwa (WA)",
-    "Meru",
-    "Metricup",
-    "Mettler",
-    "Miamoon",
-    "Middle Swan",
-    "Middlesex (WA)",
-    "Middleton Beach",
-    "Midland",
-    "Midvale",
-    "Miling",
-    "Millars Well",
-    "Millbridge",
-    "Millbrook (WA)",
-    "Millendon",
-    "Mills Lake",
-    "Millstream (WA)",
-    "Milo",
-    "Milpara",
-    "Mimegarra",
-    "Mindarabin",
-    "Mindarie (WA)",
-    "Mindarra",
-    "Minding",
-    "Mingenew",
-    "Minigin",
-    "Minilya",
-    "Minnenooka",
-    "Minnivale",
-    "Minyirr",
-    "Mira Mar",
-    "Mirrabooka (WA)",
-    "Mitchell Plateau",
-    "Mobrup",
-    "Mocardy",
-    "Mogumber",
-    "Mokine",
-    "Mokup",
-    "Mollerin",
-    "Molloy Island",
-    "Monjebup",
-    "Monjingup",
-    "Moodiarrup",
-    "Moojebing",
-    "Mooliabeenee",
-    "Moondah",
-    "Moondyne",
-    "Moonies Hill",
-    "Moonyoonooka",
-    "Moora (WA)",
-    "Moore River National Park",
-    "Mooriary",
-    "Moorine Rock",
-    "Morangup",
-    "Morawa",
-    "Morbinning",
-    "Mordalup",
-    "Moresby (WA)",
-    "Morgantown",
-    "Morley",
-    "Mornington (WA)",
-    "Mosman Park (WA)",
-    "Moulyinning",
-    "Mount Adams",
-    "Mount Anketell",
-    "Mount Barker (WA)",
-    "Mount Budd",
-    "Mount Burges",
-    "Mount Caroline",
-    "Mount Claremont",
-    "Mount Clarence",
-    "Mount Elphinstone",
-    "Mount Erin",
-    "Mount Hampton",
-    "Mount Hardey",
-    "Mount Hardman",
-    "Mount Hawthorn",
-    "Mount Helena",
-    "Mount Hill",
-    "Mount Holland",
-    "Mount Horner",
-    "Mount Jackson",
-    "Mount Lawley",
-    "Mount Lindesay (WA)",
-    "Mount Madden",
-    "Mount Magnet",
-    "Mount Melville",
-    "Mount Nasura",
-    "Mount Ney",
-    "Mount Observation (WA)",
-    "Mount Palmer",
-    "Mount Pleasant (WA)",
-    "Mount Richon",
-    "Mount Romance",
-    "Mount Sheila",
-    "Mount Sheridan (WA)",
-    "Mount Stirling",
-    "Mount Tarcoola",
-    "Mount Walker (WA)",
-    "Mount Wells",
-    "Mouroubra",
-    "Muchea",
-    "Muckenburra",
-    "Mueller Ranges",
-    "Muja",
-    "Mukinbudin",
-    "Mulataga",
-    "Mulga Downs",
-    "Mullaloo",
-    "Mullalyup",
-    "Mullewa",
-    "Mullingar",
-    "Muluckine",
-    "Mumballup",
-    "Mumberkine",
-    "Mundabullangana",
-    "Mundaring",
-    "Mundijong",
-    "Mundrabilla",
-    "Mungalup",
-    "Munglinup",
-    "Munster",
-    "Muntadgin",
-    "Muradup",
-    "Murchison (WA)",
-    "Murdoch",
-    "Murdong",
-    "Muresk",
-    "Myalup",
-    "Myara",
-    "Myaree",
-    "Myrup",
-    "Nabawa",
-    "Nairibin",
-    "Nalkain",
-    "Nalyerlup",
-    "Namban",
-    "Nambeelup",
-    "Nambung",
-    "Nanarup",
-    "Nanga",
-    "Nanga Brook",
-    "Nangeenan",
-    "Nangetty",
-    "Nannup",
-    "Nanson",
-    "Nanutarra",
-    "Napier",
-    "Naraling",
-    "Narembeen",
-    "Narngulu",
-    "Narra Tarra",
-    "Narraloggan",
-    "Narrikup",
-    "Narrogin",
-    "Narrogin Valley",
-    "Naturaliste",
-    "Naval Base",
-    "Neale",
-    "Nedlands",
-    "Needilup",
-    "Neendaling",
-    "Neerabup",
-    "Neergabby",
-    "Nembudding",
-    "Neridup",
-    "Nerramyne",
-    "Nerren Nerren",
-    "New Norcia",
-    "Newcarlbeon",
-    "Newdegate",
-    "Newlands (WA)",
-    "Newman",
-    "Ngaanyatjarra-Giles",
-    "Nickol",
-    "Nilgen",
-    "Nillup",
-    "Ningaloo",
-    "Nippering",
-    "Nirimba (WA)",
-    "Noggerup",
-    "Nokaning",
-    "Nolba",
-    "Nollamara",
-    "Nomans Lake",
-    "Noranda",
-    "Nornalup",
-    "Norpa",
-    "Norseman",
-    "North Baandee",
-    "North Bannister",
-    "North Beach (WA)",
-    "North Bodallin",
-    "North Boyanup",
-    "North Burngup",
-    "North Cascade",
-    "North Coogee",
-    "North Dandalup",
-    "North Eradu",
-    "North Fremantle",
-    "North Greenbushes",
-    "North Jindong",
-    "North Kellerberrin",
-    "North Kukerin",
-    "North Kununoppin",
-    "North Lake",
-    "North Lake Grace",
-    "North Moulyinning",
-    "North Perth",
-    "North Plantations",
-    "North Stirlings",
-    "North Tammin",
-    "North Trayning",
-    "North Walpole",
-    "North West Cape",
-    "North Wialki",
-    "North Yelbeni",
-    "North Yunderup",
-    "Northam",
-    "Northampton",
-    "Northbridge (WA)",
-    "Northcliffe",
-    "Northern Gully",
-    "Nowergup",
-    "Nugadong",
-    "Nukarni",
-    "Nullagine",
-    "Nullaki",
-    "Nulsen",
-    "Nungarin",
-    "Nunierra",
-    "Nunile",
-    "Nyabing",
-    "O'Connor (WA)",
-    "Oakajee",
-    "Oakford",
-    "Ocean Beach",
-    "Ocean Reef",
-    "Ogilvie",
-    "Old Plains",
-    "Oldbury",
-    "Ongerup",
-    "Onslow",
-    "Oombulgurri",
-    "Ora Banda",
-    "Orana",
-    "Orange Grove (WA)",
-    "Orange Springs",
-    "Orchid Valley",
-    "Ord River",
-    "Orelia",
-    "Osborne Park",
-    "Osmington",
-    "Padbury",
-    "Palgarup",
-    "Pallinup",
-    "Palmdale (WA)",
-    "Palmer (WA)",
-    "Palmyra (WA)",
-    "Pannawonica",
-    "Pantapin",
-    "Papulankutja",
-    "Paraburdoo",
-    "Paradise (WA)",
-    "Pardoo",
-    "Parker Range",
-    "Parkerville",
-    "Parkeston",
-    "Parkfield",
-    "Parklands (WA)",
-    "Parkwood (WA)",
-    "Parmelia",
-    "Parryville",
-    "Patjarr",
-    "Paulls Valley",
-    "Paynedale",
-    "Paynes Find",
-    "Paynesville (WA)",
-    "Peaceful Bay",
-    "Peak Hill (WA)",
-    "Pearsall",
-    "Peedamulla",
-    "Peerabeelup",
-    "Pegs Creek",
-    "Pelican Point (WA)",
-    "Pemberton",
-    "Peppermint Grove",
-    "Peppermint Grove Beach",
-    "Perenjori",
-    "Perillup",
-    "Peron",
-    "Perth (WA)",
-    "Perth Airport",
-    "Perup",
-    "Petrudor",
-    "Piara Waters",
-    "Piawaning",
-    "Piccadilly (WA)",
-    "Pickering Brook",
-    "Picton (WA)",
-    "Picton East",
-    "Piesse Brook",
-    "Piesseville",
-    "Pindar",
-    "Pingaring",
-    "Pingelly",
-    "Pingrup",
-    "Pinjar",
-    "Pinjarra",
-    "Pink Lake",
-    "Pintharuka",
-    "Pinwernying",
-    "Pippingarra",
-    "Pithara",
-    "Plumridge Lakes",
-    "Point Samson",
-    "Popanyinning",
-    "Porongurup",
-    "Port Albany",
-    "Port Denison",
-    "Port Hedland",
-    "Port Kennedy",
-    "Postans",
-    "Preston Beach",
-    "Preston Settlement",
-    "Prevelly",
-    "Prince Regent River",
-    "Pumphreys Bridge",
-    "Purnululu",
-    "Quairading",
-    "Qualeup",
-    "Quedjinup",
-    "Queens Park (WA)",
-    "Queenwood",
-    "Quelagetting",
-    "Quellington",
-    "Quindalup",
-    "Quindanning",
-    "Quinninup",
-    "Quinns Rocks",
-    "Ranford",
-    "Rangeway",
-    "Ravensthorpe",
-    "Ravenswood (WA)",
-    "Rawlinna",
-    "Red Gully",
-    "Red Hill (WA)",
-    "Redbank (WA)",
-    "Redcliffe (WA)",
-    "Redgate (WA)",
-    "Redmond",
-    "Redmond West",
-    "Reedy",
-    "Regans Ford",
-    "Reinscourt",
-    "Remlap",
-    "Reservoir (WA)",
-    "Ridgewood (WA)",
-    "Ringbark",
-    "Riverton (WA)",
-    "Rivervale",
-    "Robinson",
-    "Rockingham (WA)",
-    "Rocklea (WA)",
-    "Rockwell",
-    "Rocky Gully (WA)",
-    "Roebourne",
-    "Roebuck",
-    "Roelands",
-    "Roleystone",
-    "Rosa Brook",
-    "Rosa Glen",
-    "Rossmore (WA)",
-    "Rossmoyne",
-    "Rothsay",
-    "Rottnest Island",
-    "Ruabon",
-    "Rudds Gully",
-    "Ryansbrook",
-    "Sabina River",
-    "Safety Bay",
-    "Salmon Gums",
-    "Salter Point",
-    "Samson",
-    "San Remo (WA)",
-    "Sandpatch",
-    "Sandsprings",
-    "Sandstone",
-    "Sandy Gully (WA)",
-    "Sawyers Valley",
-    "Scaddan",
-    "Scarborough (WA)",
-    "Schroeder",
-    "Scotsdale",
-    "Scott River",
-    "Scott River East",
-    "Scotts Brook",
-    "Seabird",
-    "Secret Harbour",
-    "Seppings",
-    "Serpentine (WA)",
-    "Seville Grove",
-    "Shackleton",
-    "Shadforth (WA)",
-    "Shannon (WA)",
-    "Shark Bay",
-    "Shelley (WA)",
-    "Shenton Park",
-    "Sherlock (WA)",
-    "Shoalwater (WA)",
-    "Shotts",
-    "Siesta Park",
-    "Silver Sands",
-    "Sinagra",
-    "Sinclair",
-    "Singleton (WA)",
-    "Sir Samuel",
-    "Skeleton Rock",
-    "Smith Brook",
-    "Solus",
-    "Somerville (WA)",
-    "Sorrento (WA)",
-    "South Bodallin",
-    "South Boulder",
-    "South Bunbury",
-    "South Burracoppin",
-    "South Carnarvon",
-    "South Datatine",
-    "South Doodlakine",
-    "South Fremantle",
-    "South Glencoe",
-    "South Greenough",
-    "South Guildford",
-    "South Hedland",
-    "South Kalgoorlie",
-    "South Kukerin",
-    "South Kumminin",
-    "South Kununoppin",
-    "South Lake",
-    "South Lake Grace",
-    "South Murchison",
-    "South Newdegate",
-    "South Perth",
-    "South Plantations",
-    "South Quairading",
-    "South Stirling",
-    "South Tammin",
-    "South Trayning",
-    "South Yelbeni",
-    "South Yilgarn",
-    "South Yuna",
-    "South Yunderup",
-    "Southampton (WA)",
-    "Southern Brook",
-    "Southern Cross (WA)",
-    "Southern River",
-    "Spalding (WA)",
-    "Spearwood",
-    "Spencer Park",
-    "Spencers Brook",
-    "Springfield (WA)",
-    "Springs",
-    "St George Ranges",
-    "St James (WA)",
-    "St Ronans",
-    "Stake Hill",
-    "Stirling (WA)",
-    "Stirling Estate",
-    "Stirling Range National Park",
-    "Stoneville",
-    "Stove Hill",
-    "Strathalbyn (WA)",
-    "Stratham",
-    "Stratherne",
-    "Stratton",
-    "Strelley",
-    "Sturt Creek",
-    "Subiaco",
-    "Success",
-    "Sunnyside (WA)",
-    "Sunset Beach",
-    "Swan View",
-    "Swanbourne",
-    "Takalarup",
-    "Talandji",
-    "Talbot (WA)",
-    "Talbot West",
-    "Talgomine",
-    "Talisker",
-    "Tamala",
-    "Tamala Park",
-    "Tambellup",
-    "Tammin",
-    "Tampu",
-    "Tanami (WA)",
-    "Tandegin",
-    "Tapping",
-    "Tarcoola Beach",
-    "Tardun",
-    "Tarin Rock",
-    "Teesdale (WA)",
-    "Telfer",
-    "Tenindewa",
-    "Tenterden (WA)",
-    "The Lakes",
-    "The Plains",
-    "The Spectacles",
-    "The Vines",
-    "Thomson Brook",
-    "Thornlie",
-    "Three Springs",
-    "Throssell",
-    "Tibradden",
-    "Tincurrin",
-    "Tingledale",
-    "Tjirrkarli",
-    "Tjukurla",
-    "Tom Price",
-    "Tonebridge",
-    "Toodyay",
-    "Toolibin",
-    "Toolonga",
-    "Toompup",
-    "Torbay",
-    "Torndirrup",
-    "Townsendale",
-    "Trafalgar (WA)",
-    "Trayning",
-    "Treeby",
-    "Treeton",
-    "Trent",
-    "Trigg",
-    "Trigwell",
-    "Tuart Hill",
-    "Turkey Hill",
-    "Tutunup",
-    "Two Rocks",
-    "Ucarty",
-    "Ucarty West",
-    "Uduc",
-    "Ularring",
-    "Upper Capel",
-    "Upper Murray",
-    "Upper Swan",
-    "Upper Warren",
-    "Useless Loop",
-    "Usher",
-    "Utakarra",
-    "Vancouver Peninsula",
-    "Varley",
-    "Vasse",
-    "Victoria Park",
-    "Victoria Rock",
-    "Victory Heights (WA)",
-    "Vittoria (WA)",
-    "Viveash",
-    "Wadderin",
-    "Waddington",
-    "Waddy Forest",
-    "Waeel",
-    "Wagerup",
-    "Waggrakine",
-    "Wagin",
-    "Waikiki",
-    "Walebing",
-    "Walgoolan",
-    "Walkaway",
-    "Wallareenya",
-    "Wallaroo (WA)",
-    "Walliston",
-    "Walmsley",
-    "Walpole",
-    "Walsall",
-    "Walyormouring",
-    "Walyunga National Park",
-    "Walyurin",
-    "Wamenusking",
-    "Wanarn",
-    "Wandana (WA)",
-    "Wandering",
-    "Wandi",
-    "Wandillup",
-    "Wandina",
-    "Wanerie",
-    "Wangara",
-    "Wannamal",
-    "Wannanup",
-    "Wanneroo",
-    "Wansbrough",
-    "Warakurna",
-    "Warawarrup",
-    "Warburton (WA)",
-    "Wardering",
-    "Warding East",
-    "Warmun",
-    "Warnbro",
-    "Warner Glen",
-    "Waroona",
-    "Warrachuppin",
-    "Warradarge",
-    "Warralakin",
-    "Warrenup",
-    "Warwick (WA)",
-    "Waterbank",
-    "Watercarrin",
-    "Waterford (WA)",
-    "Waterloo (WA)",
-    "Watermans Bay",
-    "Watheroo",
-    "Wattening",
-    "Wattle Grove (WA)",
-    "Wattleup",
-    "Wattoning",
-    "Webberton",
-    "Wedge Island (WA)",
-    "Wedgecarrup",
-    "Wedgefield",
-    "Welbungin",
-    "Weld Range",
-    "Wellard",
-    "Wellesley (WA)",
-    "Wellington Forest",
-    "Wellington Mill",
-    "Wellstead",
-    "Welshpool (WA)",
-    "Wembley",
-    "Wembley Downs",
-    "West Ballidu",
-    "West Beach (WA)",
-    "West Binnu",
-    "West Busselton",
-    "West Cape Howe",
-    "West Casuarinas",
-    "West Coolup",
-    "West End (WA)",
-    "West Fitzgerald",
-    "West Holleton",
-    "West Kalgoorlie",
-    "West Lamington",
-    "West Leederville",
-    "West Lyons River",
-    "West Perth",
-    "West Pingelly",
-    "West Pinjarra",
-    "West Popanyinning",
-    "West River",
-    "West Swan",
-    "West Toodyay",
-    "Westdale (WA)",
-    "Westminster",
-    "Westonia",
-    "Westwood (WA)",
-    "Whim Creek",
-    "Whitby",
-    "White Gum Valley",
-    "White Peak",
-    "Whiteman",
-    "Whittaker",
-    "Wialki",
-    "Wicherina",
-    "Wicherina South",
-    "Wickepin",
-    "Wickham (WA)",
-    "Widgiemooltha",
-    "Wijilawarrim",
-    "Wilberforce (WA)",
-    "Wilbinga",
-    "Wilga",
-    "Wilga West",
-    "Wilgarrup",
-    "Wilgoyne",
-    "Willagee",
-    "Willare",
-    "Willetton",
-    "William Bay",
-    "Williams",
-    "Williamstown (WA)",
-    "Willyung",
-    "Wilson",
-    "Wiluna",
-    "Wilyabrup",
-    "Windabout",
-    "Windy Harbour",
-    "Winnejup",
-    "Winthrop",
-    "Witchcliffe",
-    "Withers",
-    "Wittenoom",
-    "Wittenoom Hills",
-    "Wogolin",
-    "Wokalup",
-    "Womarden",
-    "Wongamine",
-    "Wongan Hills",
-    "Wongoondy",
-    "Wonnerup",
-    "Wonthella",
-    "Woodanilling",
-    "Woodbridge (WA)",
-    "Woodlands (WA)",
-    "Woodleigh (WA)",
-    "Woodridge (WA)",
-    "Woodvale (WA)",
-    "Woogenellup",
-    "Woolgorong",
-    "Woolocutty",
-    "Wooramel",
-    "Wooroloo",
-    "Woorree",
-    "Woottating",
-    "Worsley",
-    "Wubin",
-    "Wundowie",
-    "Wungong",
-    "Wuraming",
-    "Wyalkatchem",
-    "Wyening",
-    "Wyndham (WA)",
-    "Wyola West",
-    "Xantippe",
-    "Yabberup",
-    "Yakamia",
-    "Yalardy",
-    "Yalgoo",
-    "Yallabatharra",
-    "Yallingup",
-    "Yallingup Siding",
-    "Yalyalup",
-    "Yanchep",
-    "Yandanooka",
-    "Yandoo Creek",
-    "Yangebup",
-    "Yanmah",
-    "Yannarie",
-    "Yarawindah",
-    "Yardarino",
-    "Yarloop",
-    "Yarragadee",
-    "Yathroo",
-    "Yeagarup",
-    "Yeal",
-    "Yealering",
-    "Yelbeni",
-    "Yellowdine",
-    "Yelverton",
-    "Yerecoin",
-    "Yetna",
-    "Yilliminning",
-    "Yoganup",
-    "Yokine",
-    "Yoongarillup",
-    "York",
-    "Yornaning",
-    "Yornup",
-    "Yoting",
-    "Youndegin",
-    "Youngs Siding",
-    "Yourdamung Lake",
-    "Yuna",
-    "Zanthus",
-    "Zuytdorp",
-    "No usual address (WA)",
-    "Migratory - Offshore - Shipping (WA)",
-    "Abbotsham",
-    "Abels Bay",
-    "Aberdeen (Tas.)",
-    "Acacia Hills (Tas.)",
-    "Acton (Tas.)",
-    "Acton Park (Tas.)",
-    "Adventure Bay",
-    "Akaroa",
-    "Alberton (Tas.)",
-    "Alcomie",
-    "Allens Rivulet",
-    "Alonnah",
-    "Ambleside",
-    "Andover",
-    "Ansons Bay",
-    "Antill Ponds",
-    "Apollo Bay (Tas.)",
-    "Apslawn",
-    "Apsley (Tas.)",
-    "Arthur River (Tas.)",
-    "Arthurs Lake",
-    "Austins Ferry",
-    "Avoca (Tas.)",
-    "Baden",
-    "Badger Head",
-    "Bagdad",
-    "Bakers Beach",
-    "Banca",
-    "Bangor (Tas.)",
-    "Barnes Bay",
-    "Barretta",
-    "Barrington (Tas.)",
-    "Battery Point",
-    "Beaconsfield (Tas.)",
-    "Beaumaris (Tas.)",
-    "Beauty Point",
-    "Beechford",
-    "Bell Bay",
-    "Bellerive",
-    "Bellingham",
-    "Ben Lomond (Tas.)",
-    "Berriedale",
-    "Beulah (Tas.)",
-    "Bicheno",
-    "Binalong Bay",
-    "Birchs Bay",
-    "Birralee",
-    "Bishopsbourne",
-    "Black Hills",
-    "Black River (Tas.)",
-    "Blackmans Bay",
-    "Blackstone Heights",
-    "Blackwall (Tas.)",
-    "Blackwood Creek",
-    "Blessington",
-    "Blue Rocks",
-    "Blumont",
-    "Boat Harbour (Tas.)",
-    "Boat Harbour Beach",
-    "Bonnet Hill",
-    "Boobyalla",
-    "Boomer Bay",
-    "Bothwell",
-    "Boyer",
-    "Bracknell",
-    "Bradys Lake",
-    "Brandum",
-    "Branxholm",
-    "Breadalbane (Tas.)",
-    "Bream Creek",
-    "Breona",
-    "Bridgenorth",
-    "Bridgewater (Tas.)",
-    "Bridport",
-    "Brighton (Tas.)",
-    "Brittons Swamp",
-    "Broadmarsh",
-    "Broadmeadows (Tas.)",
-    "Bronte Park",
-    "Brooklyn (Tas.)",
-    "Brooks Bay",
-    "Buckland (Tas.)",
-    "Bungaree (Tas.)",
-    "Burnie",
-    "Burns Creek",
-    "Bushy Park (Tas.)",
-    "Butlers Gorge",
-    "Cairns Bay",
-    "Calder",
-    "Cambridge (Tas.)",
-    "Camdale",
-    "Camena",
-    "Campania",
-    "Campbell Town",
-    "Cape Barren Island",
-    "Cape Pillar",
-    "Cape Portland",
-    "Cape Raoul",
-    "Carlton (Tas.)",
-    "Carlton River",
-    "Carrick (Tas.)",
-    "Castle Forbes Bay",
-    "Castra",
-    "Caveside",
-    "Central Plateau",
-    "Cethana",
-    "Chain Of Lagoons",
-    "Charlotte Cove",
-    "Chasm Creek",
-    "Chigwell",
-    "Christmas Hills (Tas.)",
-    "Chudleigh",
-    "Claremont (Tas.)",
-    "Clarence Point",
-    "Clarendon Vale",
-    "Claude Road",
-    "Cleveland (Tas.)",
-    "Clifton Beach (Tas.)",
-    "Cluan",
-    "Colebrook",
-    "Coles Bay",
-    "Collinsvale",
-    "Conara",
-    "Coningham",
-    "Connellys Marsh",
-    "Cooee",
-    "Copping",
-    "Corinna",
-    "Cornwall (Tas.)",
-    "Couta Rocks",
-    "Cowrie Point",
-    "Crabtree",
-    "Cradle Mountain",
-    "Cradoc",
-    "Cramps Bay",
-    "Cranbrook (Tas.)",
-    "Crayfish Creek",
-    "Cremorne (Tas.)",
-    "Cressy (Tas.)",
-    "Cuckoo",
-    "Cuprona",
-    "Currie",
-    "Cygnet",
-    "Dairy Plains",
-    "Deddington",
-    "Dee",
-    "Deep Bay",
-    "Deloraine",
-    "Dennes Point",
-    "Derby (Tas.)",
-    "Derwent Bridge",
-    "Derwent Park",
-    "Detention",
-    "Deviot",
-    "Devon Hills",
-    "Devonport",
-    "Dilston",
-    "Doctors Point",
-    "Doctors Rocks",
-    "Dodges Ferry",
-    "Dolphin Sands",
-    "Don",
-    "Douglas River",
-    "Douglas-Apsley",
-    "Dover",
-    "Downlands",
-    "Dowsing Point",
-    "Dromedary (Tas.)",
-    "Dulcot",
-    "Dunalley",
-    "Dunorlan",
-    "Dynnyrne",
-    "Dysart (Tas.)",
-    "Eaglehawk Neck",
-    "East Cam",
-    "East Devonport",
-    "East Launceston",
-    "East Ridgley",
-    "Eddystone",
-    "Edgcumbe Beach",
-    "Edith Creek",
-    "Egg Lagoon",
-    "Eggs And Bacon Bay",
-    "Elderslie (Tas.)",
-    "Electrona",
-    "Elizabeth Town",
-    "Ellendale (Tas.)",
-    "Elliott (Tas.)",
-    "Emita",
-    "Emu Heights (Tas.)",
-    "Epping Forest",
-    "Erriba",
-    "Eugenana",
-    "Evandale (Tas.)",
-    "Exeter (Tas.)",
-    "Exton",
-    "Falmouth",
-    "Fentonbury",
-    "Fern Tree",
-    "Fingal (Tas.)",
-    "Fitzgerald (Tas.)",
-    "Flintstone",
-    "Florentine",
-    "Flowerdale (Tas.)",
-    "Flowerpot",
-    "Flowery Gully",
-    "Forcett",
-    "Forest",
-    "Forester",
-    "Fortescue (Tas.)",
-    "Forth",
-    "Forthside",
-    "Four Mile Creek (Tas.)",
-    "Frankford",
-    "Franklin (Tas.)",
-    "Freycinet",
-    "Friendly Beaches",
-    "Gagebrook",
-    "Garden Island (Tas.)",
-    "Garden Island Creek",
-    "Gardners Bay",
-    "Gawler (Tas.)",
-    "Geeveston",
-    "Geilston Bay",
-    "George Town",
-    "Gladstone (Tas.)",
-    "Glaziers Bay",
-    "Glebe (Tas.)",
-    "Glen Huon",
-    "Glendevie",
-    "Glenfern (Tas.)",
-    "Glengarry (Tas.)",
-    "Glenlusk",
-    "Glenora",
-    "Glenorchy (Tas.)",
-    "Golconda",
-    "Golden Valley",
-    "Goodwood (Tas.)",
-    "Gordon (Tas.)",
-    "Gormanston",
-    "Goshen",
-    "Goulds Country",
-    "Gowrie Park",
-    "Granton",
-    "Granville Harbour",
-    "Grasstree Hill",
-    "Grassy",
-    "Gravelly Beach",
-    "Gray (Tas.)",
-    "Great Bay",
-    "Greens Beach",
-    "Gretna",
-    "Grindelwald",
-    "Grove",
-    "Guildford (Tas.)",
-    "Gunns Plains",
-    "Hadspen",
-    "Hagley",
-    "Hamilton (Tas.)",
-    "Hampshire",
-    "Harford",
-    "Hastings (Tas.)",
-    "Havenview",
-    "Hawley Beach",
-    "Hayes",
-    "Hellyer",
-    "Henrietta",
-    "Herdsmans Cove",
-    "Hermitage",
-    "Herrick",
-    "Heybridge",
-    "Highclere",
-    "Highcroft",
-    "Hillcrest (Tas.)",
-    "Hillwood",
-    "Hobart",
-    "Hollow Tree",
-    "Holwell",
-    "Honeywood",
-    "Howden",
-    "Howrah",
-    "Howth",
-    "Huntingfield",
-    "Huon Island",
-    "Huonville",
-    "Ida Bay",
-    "Interlaken",
-    "Invermay (Tas.)",
-    "Irishtown (Tas.)",
-    "Jackeys Marsh",
-    "Jericho (Tas.)",
-    "Jetsonville",
-    "Judbury",
-    "Kamona",
-    "Kaoota",
-    "Karanja",
-    "Karoola",
-    "Kayena",
-    "Kellevie",
-    "Kelso (Tas.)",
-    "Kempton",
-    "Kettering",
-    "Killiecrankie",
-    "Kimberley (Tas.)",
-    "Kindred",
-    "Kings Meadows",
-    "Kingston (Tas.)",
-    "Kingston Beach",
-    "Koonya",
-    "Lachlan",
-    "Lackrana",
-    "Lady Barron",
-    "Lake Leake",
-    "Lake Margaret",
-    "Lake Sorell",
-    "Lake St Clair",
-    "Lalla",
-    "Lanena",
-    "Lapoinya",
-    "Latrobe",
-    "Lauderdale",
-    "Launceston",
-    "Lawitta",
-    "Lebrina",
-    "Leeka",
-    "Lefroy",
-    "Legana",
-    "Legerwood",
-    "Leith",
-    "Lemont",
-    "Lenah Valley",
-    "Leslie Vale",
-    "Levendale",
-    "Lewisham (Tas.)",
-    "Liawenee",
-    "Liena",
-    "Lietinna",
-    "Liffey",
-    "Lileah",
-    "Lillico (Tas.)",
-    "Lilydale (Tas.)",
-    "Lindisfarne",
-    "Lisle",
-    "Little Pine Lagoon",
-    "Little Swanport",
-    "Loccota",
-    "Loira",
-    "London Lakes",
-    "Long Reach",
-    "Longford (Tas.)",
-    "Longley",
-    "Lonnavale",
-    "Loongana",
-    "Loorana",
-    "Lorinna",
-    "Lottah",
-    "Low Head",
-    "Lower Barrington",
-    "Lower Beulah",
-    "Lower Longley",
-    "Lower Marshes",
-    "Lower Snug",
-    "Lower Turners Marsh",
-    "Lower Wattle Grove",
-    "Lower Wilmot",
-    "Loyetea",
-    "Lucaston",
-    "Lughrata",
-    "Luina",
-    "Lulworth",
-    "Lunawanna",
-    "Lune River",
-    "Lutana",
-    "Lymington",
-    "Lymwood",
-    "Macquarie Heads",
-    "Macquarie Plains",
-    "Magra",
-    "Malbina",
-    "Mangalore (Tas.)",
-    "Mangana",
-    "Margate (Tas.)",
-    "Maria Island",
-    "Marion Bay (Tas.)",
-    "Marrawah",
-    "Mathinna",
-    "Mawbanna",
-    "Mayberry",
-    "Maydena",
-    "Mayfield (Tas.)",
-    "Meadowbank (Tas.)",
-    "Meander",
-    "Mella",
-    "Melrose (Tas.)",
-    "Melton Mowbray",
-    "Memana",
-    "Mengha",
-    "Mersey Forest",
-    "Merseylea",
-    "Meunna",
-    "Miandetta (Tas.)",
-    "Middlesex (Tas.)",
-    "Middleton (Tas.)",
-    "Midway Point",
-    "Miena",
-    "Milabena",
-    "Millers Bluff",
-    "Moina",
-    "Mole Creek",
-    "Molesworth (Tas.)",
-    "Moltema",
-    "Montagu",
-    "Montagu Bay",
-    "Montana",
-    "Montello",
-    "Montrose (Tas.)",
-    "Montumana",
-    "Moogara",
-    "Moonah",
-    "Mooreville",
-    "Moorina (Tas.)",
-    "Moorleah",
-    "Morass Bay",
-    "Moriarty",
-    "Mornington (Tas.)",
-    "Mount Direction",
-    "Mount Field",
-    "Mount Hicks",
-    "Mount Lloyd",
-    "Mount Nelson",
-    "Mount Roland",
-    "Mount Rumney",
-    "Mount Seymour",
-    "Mount Stuart (Tas.)",
-    "Mount William",
-    "Mountain River",
-    "Mowbray (Tas.)",
-    "Murdunna",
-    "Musselroe Bay",
-    "Myalla (Tas.)",
-    "Myrtle Bank (Tas.)",
-    "Nabageena",
-    "Nabowla",
-    "Naracoopa",
-    "National Park",
-    "Natone",
-    "Needles",
-    "Neika",
-    "Nelson Bay (Tas.)",
-    "New Norfolk",
-    "New Town (Tas.)",
-    "Newnham",
-    "Newstead (Tas.)",
-    "Nicholls Rivulet",
-    "Nietta",
-    "Nile",
-    "Nook",
-    "North Bruny",
-    "North Hobart",
-    "North Lilydale",
-    "North Motton",
-    "North Scottsdale",
-    "Northdown",
-    "Norwood (Tas.)",
-    "Notley Hills",
-    "Nowhere Else",
-    "Nubeena",
-    "Nugara",
-    "Nugent",
-    "Nunamara",
-    "Oakdowns",
-    "Oaks",
-    "Oatlands (Tas.)",
-    "Ocean Vista",
-    "Old Beach",
-    "Oldina",
-    "Oonah",
-    "Opossum Bay",
-    "Orford (Tas.)",
-    "Orielton",
-    "Osmaston",
-    "Osterley (Tas.)",
-    "Otago",
-    "Ouse",
-    "Oyster Cove (Tas.)",
-    "Palana",
-    "Paloona",
-    "Paradise (Tas.)",
-    "Parattah",
-    "Park Grove",
-    "Parkham",
-    "Parklands (Tas.)",
-    "Parrawe",
-    "Patersonia",
-    "Pawleena",
-    "Pawtella",
-    "Pearshape",
-    "Pegarah",
-    "Pelham (Tas.)",
-    "Pelverata",
-    "Penguin",
-    "Penna",
-    "Perth (Tas.)",
-    "Petcheys Bay",
-    "Pioneer (Tas.)",
-    "Pipers Brook",
-    "Pipers River",
-    "Plenty (Tas.)",
-    "Poatina",
-    "Police Point",
-    "Pontville",
-    "Pontypool",
-    "Port Arthur (Tas.)",
-    "Port Huon",
-    "Port Latta",
-    "Port Sorell",
-    "Powranna",
-    "Premaydena",
-    "Preolenna",
-    "Preservation Bay",
-    "Preston (Tas.)",
-    "Primrose Sands",
-    "Promised Land",
-    "Prospect (Tas.)",
-    "Prospect Vale",
-    "Punchbowl (Tas.)",
-    "Pyengana",
-    "Quamby Bend",
-    "Quamby Brook",
-    "Queens Domain",
-    "Queenstown (Tas.)",
-    "Quoiba",
-    "Railton",
-    "Raminea",
-    "Randalls Bay",
-    "Ranelagh",
-    "Ranga",
-    "Ravenswood (Tas.)",
-    "Recherche",
-    "Red Hills",
-    "Redpa",
-    "Reedy Marsh",
-    "Reekara",
-    "Relbia",
-    "Renison Bell",
-    "Retreat (Tas.)",
-    "Reynolds Neck",
-    "Rheban",
-    "Rhyndaston",
-    "Riana",
-    "Richmond (Tas.)",
-    "Ridgeway",
-    "Ridgley",
-    "Ringarooma",
-    "Risdon",
-    "Risdon Vale",
-    "Riverside (Tas.)",
-    "Robigana",
-    "Rocherlea",
-    "Roches Beach",
-    "Rocky Cape",
-    "Rocky Hills",
-    "Roger River",
-    "Rokeby (Tas.)",
-    "Roland",
-    "Romaine",
-    "Rose Bay (Tas.)",
-    "Rosebery (Tas.)",
-    "Rosegarland",
-    "Rosetta",
-    "Rosevale (Tas.)",
-    "Rosevears",
-    "Rosny",
-    "Rosny Park",
-    "Ross (Tas.)",
-    "Rossarden",
-    "Round Hill (Tas.)",
-    "Rowella",
-    "Royal George",
-    "Runnymede (Tas.)",
-    "Rushy Lagoon",
-    "Saltwater River",
-    "Sandfly",
-    "Sandford (Tas.)",
-    "Sandy Bay",
-    "Sassafras (Tas.)",
-    "Savage River",
-    "Scamander",
-    "Schouten Island",
-    "Scopus",
-    "Scotchtown",
-    "Scottsdale",
-    "Sea Elephant",
-    "Selbourne",
-    "Seven Mile Beach",
-    "Seymour (Tas.)",
-    "Shannon (Tas.)",
-    "Shearwater",
-    "Sheffield",
-    "Shorewell Park",
-    "Sidmouth",
-    "Simpsons Bay",
-    "Sisters Beach",
-    "Sisters Creek",
-    "Sloping Main",
-    "Smithton",
-    "Snug",
-    "Somerset (Tas.)",
-    "Sorell",
-    "Sorell Creek",
-    "South Arm (Tas.)",
-    "South Bruny",
-    "South Burnie",
-    "South Forest",
-    "South Hobart",
-    "South Launceston",
-    "South Mount Cameron",
-    "South Nietta",
-    "South Preston",
-    "South Riana",
-    "South Spreyton",
-    "South Springfield",
-    "Southport (Tas.)",
-    "Southport Lagoon",
-    "Southwest",
-    "Spalford",
-    "Sprent",
-    "Spreyton",
-    "Spring Beach",
-    "Springfield (Tas.)",
-    "Squeaking Point",
-    "St Helens (Tas.)",
-    "St Leonards (Tas.)",
-    "St Marys (Tas.)",
-    "Stanley (Tas.)",
-    "Staverton",
-    "Steppes",
-    "Stieglitz",
-    "Stonehenge (Tas.)",
-    "Stonor",
-    "Stony Head",
-    "Stony Rise",
-    "Stoodley",
-    "Stormlea",
-    "Stowport",
-    "Strahan",
-    "Strathblane",
-    "Strathgordon",
-    "Strickland",
-    "Strzelecki (Tas.)",
-    "Styx",
-    "Sulphur Creek",
-    "Summerhill",
-    "Sunnyside (Tas.)",
-    "Surges Bay",
-    "Surprise Bay",
-    "Surveyors Bay",
-    "Swan Bay (Tas.)",
-    "Swan Point",
-    "Swansea (Tas.)",
-    "Swanston",
-    "Table Cape",
-    "Takone",
-    "Talawa",
-    "Taranna",
-    "Targa",
-    "Tarleton",
-    "Taroona",
-    "Tarraleah",
-    "Tayene",
-    "Tea Tree",
-    "Telita",
-    "Temma",
-    "Tewkesbury",
-    "The Gardens (Tas.)",
-    "Thirlstane",
-    "Tiberias",
-    "Tinderbox",
-    "Tods Corner",
-    "Togari",
-    "Toiberry",
-    "Tolmans Hill",
-    "Tomahawk",
-    "Tonganah",
-    "Tooms Lake",
-    "Tranmere (Tas.)",
-    "Travellers Rest",
-    "Trenah",
-    "Trevallyn",
-    "Triabunna",
-    "Trial Harbour",
-    "Trowutta",
-    "Tugrah",
-    "Tulendeena",
-    "Tullah",
-    "Tunbridge",
-    "Tunnack",
-    "Tunnel",
-    "Turners Beach",
-    "Turners Marsh",
-    "Tyenna (Tas.)",
-    "Ulverstone",
-    "Underwood (Tas.)",
-    "Upper Blessington",
-    "Upper Burnie",
-    "Upper Castra",
-    "Upper Esk",
-    "Upper Natone",
-    "Upper Scamander",
-    "Upper Stowport",
-    "Upper Woodstock",
-    "Uxbridge",
-    "Verona Sands",
-    "Victoria Valley (Tas.)",
-    "Waddamana",
-    "Walls Of Jerusalem",
-    "Waratah (Tas.)",
-    "Warrane",
-    "Warrentinna",
-    "Waterhouse",
-    "Waterloo (Tas.)",
-    "Wattle Grove (Tas.)",
-    "Wattle Hill (Tas.)",
-    "Waverley (Tas.)",
-    "Wayatinah",
-    "Weegena",
-    "Weetah",
-    "Weldborough",
-    "Wellington Park",
-    "Wesley Vale",
-    "West Coast",
-    "West Hobart",
-    "West Kentish",
-    "West Launceston",
-    "West Montagu",
-    "West Moonah",
-    "West Mooreville",
-    "West Pine",
-    "West Ridgley",
-    "West Scottsdale",
-    "West Takone",
-    "West Ulverstone",
-    "Westbury (Tas.)",
-    "Western Creek (Tas.)",
-    "Western Junction",
-    "Westerway",
-    "Westwood (Tas.)",
-    "Weymouth",
-    "White Beach",
-    "White Hills (Tas.)",
-    "Whitefoord",
-    "Whitemark",
-    "Whitemore",
-    "Wickham (Tas.)",
-    "Wilburville",
-    "Wilmot",
-    "Wiltshire",
-    "Windermere (Tas.)",
-    "Wingaroo",
-    "Winkleigh",
-    "Winnaleah",
-    "Wivenhoe",
-    "Woodbridge (Tas.)",
-    "Woodbury (Tas.)",
-    "Woodsdale",
-    "Woodstock (Tas.)",
-    "Woolnorth",
-    "Wyena",
-    "Wynyard",
-    "Yambacoona",
-    "Yarra Creek",
-    "Yolla",
-    "York Plains (Tas.)",
-    "York Town",
-    "Youngtown",
-    "Zeehan",
-    "No usual address (Tas.)",
-    "Migratory - Offshore - Shipping (Tas.)",
-    "Acacia Hills (NT)",
-    "Adelaide River",
-    "Alawa",
-    "Ali Curung",
-    "Alice Springs",
-    "Alpurrurulam",
-    "Alyangula",
-    "Amoonguna",
-    "Ampilatwatja",
-    "Anatye",
-    "Angurugu",
-    "Anindilyakwa",
-    "Anmatjere",
-    "Anula",
-    "Araluen (NT)",
-    "Archer",
-    "Areyonga",
-    "Arnold (NT)",
-    "Arumbera",
-    "Atitjere",
-    "Baines",
-    "Bakewell",
-    "Barunga",
-    "Batchelor",
-    "Bayview (NT)",
-    "Bees Creek",
-    "Bellamack",
-    "Belyuen",
-    "Berrimah",
-    "Berry Springs",
-    "Beswick",
-    "Beswick Creek",
-    "Binjari",
-    "Birdum",
-    "Black Jungle",
-    "Blackmore",
-    "Borroloola",
-    "Bradshaw",
-    "Braitling",
-    "Brinkin",
-    "Buchanan (NT)",
-    "Buffalo Creek",
-    "Bulman Weemol",
-    "Burrundie",
-    "Burt Plain",
-    "Bynoe",
-    "Bynoe Harbour",
-    "Calvert (NT)",
-    "Camp Creek (NT)",
-    "Canteen Creek",
-    "Casuarina (NT)",
-    "Channel Island",
-    "Charles Darwin",
-    "Charlotte",
-    "Chilla Well",
-    "Ciccone",
-    "Claravale",
-    "Cobourg",
-    "Coconut Grove",
-    "Collett Creek",
-    "Connellan",
-    "Coolalinga",
-    "Coomalie Creek",
-    "Coonawarra (NT)",
-    "Cossack (NT)",
-    "Costello",
-    "Cox Peninsula",
-    "Creswell",
-    "Daguragu",
-    "Daly",
-    "Daly River",
-    "Daly Waters",
-    "Darwin City",
-    "Darwin River",
-    "Darwin River Dam",
-    "Davenport (NT)",
-    "Delamere (NT)",
-    "Desert Springs",
-    "Douglas-Daly",
-    "Driver",
-    "Dundee Beach",
-    "Dundee Downs",
-    "Dundee Forest",
-    "Durack (NT)",
-    "East Arm",
-    "East Arnhem",
-    "East Point",
-    "East Side",
-    "Eaton (NT)",
-    "Edith (NT)",
-    "Elliott (NT)",
-    "Elrundie",
-    "Elsey",
-    "Emungalan",
-    "Engawala",
-    "Eva Valley",
-    "Fannie Bay",
-    "Farrar",
-    "Finke",
-    "Finniss Valley",
-    "Florina",
-    "Fly Creek",
-    "Flying Fox (NT)",
-    "Flynn (NT)",
-    "Freds Pass",
-    "Galiwinku",
-    "Gapuwiyak",
-    "Ghan",
-    "Gillen",
-    "Girraween (NT)",
-    "Glyde Point",
-    "Gray (NT)",
-    "Gregory (NT)",
-    "Gulung Mardrulk",
-    "Gunbalanya",
-    "Gunn",
-    "Gunn Point",
-    "Gunyangara",
-    "Gurindji",
-    "Haasts Bluff",
-    "Hale",
-    "Hart (NT)",
-    "Herbert",
-    "Hermannsburg",
-    "Hidden Valley (NT)",
-    "Holmes",
-    "Holtze",
-    "Hotham",
-    "Howard Springs",
-    "Hugh",
-    "Hughes (NT)",
-    "Humpty Doo",
-    "Ilparpa",
-    "Imanpa",
-    "Irlpme",
-    "Jabiru",
-    "Jilkminggan",
-    "Jingili",
-    "Johnston",
-    "Kakadu",
-    "Kalkarindji",
-    "Kaltukatjara",
-    "Karama",
-    "Katherine",
-    "Katherine East",
-    "Katherine South",
-    "Kilgariff",
-    "Kintore",
-    "Knuckey Lagoon",
-    "Koolpinyah",
-    "Kunparrka",
-    "Lajamanu",
-    "Lake Bennett",
-    "Lake Mackay",
-    "Lambells Lagoon",
-    "Lansdowne (NT)",
-    "Laramba",
-    "Larapinta (NT)",
-    "Larrakeyah",
-    "Larrimah",
-    "Leanyer",
-    "Lee Point",
-    "Limmen",
-    "Litchfield Park",
-    "Livingstone",
-    "Lloyd Creek",
-    "Ludmilla",
-    "Lyons (NT)",
-    "Malak",
-    "Manbulloo",
-    "Mandorah",
-    "Maningrida",
-    "Manton (NT)",
-    "Maranunga",
-    "Margaret River (NT)",
-    "Marlow Lagoon",
-    "Marrakai",
-    "Marrara",
-    "Mataranka",
-    "McArthur",
-    "McMinns Lagoon",
-    "Mereenie",
-    "Micket Creek",
-    "Middle Point",
-    "Milikapiti",
-    "Milingimbi",
-    "Millner",
-    "Milyakburra",
-    "Miniyeri",
-    "Minjilang",
-    "Mitchell (NT)",
-    "Moil",
-    "Moulden",
-    "Mount Bundey",
-    "Mount Johns",
-    "Mount Liebig",
-    "Mount Zeil",
-    "Muirhead",
-    "Murrumujuk",
-    "Mutitjulu",
-    "Nakara",
-    "Namatjira",
-    "Nauiyu",
-    "Nemarluk",
-    "Newcastle Waters",
-    "Nganmarriyanga",
-    "Ngukurr",
-    "Nhulunbuy",
-    "Nicholson (NT)",
-    "Nightcliff",
-    "Nitmiluk",
-    "Noonamah",
-    "Numbulwar",
-    "Numburindi",
-    "Nyirripi",
-    "Palmerston City",
-    "Pamayu",
-    "Papunya",
-    "Parap",
-    "Pellew Islands",
-    "Peppimenarti",
-    "Petermann",
-    "Pigeon Hole",
-    "Pine Creek (NT)",
-    "Pinelands (NT)",
-    "Pirlangimpi",
-    "Point Stuart",
-    "Rakula",
-    "Ramingining",
-    "Ranken",
-    "Rapid Creek",
-    "Robin Falls",
-    "Robinson River",
-    "Rosebery (NT)",
-    "Ross (NT)",
-    "Rum Jungle",
-    "Sadadeen",
-    "Sandover",
-    "Santa Teresa",
-    "Shoal Bay (NT)",
-    "Simpson (NT)",
-    "Southport (NT)",
-    "Stapleton",
-    "Stuart (NT)",
-    "Stuart Park",
-    "Sturt Plateau",
-    "Tablelands (NT)",
-    "Tanami (NT)",
-    "Tanami East",
-    "Tara (NT)",
-    "Tennant Creek",
-    "Thamarrurr",
-    "The Gap (NT)",
-    "The Gardens (NT)",
-    "The Narrows (NT)",
-    "Ti Tree",
-    "Timber Creek",
-    "Tindal",
-    "Tipperary (NT)",
-    "Titjikala",
-    "Tivendale",
-    "Tiwi",
-    "Tiwi Islands",
-    "Top Springs",
-    "Tortilla Flats",
-    "Tumbling Waters",
-    "Umbakumba",
-    "Undoolya",
-    "Uralla (NT)",
-    "Van Diemen Gulf",
-    "Venn",
-    "Vernon Islands",
-    "Victoria River",
-    "Virginia (NT)",
-    "Wadeye",
-    "Wagait Beach",
-    "Wagaman",
-    "Wak Wak",
-    "Wallace Rockhole",
-    "Wanguri",
-    "Warruwi",
-    "Warumungu",
-    "Weddell",
-    "West Arnhem",
-    "White Gums",
-    "Wickham (NT)",
-    "Willowra",
-    "Wilora",
-    "Wilton (NT)",
-    "Winnellie",
-    "Wishart (NT)",
-    "Woodroffe",
-    "Woolner",
-    "Wulagi",
-    "Wurrumiyanga",
-    "Wutunugurra",
-    "Yarralin",
-    "Yarrawonga (NT)",
-    "Yirrkala",
-    "Yuelamu",
-    "Yuendumu",
-    "Yulara",
-    "Zuccoli",
-    "No usual address (NT)",
-    "Migratory - Offshore - Shipping (NT)",
-    "ACT Remainder - Belconnen",
-    "ACT Remainder - Booth",
-    "ACT Remainder - Canberra Central",
-    "ACT Remainder - Coree",
-    "ACT Remainder - Cotter River",
-    "ACT Remainder - Gungahlin",
-    "ACT Remainder - Hall",
-    "ACT Remainder - Jerrabomberra",
-    "ACT Remainder - Kowen",
-    "ACT Remainder - Majura",
-    "ACT Remainder - Molonglo Valley",
-    "ACT Remainder - Paddys River",
-    "ACT Remainder - Rendezvous Creek",
-    "ACT Remainder - Stromlo",
-    "ACT Remainder - Tuggeranong",
-    "ACT Remainder - Weston Creek",
-    "Acton (ACT)",
-    "Ainslie",
-    "Amaroo (ACT)",
-    "Aranda",
-    "Banks",
-    "Barton",
-    "Beard",
-    "Belconnen",
-    "Bonner",
-    "Bonython",
-    "Braddon",
-    "Bruce (ACT)",
-    "Calwell",
-    "Campbell",
-    "Canberra Airport",
-    "Capital Hill",
-    "Casey",
-    "Chapman",
-    "Charnwood",
-    "Chifley (ACT)",
-    "Chisholm (ACT)",
-    "City",
-    "Conder",
-    "Cook",
-    "Coombs",
-    "Crace",
-    "Curtin",
-    "Deakin",
-    "Denman Prospect",
-    "Dickson",
-    "Downer",
-    "Duffy",
-    "Dunlop",
-    "Evatt",
-    "Fadden",
-    "Farrer",
-    "Fisher (ACT)",
-    "Florey",
-    "Flynn (ACT)",
-    "Forde",
-    "Forrest (ACT)",
-    "Franklin (ACT)",
-    "Fraser",
-    "Fyshwick",
-    "Garran",
-    "Gilmore (ACT)",
-    "Giralang",
-    "Gordon (ACT)",
-    "Gowrie (ACT)",
-    "Greenway",
-    "Griffith (ACT)",
-    "Gungahlin",
-    "Hackett",
-    "Hall",
-    "Harrison",
-    "Hawker (ACT)",
-    "Higgins",
-    "Holder (ACT)",
-    "Holt",
-    "Hughes (ACT)",
-    "Hume",
-    "Isaacs",
-    "Isabella Plains",
-    "Jacka",
-    "Kaleen",
-    "Kambah",
-    "Kingston (ACT)",
-    "Latham (ACT)",
-    "Lawson (ACT)",
-    "Lyneham",
-    "Lyons (ACT)",
-    "Macarthur (ACT)",
-    "Macgregor (ACT)",
-    "Macnamara",
-    "Macquarie",
-    "Mawson",
-    "McKellar",
-    "Melba",
-    "Mitchell (ACT)",
-    "Molonglo",
-    "Monash (ACT)",
-    "Moncrieff",
-    "Narrabundah",
-    "Ngunnawal",
-    "Nicholls",
-    "O'Connor (ACT)",
-    "O'Malley",
-    "Oaks Estate",
-    "Oxley (ACT)",
-    "Page",
-    "Palmerston (ACT)",
-    "Parkes (ACT)",
-    "Pearce",
-    "Phillip",
-    "Pialligo",
-    "Red Hill (ACT)",
-    "Reid (ACT)",
-    "Richardson",
-    "Rivett",
-    "Russell",
-    "Scullin",
-    "Spence (ACT)",
-    "Stirling (ACT)",
-    "Strathnairn",
-    "Symonston",
-    "Taylor",
-    "Tharwa",
-    "Theodore (ACT)",
-    "Throsby",
-    "Torrens",
-    "Turner",
-    "Uriarra Village",
-    "Wanniassa",
-    "Waramanga",
-    "Watson",
-    "Weetangera",
-    "Weston (ACT)",
-    "Whitlam",
-    "Wright",
-    "Yarralumla",
-    "No usual address (ACT)",
-    "Migratory - Offshore - Shipping (ACT)",
-    "Christmas Island",
-    "Home Island",
-    "Jervis Bay",
-    "Norfolk Island",
-    "West Island",
-    "No usual address (OT)",
-    "Migratory - Offshore - Shipping (OT)",
-    "Outside Australia"
-]
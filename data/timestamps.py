@@ -0,0 +1,41 @@
+import calendar
+import re
+from datetime import datetime
+from functools import lru_cache
+
+# The one form jsonsplitter writes for every event
+_FIXED = re.compile(r"(\d{4})-01-01T12:00:00Z")
+
+# Any other plain UTC / offset timestamp, checked field by field
+_ISO = re.compile(r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:Z|[+-](?:[01]\d|2[0-3]):[0-5]\d)")
+
+
+@lru_cache(maxsize=4096)
+def timestamp_year(timestamp):
+    """
+    Year of an event timestamp. Raises ValueError for invalid timestamps,
+    like datetime.fromisoformat. Pipeline files only hold a handful of
+    distinct timestamps, so almost every call is a cache hit.
+    """
+    match = _FIXED.fullmatch(timestamp)
+    if match:
+        return int(match.group(1))
+
+    match = _ISO.fullmatch(timestamp)
+    if match:
+        year, month, day, hour, minute, second = (int(part) for part in match.groups())
+        if (
+            year >= 1
+            and 1 <= month <= 12
+            and 1 <= day <= calendar.monthrange(year, month)[1]
+            and hour < 24 and minute < 60 and second < 60
+        ):
+            return year
+
+    # Unusual values get the full parser
+    return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).year
+
+
+def event_year(event):
+    # Year of an event dict; raises KeyError / ValueError if it has none
+    return timestamp_year(event["time_object"]["timestamp"])
@@ -0,0 +1,327 @@
+import argparse
+import gzip
+import json
+import math
+import os
+import sqlite3
+from multiprocessing import Pool
+
+import numpy as np
+
+from geo_states import DEFAULT_COLOUR, STATE_FILES, ColourIndex, feature_name, load_geojson
+from geometry import clip_ring, polygons, quantize, ring_area, simplify_ring, to_mercator
+
+# Tile coordinate grid and the margin kept around each tile so fills don't seam
+EXTENT = 4096
+BUFFER = 64
+LAYER = "suburbs"
+
+
+# --- Mapbox vector tile (protobuf) encoding -------------------------------
+
+def _varint(value):
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _zigzag(value):
+    return (value << 1) ^ (value >> 63)
+
+
+def _key(number, wire_type):
+    return _varint((number << 3) | wire_type)
+
+
+def _length_delimited(number, payload):
+    return _key(number, 2) + _varint(len(payload)) + payload
+
+
+def _packed(number, values):
+    return _length_delimited(number, b"".join(_varint(value) for value in values))
+
+
+def encode_value(value):
+    if isinstance(value, bool):
+        return _key(7, 0) + _varint(int(value))
+    if isinstance(value, int):
+        return _key(6, 0) + _varint(_zigzag(value))
+    if isinstance(value, float):
+        return _key(3, 1) + np.float64(value).tobytes()
+    return _length_delimited(1, str(value).encode("utf-8"))
+
+
+def encode_geometry(rings):
+    # MoveTo / LineTo / ClosePath commands with zigzagged deltas; rings are closed int arrays
+    commands = []
+    x = y = 0
+    for ring in rings:
+        points = ring[:-1].tolist()
+        for i, (px, py) in enumerate(points):
+            if i == 0:
+                commands.append((1 << 3) | 1)
+            elif i == 1:
+                commands.append(((len(points) - 1) << 3) | 2)
+            commands.append(_zigzag(px - x))
+            commands.append(_zigzag(py - y))
+            x, y = px, py
+        commands.append((1 << 3) | 7)
+    return commands
+
+
+def encode_tile(features, layer=LAYER, extent=EXTENT):
+    """
+    One-layer vector tile from [(id, properties, rings)]. Property keys and
+    values are interned per layer as the spec requires.
+    """
+    keys, values = {}, {}
+    encoded = []
+    for feature_id, properties, rings in features:
+        tags = []
+        for key, value in properties.items():
+            tags.append(keys.setdefault(key, len(keys)))
+            tags.append(values.setdefault((type(value), value), len(values)))
+        encoded.append(_length_delimited(2, (
+            _key(1, 0) + _varint(feature_id)
+            + _packed(2, tags)
+            + _key(3, 0) + _varint(3)
+            + _packed(4, encode_geometry(rings))
+        )))
+
+    body = _key(15, 0) + _varint(2) + _length_delimited(1, layer.encode("utf-8"))
+    body += b"".join(encoded)
+    body += b"".join(_length_delimited(3, key.encode("utf-8")) for key in keys)
+    body += b"".join(_length_delimited(4, encode_value(value)) for _, value in values)
+    body += _key(5, 0) + _varint(extent)
+    return _length_delimited(3, body)
+
+
+# --- Tile stores ----------------------------------------------------------
+
+class DirectoryTiles:
+    """Static z/x/y.pbf pyramid, servable from public/ as-is."""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def put(self, z, x, y, data):
+        path = os.path.join(self.directory, str(z), str(x), f"{y}.pbf")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(data)
+
+    def close(self, metadata):
+        with open(os.path.join(self.directory, "metadata.json"), "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2)
+
+
+class MBTiles:
+    """Tiles in one SQLite file per the MBTiles spec: gzipped pbf, TMS row order."""
+
+    def __init__(self, path):
+        if os.path.exists(path):
+            os.remove(path)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("CREATE TABLE metadata (name TEXT, value TEXT)")
+        self.connection.execute(
+            "CREATE TABLE tiles (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB)"
+        )
+        self.connection.execute("CREATE UNIQUE INDEX tile_index ON tiles (zoom_level, tile_column, tile_row)")
+
+    def put(self, z, x, y, data):
+        self.connection.execute(
+            "INSERT INTO tiles VALUES (?, ?, ?, ?)", (z, x, (1 << z) - 1 - y, gzip.compress(data))
+        )
+
+    def close(self, metadata):
+        self.connection.executemany(
+            "INSERT INTO metadata VALUES (?, ?)",
+            [(name, value if isinstance(value, str) else json.dumps(value)) for name, value in metadata.items()]
+        )
+        self.connection.commit()
+        self.connection.close()
+
+
+def open_tiles(path):
+    # *.mbtiles is a packed SQLite tile set; anything else is a z/x/y directory
+    if path.endswith(".mbtiles"):
+        return MBTiles(path)
+    return DirectoryTiles(path)
+
+
+# --- Tiling ---------------------------------------------------------------
+
+def load_features(path, state, colours=None):
+    """
+    Read a state GeoJSON file into [(id, properties, polygons)], coordinates
+    projected once to mercator world units. Properties carry the locality
+    name, the matched MVAR suburb name and one colour per year.
+    """
+    _, abbreviation, fields = STATE_FILES[state]
+    colours = colours or {}
+    index = ColourIndex({name for year_colours in colours.values() for name in year_colours})
+
+    features = []
+    for feature_id, feature in enumerate(load_geojson(path)["features"]):
+        name = feature_name(feature, fields)
+        suburb = index.match(name, abbreviation)
+        properties = {"name": name or ""}
+        if suburb:
+            properties["suburb"] = suburb
+        for year, year_colours in sorted(colours.items()):
+            properties[f"colour_{year}"] = year_colours.get(suburb, DEFAULT_COLOUR)
+
+        projected = [[to_mercator(ring) for ring in polygon if len(ring) >= 4]
+                     for polygon in polygons(feature.get("geometry"))]
+        projected = [polygon for polygon in projected if polygon]
+        if projected:
+            features.append((feature_id, properties, projected))
+    return features
+
+
+def _oriented(ring, exterior):
+    # Exterior rings wind clockwise (positive area, y down), holes the other way
+    return ring if (ring_area(ring) > 0) == exterior else ring[::-1]
+
+
+def tile_zoom(features, zoom, tolerance, buffer=BUFFER, extent=EXTENT):
+    """
+    Cut features into the tiles of one zoom level. Geometry is snapped to the
+    zoom's integer grid and simplified once per zoom (tolerance is in tile
+    units, so it's a fixed fraction of a pixel at every zoom), then clipped
+    to each tile. Returns {(x, y): [(id, properties, rings)]}.
+    """
+    scale = extent * (1 << zoom)
+    last = (1 << zoom) - 1
+    tiles = {}
+    for feature_id, properties, projected in features:
+        for polygon in projected:
+            rings = []
+            for ring in polygon:
+                # Snap to this zoom's grid first; rings too small to simplify are kept
+                # as snapped, so dense suburbs don't vanish at low zooms
+                snapped = quantize(ring, scale)
+                simplified = simplify_ring(snapped, tolerance)
+                if simplified is None and len(snapped) >= 4 and ring_area(snapped) != 0:
+                    simplified = snapped
+                if simplified is None:
+                    if not rings:
+                        break
+                    continue
+                rings.append(simplified)
+            if not rings:
+                continue
+
+            lo, hi = rings[0].min(axis=0), rings[0].max(axis=0)
+            x0, y0 = (max(0, int((v - buffer) // extent)) for v in lo)
+            x1, y1 = (min(last, int((v + buffer) // extent)) for v in hi)
+            for x in range(x0, x1 + 1):
+                for y in range(y0, y1 + 1):
+                    left, top = x * extent, y * extent
+                    parts = []
+                    for exterior, ring in ((i == 0, ring) for i, ring in enumerate(rings)):
+                        clipped = clip_ring(ring, left - buffer, top - buffer,
+                                            left + extent + buffer, top + extent + buffer)
+                        snapped = None if clipped is None else quantize(clipped, 1.0, (left, top))
+                        if snapped is None or len(snapped) < 4 or ring_area(snapped) == 0:
+                            if exterior:
+                                break
+                            continue
+                        parts.append(_oriented(snapped, exterior))
+                    if not parts:
+                        continue
+                    tile = tiles.setdefault((x, y), {})
+                    tile.setdefault(feature_id, (properties, []))[1].extend(parts)
+
+    return {
+        key: [(feature_id, properties, rings) for feature_id, (properties, rings) in tile.items()]
+        for key, tile in tiles.items()
+    }
+
+
+def world_bounds(features):
+    lo = np.min([ring.min(axis=0) for _, _, projected in features for polygon in projected for ring in polygon],
+                axis=0)
+    hi = np.max([ring.max(axis=0) for _, _, projected in features for polygon in projected for ring in polygon],
+                axis=0)
+    return lo, hi
+
+
+def to_lonlat(x, y):
+    return x * 360.0 - 180.0, math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * y))))
+
+
+def build_tiles(path, state, output, min_zoom=4, max_zoom=12, tolerance=8.0, colours=None):
+    """
+    Tile one state file into `output` (a *.mbtiles file or a directory).
+    Returns (tile count, total bytes).
+    """
+    features = load_features(path, state, colours)
+    tiles = open_tiles(output)
+    count = size = 0
+    for zoom in range(min_zoom, max_zoom + 1):
+        for (x, y), tile_features in sorted(tile_zoom(features, zoom, tolerance).items()):
+            data = encode_tile(tile_features)
+            tiles.put(zoom, x, y, data)
+            count += 1
+            size += len(data)
+
+    lo, hi = world_bounds(features) if features else (np.zeros(2), np.ones(2))
+    west, south = to_lonlat(lo[0], hi[1])
+    east, north = to_lonlat(hi[0], lo[1])
+    # Not every feature has every key (e.g. "suburb"), so list the union
+    fields = {key: "String" for _, properties, _ in features for key in properties}
+    tiles.close({
+        "name": f"{state}_suburbs",
+        "format": "pbf",
+        "minzoom": str(min_zoom),
+        "maxzoom": str(max_zoom),
+        "bounds": f"{west:.6f},{south:.6f},{east:.6f},{north:.6f}",
+        "center": f"{(west + east) / 2:.6f},{(south + north) / 2:.6f},{min_zoom}",
+        "json": {"vector_layers": [{"id": LAYER, "fields": fields, "minzoom": min_zoom, "maxzoom": max_zoom}]},
+    })
+    return count, size
+
+
+def _build_state(job):
+    state, path, output, min_zoom, max_zoom, tolerance, colours = job
+    count, size = build_tiles(path, state, output, min_zoom, max_zoom, tolerance, colours)
+    return state, output, count, size
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cut the state suburb GeoJSON files into vector tiles")
+    parser.add_argument("--geojson-dir", default="../public", help="Directory holding the *_suburbs.json files")
+    parser.add_argument("--states", default=",".join(STATE_FILES), help="Comma-separated state keys")
+    parser.add_argument("--colours", default="map_colours.json", help="Per-year colours to embed ('' for none)")
+    parser.add_argument("--output", default="tiles", help="Output directory, one tile set per state")
+    parser.add_argument("--format", choices=["mbtiles", "files"], default="mbtiles")
+    parser.add_argument("--min-zoom", type=int, default=4)
+    parser.add_argument("--max-zoom", type=int, default=12)
+    parser.add_argument("--tolerance", type=float, default=8.0,
+                        help=f"Simplification tolerance in tile units ({EXTENT // 256} per screen pixel)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    args = parser.parse_args()
+
+    colours = {}
+    if args.colours and os.path.exists(args.colours):
+        with open(args.colours, "r", encoding="utf-8") as f:
+            colours = json.load(f)
+
+    os.makedirs(args.output, exist_ok=True)
+    jobs = []
+    for state in args.states.split(","):
+        path = os.path.join(args.geojson_dir, STATE_FILES[state][0])
+        if not os.path.exists(path):
+            print(f"Skipping {state}: {path} not found")
+            continue
+        output = os.path.join(args.output, f"{state}.mbtiles" if args.format == "mbtiles" else state)
+        jobs.append((state, path, output, args.min_zoom, args.max_zoom, args.tolerance, colours))
+
+    # States are independent, so each gets its own process
+    with Pool(min(len(jobs), args.workers or os.cpu_count()) or 1) as pool:
+        for state, output, count, size in pool.imap_unordered(_build_state, jobs):
+            print(f"{state}: {count} tiles, {size / 1e6:.1f} MB -> {output}")